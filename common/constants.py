@@ -76,6 +76,11 @@ class ConfigKeys:
 
     # UI (화면 표시 관련)
     RX_MAX_LINES = "settings.max_log_lines"
+    RX_ENCODING = "settings.rx_encoding"
+    RX_SCROLLBACK = "settings.log_scrollback"
+    RX_COMPRESSION = "settings.log_compression"
+    RX_ROW_BYTES = "settings.log_row_bytes"
+    RX_HEX_ROW_BYTES = "settings.log_hex_row_bytes"
 
     # Command (Command 형식)
     COMMAND_PREFIX = "settings.command_prefix"
@@ -94,6 +99,7 @@ class ConfigKeys:
     PACKET_PARSER_TYPE = "packet.parser_type"
     PACKET_DELIMITERS = "packet.delimiters"
     PACKET_LENGTH = "packet.packet_length"
+    PACKET_GAP_CHARS = "packet.gap_chars"
     AT_COLOR_OK = "packet.at_color_ok"
     AT_COLOR_ERROR = "packet.at_color_error"
     AT_COLOR_URC = "packet.at_color_urc"
@@ -106,6 +112,8 @@ class ConfigKeys:
 
     # Logging
     LOG_PATH = "logging.path"
+    LOG_PACKET_MODE = "logging.packet_mode"
+    LOG_PACKET_FILTER = "logging.packet_filter"
 
     # Persistence (State Saving)
     MANUAL_CONTROL_STATE = "manual_control"
@@ -144,19 +152,67 @@ TX_QUEUE_SIZE: int = 128
 BATCH_SIZE_THRESHOLD: int = 8192  # 이 크기가 넘으면 즉시 전송 (bytes)
 BATCH_TIMEOUT_MS: int = 50        # 이 시간이 지나면 크기가 작아도 전송 (ms)
 
+# 유휴 간격(Gap) 파서 기본 임계값
+# Worker 폴링 주기(WORKER_IDLE_WAIT_MS)보다 짧은 간격은 구분할 수 없음
+DEFAULT_GAP_US: int = 5000
+MIN_GAP_US: int = 1000  # 임계값 하한 (Worker 폴링 주기 1ms)
+DEFAULT_GAP_CHARS: float = 3.5  # 환경 설정 기본 임계값 (문자 시간, Modbus RTU t3.5)
+PARSER_INDEX_GAP: int = 5       # 환경 설정 파서 타입 인덱스 (유휴 간격, 연결 시 GapParser 적용)
+
+# 수신 데이터 표시 인코딩 (로그 뷰 라인 조립용)
+DEFAULT_RX_ENCODING: str = "utf-8"
+RX_ENCODINGS: List[str] = ["utf-8", "cp949", "latin-1", "ascii"]
+
 # ==========================================
 # Performance & Timings
 # ==========================================
 WORKER_IDLE_WAIT_MS: int = 1      # 데이터 없을 때 대기 시간 (CPU 방어)
 WORKER_BUSY_WAIT_US: int = 100    # 데이터 처리 중 짧은 대기 시간
 UI_REFRESH_INTERVAL_MS: int = 30  # 로그 뷰 갱신 주기 (약 33 FPS)
+UI_FLUSH_BUDGET_MS: int = 12            # UI 틱당 최대 플러시 시간 (프레임 예산)
+UI_FLUSH_SLICE_BYTES: int = 16 * 1024   # 포트 1회 방문당 최대 전달 크기 (Round-robin)
+UI_PENDING_LIMIT_BYTES: int = 256 * 1024  # 포트별 화면 대기 버퍼 상한 (초과분은 화면 표시 생략)
+LOG_HIDDEN_BACKLOG_BYTES: int = 4 * 1024 * 1024  # 숨겨진 포트 탭이 원본으로 보관할 미표시 수신 데이터 (초과분은 백그라운드로 로그 모델에 반영)
+LOG_HIDDEN_BACKLOG_MAX_BYTES: int = 32 * 1024 * 1024  # 숨겨진 탭 대기열 절대 상한 (백그라운드 반영이 못 따라가면 오래된 구간부터 화면 표시 생략)
+LOG_HIDDEN_DRAIN_BUDGET_MS: int = 4  # 모든 숨겨진 탭이 나눠 쓰는 초과분 반영 UI 틱당 시간 예산 (보이는 탭보다 낮은 우선순위)
+STATS_SAMPLE_INTERVAL_MS: int = 1000  # 포트 통계 샘플링 주기
+STATS_WINDOW_SAMPLES: int = 5         # 슬라이딩 윈도우 크기 (샘플 수)
+STATS_EWMA_ALPHA: float = 0.3         # EWMA 가중치
+LINE_PARTIAL_FLUSH_MS: int = 200      # 미완성 라인 강제 표시 대기 시간 (수신 정지 후)
+LINE_MAX_PARTIAL_CHARS: int = 4096    # 미완성 라인 최대 길이 (초과 시 즉시 표시)
 
 # ==========================================
 # UI Limits & Defaults
 # ==========================================
 DEFAULT_LOG_MAX_LINES: int = 2000
+MIN_LOG_MAX_LINES: int = 100
+MAX_LOG_MAX_LINES: int = 5_000_000  # 열 배열 저장소(LineStore) 기준 라인당 오버헤드 약 17바이트
+SCROLLBACK_RAM_WINDOW_LINES: int = 10000  # 디스크 스크롤백 모드에서 메모리에 유지할 최근 라인 수
+LOG_BLOCK_LINES: int = 1024  # 압축 보관 모드의 블록당 라인 수
+LOG_BLOCK_CACHE_SIZE: int = 8  # 압축 해제된 블록 캐시 (블록 수)
+LOG_COMPRESSION_LINES_FACTOR: int = 8  # 압축 보관 모드에서 유지할 라인 수 배율 (최대 라인 수 기준)
+MIN_LOG_BLOCK_LINES: int = 64  # 최대 라인 수가 작을 때 블록 크기 하한
+DEFAULT_LOG_ROW_BYTES: int = 1024  # 종료 문자 없는 긴 라인을 나눌 로그 행 최대 폭 (바이트)
+MIN_LOG_ROW_BYTES: int = 64
+MAX_LOG_ROW_BYTES: int = 16384
+LOG_HEX_ROW_BYTES: List[int] = [16, 32]  # HEX 모드 행당 바이트 수 (hexdump 형식)
 TRIM_CHUNK_RATIO: float = 0.2  # 20%
 MAX_PACKET_SIZE: int = 4096
+DISSECTOR_CACHE_SIZE: int = 512  # 디섹터 디코딩 결과 캐시 (패킷 수)
+LOG_RENDER_CACHE_SIZE: int = 1024  # 로그 뷰 렌더링 결과 캐시 (행 수)
+LOG_FORMAT_CACHE_SIZE: int = 2048  # 로그 행 표시 텍스트 캐시 (행 수, 표시 모드별)
+LOG_PREFETCH_ROWS: int = 256  # 행 추가 후 작업 스레드에서 미리 포맷팅할 최근 행 수
+TERMINAL_DEFAULT_COLUMNS: int = 80  # 터미널 모드 화면 크기 (뷰 크기를 알기 전 기본값)
+TERMINAL_DEFAULT_ROWS: int = 24
+TERMINAL_SCROLLBACK_LINES: int = 5000  # 터미널 모드에서 화면 위로 밀려난 라인 보관 수
+TERMINAL_TAB_WIDTH: int = 8
+COLOR_RULE_CACHE_SIZE: int = 32  # 컴파일된 색상 규칙 세트 캐시 (규칙 세트 수)
+SEARCH_INDEX_BLOCK_LINES: int = 4096  # 검색 인덱스 블록당 라인 수
+SEARCH_INDEX_MAX_BYTES: int = 64 * 1024 * 1024  # 검색 인덱스 최대 내용 크기 (초과 시 오래된 블록 제외)
+SEARCH_MINIMAP_BINS: int = 256  # 스크롤바 검색 미니맵 구간 수
+SEARCH_REFRESH_MS: int = 500  # 수신 중 검색 결과(일치 수/미니맵) 갱신 간격
+EXPORT_CHUNK_ROWS: int = 5000  # 로그 내보내기 시 메인 스레드 틱당 꺼낼 행 수
+EXPORT_QUEUE_CHUNKS: int = 4  # 로그 내보내기 쓰기 대기 청크 최대 개수
 MIN_SCAN_INTERVAL_MS: int = 1000
 MAX_SCAN_INTERVAL_MS: int = 60000
 DEFAULT_MACRO_INTERVAL_MS: int = 1000
@@ -6,8 +6,12 @@ SettingsManager의 하드코딩을 방지하고 설정값 관리를 중앙화합
 """
 from common.constants import (
     DEFAULT_BAUDRATE,
+    DEFAULT_GAP_CHARS,
     DEFAULT_LOG_MAX_LINES,
-    DEFAULT_MACRO_INTERVAL_MS
+    DEFAULT_RX_ENCODING,
+    DEFAULT_MACRO_INTERVAL_MS,
+    DEFAULT_LOG_ROW_BYTES,
+    LOG_HEX_ROW_BYTES
 )
 
 # ==========================================
@@ -21,6 +25,11 @@ DEFAULT_GLOBAL_SETTINGS = {
 
 DEFAULT_UI_SETTINGS = {
     "max_log_lines": DEFAULT_LOG_MAX_LINES,
+    "rx_encoding": DEFAULT_RX_ENCODING,
+    "log_scrollback": False,
+    "log_compression": False,
+    "log_row_bytes": DEFAULT_LOG_ROW_BYTES,
+    "log_hex_row_bytes": LOG_HEX_ROW_BYTES[0],
     "proportional_font_family": "Segoe UI",
     "proportional_font_size": 9,
     "fixed_font_family": "Consolas",
@@ -52,13 +61,16 @@ DEFAULT_COMMAND_SETTINGS = {
 }
 
 DEFAULT_LOGGING_SETTINGS = {
-    "log_dir": ""
+    "log_dir": "",
+    "packet_mode": False,  # 파싱된 패킷 단위로 기록
+    "packet_filter": ""    # 패킷 모드 필터 표현식 (빈 값이면 전체)
 }
 
 DEFAULT_PACKET_SETTINGS = {
     "parser_type": 0, # Auto
     "delimiters": ["\\r\\n"],
     "packet_length": 64,
+    "gap_chars": DEFAULT_GAP_CHARS,  # 유휴 간격 파서 임계값 (문자 시간)
     "at_color_ok": True,
     "at_color_error": True,
     "at_color_urc": True,
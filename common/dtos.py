@@ -25,7 +25,11 @@ import time
 
 from common.constants import (
     DEFAULT_BAUDRATE,
+    DEFAULT_GAP_CHARS,
     DEFAULT_MACRO_INTERVAL_MS,
+    DEFAULT_RX_ENCODING,
+    DEFAULT_LOG_ROW_BYTES,
+    LOG_HEX_ROW_BYTES,
     FONT_FAMILY_SEGOE,
     FONT_FAMILY_CONSOLAS
 )
@@ -33,7 +37,8 @@ from common.enums import (
     SerialParity,
     SerialStopBits,
     SerialFlowControl,
-    FileStatus
+    FileStatus,
+    ParserType
 )
 
 
@@ -96,6 +101,8 @@ class PortConfig:
         flowctrl (str): 흐름 제어 설정.
         speed (int): SPI 속도 (Hz).
         mode (int): SPI 모드.
+        parser_type (str): 패킷 파서 타입 (ParserType 상수).
+        parser_options (Dict[str, Any]): 파서별 추가 인자 (예: gap_us, gap_chars).
     """
     port: str
     protocol: str = "Serial"
@@ -111,6 +118,10 @@ class PortConfig:
     speed: int = 1000000
     mode: int = 0
 
+    # Packet Options
+    parser_type: str = ParserType.RAW
+    parser_options: Dict[str, Any] = field(default_factory=dict)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PortConfig':
         """
@@ -131,7 +142,9 @@ class PortConfig:
             stopbits=_safe_cast(data.get("stopbits"), float, SerialStopBits.ONE.value),
             flowctrl=data.get("flowctrl", SerialFlowControl.NONE.value),
             speed=_safe_cast(data.get("speed"), int, 1000000),
-            mode=_safe_cast(data.get("mode"), int, 0)
+            mode=_safe_cast(data.get("mode"), int, 0),
+            parser_type=data.get("parser_type", ParserType.RAW),
+            parser_options=dict(data.get("parser_options") or {})
         )
 
 
@@ -154,15 +167,33 @@ class PortStatistics:
     포트 통신 통계 DTO
 
     Attributes:
-        rx_bytes (int): 수신 바이트 수.
-        tx_bytes (int): 송신 바이트 수.
+        rx_bytes (int): 누적 수신 바이트 수.
+        tx_bytes (int): 누적 송신 바이트 수.
         error_count (int): 에러 발생 횟수.
-        bps (int): 초당 비트 전송률.
+        bps (int): 초당 비트 전송률 (RX+TX, 슬라이딩 윈도우).
+        rx_chunks (int): 누적 수신 청크(배치) 수.
+        tx_chunks (int): 누적 송신 청크 수.
+        rx_rate (float): 수신 속도 (B/s, 슬라이딩 윈도우).
+        tx_rate (float): 송신 속도 (B/s, 슬라이딩 윈도우).
+        rx_rate_ewma (float): 수신 속도 (B/s, EWMA).
+        tx_rate_ewma (float): 송신 속도 (B/s, EWMA).
+        rx_peak (float): 최대 수신 속도 (B/s).
+        tx_peak (float): 최대 송신 속도 (B/s).
+        utilization (float): 회선 점유율 (%).
     """
     rx_bytes: int = 0
     tx_bytes: int = 0
     error_count: int = 0
     bps: int = 0
+    rx_chunks: int = 0
+    tx_chunks: int = 0
+    rx_rate: float = 0.0
+    tx_rate: float = 0.0
+    rx_rate_ewma: float = 0.0
+    tx_rate_ewma: float = 0.0
+    rx_peak: float = 0.0
+    tx_peak: float = 0.0
+    utilization: float = 0.0
 
 
 @dataclass
@@ -469,6 +500,21 @@ class PacketEvent:
     port: str
     packet: Any
 
+@dataclass
+class PacketBatchEvent:
+    """
+    패킷 배치 이벤트 DTO
+
+    Worker 배치(또는 유휴 통지) 1회에서 파싱된 패킷을 묶어 한 번에 전달합니다.
+    패킷마다 이벤트를 만들지 않으므로 고속 수신 시 할당과 시그널 호출이 줄어듭니다.
+
+    Attributes:
+        port (str): 패킷이 수신된 포트 이름.
+        packets (List[Any]): 파싱된 패킷 리스트 (model.packet_parser.Packet).
+    """
+    port: str
+    packets: List[Any] = field(default_factory=list)
+
 @dataclass
 class PacketViewData:
     """
@@ -494,9 +540,42 @@ class LogDataBatch:
     Attributes:
         port (str): 데이터가 속한 포트 이름.
         data (bytes): 수신된 데이터 배치.
+        skipped (int): 과부하로 화면 표시를 생략한 바이트 수 (data 이전 구간).
     """
     port: str
     data: bytes
+    skipped: int = 0
+
+
+@dataclass
+class LogSearchResult:
+    """
+    로그 검색 결과 DTO
+
+    Attributes:
+        query (tuple): 검색 조건 (검색어, 인코딩, HEX 모드 여부).
+        generation (int): 검색 시점의 인덱스 세대 번호 (행 추가/삭제 시 증가).
+        ids (Any): 일치 행 일련번호 (오름차순 array('Q')).
+        first_id (int): 검색 시점의 첫 행 일련번호.
+        density (tuple): 행 범위를 균등 분할한 구간별 일치 비율 (스크롤바 미니맵, 0.0 ~ 1.0).
+        indexed_first_id (int): 검색 인덱스에 남아 있는 첫 행 일련번호 (인덱스 용량 초과로 제외된 행은 검색하지 않음).
+    """
+    query: tuple
+    generation: int
+    ids: Any
+    first_id: int = 0
+    density: tuple = ()
+    indexed_first_id: int = 0
+
+    @property
+    def total(self) -> int:
+        """일치 행 수"""
+        return len(self.ids)
+
+    @property
+    def truncated(self) -> bool:
+        """인덱스 용량 초과로 검색하지 못한 오래된 행이 있는지 여부"""
+        return self.indexed_first_id > self.first_id
 
 
 @dataclass
@@ -586,6 +665,11 @@ class PreferencesState:
         language (str): 언어 코드 (en/ko).
         font_size (int): UI 폰트 크기.
         max_log_lines (int): 최대 로그 라인 수.
+        rx_encoding (str): 수신 데이터 표시 인코딩.
+        log_scrollback (bool): 디스크 스크롤백 사용 여부 (최대 라인 수 제한 없음).
+        log_compression (bool): 오래된 로그 라인 메모리 압축 보관 여부.
+        log_row_bytes (int): 로그 행 최대 폭 (바이트, 긴 라인은 여러 행으로 분할).
+        log_hex_row_bytes (int): HEX 모드 행당 바이트 수.
         baudrate (int): 기본 보드레이트.
         newline (str): 줄바꿈 모드.
         local_echo_enabled (bool): 로컬 에코 사용 여부.
@@ -593,9 +677,12 @@ class PreferencesState:
         command_prefix (str): 명령어 접두사.
         command_suffix (str): 명령어 접미사.
         log_dir (str): 로그 저장 디렉토리.
+        log_packet_mode (bool): 패킷 단위 로깅 여부.
+        log_packet_filter (str): 패킷 로깅 필터 표현식.
         parser_type (int): 파서 타입 인덱스.
         delimiters (List[str]): 구분자 목록.
         packet_length (int): 고정 패킷 길이.
+        gap_chars (float): 유휴 간격 파서 임계값 (문자 시간).
         at_color_ok (bool): AT OK 색상 적용 여부.
         at_color_error (bool): AT ERROR 색상 적용 여부.
         at_color_urc (bool): AT URC 색상 적용 여부.
@@ -609,6 +696,11 @@ class PreferencesState:
     language: str = "en"
     font_size: int = 10
     max_log_lines: int = 1000
+    rx_encoding: str = DEFAULT_RX_ENCODING
+    log_scrollback: bool = False
+    log_compression: bool = False
+    log_row_bytes: int = DEFAULT_LOG_ROW_BYTES
+    log_hex_row_bytes: int = LOG_HEX_ROW_BYTES[0]
 
     # Serial Defaults
     baudrate: int = DEFAULT_BAUDRATE
@@ -622,11 +714,14 @@ class PreferencesState:
 
     # Logging
     log_dir: str = ""
+    log_packet_mode: bool = False
+    log_packet_filter: str = ""
 
     # Packet
     parser_type: int = 0
     delimiters: List[str] = field(default_factory=lambda: ["\\r\\n"])
     packet_length: int = 64
+    gap_chars: float = DEFAULT_GAP_CHARS
     at_color_ok: bool = True
     at_color_error: bool = True
     at_color_urc: bool = True
@@ -12,7 +12,7 @@
 * PortState, ParserType, ThemeType 등 상태 열거형
 * SerialParity, SerialStopBits 등 통신 설정 열거형
 * FileStatus, MacroStepType 등 프로세스 상태
-* LogFormat 등 파일 저장 형식
+* LogFormat, ExportFormat 등 파일 저장 형식
 
 ## HOW
 * Python의 enum.Enum을 사용하여 상태 정의
@@ -42,11 +42,13 @@ class ParserType:
         AT: AT 커맨드 (CRLF 기준)
         DELIMITER: 지정된 구분자 기준
         FIXED_LENGTH: 고정 길이 기준
+        GAP: 유휴 간격(Inter-byte Timeout) 기준
     """
     RAW = "Raw"
     AT = "AT"
     DELIMITER = "Delimiter"
     FIXED_LENGTH = "FixedLength"
+    GAP = "Gap"
 
 class LogFormat(Enum):
     """
@@ -61,6 +63,19 @@ class LogFormat(Enum):
     HEX = "hex"
     PCAP = "pcap"
 
+class ExportFormat(Enum):
+    """
+    로그 내보내기 형식 열거형
+
+    Attributes:
+        TEXT: 표시 텍스트 (.txt)
+        HEX: 행별 HEX 덤프 (.hex)
+        CSV: 시각, 방향, 데이터 (.csv)
+    """
+    TEXT = "text"
+    HEX = "hex"
+    CSV = "csv"
+
 class SerialParity(Enum):
     """
     시리얼 패리티 비트 설정
@@ -122,6 +137,19 @@ class NewlineMode(Enum):
     CR = "CR"      # \r
     CRLF = "CRLF"  # \r\n
 
+class LogDedupMode(Enum):
+    """
+    데이터 로그 연속 중복 라인 접기 모드
+
+    Attributes:
+        OFF: 접지 않음
+        EXACT: 내용이 같은 연속 라인을 접음
+        IGNORE_DIGITS: 숫자(카운터/타임스탬프 등)만 다른 연속 라인도 접음
+    """
+    OFF = "Off"
+    EXACT = "Exact"
+    IGNORE_DIGITS = "IgnoreDigits"
+
 class ThemeType(Enum):
     """
     테마 타입
@@ -13,13 +13,14 @@
 * DataLogger: 단일 포트의 데이터를 파일에 기록 (Producer-Consumer 패턴)
 * 포맷 지원: BIN (Raw), HEX (Text Dump), PCAP (Wireshark)
 * DataLoggerManager: 여러 포트의 로거를 관리하는 중앙 관리자
+* 패킷 모드: 원본 스트림 대신 파싱된 프레임 중 필터에 일치하는 것만 기록
 
 ## HOW
 * Queue를 사용하여 데이터 수신(Write)과 파일 저장(Disk I/O)을 분리
 * 쓰기 시점의 타임스탬프를 캡처하여 PCAP 정밀도 보장
 * 백그라운드 스레드에서 포맷에 따른 인코딩 및 파일 쓰기 수행
 """
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Tuple, Callable, Any, Sequence
 from queue import Queue, Empty
 from threading import Thread
 import os
@@ -44,13 +45,17 @@ class DataLogger:
         self._is_logging = False
         self.file_path: str = ""
         self.format: LogFormat = LogFormat.BIN
+        self.packet_mode: bool = False
+        self._packet_filter: Optional[Callable[[Any], bool]] = None
 
     @property
     def is_logging(self) -> bool:
         """현재 로깅 중인지 여부 반환"""
         return self._is_logging
 
-    def start_logging(self, file_path: str, log_format: LogFormat = LogFormat.BIN) -> bool:
+    def start_logging(self, file_path: str, log_format: LogFormat = LogFormat.BIN,
+                      packet_mode: bool = False,
+                      packet_filter: Optional[Callable[[Any], bool]] = None) -> bool:
         """
         로깅을 시작합니다.
 
@@ -63,6 +68,8 @@ class DataLogger:
         Args:
             file_path: 저장할 파일 경로
             log_format: 저장 포맷 (BIN, HEX, PCAP)
+            packet_mode: True면 원본 스트림 대신 파싱된 패킷 단위로 기록
+            packet_filter: 패킷 모드에서 기록할 패킷 판별 함수 (None이면 전체)
 
         Returns:
             bool: 시작 성공 여부
@@ -72,6 +79,8 @@ class DataLogger:
 
             self.format = log_format
             self.file_path = file_path
+            self.packet_mode = packet_mode
+            self._packet_filter = packet_filter if packet_mode else None
 
             # 모든 포맷을 바이너리 모드로 엽니다 (텍스트 인코딩 이슈 방지 및 PCAP 호환)
             self._file = open(file_path, 'wb')
@@ -118,10 +127,27 @@ class DataLogger:
         Args:
             data: 기록할 바이트 데이터
         """
-        if self._is_logging:
+        # 패킷 모드에서는 원본 스트림을 기록하지 않음 (write_packets 사용)
+        if self._is_logging and not self.packet_mode:
             timestamp = time.time()
             self._queue.put((timestamp, data))
 
+    def write_packets(self, packets: Sequence[Any]) -> None:
+        """
+        파싱된 패킷 중 필터에 일치하는 것만 로깅 큐에 추가합니다. (패킷 모드 전용)
+        패킷의 수신 시각을 그대로 사용하므로 PCAP 레코드 1개 = 프레임 1개가 됩니다.
+
+        Args:
+            packets: 패킷 리스트 (model.packet_parser.Packet)
+        """
+        if not (self._is_logging and self.packet_mode):
+            return
+
+        packet_filter = self._packet_filter
+        for packet in packets:
+            if packet_filter is None or packet_filter(packet):
+                self._queue.put((packet.timestamp, packet.data))
+
     def _write_loop(self) -> None:
         """
         백그라운드 스레드에서 실행되는 쓰기 루프
@@ -208,7 +234,9 @@ class DataLoggerManager:
     def __init__(self):
         self._loggers: Dict[str, DataLogger] = {}
 
-    def start_logging(self, port_name: str, file_path: str, log_format: LogFormat = LogFormat.BIN) -> bool:
+    def start_logging(self, port_name: str, file_path: str, log_format: LogFormat = LogFormat.BIN,
+                      packet_mode: bool = False,
+                      packet_filter: Optional[Callable[[Any], bool]] = None) -> bool:
         """
         특정 포트의 로깅을 시작합니다.
 
@@ -216,6 +244,8 @@ class DataLoggerManager:
             port_name: 포트 이름
             file_path: 저장할 파일 경로
             log_format: 저장 포맷 (기본 BIN)
+            packet_mode: 패킷 단위 기록 여부
+            packet_filter: 패킷 모드에서 기록할 패킷 판별 함수
 
         Returns:
             bool: 성공 시 True
@@ -224,7 +254,7 @@ class DataLoggerManager:
             self.stop_logging(port_name)
 
         logger_instance = DataLogger()
-        if logger_instance.start_logging(file_path, log_format):
+        if logger_instance.start_logging(file_path, log_format, packet_mode, packet_filter):
             self._loggers[port_name] = logger_instance
             return True
         return False
@@ -256,6 +286,17 @@ class DataLoggerManager:
         if port_name in self._loggers:
             self._loggers[port_name].write(data)
 
+    def write_packets(self, port_name: str, packets: Sequence[Any]) -> None:
+        """
+        특정 포트의 로거에 패킷 배치를 전달합니다. (패킷 모드 로거만 기록)
+
+        Args:
+            port_name: 포트 이름
+            packets: 패킷 리스트
+        """
+        if port_name in self._loggers:
+            self._loggers[port_name].write_packets(packets)
+
     def is_logging(self, port_name: str) -> bool:
         """
         특정 포트가 로깅 중인지 확인합니다.
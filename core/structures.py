@@ -11,10 +11,12 @@
 ## WHAT
 * ThreadSafeQueue: 스레드 안전 큐
 * RingBuffer: 고정 크기 원형 버퍼 (Zero-copy 지향)
+* ChunkBacklog: 상한이 있는 수신 청크 대기열 (메인 스레드 전용, 초과분 생략량 기록, 순서 보존 마커)
 
 ## HOW
 * deque와 Lock을 이용한 큐 구현
 * memoryview와 bytearray를 이용한 고성능 버퍼링
+* 청크 대기열은 bytes 참조만 보관하고 꺼낼 때 최대 1회 결합
 """
 
 import threading
@@ -22,6 +24,9 @@ from collections import deque
 from typing import Optional, Any
 from common.constants import RING_BUFFER_SIZE
 
+# ChunkBacklog 데이터 청크 타입 (그 외 항목은 순서 보존 마커)
+_CHUNK_TYPES = (bytes, bytearray, memoryview)
+
 class ThreadSafeQueue:
     """
     스레드 안전한(Thread-safe) 큐 래퍼 클래스입니다.
@@ -216,3 +221,94 @@ class RingBuffer:
         """
         with self._lock:
             return self._stored_bytes
+
+
+class ChunkBacklog:
+    """
+    상한이 있는 수신 청크 대기열 클래스입니다. (메인 스레드 전용)
+
+    수신 청크(bytes) 참조만 보관하며, 꺼낼 때 청크 1개를 통째로 꺼내면 복사하지 않습니다.
+    상한을 넘으면 오래된 구간부터 버리고 버린 바이트 수를 기록합니다. (상한 None이면 버리지 않음)
+    안내 마커(str) 등 데이터가 아닌 항목은 데이터 사이의 위치에 보관하며, take()는 마커 앞에서 멈춥니다.
+    """
+
+    __slots__ = ("chunks", "offset", "size", "skipped")
+
+    def __init__(self) -> None:
+        self.chunks: deque = deque()
+        self.offset = 0   # 첫 청크에서 이미 소비/생략된 위치
+        self.size = 0     # 대기 중인 총 바이트 수 (마커 제외)
+        self.skipped = 0  # 상한 초과로 생략한 바이트 수
+
+    def __bool__(self) -> bool:
+        """대기 중인 데이터 또는 마커가 있는지 여부"""
+        return bool(self.chunks)
+
+    def push(self, data: bytes, limit: Optional[int] = None) -> None:
+        """청크를 추가하고 상한 초과분은 오래된 구간부터 생략합니다. (생략 구간의 마커도 함께 제거)"""
+        self.chunks.append(data)
+        self.size += len(data)
+        if limit is None:
+            return
+
+        excess = self.size - limit
+        while excess > 0:
+            if not isinstance(self.chunks[0], _CHUNK_TYPES):
+                self.chunks.popleft()
+                continue
+            head_left = len(self.chunks[0]) - self.offset
+            if head_left <= excess:
+                self.chunks.popleft()
+                self.offset = 0
+                dropped = head_left
+            else:
+                self.offset += excess
+                dropped = excess
+            self.size -= dropped
+            self.skipped += dropped
+            excess -= dropped
+
+    def push_marker(self, marker: Any) -> None:
+        """앞서 보관한 데이터 뒤에 마커(안내 텍스트 등 데이터가 아닌 항목)를 추가합니다."""
+        self.chunks.append(marker)
+
+    @property
+    def marker_next(self) -> bool:
+        """맨 앞 항목이 마커인지 여부"""
+        return bool(self.chunks) and not isinstance(self.chunks[0], _CHUNK_TYPES)
+
+    def pop_marker(self) -> Optional[Any]:
+        """맨 앞 항목이 마커이면 꺼내 반환합니다. (아니면 None)"""
+        if self.marker_next:
+            return self.chunks.popleft()
+        return None
+
+    def take(self, max_bytes: int) -> bytes:
+        """최대 max_bytes를 꺼냅니다. (청크 1개 통째 전달 시 복사 없음, 마커 앞에서 멈춤)"""
+        parts = []
+        taken = 0
+        while self.chunks and taken < max_bytes:
+            head = self.chunks[0]
+            if not isinstance(head, _CHUNK_TYPES):
+                break
+            count = min(len(head) - self.offset, max_bytes - taken)
+            if self.offset == 0 and count == len(head):
+                parts.append(head)
+                self.chunks.popleft()
+            else:
+                parts.append(head[self.offset:self.offset + count])
+                self.offset += count
+                if self.offset == len(head):
+                    self.chunks.popleft()
+                    self.offset = 0
+            taken += count
+
+        self.size -= taken
+        return parts[0] if len(parts) == 1 else b"".join(parts)
+
+    def clear(self) -> None:
+        """대기 중인 청크/마커와 생략량을 모두 버립니다."""
+        self.chunks.clear()
+        self.offset = 0
+        self.size = 0
+        self.skipped = 0
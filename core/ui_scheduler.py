@@ -0,0 +1,145 @@
+"""
+UI 플러시 스케줄러 모듈
+
+UI 갱신(플러시) 단계들을 하나의 단발 타이머로 묶어 요청이 있을 때만 깨어나도록 합니다.
+
+## WHY
+* 컴포넌트마다 30ms 반복 타이머를 두면 트래픽이 없어도 초당 수십 회 깨어남
+* 밤새 간헐적 트래픽을 캡처하는 노트북이 저전력 상태로 진입하지 못함
+* 플러시 단계가 제각각 돌면 한 프레임에 여러 번 깨어나고 지연도 누적됨
+
+## WHAT
+* request(): 다음 UI 틱에 실행할 플러시 콜백 등록 (중복 등록은 1회로 병합)
+* cancel(): 등록된 콜백 취소 (위젯 종료 시)
+* 대기 콜백이 없으면 타이머 정지 -> 유휴 시 Wakeup 0회
+
+## HOW
+* 첫 요청 시 단발(Single-shot) QTimer 기동, 처리 중 재요청되면 다음 틱으로 재무장
+* 한 틱 안에서 앞 단계가 요청한 뒷 단계(예: Handler -> 로그 위젯)는 같은 틱에 실행
+* 콜백 예외는 로깅 후 격리하여 다른 단계에 영향 없음
+* 바운드 메서드는 WeakMethod로 보관하고, 소유 객체가 사라졌거나 C++ 객체가 삭제된 위젯이면 실행하지 않고 버림
+  -> 요청이 남은 채 탭/위젯이 닫혀도 삭제된 객체의 콜백을 호출하지 않음 (호출자별 취소 누락 방지)
+"""
+import weakref
+from types import MethodType
+from typing import Callable, Dict, Optional, Union
+
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, QTimer
+
+from common.constants import UI_REFRESH_INTERVAL_MS
+from core.logger import logger
+
+
+# 대기 항목 키 (바운드 메서드는 WeakMethod, 그 외 호출 객체는 그대로)
+_Entry = Union[weakref.WeakMethod, Callable[[], None]]
+
+
+def _entry(callback: Callable[[], None]) -> _Entry:
+    """콜백을 대기 항목 키로 변환합니다. (같은 바운드 메서드는 같은 키)"""
+    if isinstance(callback, MethodType):
+        return weakref.WeakMethod(callback)
+    return callback
+
+
+def _resolve(entry: _Entry) -> Optional[Callable[[], None]]:
+    """대기 항목을 실행할 콜백으로 변환합니다. (소유 객체가 사라졌거나 삭제된 Qt 객체면 None)"""
+    callback = entry() if isinstance(entry, weakref.WeakMethod) else entry
+    if callback is None:
+        return None
+    owner = getattr(callback, "__self__", None)
+    if isinstance(owner, QObject) and sip.isdeleted(owner):
+        return None
+    return callback
+
+
+class UiFlushScheduler(QObject):
+    """
+    요청 기반(Demand-driven) UI 플러시 스케줄러 클래스
+
+    모든 플러시 단계가 하나의 단발 타이머를 공유합니다.
+    """
+
+    def __init__(self, interval_ms: int = UI_REFRESH_INTERVAL_MS) -> None:
+        """
+        UiFlushScheduler 초기화
+
+        Args:
+            interval_ms (int): 요청 후 플러시까지의 지연 (UI 틱 간격).
+        """
+        super().__init__()
+        self._interval_ms = interval_ms
+        # 순서 유지 + 중복 병합 (대기 항목 -> None)
+        self._pending: Dict[_Entry, None] = {}
+        # QApplication 생성 이후 첫 요청 시 생성
+        self._timer: Optional[QTimer] = None
+
+    @property
+    def is_idle(self) -> bool:
+        """대기 중인 플러시 요청이 없는지 여부"""
+        return not self._pending
+
+    def request(self, callback: Callable[[], None]) -> None:
+        """
+        다음 UI 틱에 콜백 실행을 요청합니다.
+
+        Args:
+            callback (Callable[[], None]): 플러시 콜백.
+        """
+        self._pending[_entry(callback)] = None
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.setInterval(self._interval_ms)
+            self._timer.timeout.connect(self._run)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def cancel(self, callback: Callable[[], None]) -> None:
+        """
+        등록된 콜백 요청을 취소합니다.
+
+        Args:
+            callback (Callable[[], None]): 취소할 콜백.
+        """
+        self._pending.pop(_entry(callback), None)
+        if not self._pending and self._timer is not None:
+            self._timer.stop()
+
+    def _run(self) -> None:
+        """
+        대기 중인 플러시 콜백을 실행합니다. (Timer Slot)
+
+        Logic:
+            - 등록 순서대로 실행, 실행 중 새로 요청된 콜백도 같은 틱에 실행
+            - 이번 틱에 이미 실행된 콜백의 재요청은 다음 틱으로 이월 (재무장)
+            - 이월할 요청이 없으면 타이머는 정지 상태로 유지
+            - 소유 객체가 사라진(닫힌 위젯) 콜백은 실행하지 않고 버림
+        """
+        executed = set()
+        deferred: Dict[_Entry, None] = {}
+
+        while self._pending:
+            entry = next(iter(self._pending))
+            del self._pending[entry]
+            if entry in executed:
+                deferred[entry] = None
+                continue
+            executed.add(entry)
+
+            callback = _resolve(entry)
+            if callback is None:
+                continue
+
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"UI flush callback failed: {e}")
+
+        if deferred:
+            self._pending = deferred
+            self._timer.start()
+
+
+# 전역 인스턴스 (Singleton)
+ui_scheduler = UiFlushScheduler()
@@ -31,7 +31,7 @@ from common.dtos import (
     PortConfig,
     PortDataEvent,
     PortErrorEvent,
-    PacketEvent,
+    PacketBatchEvent,
     PortConnectionEvent
 )
 from common.constants import EventTopics
@@ -59,7 +59,7 @@ class ConnectionController(QObject):
     error_occurred = pyqtSignal(object)     # PortErrorEvent
     data_received = pyqtSignal(object)      # PortDataEvent
     data_sent = pyqtSignal(object)          # PortDataEvent
-    packet_received = pyqtSignal(object)    # PacketEvent
+    packet_received = pyqtSignal(object)    # PacketBatchEvent
 
     def __init__(self) -> None:
         """
@@ -214,9 +214,9 @@ class ConnectionController(QObject):
 
         Logic:
             1. 포트 이름 유효성 및 중복 연결 확인
-            2. Transport(SerialTransport) 생성 (Config 주입)
-            3. Worker(ConnectionWorker) 생성 및 Transport 주입
-            4. Parser(PacketParser) 생성 및 등록
+            2. Parser(PacketParser) 생성 (잘못된 옵션이면 Transport 생성 전에 중단)
+            3. Transport(SerialTransport) 생성 (Config 주입)
+            4. Worker(ConnectionWorker) 생성 및 Transport 주입, Parser 등록
             5. Worker 시그널을 Controller 시그널(DTO)로 변환하여 연결
             6. Worker 스레드 시작
 
@@ -236,16 +236,25 @@ class ConnectionController(QObject):
             self._emit_error(name, "Connection is already open.")
             return False
 
+        # Parser 생성 (설정 없으면 Raw, 잘못된 파서 옵션은 Transport/Worker 생성 전에 오류 보고 후 열지 않음)
+        try:
+            parser = self._create_parser(config)
+        except ValueError as e:
+            self._emit_error(name, f"Invalid parser options: {e}")
+            return False
+
         # DTO를 직접 SerialTransport에 전달
         transport = SerialTransport(config)
 
         # Worker에 Transport 주입
         worker = ConnectionWorker(transport, name)
 
-        # Parser 생성 (기본 Raw)
-        self.parsers[name] = ParserFactory.create_parser(ParserType.RAW)
+        self.parsers[name] = parser
         self.connection_configs[name] = config
 
+        # 시간 기반 파서는 Worker의 유휴 통지가 필요
+        worker.set_idle_timeout(parser.idle_timeout)
+
         # Worker signals -> Controller signals (Wrap in DTO)
         # 문자열 대신 PortConnectionEvent DTO 발행
         worker.connection_opened.connect(
@@ -255,7 +264,8 @@ class ConnectionController(QObject):
 
         # 데이터 및 에러 핸들러 연결
         worker.error_occurred.connect(lambda msg, n=name: self._emit_error(n, msg))
-        worker.data_received.connect(lambda data, n=name: self._handle_data_received(n, data))
+        worker.data_received.connect(lambda data, marks, n=name: self._handle_data_received(n, data, marks))
+        worker.line_idle.connect(lambda ts, n=name: self._handle_line_idle(n, ts))
 
         # Worker 관리 및 시작
         self.workers[name] = worker
@@ -263,6 +273,30 @@ class ConnectionController(QObject):
 
         return True
 
+    @staticmethod
+    def _create_parser(config: PortConfig) -> PacketParser:
+        """
+        연결 설정에 맞는 파서를 생성합니다.
+
+        Logic:
+            - 시리얼 파라미터를 기본 인자로 전달 (GapParser 문자 시간 환산용)
+            - parser_options가 있으면 기본 인자를 덮어씀
+
+        Args:
+            config (PortConfig): 연결 설정 정보 DTO.
+
+        Returns:
+            PacketParser: 생성된 파서 인스턴스.
+        """
+        kwargs: Dict[str, Any] = {
+            "baudrate": config.baudrate,
+            "bytesize": config.bytesize,
+            "parity": config.parity,
+            "stopbits": config.stopbits
+        }
+        kwargs.update(config.parser_options)
+        return ParserFactory.create_parser(config.parser_type or ParserType.RAW, **kwargs)
+
     def close_connection(self, name: Optional[str] = None) -> None:
         """
         포트 연결을 닫습니다. (단일 또는 전체)
@@ -325,18 +359,19 @@ class ConnectionController(QObject):
     # -------------------------------------------------------------------------
     # Data Handling (Send/Receive)
     # -------------------------------------------------------------------------
-    def _handle_data_received(self, name: str, data: bytes) -> None:
+    def _handle_data_received(self, name: str, data: bytes, chunk_marks: Optional[list] = None) -> None:
         """
         데이터 수신 처리 핸들러입니다.
 
         Logic:
             1. Raw 데이터에 대해 PortDataEvent 발행 (로그 및 UI 표시용)
-            2. 등록된 Parser를 통해 데이터 파싱
-            3. 파싱된 패킷마다 PacketEvent 발행
+            2. 등록된 Parser를 통해 데이터 파싱 (청크 도착 시각 포함)
+            3. 파싱된 패킷을 PacketBatchEvent 1개로 묶어 발행
 
         Args:
             name (str): 데이터를 수신한 연결 이름.
             data (bytes): 수신된 바이트 데이터.
+            chunk_marks (Optional[list]): Worker가 기록한 (오프셋, 도착 시각) 리스트.
         """
         # Raw 데이터 이벤트 발행
         self.data_received.emit(PortDataEvent(port=name, data=data))
@@ -344,9 +379,23 @@ class ConnectionController(QObject):
         # 패킷 파싱 및 이벤트 발행
         parser = self.parsers.get(name)
         if parser:
-            packets = parser.parse(data)
-            for packet in packets:
-                self.packet_received.emit(PacketEvent(port=name, packet=packet))
+            packets = parser.parse_chunks(data, chunk_marks)
+            if packets:
+                self.packet_received.emit(PacketBatchEvent(port=name, packets=packets))
+
+    def _handle_line_idle(self, name: str, timestamp: float) -> None:
+        """
+        회선 유휴 통지 핸들러입니다. 보류 중인 마지막 버스트를 확정합니다.
+
+        Args:
+            name (str): 유휴 상태가 된 연결 이름.
+            timestamp (float): 유휴 감지 시각 (I/O Thread 기준).
+        """
+        parser = self.parsers.get(name)
+        if parser:
+            packets = parser.flush_idle(timestamp)
+            if packets:
+                self.packet_received.emit(PacketBatchEvent(port=name, packets=packets))
 
     def send_data(self, port_name: str, data: bytes) -> None:
         """
@@ -11,6 +11,7 @@ BaseTransport 인터페이스를 사용하여 하드웨어 독립적인 I/O 처
 ## WHAT
 * 별도 Thread에서 데이터 송수신 루프 실행
 * Batch 처리로 Signal 발행 빈도 최적화
+* 청크 도착 시각 기록 및 회선 유휴(Idle) 통지 (시간 기반 파서 지원)
 * Thread-safe Queue 기반 비동기 전송
 * 연결 상태 모니터링 및 이벤트 발행
 
@@ -38,7 +39,8 @@ class ConnectionWorker(QThread):
     """
 
     # Signal 정의
-    data_received = pyqtSignal(bytes)
+    data_received = pyqtSignal(bytes, object)  # (배치 데이터, [(오프셋, 도착 시각), ...])
+    line_idle = pyqtSignal(float)              # 유휴 임계값 경과 시각 (I/O Thread 기준)
     error_occurred = pyqtSignal(str)
     connection_opened = pyqtSignal(str)
     connection_closed = pyqtSignal(str)
@@ -58,6 +60,7 @@ class ConnectionWorker(QThread):
 
         self._is_running = False
         self.broadcast_enabled = False
+        self._idle_timeout: Optional[float] = None
 
         self._mutex = QMutex()
         self._write_queue = ThreadSafeQueue() # 비동기 전송용 Queue
@@ -69,6 +72,8 @@ class ConnectionWorker(QThread):
         Logic:
             - Transport 열기 및 연결 확인
             - 수신 데이터 Batch 처리 (크기/시간 기준)
+            - 청크별 도착 시각 기록 (메인 Thread 처리 지연과 무관)
+            - 유휴 임계값 경과 시 배치를 즉시 내보내고 line_idle 발행
             - 전송 Queue 처리 (비동기 Write)
             - CPU 부하 최소화 (Sleep 조절)
             - 에러 발생 시 안전한 종료 처리
@@ -83,7 +88,10 @@ class ConnectionWorker(QThread):
 
                 # Batch 처리용 버퍼 및 타이머
                 batch_buffer = bytearray()
+                chunk_marks = []  # (배치 내 오프셋, 도착 시각)
                 last_emit_time = time.monotonic() * 1000 # ms 단위
+                last_chunk_ts = 0.0
+                idle_pending = False
 
                 while self.is_running():
                     try:
@@ -91,20 +99,35 @@ class ConnectionWorker(QThread):
                         if self.transport.in_waiting > 0:
                             chunk = self.transport.read(DEFAULT_READ_CHUNK_SIZE)
                             if chunk:
+                                last_chunk_ts = time.time()
+                                chunk_marks.append((len(batch_buffer), last_chunk_ts))
                                 batch_buffer.extend(chunk)
+                                idle_pending = True
 
                         # 3. Batch 전송 로직
-                        # 조건: 크기 임계값 초과 OR 시간 초과
+                        # 조건: 크기 임계값 초과 OR 시간 초과 OR 회선 유휴
                         # BATCH_SIZE_THRESHOLD가 상향 조정되어 고속 통신 시 시그널 빈도 감소
                         current_time = time.monotonic() * 1000
                         time_diff = current_time - last_emit_time
 
+                        idle_timeout = self._idle_timeout
+                        idle_now = 0.0
+                        is_idle = False
+                        if idle_pending and idle_timeout is not None:
+                            idle_now = time.time()
+                            is_idle = idle_now - last_chunk_ts >= idle_timeout
+
                         if len(batch_buffer) > 0:
-                            if len(batch_buffer) >= BATCH_SIZE_THRESHOLD or time_diff >= BATCH_TIMEOUT_MS:
-                                self.data_received.emit(bytes(batch_buffer))
+                            if len(batch_buffer) >= BATCH_SIZE_THRESHOLD or time_diff >= BATCH_TIMEOUT_MS or is_idle:
+                                self.data_received.emit(bytes(batch_buffer), chunk_marks)
                                 batch_buffer.clear()
+                                chunk_marks = []
                                 last_emit_time = current_time
 
+                        if is_idle:
+                            self.line_idle.emit(idle_now)
+                            idle_pending = False
+
                         # 4. TX Queue 처리 (비동기 전송)
                         while not self._write_queue.is_empty():
                             data = self._write_queue.dequeue()
@@ -179,6 +202,15 @@ class ConnectionWorker(QThread):
             return self._write_queue.enqueue(data)
         return False
 
+    def set_idle_timeout(self, seconds: Optional[float]) -> None:
+        """
+        회선 유휴 통지 임계값을 설정합니다.
+
+        Args:
+            seconds (Optional[float]): 마지막 수신 후 line_idle을 발행할 시간(초). None이면 비활성
+        """
+        self._idle_timeout = seconds
+
     def get_write_queue_size(self) -> int:
         """
         현재 전송 대기 중인 데이터 큐의 크기(청크 개수)를 반환합니다.
@@ -0,0 +1,248 @@
+"""
+라인 조립기 모듈
+
+배치(청크) 경계와 무관하게 수신 바이트 스트림을 완성된 라인 단위로 조립합니다.
+
+## WHY
+* 배치마다 독립적으로 디코딩하면 경계에 걸친 멀티바이트 문자(UTF-8/CP949 한글)가 깨짐
+* 배치마다 줄바꿈 분할하면 경계에 걸친 한 줄이 두 행으로 나뉨
+* 행 수가 실제 라인 수와 일치해야 Trim/검색이 올바르게 동작
+* 로그 뷰가 라인의 원본 바이트를 보관해야 HEX/인코딩 전환 시 표시 텍스트만 다시 만들 수 있음
+
+## WHAT
+* 완성된 라인의 원본 바이트 반환 (feed_raw, 줄바꿈 포함) 및 텍스트 변환 (decode)
+* 미완성 라인(Partial)은 다음 배치로 이월
+* 미완성 라인 강제 배출 (타임아웃 시 flush, 길이 상한 초과 시 자동)
+* 긴 라인을 행 최대 폭 이하의 여러 행으로 분할 (split_raw, 문자 경계 유지)
+* 텍스트가 필요한 호출자를 위한 feed/flush (원본 바이트 조립 + 디코딩)
+
+## HOW
+* ASCII 호환 인코딩만 허용하므로 줄바꿈 바이트는 멀티바이트 문자 안에 나타나지 않음
+  -> 바이트 단위로 분할해도 라인 경계가 항상 문자 경계
+* 이월된 Partial + 새 데이터를 한 번에 분할하여 경계에 걸친 줄바꿈(CR | LF)도 인식
+* Raw 모드(줄바꿈 None)는 증분 디코더로 끝의 불완전한 멀티바이트 시퀀스만 찾아 이월
+* 행 분할도 같은 방식으로 분할 지점 앞의 불완전한 멀티바이트 시퀀스를 다음 행으로 넘김
+"""
+import codecs
+from typing import List, Optional
+
+from common.constants import DEFAULT_RX_ENCODING, LINE_MAX_PARTIAL_CHARS
+
+
+class LineAssembler:
+    """
+    포트별 스트리밍 라인 조립기 클래스
+
+    포트(로그 뷰)마다 하나씩 사용하며, 메인 스레드에서만 호출됩니다.
+    """
+
+    def __init__(self, encoding: str = DEFAULT_RX_ENCODING, newline: Optional[str] = "\n",
+                 max_partial: int = LINE_MAX_PARTIAL_CHARS) -> None:
+        """
+        LineAssembler 초기화
+
+        Args:
+            encoding: 수신 데이터 인코딩 (예: "utf-8", "cp949")
+            newline: 줄바꿈 문자열 (None이면 Raw 모드)
+            max_partial: 미완성 라인 최대 길이 (바이트, 초과 시 강제 배출)
+
+        Raises:
+            ValueError: 지원하지 않는 인코딩인 경우
+        """
+        self._encoding = self._validate_encoding(encoding)
+        self._decoder = codecs.getincrementaldecoder(self._encoding)(errors="replace")
+        self._newline = newline
+        self._newline_bytes = newline.encode(self._encoding) if newline else b""
+        self._max_partial = max_partial
+        self._partial = b""
+
+    @property
+    def encoding(self) -> str:
+        """현재 인코딩 이름"""
+        return self._encoding
+
+    @property
+    def has_partial(self) -> bool:
+        """이월 중인 미완성 라인이 있는지 여부 (Raw 모드의 불완전한 문자는 제외)"""
+        return bool(self._partial) and bool(self._newline_bytes)
+
+    def set_encoding(self, encoding: str) -> None:
+        """
+        인코딩을 변경합니다. (변경 시 디코더 상태 및 미완성 라인 초기화)
+
+        Args:
+            encoding: 인코딩 이름
+
+        Raises:
+            ValueError: 지원하지 않는 인코딩인 경우
+        """
+        encoding = self._validate_encoding(encoding)
+        if encoding == self._encoding:
+            return
+        self._encoding = encoding
+        self.reset()
+
+    def set_newline(self, newline: Optional[str]) -> None:
+        """
+        줄바꿈 문자열을 변경합니다. (미완성 라인은 유지되어 다음 배치에서 새 기준으로 분할)
+
+        Args:
+            newline: 줄바꿈 문자열 (None이면 Raw 모드)
+        """
+        self._newline = newline
+        self._newline_bytes = newline.encode(self._encoding) if newline else b""
+
+    def feed_raw(self, data: bytes) -> List[bytes]:
+        """
+        수신 바이트를 조립하여 완성된 라인의 원본 바이트를 반환합니다.
+
+        Logic:
+            - Raw 모드: 끝의 불완전한 멀티바이트 시퀀스만 이월하고 나머지를 1개 항목으로 반환
+            - 줄바꿈 모드: Partial + 데이터를 줄바꿈 위치에서 분할 (줄바꿈 포함), 나머지는 Partial로 이월
+            - Partial이 상한을 넘으면 완성 라인으로 강제 배출
+
+        Args:
+            data: 수신 바이트
+
+        Returns:
+            List[bytes]: 완성된 라인의 원본 바이트 리스트 (줄바꿈 포함)
+        """
+        if self._partial:
+            data = self._partial + data
+
+        newline = self._newline_bytes
+        if not newline:
+            self._decoder.decode(data)
+            tail = self._decoder.getstate()[0]
+            self._decoder.reset()
+            if tail:
+                self._partial = data[-len(tail):]
+                data = data[:-len(tail)]
+            else:
+                self._partial = b""
+            return [data] if data else []
+
+        lines = []
+        start = 0
+        pos = data.find(newline)
+        while pos != -1:
+            end = pos + len(newline)
+            lines.append(data[start:end])
+            start = end
+            pos = data.find(newline, start)
+
+        partial = data[start:] if start else data
+        if len(partial) > self._max_partial:
+            lines.append(partial)
+            partial = b""
+        self._partial = partial
+        return lines
+
+    def flush_raw(self) -> List[bytes]:
+        """
+        미완성 라인을 강제로 배출합니다. (타임아웃 또는 마커 삽입 전)
+
+        Raw 모드의 불완전한 문자는 다음 배치에서 완성될 수 있으므로 유지합니다.
+
+        Returns:
+            List[bytes]: 미완성 라인의 원본 바이트 (없으면 빈 리스트)
+        """
+        if not self.has_partial:
+            return []
+        partial = self._partial
+        self._partial = b""
+        return [partial]
+
+    def split_raw(self, raw: bytes, max_bytes: int, exact: bool = False) -> List[bytes]:
+        """
+        라인 원본을 최대 폭 이하의 여러 행으로 분할합니다.
+
+        Logic:
+            - 최대 폭 이하면 그대로 1개 항목으로 반환
+            - 끝의 줄바꿈은 마지막 행에만 붙임 (줄바꿈 자체는 분할하지 않음)
+            - exact가 아니면 분할 지점에 걸친 멀티바이트 문자를 다음 행으로 넘김
+
+        Args:
+            raw: feed_raw/flush_raw가 반환한 원본 바이트
+            max_bytes: 행 최대 폭 (바이트, 줄바꿈 제외)
+            exact: 문자 경계와 무관하게 정확히 max_bytes씩 분할 (HEX 표시)
+
+        Returns:
+            List[bytes]: 분할된 행 원본 리스트
+        """
+        newline = self._newline_bytes
+        if len(raw) <= max_bytes or max_bytes <= 0:
+            return [raw]
+
+        body, tail = raw, b""
+        if newline and raw.endswith(newline):
+            body, tail = raw[:-len(newline)], newline
+
+        rows = []
+        start = 0
+        while len(body) - start > max_bytes:
+            end = start + max_bytes
+            if not exact:
+                self._decoder.decode(body[start:end])
+                carry = len(self._decoder.getstate()[0])
+                self._decoder.reset()
+                if carry < max_bytes:
+                    end -= carry
+            rows.append(body[start:end])
+            start = end
+        rows.append(body[start:] + tail)
+        return rows
+
+    def decode(self, raw: bytes) -> str:
+        """
+        라인의 원본 바이트를 표시 텍스트로 변환합니다. (끝의 줄바꿈 제외)
+
+        Args:
+            raw: feed_raw/flush_raw가 반환한 원본 바이트
+
+        Returns:
+            str: 디코딩된 텍스트 (잘못된 바이트는 대체 문자)
+        """
+        newline = self._newline_bytes
+        if newline and raw.endswith(newline):
+            raw = raw[:-len(newline)]
+        return raw.decode(self._encoding, errors="replace")
+
+    def feed(self, data: bytes) -> List[str]:
+        """
+        수신 바이트를 조립하여 완성된 라인을 텍스트로 반환합니다.
+
+        Args:
+            data: 수신 바이트
+
+        Returns:
+            List[str]: 완성된 라인 리스트 (줄바꿈 문자 제외)
+        """
+        return [self.decode(raw) for raw in self.feed_raw(data)]
+
+    def flush(self) -> List[str]:
+        """
+        미완성 라인을 텍스트로 강제 배출합니다.
+
+        Returns:
+            List[str]: 미완성 라인 (없으면 빈 리스트)
+        """
+        return [self.decode(raw) for raw in self.flush_raw()]
+
+    def reset(self) -> None:
+        """디코더 상태와 미완성 라인을 초기화합니다."""
+        self._decoder = codecs.getincrementaldecoder(self._encoding)(errors="replace")
+        self._newline_bytes = self._newline.encode(self._encoding) if self._newline else b""
+        self._partial = b""
+
+    @staticmethod
+    def _validate_encoding(encoding: str) -> str:
+        try:
+            name = codecs.lookup(encoding).name
+            # 줄바꿈을 바이트 단위로 분할하므로 ASCII 호환 인코딩만 허용 (UTF-16 등 제외)
+            ascii_compatible = "\r\n".encode(name) == b"\r\n"
+        except (LookupError, UnicodeError):
+            ascii_compatible = False
+        if not ascii_compatible:
+            raise ValueError(f"Unsupported encoding: {encoding!r}")
+        return name
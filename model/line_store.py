@@ -0,0 +1,550 @@
+"""
+라인 저장소 모듈
+
+로그 뷰의 행 데이터를 열(Column) 단위 배열에 보관하는 저장소입니다.
+
+## WHY
+* 행마다 Python 객체(str/bytes + 리스트 슬롯)를 두면 라인당 수백 바이트의 오버헤드 발생
+* 리스트 앞부분 삭제(Trim)는 O(n) 이동이라 최대 라인 수를 늘릴수록 비용 증가
+* 최대 라인 수를 수백만 단위로 늘려도 메모리가 페이로드 크기에 가깝게 유지되어야 함
+
+## WHAT
+* 라인 내용은 하나의 bytearray(Arena)에 연속 저장
+* 끝 오프셋(array('Q')), 타임스탬프(array('d')), 플래그(array('B')) 열 배열
+* 앞쪽 행 제거는 기준 인덱스 이동 (Ring 방식), 행 일련번호(first_id) 제공
+
+## HOW
+* 오프셋은 누적 절대값, 행 i의 내용 = arena[offsets[i-1] - origin:offsets[i] - origin]
+* Trim은 _base만 증가, 죽은 앞부분이 살아있는 부분보다 커지면 한 번에 압축 (분할 상환 O(1))
+* 압축은 앞부분 삭제(memmove) + origin 이동만 수행 (오프셋 재계산 루프 없음)
+* 텍스트 행(시스템 메시지/마커)은 UTF-8로 저장하고 플래그로 구분 (로컬 에코 송신 행도 플래그로 구분)
+* 스크롤백 모드(DiskLineStore)는 모든 행을 추가 전용 파일에 기록하고 최근 행 창만 메모리(LineStore)에 유지
+  -> 오래된 행은 고정 길이 인덱스 레코드를 mmap으로 조회 (행 위치 계산 O(1), 메모리 사용량 이력 길이와 무관)
+* 압축 보관 모드(CompressedLineStore)는 오래된 행을 고정 크기 블록으로 봉인하여 QThreadPool에서 zlib 압축
+  -> 화면에 들어온 블록만 압축 해제하여 LRU로 보관
+"""
+import mmap
+import os
+import struct
+import tempfile
+import weakref
+import zlib
+from array import array
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+from PyQt5.QtCore import QRunnable, QThreadPool
+
+from common.constants import SCROLLBACK_RAM_WINDOW_LINES, LOG_BLOCK_LINES, LOG_BLOCK_CACHE_SIZE
+
+# 행 플래그
+LINE_FLAG_TEXT = 0x01    # 내용이 UTF-8 텍스트 (수신 원본 bytes가 아님)
+LINE_FLAG_MARKER = 0x02  # 안내 마커 행 (표시 모드/색상 규칙 미적용)
+LINE_FLAG_TX = 0x04      # 송신 데이터 행 (로컬 에코)
+
+
+class LineStore:
+    """
+    열 배열 기반 로그 라인 저장소 클래스
+
+    메인 스레드(LogModel)에서만 사용합니다.
+    """
+
+    __slots__ = ("_arena", "_origin", "_offsets", "_stamps", "_flags", "_base", "_first_id")
+
+    def __init__(self) -> None:
+        """LineStore 초기화"""
+        self._arena = bytearray()
+        self._origin = 0             # arena[0]의 누적 절대 오프셋 (압축 시 증가)
+        self._offsets = array('Q')   # 행별 끝 오프셋 (누적 절대값)
+        self._stamps = array('d')    # 행별 타임스탬프 (epoch 초, 0.0 = 없음)
+        self._flags = array('B')     # 행별 플래그 (LINE_FLAG_*)
+        self._base = 0               # 첫 번째 살아있는 행의 배열 인덱스
+        self._first_id = 0           # 첫 번째 살아있는 행의 일련번호
+
+    def __len__(self) -> int:
+        return len(self._offsets) - self._base
+
+    @property
+    def first_id(self) -> int:
+        """첫 행의 일련번호 (앞쪽 행 제거 시 증가, 행 위치와 무관한 식별자)"""
+        return self._first_id
+
+    @property
+    def payload_bytes(self) -> int:
+        """살아있는 행 내용의 총 바이트 수"""
+        if len(self) == 0:
+            return 0
+        return self._offsets[-1] - self._start(self._base)
+
+    def extend(self, payloads: Iterable[bytes], stamp: float = 0.0, flags: int = 0) -> int:
+        """
+        여러 행을 같은 타임스탬프/플래그로 추가합니다.
+
+        Args:
+            payloads: 행 내용 리스트
+            stamp: 배치 공통 타임스탬프 (0.0 = 없음)
+            flags: 행 플래그 (LINE_FLAG_*)
+
+        Returns:
+            int: 추가된 행 수
+        """
+        arena = self._arena
+        offsets = self._offsets
+        origin = self._origin
+        count = 0
+        for payload in payloads:
+            arena += payload
+            offsets.append(origin + len(arena))
+            count += 1
+        self._stamps.extend(array('d', (stamp,)) * count)
+        self._flags.extend(array('B', (flags,)) * count)
+        return count
+
+    def get(self, row: int) -> Tuple[bytes, float, int]:
+        """
+        행을 조회합니다.
+
+        Args:
+            row: 행 인덱스 (0 = 첫 살아있는 행)
+
+        Returns:
+            Tuple[bytes, float, int]: (내용, 타임스탬프, 플래그)
+        """
+        index = self._base + row
+        origin = self._origin
+        payload = bytes(self._arena[self._start(index) - origin:self._offsets[index] - origin])
+        return payload, self._stamps[index], self._flags[index]
+
+    def export_front(self, count: int) -> Tuple[int, bytes]:
+        """
+        앞쪽 행을 블록 직렬화 형식으로 내보냅니다. (제거는 drop_front로 별도 수행)
+
+        형식: 끝 오프셋(Q * count) + 타임스탬프(d * count) + 플래그(B * count) + 내용
+
+        Args:
+            count: 내보낼 행 수 (1 이상, 행 수 이하)
+
+        Returns:
+            Tuple[int, bytes]: (첫 행의 시작 오프셋, 직렬화된 블록)
+        """
+        base = self._base
+        end = base + count
+        start = self._start(base)
+        origin = self._origin
+        blob = b"".join((
+            self._offsets[base:end].tobytes(),
+            self._stamps[base:end].tobytes(),
+            self._flags[base:end].tobytes(),
+            self._arena[start - origin:self._offsets[end - 1] - origin],
+        ))
+        return start, blob
+
+    def drop_front(self, count: int) -> None:
+        """
+        앞쪽 행을 제거합니다. (기준 인덱스 이동, 필요 시 압축)
+
+        Args:
+            count: 제거할 행 수
+        """
+        count = min(count, len(self))
+        if count <= 0:
+            return
+        self._base += count
+        self._first_id += count
+
+        # 죽은 앞부분이 살아있는 부분보다 커지면 압축
+        if self._base > len(self):
+            self._compact()
+
+    def clear(self) -> None:
+        """모든 행을 제거합니다. (일련번호는 계속 증가)"""
+        self._first_id += len(self)
+        self._arena = bytearray()
+        self._origin = 0
+        self._offsets = array('Q')
+        self._stamps = array('d')
+        self._flags = array('B')
+        self._base = 0
+
+    def _start(self, index: int) -> int:
+        return self._offsets[index - 1] if index else self._origin
+
+    def _compact(self) -> None:
+        start = self._start(self._base)
+        del self._arena[:start - self._origin]
+        self._origin = start
+        del self._offsets[:self._base]
+        del self._stamps[:self._base]
+        del self._flags[:self._base]
+        self._base = 0
+
+
+# 스크롤백 인덱스 레코드: (끝 오프셋, 타임스탬프, 플래그)
+_INDEX_RECORD = struct.Struct("<QdB")
+
+
+class _ScrollbackFiles:
+    """
+    스크롤백 데이터/인덱스 파일과 mmap 핸들 묶음 (내부용)
+
+    저장소 객체가 정리되지 않고 사라져도 weakref.finalize로 파일을 닫고 삭제합니다.
+    """
+
+    def __init__(self, directory: Optional[str]) -> None:
+        data_fd, self.data_path = tempfile.mkstemp(prefix="scrollback_", suffix=".dat", dir=directory)
+        index_fd, self.index_path = tempfile.mkstemp(prefix="scrollback_", suffix=".idx", dir=directory)
+        self.data = os.fdopen(data_fd, "w+b")
+        self.index = os.fdopen(index_fd, "w+b")
+        self.data_map: Optional[mmap.mmap] = None
+        self.index_map: Optional[mmap.mmap] = None
+
+    def remap(self) -> None:
+        """기록된 내용을 디스크로 내보내고 두 파일을 다시 매핑합니다."""
+        self.unmap()
+        self.data.flush()
+        self.index.flush()
+        if self.index.tell():
+            self.index_map = mmap.mmap(self.index.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data.tell():
+            self.data_map = mmap.mmap(self.data.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def unmap(self) -> None:
+        """매핑을 해제합니다. (파일 자르기/삭제 전 필수)"""
+        for current in (self.data_map, self.index_map):
+            if current is not None:
+                current.close()
+        self.data_map = None
+        self.index_map = None
+
+    def truncate(self) -> None:
+        """두 파일을 비웁니다."""
+        self.unmap()
+        for handle in (self.data, self.index):
+            handle.seek(0)
+            handle.truncate()
+
+    def close(self) -> None:
+        """매핑 해제 후 파일을 닫고 삭제합니다."""
+        self.unmap()
+        for handle, path in ((self.data, self.data_path), (self.index, self.index_path)):
+            handle.close()
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class DiskLineStore:
+    """
+    디스크 기반 라인 저장소 클래스 (스크롤백 모드)
+
+    LineStore와 같은 인터페이스를 제공하며, 메인 스레드(LogModel)에서만 사용합니다.
+    행은 추가 전용 파일에 기록되고 앞쪽 행 제거(drop_front)는 논리적으로만 수행됩니다.
+    """
+
+    def __init__(self, directory: Optional[str] = None, window: int = SCROLLBACK_RAM_WINDOW_LINES) -> None:
+        """
+        DiskLineStore 초기화
+
+        Args:
+            directory: 스크롤백 파일 디렉토리 (None이면 시스템 임시 디렉토리)
+            window: 메모리에 유지할 최근 행 수
+
+        Raises:
+            OSError: 스크롤백 파일을 만들 수 없는 경우
+        """
+        self._files = _ScrollbackFiles(directory)
+        self._finalizer = weakref.finalize(self, self._files.close)
+        self._data_size = 0     # 기록된 총 바이트 수
+        self._count = 0         # 기록된 총 행 수
+        self._base = 0          # 첫 번째 살아있는 행의 절대 인덱스
+        self._id_offset = 0     # clear 이전까지의 누적 행 수 (일련번호 연속성)
+        self._mapped_rows = 0   # 현재 매핑으로 조회 가능한 행 수
+        # 최근 행 메모리 창 (tail.first_id == 창 첫 행의 절대 인덱스)
+        self._tail = LineStore()
+        self._window = max(1, window)
+
+    def __len__(self) -> int:
+        return self._count - self._base
+
+    @property
+    def first_id(self) -> int:
+        """첫 행의 일련번호 (앞쪽 행 제거 시 증가, 행 위치와 무관한 식별자)"""
+        return self._id_offset + self._base
+
+    @property
+    def payload_bytes(self) -> int:
+        """살아있는 행 내용의 총 바이트 수"""
+        if len(self) == 0:
+            return 0
+        return self._data_size - (self._record(self._base - 1)[0] if self._base else 0)
+
+    def extend(self, payloads: Iterable[bytes], stamp: float = 0.0, flags: int = 0) -> int:
+        """
+        여러 행을 같은 타임스탬프/플래그로 파일에 기록하고 메모리 창에 추가합니다.
+
+        Args:
+            payloads: 행 내용 리스트
+            stamp: 배치 공통 타임스탬프 (0.0 = 없음)
+            flags: 행 플래그 (LINE_FLAG_*)
+
+        Returns:
+            int: 추가된 행 수
+        """
+        payloads = list(payloads)
+        if not payloads:
+            return 0
+
+        records = bytearray()
+        end = self._data_size
+        for payload in payloads:
+            end += len(payload)
+            records += _INDEX_RECORD.pack(end, stamp, flags)
+        self._files.data.write(b"".join(payloads))
+        self._files.index.write(records)
+        self._data_size = end
+        self._count += len(payloads)
+
+        # 메모리 창은 2배까지 허용 후 한 번에 줄임 (분할 상환)
+        tail = self._tail
+        tail.extend(payloads, stamp, flags)
+        if len(tail) > self._window * 2:
+            tail.drop_front(len(tail) - self._window)
+        return len(payloads)
+
+    def get(self, row: int) -> Tuple[bytes, float, int]:
+        """
+        행을 조회합니다. (최근 행은 메모리 창, 오래된 행은 mmap 인덱스로 O(1) 조회)
+
+        Args:
+            row: 행 인덱스 (0 = 첫 살아있는 행)
+
+        Returns:
+            Tuple[bytes, float, int]: (내용, 타임스탬프, 플래그)
+        """
+        index = self._base + row
+        tail = self._tail
+        if index >= tail.first_id:
+            return tail.get(index - tail.first_id)
+
+        end, stamp, flags = self._record(index)
+        start = self._record(index - 1)[0] if index else 0
+        data_map = self._files.data_map
+        return (data_map[start:end] if data_map is not None else b""), stamp, flags
+
+    def drop_front(self, count: int) -> None:
+        """
+        앞쪽 행을 제거합니다. (논리적 제거, 파일은 추가 전용)
+
+        Args:
+            count: 제거할 행 수
+        """
+        self._base += max(0, min(count, len(self)))
+
+    def clear(self) -> None:
+        """모든 행을 제거하고 파일을 비웁니다. (일련번호는 계속 증가)"""
+        self._id_offset += self._count
+        self._files.truncate()
+        self._data_size = 0
+        self._count = 0
+        self._base = 0
+        self._mapped_rows = 0
+        self._tail = LineStore()
+
+    def close(self) -> None:
+        """파일을 닫고 삭제합니다. (이후 사용 불가)"""
+        self._finalizer()
+
+    def _record(self, index: int) -> Tuple[int, float, int]:
+        if index >= self._mapped_rows:
+            self._files.remap()
+            self._mapped_rows = self._count
+        return _INDEX_RECORD.unpack_from(self._files.index_map, index * _INDEX_RECORD.size)
+
+
+class _SealedBlock:
+    """
+    봉인된 행 블록 (내부용)
+
+    압축 전에는 raw, 압축 후에는 compressed만 보관합니다.
+    압축 작업은 compressed를 먼저 설정한 뒤 raw를 비우므로 메인 스레드는 항상 둘 중 하나를 읽을 수 있습니다.
+    """
+
+    __slots__ = ("block_id", "count", "origin", "raw", "compressed", "__weakref__")
+
+    def __init__(self, block_id: int, count: int, origin: int, raw: bytes) -> None:
+        self.block_id = block_id
+        self.count = count
+        self.origin = origin
+        self.raw: Optional[bytes] = raw
+        self.compressed: Optional[bytes] = None
+
+
+class _BlockCompressTask(QRunnable):
+    """
+    블록 압축 작업 (QThreadPool에서 실행, zlib은 GIL을 해제하므로 메인 스레드와 병렬 수행)
+    """
+
+    def __init__(self, block: _SealedBlock) -> None:
+        super().__init__()
+        self._block = weakref.ref(block)
+
+    def run(self) -> None:
+        block = self._block()
+        if block is None or block.raw is None:
+            return
+        block.compressed = zlib.compress(block.raw)
+        block.raw = None
+
+
+class CompressedLineStore:
+    """
+    압축 블록 기반 라인 저장소 클래스 (메모리 전용 장기 이력)
+
+    LineStore와 같은 인터페이스를 제공하며, 메인 스레드(LogModel)에서만 사용합니다.
+    최근 행은 일반 LineStore에 두고, 그 앞의 행은 block_lines 단위로 봉인하여 백그라운드에서 압축합니다.
+    """
+
+    def __init__(self, block_lines: int = LOG_BLOCK_LINES, cache_blocks: int = LOG_BLOCK_CACHE_SIZE) -> None:
+        """
+        CompressedLineStore 초기화
+
+        Args:
+            block_lines: 블록당 행 수 (최근 행도 최소 이만큼은 압축하지 않고 유지)
+            cache_blocks: 압축 해제된 블록 캐시 최대 항목 수
+        """
+        self._block_lines = max(1, block_lines)
+        self._blocks: list = []        # 봉인된 블록 (오래된 순)
+        self._blocks_start = 0         # 첫 블록 첫 행의 절대 인덱스
+        self._base = 0                 # 첫 번째 살아있는 행의 절대 인덱스
+        self._id_offset = 0            # clear 이전까지의 누적 행 수 (일련번호 연속성)
+        self._next_block_id = 0
+        # 봉인되지 않은 최근 행 (tail.first_id == 첫 행의 절대 인덱스)
+        self._tail = LineStore()
+        # 압축 해제 블록 캐시: 블록 ID -> (끝 오프셋, 타임스탬프, 플래그, 내용)
+        self._decoded: "OrderedDict[int, tuple]" = OrderedDict()
+        self._cache_blocks = max(1, cache_blocks)
+
+    def __len__(self) -> int:
+        return self._tail.first_id + len(self._tail) - self._base
+
+    @property
+    def first_id(self) -> int:
+        """첫 행의 일련번호 (앞쪽 행 제거 시 증가, 행 위치와 무관한 식별자)"""
+        return self._id_offset + self._base
+
+    @property
+    def block_lines(self) -> int:
+        """블록당 행 수"""
+        return self._block_lines
+
+    @property
+    def compressed_bytes(self) -> int:
+        """봉인된 블록이 차지하는 바이트 수 (압축 완료 전 블록은 원본 크기)"""
+        return sum(len(block.compressed if block.raw is None else block.raw) for block in self._blocks)
+
+    def extend(self, payloads: Iterable[bytes], stamp: float = 0.0, flags: int = 0) -> int:
+        """
+        여러 행을 같은 타임스탬프/플래그로 추가하고, 쌓인 앞쪽 행은 블록으로 봉인합니다.
+
+        Args:
+            payloads: 행 내용 리스트
+            stamp: 배치 공통 타임스탬프 (0.0 = 없음)
+            flags: 행 플래그 (LINE_FLAG_*)
+
+        Returns:
+            int: 추가된 행 수
+        """
+        count = self._tail.extend(payloads, stamp, flags)
+        while len(self._tail) >= self._block_lines * 2:
+            self._seal()
+        return count
+
+    def get(self, row: int) -> Tuple[bytes, float, int]:
+        """
+        행을 조회합니다. (봉인된 행은 블록 단위로 압축 해제 후 캐시)
+
+        Args:
+            row: 행 인덱스 (0 = 첫 살아있는 행)
+
+        Returns:
+            Tuple[bytes, float, int]: (내용, 타임스탬프, 플래그)
+        """
+        index = self._base + row
+        tail = self._tail
+        if index >= tail.first_id:
+            return tail.get(index - tail.first_id)
+
+        position, offset = divmod(index - self._blocks_start, self._block_lines)
+        block = self._blocks[position]
+        offsets, stamps, flags, content = self._decode(block)
+        start = offsets[offset - 1] - block.origin if offset else 0
+        return content[start:offsets[offset] - block.origin], stamps[offset], flags[offset]
+
+    def drop_front(self, count: int) -> None:
+        """
+        앞쪽 행을 제거합니다. (전부 제거된 블록은 해제)
+
+        Args:
+            count: 제거할 행 수
+        """
+        self._base += max(0, min(count, len(self)))
+        while self._blocks and self._blocks_start + self._block_lines <= self._base:
+            block = self._blocks.pop(0)
+            self._decoded.pop(block.block_id, None)
+            self._blocks_start += self._block_lines
+        tail = self._tail
+        if self._base > tail.first_id:
+            tail.drop_front(self._base - tail.first_id)
+
+    def clear(self) -> None:
+        """모든 행을 제거합니다. (일련번호는 계속 증가)"""
+        self._id_offset += self._tail.first_id + len(self._tail)
+        self._blocks = []
+        self._blocks_start = 0
+        self._base = 0
+        self._tail = LineStore()
+        self._decoded.clear()
+
+    def _seal(self) -> None:
+        """가장 오래된 block_lines 행을 블록으로 봉인하고 압축 작업을 예약합니다."""
+        tail = self._tail
+        origin, raw = tail.export_front(self._block_lines)
+        block = _SealedBlock(self._next_block_id, self._block_lines, origin, raw)
+        self._next_block_id += 1
+        if not self._blocks:
+            self._blocks_start = tail.first_id
+        self._blocks.append(block)
+        tail.drop_front(self._block_lines)
+        QThreadPool.globalInstance().start(_BlockCompressTask(block))
+
+    def _decode(self, block: _SealedBlock) -> tuple:
+        """
+        블록을 (끝 오프셋, 타임스탬프, 플래그, 내용)으로 해석합니다. (LRU 캐시)
+
+        Args:
+            block: 봉인된 블록
+
+        Returns:
+            tuple: (array('Q'), array('d'), array('B'), bytes)
+        """
+        entry = self._decoded.get(block.block_id)
+        if entry is not None:
+            self._decoded.move_to_end(block.block_id)
+            return entry
+
+        raw = block.raw
+        if raw is None:
+            raw = zlib.decompress(block.compressed)
+        count = block.count
+        offsets = array('Q')
+        offsets.frombytes(raw[:8 * count])
+        stamps = array('d')
+        stamps.frombytes(raw[8 * count:16 * count])
+        flags = array('B')
+        flags.frombytes(raw[16 * count:17 * count])
+        entry = self._decoded[block.block_id] = (offsets, stamps, flags, raw[17 * count:])
+        if len(self._decoded) > self._cache_blocks:
+            self._decoded.popitem(last=False)
+        return entry
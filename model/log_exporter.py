@@ -0,0 +1,312 @@
+"""
+로그 내보내기 모듈
+
+데이터 로그/패킷 뷰의 행을 파일로 스트리밍 저장합니다.
+
+## WHY
+* 전체 로그를 하나의 문자열로 만들어 저장하면 대량 이력에서 UI 프리징 및 메모리 2배 사용
+* 행 저장소는 메인 스레드 전용이므로 백그라운드 스레드에서 직접 읽을 수 없음
+* 텍스트 외에 HEX 덤프, 표 계산용 CSV(시각, 방향, 데이터, 반복 횟수, 마지막 수신 시각) 형식 필요
+* 반복 접기로 합쳐진 행은 반복 횟수/마지막 시각을 함께 기록해야 원본 수신 이력을 잃지 않음
+
+## WHAT
+* 메인 스레드에서 행을 청크 단위로 꺼내는 작업 (LogExportJob, UI 틱 구동)
+* 청크를 형식에 맞게 변환하여 파일에 쓰는 작업 (LogExportTask, QRunnable)
+* 진행률 보고 및 취소 (취소 시 미완성 파일 삭제)
+
+## HOW
+* 내보내기 시작 시점의 행 일련번호 범위 [first_id, first_id + rowCount)를 고정
+  -> 이후 추가된 행은 제외, 내보내기 중 Trim된 행은 건너뜀
+* 원본 모델은 first_id, rowCount(), export_rows(start_id, count)를 제공 (LogModel, PacketModel)
+* 메인 스레드는 UI 틱(ui_scheduler)마다 프레임 예산 안에서 원본 참조만 담은 청크를 크기 제한 큐에 넣고,
+  문자열 변환과 파일 쓰기는 작업 스레드에서 수행
+* 큐가 가득 차서 넣지 못한 청크는 보관했다가 다음 틱에 전달만 재시도 (같은 행을 다시 읽지 않음)
+"""
+import csv
+import io
+import os
+import queue
+import time
+from typing import Any, List, Optional, Sequence, Tuple
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from common.constants import (
+    DEFAULT_RX_ENCODING, EXPORT_CHUNK_ROWS, EXPORT_QUEUE_CHUNKS, UI_FLUSH_BUDGET_MS
+)
+from common.enums import ExportFormat
+from core.logger import logger
+from core.ui_scheduler import ui_scheduler
+
+# 내보내기 행: (타임스탬프(epoch 초, 0.0 = 없음), 방향/종류, 내용 bytes, 텍스트 행 여부(UTF-8),
+#              반복 정보((반복 횟수, 마지막 수신 시각), 접히지 않은 행은 None))
+ExportRow = Tuple[float, str, bytes, bool, Optional[Tuple[int, float]]]
+
+# CSV 머리글
+_CSV_HEADER = "timestamp,direction,data,count,last_seen\n"
+
+# HEX 덤프 한 줄당 바이트 수
+_HEX_DUMP_WIDTH = 16
+
+# HEX 덤프 ASCII 열 변환 테이블 (출력 불가 문자는 '.')
+_ASCII_TABLE = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+
+# 청크 큐 종료 표시
+_END_OF_ROWS = None
+
+
+def _format_time(stamp: float, with_date: bool = False) -> str:
+    """타임스탬프를 밀리초 포함 문자열로 변환합니다. (0.0이면 빈 문자열)"""
+    if not stamp:
+        return ""
+    base = time.strftime("%Y-%m-%d %H:%M:%S" if with_date else "%H:%M:%S", time.localtime(stamp))
+    return f"{base}.{int(stamp * 1000) % 1000:03d}"
+
+
+def _repeat_suffix(repeat: Optional[Tuple[int, float]]) -> str:
+    """반복 정보를 로그 뷰와 같은 "  (×N, HH:MM:SS)" 접미사로 변환합니다. (None이면 빈 문자열)"""
+    if repeat is None:
+        return ""
+    count, last_seen = repeat
+    return f"  (×{count}, {time.strftime('%H:%M:%S', time.localtime(last_seen))})"
+
+
+def format_rows(rows: Sequence[ExportRow], export_format: ExportFormat,
+                encoding: str = DEFAULT_RX_ENCODING) -> str:
+    """
+    내보내기 행을 형식에 맞는 텍스트로 변환합니다.
+
+    Logic:
+        - TEXT: "[시각] 내용" (시각이 없으면 내용만)
+        - HEX: 행 머리글("시각 방향 (N bytes)") + 16바이트 단위 오프셋/HEX/ASCII 줄
+        - CSV: timestamp, direction, data, count, last_seen (CSV 따옴표 처리)
+        - 반복 접힌 행: TEXT/HEX는 "  (×N, HH:MM:SS)" 접미사, CSV는 count/last_seen 열
+
+    Args:
+        rows: 내보내기 행 리스트
+        export_format: 내보내기 형식
+        encoding: 텍스트 행이 아닌 내용의 디코딩 인코딩
+
+    Returns:
+        str: 변환된 텍스트 (줄바꿈 포함)
+    """
+    def decode(payload: bytes, is_text: bool) -> str:
+        text = payload.decode("utf-8" if is_text else encoding, errors="replace")
+        return text.rstrip("\r\n")
+
+    if export_format == ExportFormat.CSV:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerows((_format_time(stamp, with_date=True), direction, decode(payload, is_text),
+                          repeat[0] if repeat else 1,
+                          _format_time(repeat[1], with_date=True) if repeat else "")
+                         for stamp, direction, payload, is_text, repeat in rows)
+        return buffer.getvalue()
+
+    lines: List[str] = []
+    if export_format == ExportFormat.HEX:
+        for stamp, direction, payload, is_text, repeat in rows:
+            header = " ".join(part for part in (_format_time(stamp), direction) if part)
+            lines.append(f"{header} ({len(payload)} bytes){_repeat_suffix(repeat)}".lstrip())
+            for offset in range(0, len(payload), _HEX_DUMP_WIDTH):
+                chunk = payload[offset:offset + _HEX_DUMP_WIDTH]
+                lines.append(f"{offset:04X}  {chunk.hex(' ').upper():<{_HEX_DUMP_WIDTH * 3 - 1}}  "
+                             f"{chunk.translate(_ASCII_TABLE).decode('ascii')}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    for stamp, direction, payload, is_text, repeat in rows:
+        text = decode(payload, is_text) + _repeat_suffix(repeat)
+        lines.append(f"[{_format_time(stamp)}] {text}" if stamp else text)
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+class LogExportSignals(QObject):
+    """
+    내보내기 작업 시그널 정의 클래스
+
+    QRunnable은 QObject가 아니므로 시그널을 직접 가질 수 없어 별도 클래스로 분리합니다.
+    """
+    progress_updated = pyqtSignal(int, int)  # (기록한 행 수, 전체 행 수)
+    export_completed = pyqtSignal(str, int)  # (파일 경로, 기록한 행 수)
+    export_cancelled = pyqtSignal(str)       # 파일 경로
+    error_occurred = pyqtSignal(str)         # 오류 메시지
+
+
+class LogExportTask(QRunnable):
+    """
+    내보내기 파일 쓰기 작업 (QThreadPool에서 실행)
+
+    feed/finish/cancel은 메인 스레드에서, run은 작업 스레드에서 호출합니다.
+    """
+
+    def __init__(self, file_path: str, export_format: ExportFormat, total_rows: int,
+                 encoding: str = DEFAULT_RX_ENCODING, max_chunks: int = EXPORT_QUEUE_CHUNKS) -> None:
+        """
+        LogExportTask 초기화
+
+        Args:
+            file_path: 저장할 파일 경로
+            export_format: 내보내기 형식
+            total_rows: 전체 행 수 (진행률 계산용)
+            encoding: 원본 내용 디코딩 인코딩
+            max_chunks: 대기 청크 최대 개수 (메모리 사용량 제한)
+        """
+        super().__init__()
+        self.signals = LogExportSignals()
+        self._file_path = file_path
+        self._format = export_format
+        self._total_rows = total_rows
+        self._encoding = encoding
+        self._chunks: "queue.Queue[Optional[List[ExportRow]]]" = queue.Queue(maxsize=max_chunks)
+        self._cancelled = False
+
+    @property
+    def file_path(self) -> str:
+        """저장할 파일 경로"""
+        return self._file_path
+
+    def feed(self, rows: List[ExportRow]) -> bool:
+        """
+        행 청크를 쓰기 대기열에 넣습니다. (메인 스레드, 대기하지 않음)
+
+        Args:
+            rows: 내보내기 행 리스트
+
+        Returns:
+            bool: 넣었으면 True, 대기열이 가득 찼으면 False (다음 틱에 재시도)
+        """
+        try:
+            self._chunks.put_nowait(rows)
+        except queue.Full:
+            return False
+        return True
+
+    def finish(self) -> bool:
+        """
+        더 이상 행이 없음을 알립니다. (메인 스레드)
+
+        Returns:
+            bool: 알렸으면 True, 대기열이 가득 찼으면 False (다음 틱에 재시도)
+        """
+        return self.feed(_END_OF_ROWS)
+
+    def cancel(self) -> None:
+        """내보내기를 취소합니다. (다음 청크 경계에서 중단, 미완성 파일 삭제)"""
+        self._cancelled = True
+        try:
+            self._chunks.put_nowait(_END_OF_ROWS)
+        except queue.Full:
+            pass  # 작업 스레드가 다음 청크에서 취소 플래그 확인
+
+    def run(self) -> None:
+        """청크를 변환하여 파일에 기록합니다."""
+        written = 0
+        try:
+            with open(self._file_path, "w", encoding="utf-8", newline="") as f:
+                if self._format == ExportFormat.CSV:
+                    f.write(_CSV_HEADER)
+                while not self._cancelled:
+                    rows = self._chunks.get()
+                    if rows is _END_OF_ROWS or self._cancelled:
+                        break
+                    f.write(format_rows(rows, self._format, self._encoding))
+                    written += len(rows)
+                    self.signals.progress_updated.emit(written, self._total_rows)
+        except OSError as e:
+            logger.error(f"Log export failed: {e}")
+            self.signals.error_occurred.emit(str(e))
+            return
+
+        if self._cancelled:
+            try:
+                os.remove(self._file_path)
+            except OSError:
+                pass
+            self.signals.export_cancelled.emit(self._file_path)
+            return
+        self.signals.export_completed.emit(self._file_path, written)
+
+
+class LogExportJob(QObject):
+    """
+    내보내기 작업 관리 클래스 (메인 스레드)
+
+    UI 틱마다 원본 모델에서 행 청크를 꺼내 LogExportTask에 전달합니다.
+    원본 모델은 first_id, rowCount(), export_rows(start_id, count)를 제공해야 합니다.
+    """
+
+    def __init__(self, model: Any, file_path: str, export_format: ExportFormat,
+                 encoding: str = DEFAULT_RX_ENCODING, chunk_rows: int = EXPORT_CHUNK_ROWS,
+                 parent: Optional[QObject] = None) -> None:
+        """
+        LogExportJob 초기화
+
+        Args:
+            model: 원본 모델 (LogModel, PacketModel)
+            file_path: 저장할 파일 경로
+            export_format: 내보내기 형식
+            encoding: 원본 내용 디코딩 인코딩
+            chunk_rows: 청크당 꺼낼 행 수
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        self._model = model
+        self._chunk_rows = max(1, chunk_rows)
+        # 시작 시점의 행 범위 고정
+        self._next_id = model.first_id
+        self._end_id = self._next_id + model.rowCount()
+        # 대기열이 가득 차서 아직 전달하지 못한 청크 (다음 틱에 전달만 재시도)
+        self._unsent: Optional[List[ExportRow]] = None
+        self._active = False
+        # 초기화/저장소 교체 시 행 일련번호가 다시 매겨지므로 그때까지 보낸 행으로 마무리
+        model.modelReset.connect(self._on_model_reset)
+
+        self.task = LogExportTask(file_path, export_format, self._end_id - self._next_id, encoding)
+        self.signals = self.task.signals
+
+    def start(self) -> None:
+        """파일 쓰기 작업과 행 공급을 시작합니다."""
+        QThreadPool.globalInstance().start(self.task)
+        self._active = True
+        ui_scheduler.request(self._pump)
+
+    def cancel(self) -> None:
+        """내보내기를 취소합니다."""
+        self._active = False
+        self._unsent = None
+        ui_scheduler.cancel(self._pump)
+        self.task.cancel()
+
+    def _on_model_reset(self) -> None:
+        self._end_id = self._next_id
+
+    def _pump(self) -> None:
+        """
+        행 청크를 작업에 전달합니다. (UI 틱 콜백)
+
+        Logic:
+            - 프레임 예산 안에서 대기열이 찰 때까지 청크를 꺼내 전달
+            - 대기열이 가득 차면 꺼낸 청크를 보관하고 다음 틱에 전달만 재시도
+            - 모든 행을 전달하면 종료 표시를 넣고 공급 중단
+        """
+        if not self._active:
+            return
+        deadline = time.perf_counter() + UI_FLUSH_BUDGET_MS / 1000
+        while time.perf_counter() < deadline:
+            if self._unsent is None:
+                if self._next_id >= self._end_id:
+                    if self.task.finish():
+                        self._active = False
+                        return
+                    break
+                # 내보내기 중 Trim된 행은 건너뜀
+                self._next_id = max(self._next_id, self._model.first_id)
+                count = min(self._chunk_rows, self._end_id - self._next_id)
+                if count <= 0:
+                    continue
+                self._unsent = self._model.export_rows(self._next_id, count)
+                self._next_id += count
+            if not self.task.feed(self._unsent):
+                break
+            self._unsent = None
+        ui_scheduler.request(self._pump)
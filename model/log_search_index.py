@@ -0,0 +1,467 @@
+"""
+로그 검색 인덱스 모듈
+
+로그 뷰의 행 내용을 검색용 블록으로 누적하고, 검색 질의를 백그라운드에서 처리합니다.
+
+## WHY
+* 행마다 표시 텍스트를 만들어 정규식을 적용하는 메인 스레드 순회는 대량 이력에서 UI 프리징 유발
+* 검색 버튼을 누를 때마다 전체 이력을 처음부터 다시 순회
+* 전체 일치 수와 일치 위치 분포(스크롤바 미니맵)는 전체 이력을 봐야 알 수 있음
+
+## WHAT
+* 행이 추가될 때마다 증분 갱신되는 검색 인덱스 (LogSearchIndex)
+* 전체 일치 행 일련번호 + 일치 밀도 미니맵을 만드는 검색 작업 (LogSearchTask, QRunnable)
+  (필터 모드용 점진 결과 전달 및 중단 지원)
+* 새로 추가된 행을 메인 스레드에서 바로 판정하는 행 판정기 (compile_matcher, match_payload)
+
+## HOW
+* 블록 = 행 내용(끝의 줄바꿈 제외)을 구분자(\\n)로 이어붙인 bytes + 행 시작 오프셋 배열
+  -> 블록 전체를 bytes.find 또는 bytes 정규식(대소문자 무시)으로 C 수준 탐색 후 bisect로 행 매핑
+* 정규식 메타 문자가 없는 검색어는 블록을 소문자로 변환한 뒤 bytes.find (대소문자 무시 정규식보다 수십 배 빠름)
+* 행별 트라이그램 추출은 Python 루프 비용이 탐색 비용보다 커서 사용하지 않음 (블록 단위 연속 탐색)
+* 검색어를 현재 인코딩으로 변환하여 원본 바이트에서 탐색 (인코딩 전환 시 인덱스 재구성 불필요)
+  HEX 모드는 검색어를 바이트열("0D 0A")로 해석
+* 메인 스레드는 추가된 행 참조를 대기열에 넣고, 블록 1개 분량이 쌓이면 바로 블록으로 구성
+  -> 행별 bytes 객체는 최대 블록 1개 분량만 보관 (검색하지 않는 세션/스크롤백 모드에서도 행 수에 비례한 객체 없음)
+  (잠금은 대기열 인계와 블록 목록 교체에만 사용, 블록 구성과 탐색은 잠금 밖에서 수행)
+* 대기열은 제거(Trim)된 행을 즉시 버리고 용량 상한을 넘으면 오래된 행부터 제외
+  -> 검색하지 않는 세션에서도 저장소보다 많은 행을 붙잡지 않음
+  -> 제외된 구간은 검색 결과의 indexed_first_id/truncated로 보고하여 화면에 일부 검색임을 표시
+"""
+import re
+import threading
+from array import array
+from bisect import bisect_right
+from typing import Callable, List, Optional, Tuple
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from common.constants import SEARCH_INDEX_BLOCK_LINES, SEARCH_INDEX_MAX_BYTES, SEARCH_MINIMAP_BINS
+from common.dtos import LogSearchResult
+
+# 블록 내 행 구분자 (행 끝의 줄바꿈은 제거 후 연결)
+_ROW_SEPARATOR = b"\n"
+
+# 정규식 메타 문자가 없는 검색어 판별 (리터럴 고속 경로)
+_REGEX_META_RE = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+# 탐색 방식
+_MATCH_EXACT = 0    # 원본 바이트 그대로 bytes.find (HEX)
+_MATCH_LITERAL = 1  # 소문자 변환 블록에서 bytes.find (대소문자 무시)
+_MATCH_REGEX = 2    # bytes 정규식 (대소문자 무시)
+
+
+class _SearchBlock:
+    """
+    검색 블록 (내부용, 생성 후 불변)
+    """
+
+    __slots__ = ("first_id", "text", "starts")
+
+    def __init__(self, first_id: int, text: bytes, starts: array) -> None:
+        self.first_id = first_id
+        self.text = text
+        self.starts = starts
+
+    @property
+    def count(self) -> int:
+        return len(self.starts)
+
+
+class LogSearchIndex:
+    """
+    증분 로그 검색 인덱스 클래스
+
+    append/drop_front/reset은 메인 스레드(LogModel)에서, search는 검색 작업 스레드에서 호출합니다.
+    행 일련번호는 LogModel 저장소의 first_id + 행 인덱스와 같습니다.
+    """
+
+    def __init__(self, block_lines: int = SEARCH_INDEX_BLOCK_LINES,
+                 max_bytes: int = SEARCH_INDEX_MAX_BYTES) -> None:
+        """
+        LogSearchIndex 초기화
+
+        Args:
+            block_lines: 블록당 최대 행 수
+            max_bytes: 인덱스에 보관할 최대 내용 바이트 수 (초과 시 오래된 블록부터 제외)
+        """
+        self._block_lines = max(1, block_lines)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # 블록 구성 직렬화 (메인 스레드와 검색 작업이 동시에 대기열을 구성하지 않도록)
+        self._fold_lock = threading.Lock()
+
+        # 메인 스레드 측 상태 (잠금 안에서 갱신)
+        self._pending: List[bytes] = []  # 아직 블록으로 구성하지 않은 행
+        self._pending_id = 0             # 대기열 첫 행의 일련번호
+        self._pending_bytes = 0          # 대기열 내용 바이트 수
+        self._first_id = 0               # 살아있는 첫 행의 일련번호
+        self._generation = 0             # 행 추가/삭제/초기화 횟수 (결과 최신 여부 판별)
+        self._epoch = 0                  # 초기화 횟수 (잠금 밖에서 구성한 블록의 유효성 판별)
+
+        # 검색 작업 측 상태 (잠금 안에서 교체)
+        self._blocks: List[_SearchBlock] = []
+        self._indexed_bytes = 0
+
+    @property
+    def generation(self) -> int:
+        """행 추가/삭제/초기화 시 증가하는 세대 번호"""
+        return self._generation
+
+    def append(self, payloads: List[bytes]) -> None:
+        """
+        추가된 행을 대기열에 넣습니다. (메인 스레드)
+
+        Logic:
+            - 대기열이 블록 1개 분량(block_lines)에 이르면 바로 블록으로 구성 (행별 객체를 오래 보관하지 않음)
+
+        Args:
+            payloads: 행 내용 리스트 (저장소에 추가된 순서)
+        """
+        with self._lock:
+            self._pending.extend(payloads)
+            self._pending_bytes += sum(map(len, payloads))
+            self._generation += 1
+            if self._pending_bytes > self._max_bytes:
+                self._drop_pending_bytes(self._pending_bytes - self._max_bytes)
+            full = len(self._pending) >= self._block_lines
+        if full:
+            self._fold_pending()
+
+    def drop_front(self, count: int) -> None:
+        """
+        앞쪽 행 제거를 기록합니다. (메인 스레드, 블록 정리는 다음 검색 시 수행)
+
+        Args:
+            count: 제거된 행 수
+        """
+        with self._lock:
+            self._first_id += count
+            self._generation += 1
+            # 아직 블록으로 구성하지 않은 제거 행은 바로 해제
+            stale = min(self._first_id - self._pending_id, len(self._pending))
+            if stale > 0:
+                self._pending_bytes -= sum(map(len, self._pending[:stale]))
+                del self._pending[:stale]
+                self._pending_id += stale
+
+    def _drop_pending_bytes(self, excess: int) -> None:
+        """대기열 앞쪽 행을 excess 바이트 이상 제외합니다. (잠금 안, 용량 상한 초과 시)"""
+        drop = 0
+        freed = 0
+        pending = self._pending
+        while freed < excess and drop < len(pending):
+            freed += len(pending[drop])
+            drop += 1
+        del pending[:drop]
+        self._pending_bytes -= freed
+        self._pending_id += drop
+
+    def reset(self, first_id: int = 0) -> None:
+        """
+        인덱스를 비웁니다. (저장소 초기화/교체 시)
+
+        Args:
+            first_id: 이후 추가될 첫 행의 일련번호
+        """
+        with self._lock:
+            self._pending = []
+            self._pending_id = first_id
+            self._pending_bytes = 0
+            self._first_id = first_id
+            self._blocks = []
+            self._indexed_bytes = 0
+            self._generation += 1
+            self._epoch += 1
+
+    def search(self, text: str, encoding: str, hex_mode: bool = False,
+               bins: int = SEARCH_MINIMAP_BINS, limit_id: Optional[int] = None,
+               progress: Optional[Callable[[array], bool]] = None) -> LogSearchResult:
+        """
+        검색어와 일치하는 모든 행을 찾습니다. (검색 작업 스레드)
+
+        Logic:
+            - 대기열의 행을 블록으로 구성하고 제거된 행의 블록 정리 (잠금 안)
+            - 블록 스냅샷을 잠금 밖에서 탐색, 일치 위치를 행 일련번호로 변환 (행당 1회)
+            - 블록마다 일치 행을 progress로 전달 (False를 반환하면 중단)
+            - 살아있는 행 범위를 bins 구간으로 나눈 일치 밀도 계산
+            - 용량 상한으로 인덱스에서 제외된 오래된 행은 indexed_first_id로 보고 (결과의 truncated)
+
+        Args:
+            text: 검색어 (정규식, 유효하지 않으면 일반 문자열)
+            encoding: 원본 바이트 인코딩 (검색어 변환용)
+            hex_mode: True면 검색어를 HEX 바이트열로 해석
+            bins: 미니맵 구간 수
+            limit_id: 이 일련번호 이상의 행은 제외 (None이면 제한 없음)
+            progress: 블록별 일치 행 일련번호를 받는 콜백 (검색 작업 스레드에서 호출)
+
+        Returns:
+            LogSearchResult: 일치 행 일련번호(오름차순)와 밀도 미니맵
+        """
+        self._fold_pending()
+        with self._lock:
+            generation = self._generation
+            first_id = self._first_id
+            end_id = self._pending_id if limit_id is None else min(limit_id, self._pending_id)
+            blocks = list(self._blocks)
+            indexed_first_id = max(first_id, blocks[0].first_id) if blocks else self._pending_id
+
+        ids = array('Q')
+        matcher = compile_matcher(text, encoding, hex_mode)
+        if matcher is not None:
+            for block in blocks:
+                if block.first_id >= end_id:
+                    break
+                found = array('Q')
+                self._scan_block(block, matcher, first_id, end_id, found)
+                ids.extend(found)
+                if progress is not None and found and not progress(found):
+                    break
+
+        return LogSearchResult(
+            query=(text, encoding, hex_mode),
+            generation=generation,
+            ids=ids,
+            first_id=first_id,
+            density=self._density(ids, first_id, end_id, bins),
+            indexed_first_id=indexed_first_id,
+        )
+
+    def _fold_pending(self) -> None:
+        """
+        대기열의 행을 블록으로 구성하고, 제거된 행만 담은 블록과 용량 초과 블록을 정리합니다. (메인/검색 작업 스레드)
+
+        Logic:
+            - 대기열 인계만 잠금 안에서 수행하고 블록 구성은 잠금 밖에서 수행 (메인 스레드 append 지연 없음)
+            - 마지막 블록이 대기열 첫 행과 이어지고 여유가 있으면 이어붙인 새 블록으로 교체 (기존 블록 객체는 불변)
+            - 구성 중 초기화되었으면 결과 폐기
+        """
+        with self._fold_lock:
+            with self._lock:
+                pending = self._pending
+                next_id = self._pending_id
+                epoch = self._epoch
+                tail = self._blocks[-1] if self._blocks else None
+                self._pending = []
+                self._pending_id += len(pending)
+                self._pending_bytes = 0
+
+            built = []
+            if tail is not None and (tail.first_id + tail.count != next_id or tail.count >= self._block_lines):
+                tail = None
+            if pending and tail is not None:
+                room = self._block_lines - tail.count
+                built.append(self._build_block(tail.first_id, pending[:room], tail))
+                next_id += room
+                pending = pending[room:]
+            for start in range(0, len(pending), self._block_lines):
+                built.append(self._build_block(next_id + start, pending[start:start + self._block_lines]))
+
+            with self._lock:
+                if epoch != self._epoch:
+                    return
+                blocks = self._blocks
+                if built and tail is not None:
+                    blocks.pop()
+                    self._indexed_bytes -= len(tail.text)
+                for block in built:
+                    blocks.append(block)
+                    self._indexed_bytes += len(block.text)
+
+                drop = 0
+                while drop < len(blocks) and (
+                        blocks[drop].first_id + blocks[drop].count <= self._first_id
+                        or self._indexed_bytes > self._max_bytes and drop < len(blocks) - 1):
+                    self._indexed_bytes -= len(blocks[drop].text)
+                    drop += 1
+                if drop:
+                    del blocks[:drop]
+
+    @staticmethod
+    def _build_block(first_id: int, payloads: List[bytes],
+                     previous: Optional[_SearchBlock] = None) -> _SearchBlock:
+        """행 내용으로 검색 블록을 만듭니다. (previous가 있으면 그 뒤에 이어붙인 새 블록)"""
+        rows = [payload.rstrip(b"\r\n") for payload in payloads]
+        if previous is not None:
+            starts = array('I', previous.starts)
+            position = len(previous.text) + len(_ROW_SEPARATOR)
+            text = previous.text + _ROW_SEPARATOR + _ROW_SEPARATOR.join(rows)
+        else:
+            starts = array('I')
+            position = 0
+            text = _ROW_SEPARATOR.join(rows)
+        for row in rows:
+            starts.append(position)
+            position += len(row) + len(_ROW_SEPARATOR)
+        return _SearchBlock(first_id, text, starts)
+
+    @staticmethod
+    def _scan_block(block: _SearchBlock, matcher: tuple, first_id: int, end_id: int, ids: array) -> None:
+        """
+        블록에서 일치하는 행의 일련번호를 ids에 추가합니다. (행당 1회, [first_id, end_id) 범위만)
+
+        행 경계(구분자)를 넘는 일치는 그 행 안에서만 다시 판정하여 match_payload와 같은 결과를 냅니다.
+        """
+        kind, needle = matcher
+        text = block.text.lower() if kind == _MATCH_LITERAL else block.text
+        starts = block.starts
+        count = len(starts)
+        # 제거된 행 이후부터 탐색
+        row = max(0, first_id - block.first_id)
+        if row >= count:
+            return
+        position = starts[row]
+
+        while True:
+            if kind != _MATCH_REGEX:
+                found = text.find(needle, position)
+                end = found + len(needle)
+            else:
+                match = needle.search(text, position)
+                found, end = match.span() if match is not None else (-1, -1)
+            if found < 0:
+                return
+            row = bisect_right(starts, found) - 1
+            if block.first_id + row >= end_id:
+                return
+            row_end = starts[row + 1] - len(_ROW_SEPARATOR) if row + 1 < count else len(text)
+            if end <= row_end:
+                ids.append(block.first_id + row)
+            elif kind != _MATCH_REGEX:
+                if text.find(needle, found + 1, row_end) >= 0:
+                    ids.append(block.first_id + row)
+            elif needle.search(text, starts[row], row_end) is not None:
+                ids.append(block.first_id + row)
+            # 같은 행의 나머지 일치는 건너뛰고 다음 행부터 탐색
+            if row + 1 >= count:
+                return
+            position = starts[row + 1]
+
+    @staticmethod
+    def _density(ids: array, first_id: int, end_id: int, bins: int) -> Tuple[float, ...]:
+        """살아있는 행 범위를 bins 구간으로 나눈 구간별 일치 비율 (최대 구간 = 1.0)"""
+        total = end_id - first_id
+        if not ids or total <= 0 or bins <= 0:
+            return ()
+        counts = [0] * bins
+        for row_id in ids:
+            counts[min(bins - 1, (row_id - first_id) * bins // total)] += 1
+        peak = max(counts)
+        return tuple(count / peak for count in counts)
+
+
+def compile_matcher(text: str, encoding: str, hex_mode: bool = False) -> Optional[tuple]:
+    """
+    검색어를 바이트 판정기로 변환합니다.
+
+    Logic:
+        - HEX 모드: 검색어를 바이트열로 해석 (실패 시 일반 검색어)
+        - 정규식 메타 문자가 없으면 소문자 리터럴, 있으면 bytes 정규식 (유효하지 않으면 리터럴)
+
+    Args:
+        text: 검색어
+        encoding: 원본 바이트 인코딩
+        hex_mode: HEX 모드 여부
+
+    Returns:
+        Optional[tuple]: (탐색 방식, bytes 또는 컴파일된 bytes 정규식). 변환할 수 없으면 None.
+    """
+    if not text:
+        return None
+    if hex_mode:
+        try:
+            needle = bytes.fromhex(text)
+        except ValueError:
+            needle = b""  # HEX가 아니면 일반 검색어로 처리
+        if needle:
+            return _MATCH_EXACT, needle
+    try:
+        encoded = text.encode(encoding)
+    except (LookupError, UnicodeError):
+        return None
+    if not _REGEX_META_RE.search(text):
+        return _MATCH_LITERAL, encoded.lower()
+    try:
+        return _MATCH_REGEX, re.compile(encoded, re.IGNORECASE | re.MULTILINE)
+    except re.error:
+        # 유효하지 않은 정규식은 일반 문자열로 검색
+        return _MATCH_LITERAL, encoded.lower()
+
+
+def match_payload(matcher: tuple, payload: bytes) -> bool:
+    """
+    행 내용 하나가 판정기와 일치하는지 확인합니다. (인덱스 블록과 같은 기준: 끝의 줄바꿈 제외)
+
+    Args:
+        matcher: compile_matcher 결과
+        payload: 행 내용
+
+    Returns:
+        bool: 일치하면 True
+    """
+    kind, needle = matcher
+    payload = payload.rstrip(b"\r\n")
+    if kind == _MATCH_LITERAL:
+        return needle in payload.lower()
+    if kind == _MATCH_EXACT:
+        return needle in payload
+    return needle.search(payload) is not None
+
+
+class LogSearchSignals(QObject):
+    """
+    검색 작업 시그널 정의 클래스
+
+    QRunnable은 QObject가 아니므로 시그널을 직접 가질 수 없어 별도 클래스로 분리합니다.
+    """
+    search_progress = pyqtSignal(object)  # array('Q') (블록별 일치 행 일련번호, 점진 모드)
+    search_finished = pyqtSignal(object)  # LogSearchResult
+
+
+class LogSearchTask(QRunnable):
+    """
+    로그 검색 작업 (QThreadPool에서 실행)
+
+    시그널 객체는 메인 스레드에서 생성되므로 결과는 메인 스레드 슬롯으로 전달됩니다.
+    """
+
+    def __init__(self, index: LogSearchIndex, text: str, encoding: str, hex_mode: bool,
+                 limit_id: Optional[int] = None, progressive: bool = False) -> None:
+        """
+        LogSearchTask 초기화
+
+        Args:
+            index: 검색할 인덱스
+            text: 검색어
+            encoding: 원본 바이트 인코딩
+            hex_mode: HEX 모드 여부
+            limit_id: 이 일련번호 이상의 행은 제외 (None이면 제한 없음)
+            progressive: True면 블록별 일치 행을 search_progress로 먼저 전달
+        """
+        super().__init__()
+        self.signals = LogSearchSignals()
+        self._index = index
+        self._text = text
+        self._encoding = encoding
+        self._hex_mode = hex_mode
+        self._limit_id = limit_id
+        self._progressive = progressive
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """검색을 중단합니다. (다음 블록 경계에서 중단, 완료 시그널 미발생)"""
+        self._cancelled = True
+
+    def run(self) -> None:
+        """검색을 수행하고 결과를 시그널로 전달합니다."""
+        if self._cancelled:
+            return
+        result = self._index.search(self._text, self._encoding, self._hex_mode,
+                                    limit_id=self._limit_id, progress=self._on_progress)
+        if not self._cancelled:
+            self.signals.search_finished.emit(result)
+
+    def _on_progress(self, ids: array) -> bool:
+        if self._progressive and not self._cancelled:
+            self.signals.search_progress.emit(ids)
+        return not self._cancelled
@@ -0,0 +1,334 @@
+"""
+패킷 디섹터 모듈
+
+프레이밍(PacketParser) 이후 단계에서 프로토콜별 필드 트리를 해석합니다.
+
+## WHY
+* 패킷 인스펙터에서 프로토콜 필드 단위 분석 필요 (간이 Wireshark)
+* 대부분의 패킷은 아무도 펼쳐보지 않으므로 수신 시점 디코딩은 낭비
+
+## WHAT
+* DissectedField: 필드 트리 노드
+* PacketDissector 추상 클래스 및 구현체 (AT, Modbus RTU)
+* DissectorRegistry: 파서 출력 타입별 디섹터 등록 및 지연 디코딩 캐시
+
+## HOW
+* 디섹터는 적용 대상 패킷 타입(type_name)을 선언
+* decode()는 행 선택/필터 참조 시점에만 호출 (Lazy)
+* 결과는 패킷 객체 기준 LRU 캐시에 보관하여 메모리 상한 유지
+"""
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from common.constants import DISSECTOR_CACHE_SIZE
+
+
+class DissectedField:
+    """
+    디섹터가 해석한 필드 트리 노드
+
+    Attributes:
+        name: 필드 이름 (필터 경로로 사용, 예: "function")
+        value: 필드 값 (표시 및 비교용)
+        children: 하위 필드 리스트
+    """
+    __slots__ = ("name", "value", "children")
+
+    def __init__(self, name: str, value: Any = None, children: Optional[List['DissectedField']] = None) -> None:
+        self.name = name
+        self.value = value
+        self.children = children or []
+
+    def find(self, path: List[str]) -> Optional['DissectedField']:
+        """하위 경로의 필드를 찾습니다. (빈 경로면 자기 자신)"""
+        node = self
+        for name in path:
+            node = next((c for c in node.children if c.name == name), None)
+            if node is None:
+                return None
+        return node
+
+    def __repr__(self) -> str:
+        return f"DissectedField({self.name}={self.value!r}, children={len(self.children)})"
+
+
+class PacketDissector(ABC):
+    """
+    프로토콜 디섹터 추상 기본 클래스 (Interface)
+
+    Attributes:
+        name: 디섹터 이름 (필드 트리 루트 및 필터 경로 접두사, 예: "modbus")
+        applies_to: 적용 대상 패킷 타입 (Packet.type_name)
+    """
+    name: str = ""
+    applies_to: Tuple[str, ...] = ()
+
+    @abstractmethod
+    def decode(self, packet: Any) -> Optional[DissectedField]:
+        """
+        패킷을 필드 트리로 해석합니다.
+
+        Args:
+            packet: 파싱된 패킷 (model.packet_parser.Packet)
+
+        Returns:
+            Optional[DissectedField]: 루트 필드 (해석 불가 시 None)
+        """
+        pass
+
+    def count_errors(self, root: DissectedField) -> int:
+        """
+        decode() 결과에서 프로토콜 오류 수를 셉니다. (필터 errors 필드용, 기본 0)
+
+        Args:
+            root: 이 디섹터가 반환한 루트 필드
+
+        Returns:
+            int: 오류 수
+        """
+        return 0
+
+
+class ATDissector(PacketDissector):
+    """AT 응답/URC 라인 디섹터"""
+
+    name = "at"
+    applies_to = ("AT",)
+
+    _FINAL_RESULTS = ("OK", "ERROR", "NO CARRIER", "BUSY", "NO ANSWER", "NO DIALTONE")
+
+    def decode(self, packet: Any) -> Optional[DissectedField]:
+        """
+        Logic:
+            - 최종 결과 코드(OK/ERROR 등) / 명령 에코(AT...) / URC(+CMD: ...) 분류
+            - URC 및 명령은 이름과 파라미터로 분해
+        """
+        line = packet.data.decode("ascii", errors="replace").strip()
+        upper = line.upper()
+
+        if upper in self._FINAL_RESULTS or upper.startswith("+CME ERROR") or upper.startswith("+CMS ERROR"):
+            return DissectedField(self.name, line, [DissectedField("kind", "RESULT"), DissectedField("result", line)])
+
+        if upper.startswith("AT"):
+            return DissectedField(self.name, line, [DissectedField("kind", "COMMAND"), DissectedField("command", line[2:])])
+
+        if line.startswith("+") and ":" in line:
+            command, params = line.split(":", 1)
+            param_fields = [DissectedField(str(i), p.strip()) for i, p in enumerate(params.split(","))]
+            return DissectedField(self.name, line, [
+                DissectedField("kind", "URC"),
+                DissectedField("command", command),
+                DissectedField("params", params.strip(), param_fields)
+            ])
+
+        return DissectedField(self.name, line, [DissectedField("kind", "TEXT")])
+
+    def count_errors(self, root: DissectedField) -> int:
+        """ERROR / +CME ERROR / +CMS ERROR 최종 결과를 오류 1건으로 셉니다."""
+        result = root.find(["result"])
+        return int(result is not None and "ERROR" in result.value.upper())
+
+
+class ModbusRtuDissector(PacketDissector):
+    """
+    Modbus RTU 프레임 디섹터
+
+    유휴 간격(GapParser)으로 프레이밍된 패킷에 적용합니다.
+    """
+
+    name = "modbus"
+    applies_to = ("GAP",)
+
+    _FUNCTION_NAMES = {
+        1: "Read Coils",
+        2: "Read Discrete Inputs",
+        3: "Read Holding Registers",
+        4: "Read Input Registers",
+        5: "Write Single Coil",
+        6: "Write Single Register",
+        15: "Write Multiple Coils",
+        16: "Write Multiple Registers",
+    }
+
+    def decode(self, packet: Any) -> Optional[DissectedField]:
+        """
+        Logic:
+            - 최소 길이(주소+함수+CRC 2바이트) 확인
+            - CRC16(0xA001) 검증 결과와 예외 응답(함수코드 | 0x80) 표시
+        """
+        data = packet.data
+        if len(data) < 4:
+            return None
+
+        address, function = data[0], data[1]
+        payload = data[2:-2]
+        crc_recv = data[-2] | (data[-1] << 8)
+        crc_calc = self._crc16(data[:-2])
+
+        is_exception = bool(function & 0x80)
+        function_code = function & 0x7F
+        function_name = self._FUNCTION_NAMES.get(function_code, "Unknown")
+
+        fields = [
+            DissectedField("address", address),
+            DissectedField("function", function_code, [DissectedField("name", function_name)]),
+            DissectedField("exception", payload[0] if is_exception and payload else 0),
+            DissectedField("payload", payload.hex(" ").upper()),
+            DissectedField("crc", f"0x{crc_recv:04X}", [DissectedField("valid", crc_recv == crc_calc)]),
+        ]
+        summary = f"{function_name} (addr={address}{', exception' if is_exception else ''})"
+        return DissectedField(self.name, summary, fields)
+
+    def count_errors(self, root: DissectedField) -> int:
+        """CRC 불일치와 예외 응답을 각각 오류 1건으로 셉니다."""
+        crc_valid = root.find(["crc", "valid"])
+        exception = root.find(["exception"])
+        return int(crc_valid is not None and not crc_valid.value) + int(bool(exception and exception.value))
+
+    @staticmethod
+    def _crc16(data: bytes) -> int:
+        """Modbus CRC16 계산"""
+        crc = 0xFFFF
+        for b in data:
+            crc ^= b
+            for _ in range(8):
+                crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        return crc
+
+
+class DissectorRegistry:
+    """
+    디섹터 등록 및 지연 디코딩 관리 클래스
+
+    ParserFactory와 나란히 동작하며, 패킷 타입별로 적용 가능한 디섹터를 찾아
+    요청 시점에만 디코딩하고 결과를 LRU 캐시에 보관합니다.
+    """
+
+    def __init__(self, cache_size: int = DISSECTOR_CACHE_SIZE) -> None:
+        """
+        DissectorRegistry 초기화
+
+        Args:
+            cache_size: 디코딩 결과 캐시 최대 패킷 수
+        """
+        self._dissectors: Dict[str, PacketDissector] = {}
+        self._by_type: Dict[str, List[PacketDissector]] = {}
+        self._cache: "OrderedDict[Any, List[DissectedField]]" = OrderedDict()
+        self._cache_size = cache_size
+
+    def register(self, dissector: PacketDissector) -> None:
+        """
+        디섹터를 등록합니다. (같은 이름은 교체)
+
+        Args:
+            dissector: 등록할 디섹터
+        """
+        self.unregister(dissector.name)
+        self._dissectors[dissector.name] = dissector
+        for type_name in dissector.applies_to:
+            self._by_type.setdefault(type_name, []).append(dissector)
+        self._cache.clear()
+
+    def unregister(self, name: str) -> None:
+        """
+        디섹터 등록을 해제합니다.
+
+        Args:
+            name: 디섹터 이름
+        """
+        dissector = self._dissectors.pop(name, None)
+        if dissector is None:
+            return
+        for type_name in dissector.applies_to:
+            candidates = self._by_type.get(type_name, [])
+            if dissector in candidates:
+                candidates.remove(dissector)
+        self._cache.clear()
+
+    def has_dissector(self, type_name: str) -> bool:
+        """해당 패킷 타입에 적용 가능한 디섹터가 있는지 확인합니다."""
+        return bool(self._by_type.get(type_name))
+
+    def decode(self, packet: Any) -> List[DissectedField]:
+        """
+        패킷의 필드 트리를 반환합니다. (지연 디코딩 + LRU 캐시)
+
+        Logic:
+            - 캐시 히트 시 최근 사용으로 갱신 후 반환
+            - 적용 가능한 디섹터를 순서대로 실행하여 루트 필드 수집
+            - 디섹터 예외는 해당 디섹터 결과만 생략 (수신 경로에 영향 없음)
+
+        Args:
+            packet: 파싱된 패킷
+
+        Returns:
+            List[DissectedField]: 디섹터별 루트 필드 리스트
+        """
+        cached = self._cache.get(packet)
+        if cached is not None:
+            self._cache.move_to_end(packet)
+            return cached
+
+        roots = []
+        for dissector in self._by_type.get(packet.type_name, ()):
+            try:
+                root = dissector.decode(packet)
+            except Exception:
+                root = None
+            if root is not None:
+                roots.append(root)
+
+        self._cache[packet] = roots
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return roots
+
+    def get_field_value(self, packet: Any, path: str) -> Any:
+        """
+        점(.)으로 구분된 경로의 필드 값을 반환합니다. (필터 표현식용)
+
+        Args:
+            packet: 파싱된 패킷
+            path: 필드 경로 (예: "modbus.function", "at.kind")
+
+        Returns:
+            Any: 필드 값. 디섹터가 없거나 필드가 없으면 None
+        """
+        name, *rest = path.split(".")
+        if name not in self._dissectors or not self.has_dissector(packet.type_name):
+            return None
+        for root in self.decode(packet):
+            if root.name == name:
+                node = root.find(rest)
+                return node.value if node is not None else None
+        return None
+
+    def error_count(self, packet: Any) -> int:
+        """
+        디섹터가 보고한 패킷의 오류 수를 반환합니다. (필터 표현식 errors 필드용)
+
+        Args:
+            packet: 파싱된 패킷
+
+        Returns:
+            int: 디섹터별 오류 수 합계 (적용 가능한 디섹터가 없으면 0)
+        """
+        if not self.has_dissector(packet.type_name):
+            return 0
+        total = 0
+        for root in self.decode(packet):
+            dissector = self._dissectors.get(root.name)
+            if dissector is not None:
+                total += dissector.count_errors(root)
+        return total
+
+    def clear_cache(self) -> None:
+        """디코딩 캐시를 비웁니다."""
+        self._cache.clear()
+
+
+# 전역 인스턴스 (Singleton) 및 기본 디섹터 등록
+dissector_registry = DissectorRegistry()
+dissector_registry.register(ATDissector())
+dissector_registry.register(ModbusRtuDissector())
@@ -0,0 +1,292 @@
+"""
+패킷 필터 모듈
+
+패킷 필터 표현식을 한 번만 컴파일하여 Python 클로저로 변환합니다.
+
+## WHY
+* 패킷 인스펙터/로거가 전체 트래픽이 아닌 관심 트래픽에 비례해 동작해야 함
+* 패킷마다 표현식을 재해석하면 고속 수신 시 CPU 낭비
+
+## WHAT
+* compile_packet_filter: 표현식 문자열 -> Callable[[Packet], bool]
+* 지원 필드: type, len, data(payload), time, errors(디섹터가 보고한 오류 수), 그 외 패킷 속성
+* 디섹터 필드: 점(.) 경로 (예: modbus.function, at.kind) - 참조 시에만 지연 디코딩
+* 지원 연산: == != > >= < <= contains, and/or/not, 괄호
+
+## HOW
+* 정규식 토크나이저 + 재귀 하강 파서
+* 파싱 시점에 리터럴 변환/필드 접근자를 확정하여 중첩 클로저 생성
+* 문법 오류는 ValueError로 보고
+
+예시:
+    type == AT and len > 20
+    data contains 0x7E01 or data contains "ERROR"
+    not (type == GAP) and errors > 0
+    at.kind == URC and at.command contains CREG
+"""
+import re
+import operator
+from typing import Any, Callable, List, Optional, Tuple
+
+from model.packet_dissector import dissector_registry
+
+PacketPredicate = Callable[[Any], bool]
+
+# 토큰: 문자열, 16진수, 10진수(실수), 비교 연산자, 괄호, 식별자
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<str>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*') |
+        (?P<hex>0[xX][0-9A-Fa-f]+) |
+        (?P<num>\d+(?:\.\d+)?) |
+        (?P<op>==|!=|>=|<=|>|<) |
+        (?P<paren>[()]) |
+        (?P<ident>[A-Za-z_][A-Za-z0-9_.]*)
+    )""", re.VERBOSE)
+
+_COMPARE_OPS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+# 필드 별칭 -> 패킷 속성 이름
+_FIELD_ALIASES = {
+    "type": "type_name",
+    "data": "data",
+    "payload": "data",
+    "time": "timestamp",
+}
+
+_KEYWORDS = ("and", "or", "not", "contains")
+
+
+def _tokenize(expr: str) -> List[Tuple[str, str]]:
+    """
+    표현식을 (종류, 값) 토큰 리스트로 분해합니다.
+
+    Raises:
+        ValueError: 인식할 수 없는 문자가 있는 경우
+    """
+    tokens = []
+    pos = 0
+    expr = expr.rstrip()
+    while pos < len(expr):
+        match = _TOKEN_RE.match(expr, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"Unexpected character at {pos}: {expr[pos:pos + 10]!r}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "ident" and value.lower() in _KEYWORDS:
+            kind, value = "kw", value.lower()
+        tokens.append((kind, value))
+        pos = match.end()
+    return tokens
+
+
+class _FilterCompiler:
+    """
+    재귀 하강 방식으로 토큰을 클로저 트리로 변환하는 내부 클래스
+
+    Grammar:
+        or_expr    := and_expr ('or' and_expr)*
+        and_expr   := not_expr ('and' not_expr)*
+        not_expr   := 'not' not_expr | primary
+        primary    := '(' or_expr ')' | comparison
+        comparison := field (op literal | 'contains' literal)
+    """
+
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self._tokens = tokens
+        self._pos = 0
+
+    def compile(self) -> PacketPredicate:
+        predicate = self._or_expr()
+        if self._pos != len(self._tokens):
+            raise ValueError(f"Unexpected token: {self._tokens[self._pos][1]!r}")
+        return predicate
+
+    # -------------------------------------------------------------------------
+    # Token Helpers
+    # -------------------------------------------------------------------------
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
+
+    def _next(self) -> Tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise ValueError("Unexpected end of expression")
+        self._pos += 1
+        return token
+
+    def _accept(self, kind: str, value: Optional[str] = None) -> bool:
+        token = self._peek()
+        if token and token[0] == kind and (value is None or token[1] == value):
+            self._pos += 1
+            return True
+        return False
+
+    # -------------------------------------------------------------------------
+    # Grammar Rules
+    # -------------------------------------------------------------------------
+    def _or_expr(self) -> PacketPredicate:
+        terms = [self._and_expr()]
+        while self._accept("kw", "or"):
+            terms.append(self._and_expr())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda p: any(term(p) for term in terms)
+
+    def _and_expr(self) -> PacketPredicate:
+        terms = [self._not_expr()]
+        while self._accept("kw", "and"):
+            terms.append(self._not_expr())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda p: all(term(p) for term in terms)
+
+    def _not_expr(self) -> PacketPredicate:
+        if self._accept("kw", "not"):
+            inner = self._not_expr()
+            return lambda p: not inner(p)
+        return self._primary()
+
+    def _primary(self) -> PacketPredicate:
+        if self._accept("paren", "("):
+            inner = self._or_expr()
+            if not self._accept("paren", ")"):
+                raise ValueError("Missing ')'")
+            return inner
+        return self._comparison()
+
+    def _comparison(self) -> PacketPredicate:
+        kind, name = self._next()
+        if kind != "ident":
+            raise ValueError(f"Field name expected, got {name!r}")
+        field = name.lower()
+        getter = self._make_getter(field)
+
+        kind, op = self._next()
+        if kind == "kw" and op == "contains":
+            literal = self._next()
+            if field in ("data", "payload"):
+                needle = self._bytes_literal(literal)
+                return lambda p: needle in p.data
+
+            text_needle = self._text_literal(literal)
+
+            def _contains_text(p: Any) -> bool:
+                value = getter(p)
+                return value is not None and text_needle in str(value)
+            return _contains_text
+        if kind != "op":
+            raise ValueError(f"Operator expected after {name!r}, got {op!r}")
+
+        compare = _COMPARE_OPS[op]
+        literal = self._next()
+
+        if field == "type":
+            target = self._text_literal(literal).upper()
+            return lambda p: compare(p.type_name, target)
+        if field in ("data", "payload"):
+            target = self._bytes_literal(literal)
+            return lambda p: compare(p.data, target)
+
+        # 숫자 리터럴은 숫자 비교, 그 외(디섹터 문자열 필드)는 문자열 비교
+        if literal[0] in ("num", "hex"):
+            target = self._number_literal(literal)
+            convert = _to_number
+        else:
+            target = self._text_literal(literal)
+            convert = str
+
+        def _compare_value(p: Any) -> bool:
+            value = getter(p)
+            # 속성/필드가 없는 패킷은 조건 불일치로 처리
+            if value is None:
+                return False
+            try:
+                return compare(convert(value), target)
+            except (TypeError, ValueError):
+                return False
+        return _compare_value
+
+    # -------------------------------------------------------------------------
+    # Field / Literal Conversion (컴파일 시점 1회)
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _make_getter(field: str) -> Callable[[Any], Any]:
+        if field == "len":
+            return lambda p: len(p.data)
+        if field == "errors":
+            # 디섹터 오류 수 (Modbus CRC 불일치/예외 응답, AT ERROR 결과 등)
+            return dissector_registry.error_count
+        if "." in field:
+            # 디섹터 필드: 해당 패킷을 필터가 참조할 때만 디코딩 (결과는 레지스트리 캐시)
+            return lambda p: dissector_registry.get_field_value(p, field)
+        attr = _FIELD_ALIASES.get(field, field)
+        return lambda p: getattr(p, attr, None)
+
+    @staticmethod
+    def _text_literal(token: Tuple[str, str]) -> str:
+        kind, value = token
+        if kind == "str":
+            return _unquote(value)
+        if kind in ("ident", "num", "hex"):
+            return value
+        raise ValueError(f"Literal expected, got {value!r}")
+
+    @staticmethod
+    def _bytes_literal(token: Tuple[str, str]) -> bytes:
+        kind, value = token
+        if kind == "str":
+            return _unquote(value).encode("utf-8")
+        if kind == "hex":
+            digits = value[2:]
+            if len(digits) % 2:
+                digits = "0" + digits
+            return bytes.fromhex(digits)
+        raise ValueError(f"Byte literal (\"text\" or 0x..) expected, got {value!r}")
+
+    @staticmethod
+    def _number_literal(token: Tuple[str, str]) -> float:
+        kind, value = token
+        if kind == "hex":
+            return int(value, 16)
+        if kind == "num":
+            return float(value) if "." in value else int(value)
+        raise ValueError(f"Number expected, got {value!r}")
+
+
+def _to_number(value: Any) -> Any:
+    """디섹터 문자열 필드(예: AT 파라미터)를 숫자 비교가 가능하도록 변환"""
+    if isinstance(value, str):
+        return float(value) if "." in value else int(value, 0)
+    return value
+
+
+def _unquote(value: str) -> str:
+    """따옴표 제거 및 이스케이프(\\r, \\n, \\xNN 등) 해석"""
+    body = value[1:-1]
+    return body.encode("latin-1", "backslashreplace").decode("unicode_escape")
+
+
+def compile_packet_filter(expr: str) -> Optional[PacketPredicate]:
+    """
+    패킷 필터 표현식을 컴파일합니다.
+
+    Args:
+        expr: 필터 표현식 (빈 문자열이면 필터 없음)
+
+    Returns:
+        Optional[PacketPredicate]: 패킷을 받아 일치 여부를 반환하는 함수. 빈 표현식이면 None
+
+    Raises:
+        ValueError: 문법 오류가 있는 경우
+    """
+    if not expr or not expr.strip():
+        return None
+    tokens = _tokenize(expr)
+    return _FilterCompiler(tokens).compile()
@@ -9,35 +9,55 @@
 * 매크로의 Expect 기능 지원
 
 ## WHAT
-* PacketParser 추상 클래스 및 구현체 (Raw, AT, Delimiter, FixedLength)
+* PacketParser 추상 클래스 및 구현체 (Raw, AT, Delimiter, FixedLength, Gap)
 * ExpectMatcher: 정규식 기반 응답 대기 매처
 * ParserFactory: 파서 생성 팩토리
 
 ## HOW
 * 전략 패턴을 사용하여 파서 알고리즘 캡슐화
 * 내부 버퍼 관리로 불완전한 패킷 처리
+* GapParser는 I/O Thread에서 기록한 청크 도착 시각으로 유휴 간격 기반 프레이밍 수행
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
 import time
 import re
 
 from common.enums import ParserType
+from common.constants import DEFAULT_GAP_US, MIN_GAP_US
+
+# (배치 내 시작 오프셋, 도착 시각) 쌍. ConnectionWorker가 I/O Thread에서 기록합니다.
+ChunkMark = Tuple[int, float]
 
-@dataclass
 class Packet:
     """
     파싱된 패킷 데이터
 
+    초당 수만 개가 생성되므로 __slots__로 인스턴스 dict를 제거합니다.
+    타입명은 파서별 클래스 상수(공유 문자열)를 참조하므로 패킷당 추가 할당이 없습니다.
+
     Attributes:
         data: 패킷 바이트 데이터
         timestamp: 수신 시각 (Unix timestamp)
-        metadata: 추가 정보 (파서 타입, 상태 등)
+        type_name: 패킷 타입 (생성한 파서 기준, 예: "RAW", "AT")
     """
-    data: bytes
-    timestamp: float
-    metadata: Optional[dict] = None
+    __slots__ = ("data", "timestamp", "type_name")
+
+    def __init__(self, data: bytes, timestamp: float, type_name: str = "RAW") -> None:
+        self.data = data
+        self.timestamp = timestamp
+        self.type_name = type_name
+
+    @property
+    def raw_data(self) -> bytes:
+        """data 별칭 (하위 호환)"""
+        return self.data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"Packet(type={self.type_name}, len={len(self.data)}, ts={self.timestamp:.6f})"
 
 class PacketParser(ABC):
     """
@@ -64,6 +84,39 @@ class PacketParser(ABC):
         """파서 상태 초기화 (내부 버퍼 클리어)"""
         pass
 
+    def parse_chunks(self, buffer: bytes, chunk_marks: Optional[Sequence[ChunkMark]] = None) -> List[Packet]:
+        """
+        청크 도착 시각 정보와 함께 버퍼를 파싱합니다.
+
+        기본 구현은 시각 정보를 무시하고 parse()에 위임합니다.
+        시간 기반 파서(GapParser)만 재정의합니다.
+
+        Args:
+            buffer: 파싱할 바이트 데이터 (Worker 배치)
+            chunk_marks: (배치 내 오프셋, 도착 시각) 리스트 (오프셋 오름차순)
+
+        Returns:
+            List[Packet]: 파싱된 패킷 리스트
+        """
+        return self.parse(buffer)
+
+    def flush_idle(self, now: float) -> List[Packet]:
+        """
+        회선 유휴 통지 시 보류 중인 데이터를 패킷으로 확정합니다.
+
+        Args:
+            now: 유휴 감지 시각 (I/O Thread 기준 Unix timestamp)
+
+        Returns:
+            List[Packet]: 확정된 패킷 리스트 (기본: 없음)
+        """
+        return []
+
+    @property
+    def idle_timeout(self) -> Optional[float]:
+        """Worker에 요청할 유휴 통지 임계값 (초). None이면 통지 불필요"""
+        return None
+
 class RawParser(PacketParser):
     """바이너리 데이터를 그대로 전달하는 파서"""
 
@@ -71,8 +124,7 @@ class RawParser(PacketParser):
         """모든 데이터를 하나의 패킷으로 처리"""
         if not buffer:
             return []
-        packet = Packet(data=buffer, timestamp=time.time())
-        return [packet]
+        return [Packet(buffer, time.time(), "RAW")]
 
     def reset(self) -> None:
         pass
@@ -112,11 +164,12 @@ class ATParser(PacketParser):
             self._buffer = self._buffer[-self._max_buffer_size:]
 
         packets = []
+        now = time.time()
 
         while b'\r\n' in self._buffer:
             line, self._buffer = self._buffer.split(b'\r\n', 1)
             if line:
-                packets.append(Packet(data=line + b'\r\n', timestamp=time.time(), metadata={"type": "AT"}))
+                packets.append(Packet(line + b'\r\n', now, "AT"))
 
         return packets
 
@@ -147,10 +200,11 @@ class DelimiterParser(PacketParser):
             self._buffer = self._buffer[-self._max_buffer_size:]
 
         packets = []
+        now = time.time()
 
         while self._delimiter in self._buffer:
             chunk, self._buffer = self._buffer.split(self._delimiter, 1)
-            packets.append(Packet(data=chunk + self._delimiter, timestamp=time.time()))
+            packets.append(Packet(chunk + self._delimiter, now, "DELIMITER"))
 
         return packets
 
@@ -181,17 +235,131 @@ class FixedLengthParser(PacketParser):
             self._buffer = self._buffer[-self._max_buffer_size:]
 
         packets = []
+        now = time.time()
 
         while len(self._buffer) >= self._length:
             chunk = self._buffer[:self._length]
             self._buffer = self._buffer[self._length:]
-            packets.append(Packet(data=chunk, timestamp=time.time()))
+            packets.append(Packet(chunk, now, "FIXED"))
 
         return packets
 
     def reset(self) -> None:
         self._buffer = b""
 
+class GapParser(PacketParser):
+    """
+    유휴 간격(Inter-byte Timeout) 기반 파서
+
+    프레이밍 없이 버스트 단위로 송신하는 장치를 위해,
+    청크 사이의 무수신 구간이 임계값 이상이면 패킷 경계로 판단합니다.
+    시각은 메인 Thread 처리 시점이 아닌 I/O Thread 도착 시각을 사용하므로
+    UI 부하나 Worker 배치 설정과 무관하게 버스트 1개 = 패킷 1개가 됩니다.
+    """
+
+    def __init__(self, gap_us: float, max_buffer_size: int = 4096):
+        """
+        GapParser 초기화
+
+        Args:
+            gap_us: 패킷 경계로 판단할 최소 유휴 간격 (마이크로초, MIN_GAP_US 미만은 하한으로 보정)
+            max_buffer_size: 최대 버퍼 크기 (초과 시 강제 분할)
+
+        Raises:
+            ValueError: gap_us가 0 이하인 경우 (모든 청크가 패킷으로 분리됨)
+        """
+        if gap_us <= 0:
+            raise ValueError(f"gap_us must be positive: {gap_us}")
+        self._gap_s = max(float(gap_us), MIN_GAP_US) / 1_000_000
+        self._max_buffer_size = max_buffer_size
+        self._buffer = bytearray()
+        self._first_ts = 0.0
+        self._last_ts = 0.0
+
+    @property
+    def gap_us(self) -> float:
+        """유휴 간격 임계값 (마이크로초)"""
+        return self._gap_s * 1_000_000
+
+    @property
+    def idle_timeout(self) -> Optional[float]:
+        return self._gap_s
+
+    def parse(self, buffer: bytes) -> List[Packet]:
+        """시각 정보가 없는 입력은 현재 시각에 도착한 단일 청크로 처리"""
+        return self.parse_chunks(buffer, None)
+
+    def parse_chunks(self, buffer: bytes, chunk_marks: Optional[Sequence[ChunkMark]] = None) -> List[Packet]:
+        """
+        청크 도착 시각을 비교하여 버스트 단위로 분할
+
+        Logic:
+            - 시각 정보가 없으면 배치 전체를 현재 시각의 단일 청크로 간주
+            - 직전 청크 도착 후 간격이 임계값 이상이면 보류 버퍼를 패킷으로 확정
+            - 버퍼 크기 초과 시 강제 확정 (메모리 보호)
+            - 마지막 버스트는 다음 청크 또는 flush_idle()까지 보류
+        """
+        if not buffer:
+            return []
+        if not chunk_marks:
+            chunk_marks = ((0, time.time()),)
+
+        packets = []
+        count = len(chunk_marks)
+        for i in range(count):
+            start, ts = chunk_marks[i]
+            end = chunk_marks[i + 1][0] if i + 1 < count else len(buffer)
+            if start >= end:
+                continue
+
+            if self._buffer and ts - self._last_ts >= self._gap_s:
+                packets.append(self._take_packet())
+
+            if not self._buffer:
+                self._first_ts = ts
+            self._buffer += buffer[start:end]
+            self._last_ts = ts
+
+            if len(self._buffer) >= self._max_buffer_size:
+                packets.append(self._take_packet())
+
+        return packets
+
+    def flush_idle(self, now: float) -> List[Packet]:
+        """유휴 시간이 임계값을 넘었으면 보류 중인 버스트를 확정"""
+        if self._buffer and now - self._last_ts >= self._gap_s:
+            return [self._take_packet()]
+        return []
+
+    def _take_packet(self) -> Packet:
+        """보류 버퍼를 패킷으로 변환 (타임스탬프는 버스트 첫 청크 도착 시각)"""
+        packet = Packet(bytes(self._buffer), self._first_ts, "GAP")
+        self._buffer.clear()
+        return packet
+
+    def reset(self) -> None:
+        self._buffer.clear()
+        self._first_ts = 0.0
+        self._last_ts = 0.0
+
+def calc_char_time_us(baudrate: int, bytesize: int = 8, parity: str = "N", stopbits: float = 1.0) -> float:
+    """
+    UART 문자 1개 전송 시간을 계산합니다.
+
+    Args:
+        baudrate: 보드레이트
+        bytesize: 데이터 비트 수
+        parity: 패리티 설정 ('N'이면 패리티 비트 없음)
+        stopbits: 스탑 비트 수
+
+    Returns:
+        float: 문자 시간 (마이크로초). baudrate가 0 이하이면 0
+    """
+    if baudrate <= 0:
+        return 0.0
+    bits = 1 + bytesize + (0 if parity == "N" else 1) + stopbits
+    return bits * 1_000_000 / baudrate
+
 class ParserFactory:
     """파서 생성 팩토리"""
 
@@ -206,6 +374,9 @@ class ParserFactory:
 
         Returns:
             PacketParser: 생성된 파서 인스턴스
+
+        Raises:
+            ValueError: GAP 파서의 gap_us/gap_chars가 0 이하인 경우
         """
         if parser_type == ParserType.AT:
             return ATParser()
@@ -215,6 +386,24 @@ class ParserFactory:
         elif parser_type == ParserType.FIXED_LENGTH:
             length = kwargs.get("length", 10)
             return FixedLengthParser(length)
+        elif parser_type == ParserType.GAP:
+            # gap_chars 지정 시 문자 시간 단위로 환산 (baudrate 등 필요)
+            # baudrate를 알 수 없으면(문자 시간 0) 기본 임계값 사용
+            gap_us = kwargs.get("gap_us")
+            gap_chars = kwargs.get("gap_chars")
+            if gap_chars is not None:
+                if gap_chars <= 0:
+                    raise ValueError(f"gap_chars must be positive: {gap_chars}")
+                char_us = calc_char_time_us(
+                    kwargs.get("baudrate", 0),
+                    kwargs.get("bytesize", 8),
+                    kwargs.get("parity", "N"),
+                    kwargs.get("stopbits", 1.0)
+                )
+                gap_us = gap_chars * char_us if char_us > 0 else None
+            if gap_us is None:
+                gap_us = DEFAULT_GAP_US
+            return GapParser(gap_us)
         else:
             return RawParser()
 
@@ -0,0 +1,188 @@
+"""
+포트 통계 엔진 모듈
+
+포트별 송수신 처리량(Throughput)과 회선 점유율을 집계합니다.
+
+## WHY
+* 전역 카운터 2개만으로는 어떤 포트가 포화 상태인지 알 수 없음
+* 16개 포트 동시 운용 시 분석기 없이 포트별 부하 확인 필요
+* I/O 경로에서 호출되므로 갱신 비용이 최소여야 함
+
+## WHAT
+* 포트별 RX/TX 바이트 및 청크(배치) 카운터, 에러 카운트
+* 슬라이딩 윈도우 평균 속도, EWMA 속도, 최대(Peak) 속도
+* 보드레이트/프레임 형식 기반 회선 점유율(%)
+
+## HOW
+* 기록(record_*)은 정수 덧셈만 수행 (락 없음, 메인 스레드 Fast Path 전용)
+* 속도 계산은 UI 타이머가 고정 주기로 sample()을 호출할 때만 수행
+* 샘플 이력은 deque(maxlen)으로 윈도우 크기를 고정
+"""
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from common.constants import STATS_WINDOW_SAMPLES, STATS_EWMA_ALPHA
+from common.dtos import PortStatistics
+from model.packet_parser import calc_char_time_us
+
+
+class _PortCounters:
+    """포트 1개의 누적 카운터 및 샘플 이력 (내부용)"""
+
+    __slots__ = (
+        "rx_bytes", "tx_bytes", "rx_chunks", "tx_chunks", "errors",
+        "bits_per_char", "baudrate", "history",
+        "rx_ewma", "tx_ewma", "rx_peak", "tx_peak"
+    )
+
+    def __init__(self, window: int) -> None:
+        self.rx_bytes = 0
+        self.tx_bytes = 0
+        self.rx_chunks = 0
+        self.tx_chunks = 0
+        self.errors = 0
+        self.bits_per_char = 10.0  # 8N1 기본
+        self.baudrate = 0
+        # (시각, 누적 RX, 누적 TX) 샘플
+        self.history: deque = deque(maxlen=window + 1)
+        self.rx_ewma = 0.0
+        self.tx_ewma = 0.0
+        self.rx_peak = 0.0
+        self.tx_peak = 0.0
+
+
+class PortStatisticsEngine:
+    """
+    포트별 처리량 통계 엔진
+
+    record_* 메서드는 데이터 경로(DataTrafficHandler)에서 호출되고,
+    sample()은 UI 타이머에서 고정 주기로 호출됩니다.
+    두 경로 모두 메인 스레드에서 실행되므로 별도의 락을 사용하지 않습니다.
+    """
+
+    def __init__(self, window: int = STATS_WINDOW_SAMPLES, alpha: float = STATS_EWMA_ALPHA) -> None:
+        """
+        PortStatisticsEngine 초기화
+
+        Args:
+            window: 슬라이딩 윈도우 크기 (샘플 수)
+            alpha: EWMA 가중치 (0~1, 클수록 최근 값 반영이 빠름)
+        """
+        self._window = window
+        self._alpha = alpha
+        self._ports: Dict[str, _PortCounters] = {}
+
+    def _get(self, port: str) -> _PortCounters:
+        counters = self._ports.get(port)
+        if counters is None:
+            counters = self._ports[port] = _PortCounters(self._window)
+        return counters
+
+    # -------------------------------------------------------------------------
+    # I/O Path (Hot)
+    # -------------------------------------------------------------------------
+    def record_rx(self, port: str, nbytes: int) -> None:
+        """수신 청크 1개를 기록합니다."""
+        counters = self._get(port)
+        counters.rx_bytes += nbytes
+        counters.rx_chunks += 1
+
+    def record_tx(self, port: str, nbytes: int) -> None:
+        """송신 청크 1개를 기록합니다."""
+        counters = self._get(port)
+        counters.tx_bytes += nbytes
+        counters.tx_chunks += 1
+
+    def record_error(self, port: str) -> None:
+        """에러 1건을 기록합니다."""
+        self._get(port).errors += 1
+
+    # -------------------------------------------------------------------------
+    # Port Lifecycle
+    # -------------------------------------------------------------------------
+    def configure_port(self, port: str, baudrate: int, bytesize: int = 8,
+                       parity: str = "N", stopbits: float = 1.0) -> None:
+        """
+        포트 통계를 초기화하고 회선 점유율 계산용 프레임 형식을 설정합니다.
+
+        Args:
+            port: 포트 이름
+            baudrate: 보드레이트 (0이면 점유율 계산 안 함)
+            bytesize: 데이터 비트 수
+            parity: 패리티 설정
+            stopbits: 스탑 비트 수
+        """
+        counters = self._ports[port] = _PortCounters(self._window)
+        counters.baudrate = baudrate
+        if baudrate > 0:
+            # 문자 시간(us) x 보드레이트 = 문자당 비트 수 (start/parity/stop 포함)
+            counters.bits_per_char = calc_char_time_us(baudrate, bytesize, parity, stopbits) * baudrate / 1_000_000
+
+    def remove_port(self, port: str) -> None:
+        """포트 통계를 제거합니다."""
+        self._ports.pop(port, None)
+
+    # -------------------------------------------------------------------------
+    # Sampling (UI Cadence)
+    # -------------------------------------------------------------------------
+    def sample(self, now: Optional[float] = None) -> Dict[str, PortStatistics]:
+        """
+        모든 포트의 현재 통계를 계산합니다. (고정 주기로 호출)
+
+        Logic:
+            - 직전 샘플 대비 순간 속도로 EWMA/Peak 갱신
+            - 윈도우 내 가장 오래된 샘플 대비 평균 속도 계산
+            - 회선 점유율 = 속도(B/s) x 문자당 비트 / 보드레이트 (RX/TX 중 큰 값)
+
+        Args:
+            now: 샘플 시각 (기본값 time.monotonic())
+
+        Returns:
+            Dict[str, PortStatistics]: 포트 이름 -> 통계 DTO
+        """
+        if now is None:
+            now = time.monotonic()
+
+        result = {}
+        for port, c in self._ports.items():
+            history = c.history
+            rx_rate = tx_rate = 0.0
+            if history:
+                last_time, last_rx, last_tx = history[-1]
+                dt = now - last_time
+                if dt > 0:
+                    rx_inst = (c.rx_bytes - last_rx) / dt
+                    tx_inst = (c.tx_bytes - last_tx) / dt
+                    c.rx_ewma += self._alpha * (rx_inst - c.rx_ewma)
+                    c.tx_ewma += self._alpha * (tx_inst - c.tx_ewma)
+                    c.rx_peak = max(c.rx_peak, rx_inst)
+                    c.tx_peak = max(c.tx_peak, tx_inst)
+            history.append((now, c.rx_bytes, c.tx_bytes))
+
+            first_time, first_rx, first_tx = history[0]
+            span = now - first_time
+            if span > 0:
+                rx_rate = (c.rx_bytes - first_rx) / span
+                tx_rate = (c.tx_bytes - first_tx) / span
+
+            utilization = 0.0
+            if c.baudrate > 0:
+                utilization = min(100.0, max(rx_rate, tx_rate) * c.bits_per_char * 100 / c.baudrate)
+
+            result[port] = PortStatistics(
+                rx_bytes=c.rx_bytes,
+                tx_bytes=c.tx_bytes,
+                error_count=c.errors,
+                bps=int((rx_rate + tx_rate) * 8),
+                rx_chunks=c.rx_chunks,
+                tx_chunks=c.tx_chunks,
+                rx_rate=rx_rate,
+                tx_rate=tx_rate,
+                rx_rate_ewma=c.rx_ewma,
+                tx_rate_ewma=c.tx_ewma,
+                rx_peak=c.rx_peak,
+                tx_peak=c.tx_peak,
+                utilization=utilization
+            )
+        return result
@@ -0,0 +1,786 @@
+"""
+터미널 화면 버퍼 모듈
+
+ANSI/VT100 이스케이프 시퀀스를 해석하여 셀 격자(문자 + 속성) 화면을 유지합니다.
+
+## WHY
+* 셸, 부트로더, 메뉴 UI 등은 색상 코드와 커서 이동 시퀀스를 출력하므로 라인 로그에서는 깨진 문자로 보임
+* 색상 규칙(HTML/서식) 경로로 에뮬레이션하면 라인마다 서식을 다시 만들어 고속 출력을 따라가지 못함
+* 커서 이동/화면 지우기는 이미 표시된 위치를 다시 쓰므로 추가 전용(Append-only) 행 모델로 표현 불가
+
+## WHAT
+* 고정 크기 셀 격자 화면 + 스크롤백 (TerminalScreen, TerminalLine)
+* 배치 경계와 무관한 증분 파서 (GROUND/ESC/CSI/OSC 상태 유지, 멀티바이트 문자 이월)
+* SGR 색상(16/256/TrueColor)/굵게/밑줄/반전, 커서 이동, 화면/라인 지우기, 삽입/삭제, 스크롤 영역, 대체 화면
+* 변경 영역 추적 (변경 행 집합 + 전체 화면 스크롤 줄 수) -> 뷰는 바뀐 행만 다시 그림
+
+## HOW
+* 행 = 문자 리스트 + 속성 정수 리스트 (셀 객체 없음, 속성은 색상/플래그를 정수 하나로 압축)
+* 제어 문자가 없는 출력 구간은 정규식으로 한 번에 찾아 리스트 슬라이스 대입 (문자 단위 Python 루프 없음)
+* 전체 화면 스크롤은 줄 수만 누적하고 변경 행 번호를 함께 이동 -> 뷰는 화면 복사(Blit) 후 새 행만 그림
+* 화면 위로 밀려난 행은 상한이 있는 deque로 스크롤백에 보관 (대체 화면/부분 스크롤 영역은 제외)
+* Qt에 의존하지 않음 (메인 스레드의 뷰가 UI 틱마다 feed 후 변경 영역을 가져감)
+"""
+import codecs
+import re
+import unicodedata
+from collections import deque
+from typing import Deque, List, Optional, Set, Tuple
+
+from common.constants import (
+    DEFAULT_RX_ENCODING, TERMINAL_DEFAULT_COLUMNS, TERMINAL_DEFAULT_ROWS,
+    TERMINAL_SCROLLBACK_LINES, TERMINAL_TAB_WIDTH
+)
+
+# 셀 속성 플래그 (하위 8비트)
+ATTR_BOLD = 0x01
+ATTR_UNDERLINE = 0x02
+ATTR_REVERSE = 0x04
+ATTR_ITALIC = 0x08
+
+# 색상 코드 (0 = 기본색, 1~256 = 팔레트 인덱스 + 1, COLOR_RGB | 0xRRGGBB = TrueColor)
+COLOR_DEFAULT = 0
+COLOR_RGB = 1 << 25
+
+_FG_SHIFT = 8
+_BG_SHIFT = 34
+_COLOR_MASK = (1 << 26) - 1
+_FLAG_MASK = 0xFF
+_BG_ONLY = _COLOR_MASK << _BG_SHIFT
+
+# 파서 상태
+_GROUND = 0
+_ESCAPE = 1
+_ESCAPE_SKIP = 2  # 문자 집합 지정 등 1글자 인자를 가진 ESC 시퀀스
+_CSI = 3
+_OSC = 4
+_OSC_ESCAPE = 5
+
+# 제어 문자가 없는 출력 구간 (C0, DEL, C1 제외)
+_TEXT_RUN = re.compile(r"[^\x00-\x1f\x7f-\x9f]+")
+# CSI 인자/중간 바이트 구간
+_CSI_BODY = re.compile(r"[\x20-\x3f]*")
+# OSC 종료 후보 (BEL 또는 ESC)
+_OSC_END = re.compile(r"[\x07\x1b]")
+
+# 비정상 시퀀스로 인한 버퍼 증가 방지
+_CSI_MAX_LENGTH = 64
+
+
+def decode_attr(attr: int) -> Tuple[int, int, int]:
+    """
+    셀 속성을 (전경색 코드, 배경색 코드, 플래그)로 분해합니다.
+
+    Args:
+        attr (int): 셀 속성.
+
+    Returns:
+        Tuple[int, int, int]: 전경색 코드, 배경색 코드, 플래그.
+    """
+    return (attr >> _FG_SHIFT) & _COLOR_MASK, (attr >> _BG_SHIFT) & _COLOR_MASK, attr & _FLAG_MASK
+
+
+class TerminalLine:
+    """
+    터미널 화면의 한 행 (문자 + 속성)
+
+    넓은 문자(한글 등)는 2칸을 차지하며 두 번째 칸은 빈 문자열로 채웁니다.
+    """
+
+    __slots__ = ("chars", "attrs")
+
+    def __init__(self, columns: int, attr: int = 0) -> None:
+        self.chars: List[str] = [" "] * columns
+        self.attrs: List[int] = [attr] * columns
+
+    def resize(self, columns: int) -> None:
+        """행 폭을 조정합니다. (넘치는 칸은 버리고 모자란 칸은 공백)"""
+        extra = columns - len(self.chars)
+        if extra > 0:
+            self.chars.extend(" " * extra)
+            self.attrs.extend([0] * extra)
+        elif extra < 0:
+            del self.chars[columns:]
+            del self.attrs[columns:]
+
+    def erase(self, start: int, end: int, attr: int = 0) -> None:
+        """[start, end) 칸을 공백으로 지웁니다."""
+        count = end - start
+        if count > 0:
+            self.chars[start:end] = " " * count
+            self.attrs[start:end] = [attr] * count
+
+    @property
+    def text(self) -> str:
+        """행 텍스트 (끝의 공백 제외)"""
+        return "".join(self.chars).rstrip()
+
+
+class TerminalScreen:
+    """
+    VT100/xterm 호환 셀 격자 화면 버퍼 클래스
+
+    포트(로그 위젯)마다 하나씩 사용하며, 메인 스레드에서만 호출됩니다.
+    화면 행 번호는 0부터 시작하며, 스크롤백 행은 화면 행보다 앞에 위치합니다.
+    """
+
+    def __init__(self, columns: int = TERMINAL_DEFAULT_COLUMNS, rows: int = TERMINAL_DEFAULT_ROWS,
+                 scrollback: int = TERMINAL_SCROLLBACK_LINES,
+                 encoding: str = DEFAULT_RX_ENCODING) -> None:
+        """
+        TerminalScreen 초기화
+
+        Args:
+            columns (int): 화면 열 수.
+            rows (int): 화면 행 수.
+            scrollback (int): 스크롤백 최대 행 수.
+            encoding (str): 수신 데이터 인코딩.
+
+        Raises:
+            LookupError: 알 수 없는 인코딩인 경우
+        """
+        self._columns = max(1, columns)
+        self._rows = max(1, rows)
+        self._encoding = codecs.lookup(encoding).name
+        self._decoder = codecs.getincrementaldecoder(self._encoding)(errors="replace")
+
+        self.history: Deque[TerminalLine] = deque(maxlen=scrollback)
+        # 스크롤백에 추가된 누적 행 수 (뷰가 오래된 행 제거량을 계산하는 기준)
+        self.history_total = 0
+
+        self._lines: List[TerminalLine] = []
+        self._alt_saved: Optional[Tuple[List[TerminalLine], int, int]] = None
+        self._dirty: Set[int] = set()
+        self._scrolled = 0
+        self.reset()
+
+    # -------------------------------------------------------------------------
+    # 상태 조회
+    # -------------------------------------------------------------------------
+    @property
+    def columns(self) -> int:
+        """화면 열 수"""
+        return self._columns
+
+    @property
+    def rows(self) -> int:
+        """화면 행 수"""
+        return self._rows
+
+    @property
+    def lines(self) -> List[TerminalLine]:
+        """화면 행 리스트 (읽기 전용으로 사용)"""
+        return self._lines
+
+    @property
+    def in_alternate_screen(self) -> bool:
+        """대체 화면(전체 화면 UI) 사용 중 여부"""
+        return self._alt_saved is not None
+
+    def line(self, index: int) -> TerminalLine:
+        """
+        스크롤백 + 화면을 이어붙인 순서의 행을 반환합니다.
+
+        Args:
+            index (int): 0 = 가장 오래된 스크롤백 행, len(history) = 화면 첫 행.
+
+        Returns:
+            TerminalLine: 해당 행.
+        """
+        count = len(self.history)
+        if index < count:
+            return self.history[index]
+        return self._lines[index - count]
+
+    def take_damage(self) -> Tuple[int, Set[int]]:
+        """
+        마지막 호출 이후의 변경 영역을 가져오고 초기화합니다.
+
+        Returns:
+            Tuple[int, Set[int]]: (전체 화면이 위로 스크롤된 줄 수, 변경된 화면 행 번호 집합).
+            변경 행 번호는 스크롤 이후(현재) 기준입니다.
+        """
+        damage = (self._scrolled, self._dirty)
+        self._scrolled = 0
+        self._dirty = set()
+        return damage
+
+    # -------------------------------------------------------------------------
+    # 설정
+    # -------------------------------------------------------------------------
+    def set_encoding(self, encoding: str) -> None:
+        """
+        수신 데이터 인코딩을 변경합니다. (디코더 상태 초기화, 화면 유지)
+
+        Args:
+            encoding (str): 인코딩 이름.
+
+        Raises:
+            LookupError: 알 수 없는 인코딩인 경우
+        """
+        name = codecs.lookup(encoding).name
+        if name == self._encoding:
+            return
+        self._encoding = name
+        self._decoder = codecs.getincrementaldecoder(name)(errors="replace")
+
+    def resize(self, columns: int, rows: int) -> None:
+        """
+        화면 크기를 변경합니다. (줄바꿈 재배치 없음)
+
+        Logic:
+            - 행이 줄면 커서가 화면에 남도록 위쪽 행을 스크롤백으로 보내고 나머지는 아래에서 제거
+            - 행이 늘면 아래에 빈 행 추가
+            - 스크롤 영역은 전체 화면으로 초기화
+
+        Args:
+            columns (int): 화면 열 수.
+            rows (int): 화면 행 수.
+        """
+        columns = max(1, columns)
+        rows = max(1, rows)
+        if columns == self._columns and rows == self._rows:
+            return
+
+        # 커서가 화면 밖으로 나가지 않도록 위쪽에서 밀어낼 행 수
+        push = max(0, self.cursor_row - (rows - 1))
+        if push:
+            if self._alt_saved is None:
+                self._push_history(self._lines[:push])
+            del self._lines[:push]
+            self.cursor_row -= push
+
+        screens = [self._lines]
+        if self._alt_saved is not None:
+            lines, row, col = self._alt_saved
+            self._alt_saved = (lines, min(row, rows - 1), min(col, columns - 1))
+            screens.append(lines)
+        for lines in screens:
+            for line in lines:
+                line.resize(columns)
+            del lines[rows:]
+            while len(lines) < rows:
+                lines.append(TerminalLine(columns))
+
+        self._columns = columns
+        self._rows = rows
+        self.cursor_col = min(self.cursor_col, columns - 1)
+        self._saved_cursor = (min(self._saved_cursor[0], rows - 1), min(self._saved_cursor[1], columns - 1),
+                              self._saved_cursor[2])
+        self._wrap_pending = False
+        self._top = 0
+        self._bottom = rows - 1
+        self._scrolled = 0
+        self._dirty = set(range(rows))
+
+    def reset(self) -> None:
+        """화면, 커서, 속성, 파서 상태를 초기화합니다. (스크롤백 유지)"""
+        self._lines = [TerminalLine(self._columns) for _ in range(self._rows)]
+        self._alt_saved = None
+        self.cursor_row = 0
+        self.cursor_col = 0
+        self.cursor_visible = True
+        self._attr = 0
+        self._autowrap = True
+        self._wrap_pending = False
+        self._saved_cursor = (0, 0, 0)
+        self._top = 0
+        self._bottom = self._rows - 1
+        self._state = _GROUND
+        self._csi_buf = ""
+        self._decoder.reset()
+        self._scrolled = 0
+        self._dirty = set(range(self._rows))
+
+    def clear(self) -> None:
+        """스크롤백과 화면을 모두 지웁니다."""
+        self.history.clear()
+        self.history_total = 0
+        self.reset()
+
+    # -------------------------------------------------------------------------
+    # 입력 처리
+    # -------------------------------------------------------------------------
+    def feed(self, data: bytes) -> None:
+        """
+        수신 바이트를 해석하여 화면에 반영합니다.
+
+        Logic:
+            - 증분 디코더로 배치 끝의 불완전한 멀티바이트 문자를 다음 배치로 이월
+            - GROUND 상태에서는 제어 문자 없는 구간을 한 번에 기록
+            - 이스케이프 시퀀스는 상태를 유지하며 배치 경계를 넘어 이어서 해석
+
+        Args:
+            data (bytes): 수신 원본 바이트.
+        """
+        text = self._decoder.decode(data)
+        length = len(text)
+        pos = 0
+        while pos < length:
+            state = self._state
+            if state == _GROUND:
+                match = _TEXT_RUN.match(text, pos)
+                if match:
+                    self._write(match.group())
+                    pos = match.end()
+                    continue
+                ch = text[pos]
+                pos += 1
+                if ch == "\x1b":
+                    self._state = _ESCAPE
+                else:
+                    self._control(ch)
+            elif state == _CSI:
+                match = _CSI_BODY.match(text, pos)
+                self._csi_buf += match.group()
+                pos = match.end()
+                if pos >= length:
+                    if len(self._csi_buf) > _CSI_MAX_LENGTH:
+                        self._state = _GROUND
+                    break
+                ch = text[pos]
+                pos += 1
+                if "\x40" <= ch <= "\x7e":
+                    self._state = _GROUND
+                    if len(self._csi_buf) <= _CSI_MAX_LENGTH:
+                        self._csi(self._csi_buf, ch)
+                elif ch == "\x1b":
+                    self._state = _ESCAPE
+                elif ch < "\x20":
+                    # 시퀀스 중간의 C0 제어 문자는 즉시 실행 (VT100 동작)
+                    self._control(ch)
+                else:
+                    self._state = _GROUND
+            elif state == _ESCAPE:
+                ch = text[pos]
+                pos += 1
+                self._escape(ch)
+            elif state == _ESCAPE_SKIP:
+                pos += 1
+                self._state = _GROUND
+            else:
+                # OSC (창 제목 등): 표시하지 않으므로 종료 문자까지 버림
+                if state == _OSC_ESCAPE:
+                    self._state = _GROUND if text[pos] == "\\" else _OSC
+                    if self._state == _GROUND:
+                        pos += 1
+                    continue
+                match = _OSC_END.search(text, pos)
+                if match is None:
+                    break
+                pos = match.end()
+                self._state = _GROUND if match.group() == "\x07" else _OSC_ESCAPE
+
+    def write_marker(self, text: str) -> None:
+        """
+        수신 데이터와 구분되는 안내 마커 라인을 기록합니다. (반전 표시)
+
+        Args:
+            text (str): 마커 텍스트.
+        """
+        if self.cursor_col or self._wrap_pending:
+            self._control("\r")
+            self._control("\n")
+        attr = self._attr
+        self._attr = ATTR_REVERSE
+        self._write(text.replace("\n", " ").replace("\r", " "))
+        self._attr = attr
+        self._control("\r")
+        self._control("\n")
+
+    # -------------------------------------------------------------------------
+    # 출력 문자
+    # -------------------------------------------------------------------------
+    def _write(self, text: str) -> None:
+        """커서 위치부터 출력 문자를 기록합니다. (자동 줄바꿈 포함)"""
+        if not text.isascii():
+            self._write_wide(text)
+            return
+
+        columns = self._columns
+        attr = self._attr
+        while text:
+            if self._wrap_pending:
+                self._wrap()
+            line = self._lines[self.cursor_row]
+            col = self.cursor_col
+            chunk = text[:columns - col]
+            text = text[len(chunk):]
+            end = col + len(chunk)
+            line.chars[col:end] = chunk
+            line.attrs[col:end] = [attr] * len(chunk)
+            self._dirty.add(self.cursor_row)
+            if end < columns:
+                self.cursor_col = end
+                continue
+            self.cursor_col = columns - 1
+            if self._autowrap:
+                self._wrap_pending = True
+            elif text:
+                # 자동 줄바꿈이 꺼져 있으면 남은 문자는 마지막 칸을 덮어씀
+                line.chars[-1] = text[-1]
+                text = ""
+
+    def _write_wide(self, text: str) -> None:
+        """넓은 문자/결합 문자가 섞인 출력 문자를 한 글자씩 기록합니다."""
+        columns = self._columns
+        attr = self._attr
+        for ch in text:
+            if unicodedata.combining(ch):
+                # 결합 문자는 직전 칸 문자에 붙임
+                col = self.cursor_col if self._wrap_pending else self.cursor_col - 1
+                line = self._lines[self.cursor_row]
+                if col >= 0:
+                    line.chars[col] += ch
+                continue
+
+            width = 2 if unicodedata.east_asian_width(ch) in "WF" and columns > 1 else 1
+            if self._wrap_pending or self.cursor_col + width > columns:
+                if not self._autowrap:
+                    self.cursor_col = columns - width
+                else:
+                    self._wrap()
+            line = self._lines[self.cursor_row]
+            col = self.cursor_col
+            line.chars[col] = ch
+            line.attrs[col] = attr
+            if width == 2:
+                line.chars[col + 1] = ""
+                line.attrs[col + 1] = attr
+            self._dirty.add(self.cursor_row)
+            if col + width < columns:
+                self.cursor_col = col + width
+            else:
+                self.cursor_col = columns - 1
+                self._wrap_pending = self._autowrap
+
+    def _wrap(self) -> None:
+        """자동 줄바꿈 (다음 행 첫 칸으로 이동)"""
+        self._wrap_pending = False
+        self.cursor_col = 0
+        self._index()
+
+    # -------------------------------------------------------------------------
+    # 제어 문자 / 이스케이프 시퀀스
+    # -------------------------------------------------------------------------
+    def _control(self, ch: str) -> None:
+        """C0 제어 문자를 실행합니다. (그 외 제어 문자는 무시)"""
+        if ch == "\n" or ch == "\x0b" or ch == "\x0c":
+            self._wrap_pending = False
+            self._index()
+        elif ch == "\r":
+            self._wrap_pending = False
+            self.cursor_col = 0
+        elif ch == "\x08":
+            self._wrap_pending = False
+            if self.cursor_col:
+                self.cursor_col -= 1
+        elif ch == "\t":
+            self._wrap_pending = False
+            self.cursor_col = min(self._columns - 1, (self.cursor_col // TERMINAL_TAB_WIDTH + 1) * TERMINAL_TAB_WIDTH)
+
+    def _escape(self, ch: str) -> None:
+        """ESC 다음 문자를 해석합니다."""
+        self._state = _GROUND
+        if ch == "[":
+            self._state = _CSI
+            self._csi_buf = ""
+        elif ch == "]":
+            self._state = _OSC
+        elif ch in "()*+#%":
+            self._state = _ESCAPE_SKIP
+        elif ch == "7":
+            self._save_cursor()
+        elif ch == "8":
+            self._restore_cursor()
+        elif ch == "D":
+            self._index()
+        elif ch == "E":
+            self.cursor_col = 0
+            self._index()
+        elif ch == "M":
+            self._reverse_index()
+        elif ch == "c":
+            self.reset()
+        elif ch == "\x1b":
+            self._state = _ESCAPE
+
+    def _csi(self, body: str, final: str) -> None:
+        """CSI 시퀀스를 실행합니다."""
+        private = body[:1] in ("?", ">", "=", "<")
+        if private:
+            body = body[1:]
+        params = [int(p) if p.isdigit() else 0 for p in body.replace(":", ";").split(";")] if body else []
+        first = params[0] if params else 0
+        count = first or 1
+
+        if private:
+            if final in "hl":
+                self._set_private_modes(params, final == "h")
+            return
+
+        self._wrap_pending = False
+        if final == "m":
+            self._sgr(params)
+        elif final in "Hf":
+            row = count
+            col = (params[1] if len(params) > 1 else 0) or 1
+            self._move_to(row - 1, col - 1)
+        elif final == "A":
+            self._move_to(max(self.cursor_row - count, self._top if self.cursor_row >= self._top else 0),
+                          self.cursor_col)
+        elif final == "B" or final == "e":
+            self._move_to(min(self.cursor_row + count,
+                              self._bottom if self.cursor_row <= self._bottom else self._rows - 1),
+                          self.cursor_col)
+        elif final == "C" or final == "a":
+            self._move_to(self.cursor_row, self.cursor_col + count)
+        elif final == "D":
+            self._move_to(self.cursor_row, self.cursor_col - count)
+        elif final == "E":
+            self._move_to(self.cursor_row + count, 0)
+        elif final == "F":
+            self._move_to(self.cursor_row - count, 0)
+        elif final == "G" or final == "`":
+            self._move_to(self.cursor_row, count - 1)
+        elif final == "d":
+            self._move_to(count - 1, self.cursor_col)
+        elif final == "J":
+            self._erase_display(first)
+        elif final == "K":
+            self._erase_line(first)
+        elif final == "X":
+            line = self._lines[self.cursor_row]
+            line.erase(self.cursor_col, min(self._columns, self.cursor_col + count), self._attr & _BG_ONLY)
+            self._dirty.add(self.cursor_row)
+        elif final == "@":
+            self._shift_chars(count)
+        elif final == "P":
+            self._shift_chars(-count)
+        elif final == "L":
+            if self._top <= self.cursor_row <= self._bottom:
+                self._scroll_down(count, self.cursor_row)
+        elif final == "M":
+            if self._top <= self.cursor_row <= self._bottom:
+                self._scroll_up(count, self.cursor_row)
+        elif final == "S":
+            self._scroll_up(count, self._top)
+        elif final == "T":
+            self._scroll_down(count, self._top)
+        elif final == "r":
+            top = count - 1
+            bottom = ((params[1] if len(params) > 1 else 0) or self._rows) - 1
+            if top < bottom <= self._rows - 1:
+                self._top, self._bottom = top, bottom
+                self._move_to(0, 0)
+        elif final == "s":
+            self._save_cursor()
+        elif final == "u":
+            self._restore_cursor()
+
+    def _set_private_modes(self, params: List[int], enabled: bool) -> None:
+        """DEC 전용 모드(?25 커서 표시, ?7 자동 줄바꿈, ?1049 대체 화면)를 설정합니다."""
+        for mode in params:
+            if mode == 25:
+                self.cursor_visible = enabled
+                self._dirty.add(self.cursor_row)
+            elif mode == 7:
+                self._autowrap = enabled
+            elif mode in (47, 1047, 1049):
+                self._set_alternate_screen(enabled, save_cursor=(mode == 1049))
+
+    def _set_alternate_screen(self, enabled: bool, save_cursor: bool) -> None:
+        """대체 화면 전환 (전체 화면 UI 종료 시 원래 화면 복원, 스크롤백 미사용)"""
+        if enabled == (self._alt_saved is not None):
+            return
+        if enabled:
+            self._alt_saved = (self._lines, self.cursor_row, self.cursor_col)
+            self._lines = [TerminalLine(self._columns) for _ in range(self._rows)]
+        else:
+            lines, row, col = self._alt_saved
+            self._alt_saved = None
+            self._lines = lines
+            if save_cursor:
+                self.cursor_row, self.cursor_col = row, col
+        self._top = 0
+        self._bottom = self._rows - 1
+        self._dirty = set(range(self._rows))
+
+    def _sgr(self, params: List[int]) -> None:
+        """SGR(Select Graphic Rendition) 속성을 적용합니다."""
+        if not params:
+            params = [0]
+        attr = self._attr
+        index = 0
+        count = len(params)
+        while index < count:
+            code = params[index]
+            index += 1
+            if code == 0:
+                attr = 0
+            elif code == 1:
+                attr |= ATTR_BOLD
+            elif code == 3:
+                attr |= ATTR_ITALIC
+            elif code == 4:
+                attr |= ATTR_UNDERLINE
+            elif code == 7:
+                attr |= ATTR_REVERSE
+            elif code == 22:
+                attr &= ~ATTR_BOLD
+            elif code == 23:
+                attr &= ~ATTR_ITALIC
+            elif code == 24:
+                attr &= ~ATTR_UNDERLINE
+            elif code == 27:
+                attr &= ~ATTR_REVERSE
+            elif 30 <= code <= 37 or 90 <= code <= 97:
+                attr = self._with_color(attr, _FG_SHIFT, code - 30 if code < 90 else code - 82)
+            elif 40 <= code <= 47 or 100 <= code <= 107:
+                attr = self._with_color(attr, _BG_SHIFT, code - 40 if code < 100 else code - 92)
+            elif code == 39:
+                attr &= ~(_COLOR_MASK << _FG_SHIFT)
+            elif code == 49:
+                attr &= ~_BG_ONLY
+            elif code == 38 or code == 48:
+                shift = _FG_SHIFT if code == 38 else _BG_SHIFT
+                kind = params[index] if index < count else 0
+                if kind == 5 and index + 1 < count:
+                    attr = self._with_color(attr, shift, params[index + 1] & 0xFF)
+                    index += 2
+                elif kind == 2 and index + 3 < count:
+                    red, green, blue = (v & 0xFF for v in params[index + 1:index + 4])
+                    attr = (attr & ~(_COLOR_MASK << shift)) | ((COLOR_RGB | red << 16 | green << 8 | blue) << shift)
+                    index += 4
+                else:
+                    index = count
+        self._attr = attr
+
+    @staticmethod
+    def _with_color(attr: int, shift: int, palette_index: int) -> int:
+        return (attr & ~(_COLOR_MASK << shift)) | ((palette_index + 1) << shift)
+
+    # -------------------------------------------------------------------------
+    # 커서 / 스크롤
+    # -------------------------------------------------------------------------
+    def _move_to(self, row: int, col: int) -> None:
+        self._wrap_pending = False
+        self.cursor_row = min(max(row, 0), self._rows - 1)
+        self.cursor_col = min(max(col, 0), self._columns - 1)
+
+    def _save_cursor(self) -> None:
+        self._saved_cursor = (self.cursor_row, self.cursor_col, self._attr)
+
+    def _restore_cursor(self) -> None:
+        row, col, self._attr = self._saved_cursor
+        self._move_to(row, col)
+
+    def _index(self) -> None:
+        """커서를 한 행 아래로 이동 (스크롤 영역 하단이면 영역을 위로 스크롤)"""
+        if self.cursor_row == self._bottom:
+            self._scroll_up(1, self._top)
+        elif self.cursor_row < self._rows - 1:
+            self.cursor_row += 1
+
+    def _reverse_index(self) -> None:
+        """커서를 한 행 위로 이동 (스크롤 영역 상단이면 영역을 아래로 스크롤)"""
+        self._wrap_pending = False
+        if self.cursor_row == self._top:
+            self._scroll_down(1, self._top)
+        elif self.cursor_row:
+            self.cursor_row -= 1
+
+    def _scroll_up(self, count: int, top: int) -> None:
+        """
+        [top, 스크롤 영역 하단] 구간을 위로 스크롤합니다.
+
+        Logic:
+            - 전체 화면 스크롤: 밀려난 행을 스크롤백으로 보내고 스크롤 줄 수 누적, 변경 행 번호 이동
+            - 부분 영역 스크롤: 영역 내 행 이동 후 영역 전체를 변경 행으로 표시
+        """
+        bottom = self._bottom
+        count = min(count, bottom - top + 1)
+        lines = self._lines
+        removed = lines[top:top + count]
+        del lines[top:top + count]
+        blank = self._attr & _BG_ONLY
+        for _ in range(count):
+            lines.insert(bottom - count + 1, TerminalLine(self._columns, blank))
+
+        if top == 0 and bottom == self._rows - 1:
+            if self._alt_saved is None:
+                self._push_history(removed)
+            self._scrolled += count
+            self._dirty = {row - count for row in self._dirty if row >= count}
+            self._dirty.update(range(self._rows - count, self._rows))
+        else:
+            self._dirty.update(range(top, bottom + 1))
+
+    def _scroll_down(self, count: int, top: int) -> None:
+        """[top, 스크롤 영역 하단] 구간을 아래로 스크롤합니다. (위쪽에 빈 행 삽입)"""
+        bottom = self._bottom
+        count = min(count, bottom - top + 1)
+        lines = self._lines
+        del lines[bottom - count + 1:bottom + 1]
+        blank = self._attr & _BG_ONLY
+        for _ in range(count):
+            lines.insert(top, TerminalLine(self._columns, blank))
+        self._dirty.update(range(top, bottom + 1))
+
+    def _push_history(self, lines: List[TerminalLine]) -> None:
+        self.history.extend(lines)
+        self.history_total += len(lines)
+
+    # -------------------------------------------------------------------------
+    # 지우기 / 삽입 / 삭제
+    # -------------------------------------------------------------------------
+    def _erase_display(self, mode: int) -> None:
+        """ED: 0 = 커서부터 끝, 1 = 처음부터 커서, 2 = 전체 화면, 3 = 전체 + 스크롤백"""
+        blank = self._attr & _BG_ONLY
+        row = self.cursor_row
+        if mode == 0:
+            self._lines[row].erase(self.cursor_col, self._columns, blank)
+            rows = range(row + 1, self._rows)
+            self._dirty.add(row)
+        elif mode == 1:
+            self._lines[row].erase(0, self.cursor_col + 1, blank)
+            rows = range(0, row)
+            self._dirty.add(row)
+        else:
+            rows = range(self._rows)
+            if mode == 3:
+                self.history.clear()
+        for index in rows:
+            self._lines[index].erase(0, self._columns, blank)
+        self._dirty.update(rows)
+
+    def _erase_line(self, mode: int) -> None:
+        """EL: 0 = 커서부터 끝, 1 = 처음부터 커서, 2 = 행 전체"""
+        line = self._lines[self.cursor_row]
+        blank = self._attr & _BG_ONLY
+        if mode == 0:
+            line.erase(self.cursor_col, self._columns, blank)
+        elif mode == 1:
+            line.erase(0, self.cursor_col + 1, blank)
+        else:
+            line.erase(0, self._columns, blank)
+        self._dirty.add(self.cursor_row)
+
+    def _shift_chars(self, count: int) -> None:
+        """ICH(양수: 빈 칸 삽입) / DCH(음수: 문자 삭제) - 커서 오른쪽 문자를 이동"""
+        line = self._lines[self.cursor_row]
+        col = self.cursor_col
+        columns = self._columns
+        blank = self._attr & _BG_ONLY
+        count = min(abs(count), columns - col) * (1 if count > 0 else -1)
+        if count > 0:
+            line.chars[col:col] = " " * count
+            line.attrs[col:col] = [blank] * count
+            del line.chars[columns:]
+            del line.attrs[columns:]
+        else:
+            del line.chars[col:col - count]
+            del line.attrs[col:col - count]
+            line.chars.extend(" " * -count)
+            line.attrs.extend([blank] * -count)
+        self._dirty.add(self.cursor_row)
@@ -9,21 +9,33 @@ Fast Path를 통한 고속 데이터 수신 처리 및 UI 업데이트 스로틀
 * View 내부 구조에 대한 의존성 제거 (Decoupling)
 
 ## WHAT
-* Fast Path 수신 처리 (파일 로깅, 통계 집계)
+* Fast Path 수신 처리 (파일 로깅, 포트별 통계 집계)
+* 패킷 배치의 패킷 모드 로깅 전달
 * UI 업데이트 버퍼링 및 플러싱 (Throttling)
+* 과부하 시 화면 표시 생략 및 생략 마커 전달 (Degradation)
 * DTO 기반 데이터 전달
 
 ## HOW
-* QTimer를 사용한 배치 처리 (30ms 간격)
+* 공용 UI 스케줄러(ui_scheduler)로 데이터가 있을 때만 플러시 예약 (유휴 시 Wakeup 없음)
+* 틱당 시간 예산(UI_FLUSH_BUDGET_MS) 내에서 포트별 Round-robin 플러시
+* 포트별 대기 버퍼 상한(UI_PENDING_LIMIT_BYTES) 초과 시 오래된 구간부터 생략
+* 수신 청크는 참조만 보관하고 플러시 시 최대 1회 결합 (Worker -> 모델 사이 복사 최소화)
 * View Interface (append_rx_data) 호출을 통한 UI 갱신
 * DTO(PortDataEvent, LogDataBatch)를 사용하여 타입 안전성 확보
 """
-from collections import defaultdict
-from PyQt5.QtCore import QObject, QTimer
+import time
+from collections import deque
+from typing import Dict
+
+from PyQt5.QtCore import QObject
 
 from core.data_logger import data_logger_manager
+from core.structures import ChunkBacklog
+from core.ui_scheduler import ui_scheduler
+from model.port_statistics import PortStatisticsEngine
 from view.main_window import MainWindow
-from common.dtos import PortDataEvent, LogDataBatch
+from common.constants import UI_FLUSH_BUDGET_MS, UI_FLUSH_SLICE_BYTES, UI_PENDING_LIMIT_BYTES
+from common.dtos import PortDataEvent, PacketBatchEvent, LogDataBatch, PortConfig, PortStatistics
 
 
 class DataTrafficHandler(QObject):
@@ -44,18 +56,13 @@ class DataTrafficHandler(QObject):
         super().__init__()
         self.view = view
 
-        # 포트별 수신 데이터 버퍼 (포트이름 -> bytearray)
-        self._rx_buffer = defaultdict(bytearray)
-
-        # 통계 카운터
-        self.rx_byte_count = 0
-        self.tx_byte_count = 0
+        # 포트별 화면 대기 데이터 (포트이름 -> ChunkBacklog, 상한 UI_PENDING_LIMIT_BYTES)
+        self._rx_buffer: Dict[str, ChunkBacklog] = {}
+        # 대기 데이터가 있는 포트의 Round-robin 순서
+        self._pending_ports: deque = deque()
 
-        # UI 업데이트 타이머 (Throttling)
-        self._ui_refresh_timer = QTimer()
-        self._ui_refresh_timer.setInterval(30)  # 30ms (약 33 FPS)
-        self._ui_refresh_timer.timeout.connect(self._flush_rx_buffer_to_ui)
-        self._ui_refresh_timer.start()
+        # 포트별 통계 엔진
+        self._stats = PortStatisticsEngine()
 
     def on_fast_data_received(self, event: PortDataEvent) -> None:
         """
@@ -65,7 +72,8 @@ class DataTrafficHandler(QObject):
             1. DTO에서 데이터 추출
             2. 파일 로깅 (지연 없이 즉시 수행)
             3. 통계 집계 (RX 바이트)
-            4. UI 버퍼에 데이터 추가 (나중에 타이머에 의해 플러시)
+            4. UI 버퍼에 데이터 추가 및 플러시 예약 (다음 UI 틱)
+            5. 대기 버퍼 상한 초과 시 오래된 구간을 버리고 생략량 기록 (과부하 모드)
 
         Args:
             event (PortDataEvent): 포트 데이터 이벤트 DTO.
@@ -81,10 +89,29 @@ class DataTrafficHandler(QObject):
             data_logger_manager.write(port_name, data)
 
         # 2. 통계 집계
-        self.rx_byte_count += len(data)
+        self._stats.record_rx(port_name, len(data))
+
+        # 3. UI 업데이트 버퍼링 (청크 참조 보관, 복사 없음)
+        pending = self._rx_buffer.get(port_name)
+        if pending is None:
+            pending = self._rx_buffer[port_name] = ChunkBacklog()
+            self._pending_ports.append(port_name)
+            ui_scheduler.request(self._flush_rx_buffer_to_ui)
+
+        # 4. 과부하: 화면이 따라가지 못하는 구간은 표시 생략 (파일 로깅은 이미 완료)
+        pending.push(data, UI_PENDING_LIMIT_BYTES)
+
+    def on_packet_batch_received(self, event: PacketBatchEvent) -> None:
+        """
+        패킷 배치 수신 핸들러 (Fast Path)
+
+        패킷 모드 로거에만 전달되며, 필터링은 로거가 큐 적재 전에 수행합니다.
 
-        # 3. UI 업데이트 버퍼링
-        self._rx_buffer[port_name].extend(data)
+        Args:
+            event (PacketBatchEvent): 패킷 배치 이벤트 DTO.
+        """
+        if data_logger_manager.is_logging(event.port):
+            data_logger_manager.write_packets(event.port, event.packets)
 
     def on_data_sent(self, event: PortDataEvent) -> None:
         """
@@ -104,46 +131,85 @@ class DataTrafficHandler(QObject):
         if data_logger_manager.is_logging(port_name):
             data_logger_manager.write(port_name, data)
 
-        self.tx_byte_count += len(data)
+        self._stats.record_tx(port_name, len(data))
 
     def _flush_rx_buffer_to_ui(self) -> None:
         """
         버퍼링된 데이터를 UI에 반영합니다. (Timer Slot)
 
         Logic:
-            - 버퍼가 비어있으면 리턴
-            - 버퍼에 데이터가 있는 포트 목록 순회
-            - DTO(LogDataBatch) 생성하여 View 인터페이스 호출
-            - 처리된 버퍼 비우기
+            - 대기 포트를 Round-robin으로 방문하며 포트당 최대 UI_FLUSH_SLICE_BYTES 전달
+            - 생략된 구간이 있으면 DTO(LogDataBatch.skipped)로 함께 전달 (마커 표시)
+            - 틱당 시간 예산(UI_FLUSH_BUDGET_MS)을 넘으면 남은 데이터는 다음 틱으로 이월 (재예약)
         """
-        if not self._rx_buffer:
+        if not self._pending_ports:
             return
 
-        # 처리할 데이터가 있는 포트 목록 복사 (Dictionary size change 방지)
-        pending_ports = list(self._rx_buffer.keys())
+        deadline = time.perf_counter() + UI_FLUSH_BUDGET_MS / 1000
+        while self._pending_ports:
+            port_name = self._pending_ports.popleft()
+            pending = self._rx_buffer[port_name]
 
-        for port_name in pending_ports:
-            data = self._rx_buffer[port_name]
-            if not data:
-                continue
+            skipped = pending.skipped
+            pending.skipped = 0
+            data_bytes = pending.take(UI_FLUSH_SLICE_BYTES)
+            if pending.size:
+                # 남은 데이터는 다른 포트 뒤에서 다시 처리
+                self._pending_ports.append(port_name)
+            else:
+                del self._rx_buffer[port_name]
 
-            # bytes로 변환
-            data_bytes = bytes(data)
+            # View 전달용 DTO 생성 및 View Interface 호출 (Decoupling)
+            # 로그 뷰는 이 호출에서 바로 모델에 반영 (추가 버퍼링 단계 없음)
+            self.view.append_rx_data(LogDataBatch(port=port_name, data=data_bytes, skipped=skipped))
 
-            # View 전달용 DTO 생성
-            batch = LogDataBatch(port=port_name, data=data_bytes)
+            if time.perf_counter() >= deadline:
+                break
 
-            # View Interface 호출 (Decoupling)
-            self.view.append_rx_data(batch)
-
-            # 버퍼 비우기 (해당 포트 키 삭제)
-            del self._rx_buffer[port_name]
+        if self._pending_ports:
+            ui_scheduler.request(self._flush_rx_buffer_to_ui)
 
     def stop(self) -> None:
-        """핸들러를 중지하고 타이머를 끕니다."""
-        self._ui_refresh_timer.stop()
+        """핸들러를 중지하고 예약된 플러시를 취소합니다."""
+        ui_scheduler.cancel(self._flush_rx_buffer_to_ui)
+
+    # -------------------------------------------------------------------------
+    # Statistics
+    # -------------------------------------------------------------------------
+    def on_port_opened(self, config: PortConfig) -> None:
+        """
+        포트 열림 시 해당 포트 통계를 초기화합니다.
+
+        Args:
+            config (PortConfig): 포트 연결 설정 (회선 점유율 계산용).
+        """
+        self._stats.configure_port(
+            config.port, config.baudrate, config.bytesize, config.parity, config.stopbits
+        )
+
+    def on_port_closed(self, port_name: str) -> None:
+        """
+        포트 닫힘 시 해당 포트 통계를 제거합니다.
+
+        Args:
+            port_name (str): 포트 이름.
+        """
+        self._stats.remove_port(port_name)
+
+    def on_port_error(self, port_name: str) -> None:
+        """
+        포트 에러를 통계에 기록합니다.
+
+        Args:
+            port_name (str): 포트 이름.
+        """
+        self._stats.record_error(port_name)
 
-    def reset_counts(self) -> None:
-        """통계 카운터를 초기화합니다 (주기적 속도 계산 후 호출)."""
-        self.rx_byte_count = 0
-        self.tx_byte_count = 0
\ No newline at end of file
+    def sample_statistics(self) -> Dict[str, PortStatistics]:
+        """
+        포트별 통계를 샘플링합니다. (UI 타이머에서 고정 주기로 호출)
+
+        Returns:
+            Dict[str, PortStatistics]: 포트 이름 -> 통계 DTO.
+        """
+        return self._stats.sample()
\ No newline at end of file
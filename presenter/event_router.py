@@ -19,7 +19,7 @@ EventBus와 Presenter/View 사이의 이벤트를 라우팅합니다.
 from PyQt5.QtCore import QObject, pyqtSignal
 from core.event_bus import event_bus
 from common.dtos import (
-    PortDataEvent, PortErrorEvent, PacketEvent,
+    PortDataEvent, PortErrorEvent, PacketBatchEvent,
     FileProgressEvent, PreferencesState, PortConnectionEvent,
     FileErrorEvent, MacroErrorEvent, FileCompletionEvent
 )
@@ -42,7 +42,7 @@ class EventRouter(QObject):
     port_error = pyqtSignal(object)        # PortErrorEvent
     data_received = pyqtSignal(object)     # PortDataEvent
     data_sent = pyqtSignal(object)         # PortDataEvent
-    packet_received = pyqtSignal(object)   # PacketEvent
+    packet_received = pyqtSignal(object)   # PacketBatchEvent
 
     # ---------------------------------------------------------
     # 2. Macro Events
@@ -146,12 +146,12 @@ class EventRouter(QObject):
         """
         self.data_sent.emit(event)
 
-    def _on_packet_received(self, event: PacketEvent):
+    def _on_packet_received(self, event: PacketBatchEvent):
         """
         패킷 파싱 완료 이벤트 처리
 
         Args:
-            event (PacketEvent): 패킷 이벤트 DTO.
+            event (PacketBatchEvent): 패킷 배치 이벤트 DTO.
         """
         self.packet_received.emit(event)
 
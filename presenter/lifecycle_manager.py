@@ -26,7 +26,7 @@ from PyQt5.QtCore import QTimer
 from core.settings_manager import SettingsManager
 from core.logger import logger
 from view.managers.color_manager import color_manager
-from common.constants import ConfigKeys
+from common.constants import ConfigKeys, STATS_SAMPLE_INTERVAL_MS
 from common.dtos import (
     MainWindowState,
     FontConfig,
@@ -91,6 +91,9 @@ class AppLifecycleManager:
         self.mp.connection_controller.data_received.connect(
             self.mp.data_handler.on_fast_data_received
         )
+        self.mp.connection_controller.packet_received.connect(
+            self.mp.data_handler.on_packet_batch_received
+        )
 
         # 6. 이벤트 및 시그널 연결 (MainPresenter 메서드 호출)
         self.mp._connect_signals()
@@ -164,10 +167,10 @@ class AppLifecycleManager:
         """
         백그라운드 서비스 및 타이머를 시작합니다.
         """
-        # 상태바 업데이트 타이머 시작 (1초 주기)
+        # 상태바/포트 통계 샘플링 타이머 시작 (1초 주기)
         self.mp.status_timer = QTimer()
         self.mp.status_timer.timeout.connect(self.mp.update_status_bar)
-        self.mp.status_timer.start(1000)
+        self.mp.status_timer.start(STATS_SAMPLE_INTERVAL_MS)
 
         # 초기화 완료 로그 - DTO 사용
         event = SystemLogEvent(message="Application initialized", level="INFO")
@@ -30,6 +30,7 @@ from PyQt5.QtCore import QObject, QTimer, QDateTime, Qt
 from view.main_window import MainWindow
 from model.connection_controller import ConnectionController
 from model.macro_runner import MacroRunner
+from model.packet_filter import compile_packet_filter
 
 from .port_presenter import PortPresenter
 from .macro_presenter import MacroPresenter
@@ -49,7 +50,9 @@ from view.panels.port_panel import PortPanel
 from view.managers.language_manager import language_manager
 from view.managers.color_manager import color_manager
 from core.logger import logger
-from common.constants import ConfigKeys, EventTopics
+from common.constants import (
+    ConfigKeys, EventTopics, DEFAULT_GAP_CHARS, DEFAULT_RX_ENCODING, DEFAULT_LOG_ROW_BYTES, LOG_HEX_ROW_BYTES
+)
 from common.enums import LogFormat
 from common.dtos import (
     ManualCommand,
@@ -224,6 +227,11 @@ class MainPresenter(QObject):
             language=settings.get(ConfigKeys.LANGUAGE, "en"),
             font_size=settings.get(ConfigKeys.PROP_FONT_SIZE, 10),
             max_log_lines=settings.get(ConfigKeys.RX_MAX_LINES, 2000),
+            rx_encoding=settings.get(ConfigKeys.RX_ENCODING, DEFAULT_RX_ENCODING),
+            log_scrollback=settings.get(ConfigKeys.RX_SCROLLBACK, False),
+            log_compression=settings.get(ConfigKeys.RX_COMPRESSION, False),
+            log_row_bytes=settings.get(ConfigKeys.RX_ROW_BYTES, DEFAULT_LOG_ROW_BYTES),
+            log_hex_row_bytes=settings.get(ConfigKeys.RX_HEX_ROW_BYTES, LOG_HEX_ROW_BYTES[0]),
             baudrate=settings.get(ConfigKeys.PORT_BAUDRATE, 115200),
             newline=str(settings.get(ConfigKeys.PORT_NEWLINE, "\n")),
             local_echo_enabled=settings.get(ConfigKeys.PORT_LOCAL_ECHO, False),
@@ -231,9 +239,12 @@ class MainPresenter(QObject):
             command_prefix=settings.get(ConfigKeys.COMMAND_PREFIX, ""),
             command_suffix=settings.get(ConfigKeys.COMMAND_SUFFIX, ""),
             log_dir=settings.get(ConfigKeys.LOG_PATH, ""),
+            log_packet_mode=settings.get(ConfigKeys.LOG_PACKET_MODE, False),
+            log_packet_filter=settings.get(ConfigKeys.LOG_PACKET_FILTER, ""),
             parser_type=settings.get(ConfigKeys.PACKET_PARSER_TYPE, 0),
             delimiters=settings.get(ConfigKeys.PACKET_DELIMITERS, ["\\r\\n"]),
             packet_length=settings.get(ConfigKeys.PACKET_LENGTH, 64),
+            gap_chars=settings.get(ConfigKeys.PACKET_GAP_CHARS, DEFAULT_GAP_CHARS),
             at_color_ok=settings.get(ConfigKeys.AT_COLOR_OK, True),
             at_color_error=settings.get(ConfigKeys.AT_COLOR_ERROR, True),
             at_color_urc=settings.get(ConfigKeys.AT_COLOR_URC, True),
@@ -330,6 +341,11 @@ class MainPresenter(QObject):
         settings.set(ConfigKeys.LANGUAGE, new_state.language)
         settings.set(ConfigKeys.PROP_FONT_SIZE, new_state.font_size)
         settings.set(ConfigKeys.RX_MAX_LINES, new_state.max_log_lines)
+        settings.set(ConfigKeys.RX_ENCODING, new_state.rx_encoding)
+        settings.set(ConfigKeys.RX_SCROLLBACK, new_state.log_scrollback)
+        settings.set(ConfigKeys.RX_COMPRESSION, new_state.log_compression)
+        settings.set(ConfigKeys.RX_ROW_BYTES, new_state.log_row_bytes)
+        settings.set(ConfigKeys.RX_HEX_ROW_BYTES, new_state.log_hex_row_bytes)
         settings.set(ConfigKeys.PORT_BAUDRATE, new_state.baudrate)
         settings.set(ConfigKeys.PORT_NEWLINE, new_state.newline)
         settings.set(ConfigKeys.PORT_LOCAL_ECHO, new_state.local_echo_enabled)
@@ -337,11 +353,14 @@ class MainPresenter(QObject):
         settings.set(ConfigKeys.COMMAND_PREFIX, new_state.command_prefix)
         settings.set(ConfigKeys.COMMAND_SUFFIX, new_state.command_suffix)
         settings.set(ConfigKeys.LOG_PATH, new_state.log_dir)
+        settings.set(ConfigKeys.LOG_PACKET_MODE, new_state.log_packet_mode)
+        settings.set(ConfigKeys.LOG_PACKET_FILTER, new_state.log_packet_filter)
 
         # Packet Settings
         settings.set(ConfigKeys.PACKET_PARSER_TYPE, new_state.parser_type)
         settings.set(ConfigKeys.PACKET_DELIMITERS, new_state.delimiters)
         settings.set(ConfigKeys.PACKET_LENGTH, new_state.packet_length)
+        settings.set(ConfigKeys.PACKET_GAP_CHARS, new_state.gap_chars)
         settings.set(ConfigKeys.AT_COLOR_OK, new_state.at_color_ok)
         settings.set(ConfigKeys.AT_COLOR_ERROR, new_state.at_color_error)
         settings.set(ConfigKeys.AT_COLOR_URC, new_state.at_color_urc)
@@ -363,6 +382,14 @@ class MainPresenter(QObject):
             # PortPanel인지 확인하고 설정 (View 내부 로직 의존 최소화)
             if hasattr(widget, 'set_max_log_lines'):
                 widget.set_max_log_lines(new_state.max_log_lines)
+            if hasattr(widget, 'set_rx_encoding'):
+                widget.set_rx_encoding(new_state.rx_encoding)
+            if hasattr(widget, 'set_log_scrollback'):
+                widget.set_log_scrollback(new_state.log_scrollback)
+            if hasattr(widget, 'set_log_compression'):
+                widget.set_log_compression(new_state.log_compression)
+            if hasattr(widget, 'set_log_row_bytes'):
+                widget.set_log_row_bytes(new_state.log_row_bytes, new_state.log_hex_row_bytes)
 
         self.manual_control_presenter.update_local_echo_setting(new_state.local_echo_enabled)
 
@@ -405,12 +432,17 @@ class MainPresenter(QObject):
         포트 열림 알림
 
         Logic:
+            - 포트 통계 초기화 (회선 점유율 계산용 설정 전달)
             - 상태바 업데이트
             - 컨트롤 패널(수동/매크로) 활성화 동기화
 
         Args:
             event (PortConnectionEvent): 포트 연결 이벤트 DTO.
         """
+        config = self.connection_controller.get_connection_config(event.port)
+        if config:
+            self.data_handler.on_port_opened(config)
+
         self.view.update_status_bar_port(event.port, True)
         self.view.show_status_message(f"Connected to {event.port}", 3000)
 
@@ -442,6 +474,7 @@ class MainPresenter(QObject):
                 if not self.connection_controller.has_active_broadcast_ports():
                     self._notify_macro_error("No active ports left. Macro stopped.")
 
+        self.data_handler.on_port_closed(port_name)
         self.view.update_status_bar_port(event.port, False)
         self.view.show_status_message(f"Disconnected from {event.port}", 3000)
 
@@ -454,6 +487,7 @@ class MainPresenter(QObject):
         Args:
             event (PortErrorEvent): 포트 오류 이벤트 DTO.
         """
+        self.data_handler.on_port_error(event.port)
         self.view.show_status_message(f"Error ({event.port}): {event.message}", 5000)
 
     def _on_port_tab_changed(self, index: int) -> None:
@@ -631,18 +665,25 @@ class MainPresenter(QObject):
     def update_status_bar(self) -> None:
         """
         상태 표시줄 업데이트 (Timer Slot).
-        DataHandler의 통계를 바탕으로 UI 갱신.
-        """
-        stats = PortStatistics(
-            rx_bytes=self.data_handler.rx_byte_count,
-            tx_bytes=self.data_handler.tx_byte_count,
-            bps=0
-        )
-
-        self.view.update_status_bar_stats(stats)
+        DataHandler의 포트별 통계를 샘플링하여 UI 갱신.
 
-        # 카운터 초기화 (Interval 단위 속도 계산용)
-        self.data_handler.reset_counts()
+        Logic:
+            - 포트별 통계는 해당 포트 탭의 통계 위젯에 반영
+            - 상태바에는 전체 포트 합계 표시
+        """
+        port_stats = self.data_handler.sample_statistics()
+
+        total = PortStatistics()
+        for port_name, stats in port_stats.items():
+            self.view.update_port_statistics(port_name, stats)
+            total.rx_bytes += stats.rx_bytes
+            total.tx_bytes += stats.tx_bytes
+            total.error_count += stats.error_count
+            total.bps += stats.bps
+            total.rx_rate += stats.rx_rate
+            total.tx_rate += stats.tx_rate
+
+        self.view.update_status_bar_stats(total)
         self.view.update_status_bar_time(QDateTime.currentDateTime().toString("HH:mm:ss"))
 
     def on_shortcut_connect(self) -> None:
@@ -708,6 +749,7 @@ class MainPresenter(QObject):
         Logic:
             - Panel을 통해 파일 다이얼로그 표시
             - 확장자 기반 포맷 결정 (BIN/HEX/PCAP)
+            - 패킷 모드인 경우 필터 표현식 컴파일 (오류 시 중단)
             - DataLoggerManager에 시작 요청
             - Panel을 통해 로깅 활성화 UI 상태 업데이트
 
@@ -736,8 +778,19 @@ class MainPresenter(QObject):
         lower_ext = ext.lower()
         log_format = format_map.get(lower_ext, LogFormat.BIN)
 
+        # 패킷 모드 설정 (필터는 시작 시 1회 컴파일)
+        packet_mode = self.settings_manager.get(ConfigKeys.LOG_PACKET_MODE, False)
+        packet_filter = None
+        if packet_mode:
+            try:
+                packet_filter = compile_packet_filter(self.settings_manager.get(ConfigKeys.LOG_PACKET_FILTER, ""))
+            except ValueError as e:
+                panel.set_logging_active(False)
+                self._log_error(f"[{port}] Invalid packet filter: {e}")
+                return
+
         # 포맷 전달 및 시작
-        if data_logger_manager.start_logging(port, file_path, log_format):
+        if data_logger_manager.start_logging(port, file_path, log_format, packet_mode, packet_filter):
             panel.set_logging_active(True)
             self._log_info(f"[{port}] Logging started ({log_format.value}): {file_path}")
         else:
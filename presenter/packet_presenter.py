@@ -5,22 +5,26 @@
 
 ## WHY
 * 실시간 패킷 데이터의 UI 업데이트 로직 분리 (MVP 패턴)
-* 패킷 파싱 데이터의 시각화 형식(Hex/ASCII) 변환 담당
 * 대량 패킷 수신 시 UI 버퍼링 및 설정 동기화 관리
 
 ## WHAT
 * PacketPanel(View)과 EventRouter(Model Interface) 연결
-* 패킷 수신 이벤트(PacketEvent) 처리 및 View 데이터(PacketViewData) 변환
+* 패킷 배치 이벤트(PacketBatchEvent) 처리 및 View 전달
 * 설정 변경(버퍼 크기, 색상 등)에 따른 View 업데이트
 * 캡처 시작/정지 및 초기화 제어
+* 필터 표현식 컴파일 및 포맷팅 전 패킷 선별
+* 선택된 패킷의 프로토콜 필드 지연 디코딩 (DissectorRegistry)
 
 ## HOW
 * EventRouter의 시그널을 구독하여 패킷 수신
-* DTO 변환 후 View의 append_packet 메서드 호출
+* 변환 없이 View의 append_packets 메서드로 배치 단위 호출
 * SettingsManager를 통해 초기 설정 로드 및 변경 사항 반영
 """
-from typing import Optional
-from PyQt5.QtCore import QObject, QDateTime
+from typing import Any, Optional
+from PyQt5.QtCore import QObject
+
+from model.packet_filter import compile_packet_filter, PacketPredicate
+from model.packet_dissector import dissector_registry
 
 from view.panels.packet_panel import PacketPanel
 from presenter.event_router import EventRouter
@@ -28,8 +32,7 @@ from core.settings_manager import SettingsManager
 from core.logger import logger
 from common.constants import ConfigKeys
 from common.dtos import (
-    PacketEvent,
-    PacketViewData,
+    PacketBatchEvent,
     PreferencesState
 )
 
@@ -56,12 +59,17 @@ class PacketPresenter(QObject):
         # 캡처 활성화 상태 (기본값 True)
         self._is_capturing = True
 
+        # 컴파일된 필터 (None이면 전체 표시)
+        self._packet_filter: Optional[PacketPredicate] = None
+
         # 1. 초기 설정 적용
         self._apply_initial_settings()
 
         # 2. View 시그널 연결 (Facade Signal)
         self.panel.clear_requested.connect(self.on_clear_requested)
         self.panel.capture_toggled.connect(self.on_capture_toggled)
+        self.panel.filter_changed.connect(self.on_filter_changed)
+        self.panel.packet_selected.connect(self.on_packet_selected)
 
         # 3. EventRouter 시그널 연결
         self.event_router.packet_received.connect(self.on_packet_received)
@@ -84,54 +92,32 @@ class PacketPresenter(QObject):
         self._is_capturing = realtime
         self.panel.set_capture_state(realtime)
 
-    def on_packet_received(self, event: PacketEvent) -> None:
+    def on_packet_received(self, event: PacketBatchEvent) -> None:
         """
-        패킷 수신 이벤트 처리 핸들러
+        패킷 배치 수신 이벤트 처리 핸들러
 
         Logic:
             1. 캡처 중지 상태면 무시
-            2. DTO(`PacketEvent`)에서 패킷 객체 추출
-            3. 패킷 데이터를 View용 DTO(`PacketViewData`)로 변환
-            4. View에 추가 요청
+            2. 필터가 있으면 일치하는 패킷만 선별
+            3. 패킷 배치를 그대로 View에 전달
+               (문자열 변환은 모델이 화면에 보이는 행에 대해서만 수행)
 
         Args:
-            event (PacketEvent): 수신된 패킷 이벤트 DTO.
+            event (PacketBatchEvent): 수신된 패킷 배치 이벤트 DTO.
         """
         if not self._is_capturing:
             return
 
-        packet = event.packet
-        if not packet:
-            return
-
-        # 타임스탬프 포맷팅
-        timestamp = QDateTime.currentDateTime().toString("HH:mm:ss.zzz")
-
-        # 데이터 변환 (Hex / ASCII)
-        # Packet 객체(model.packet_parser.Packet)는 raw_data 속성을 가진다고 가정
-        raw_data = getattr(packet, 'data', b'') # Packet DTO 속성명 'data'
-
-        # Hex 문자열 변환 (예: "01 02 0A")
-        data_hex = " ".join(f"{b:02X}" for b in raw_data)
+        packets = event.packets
+        if self._packet_filter is not None:
+            packet_filter = self._packet_filter
+            packets = [p for p in packets if packet_filter(p)]
 
-        # ASCII 문자열 변환 (제어 문자는 점으로 표시)
-        data_ascii = "".join(chr(b) if 32 <= b < 127 else "." for b in raw_data)
-
-        # 패킷 타입 (메타데이터 활용)
-        packet_type = "Raw"
-        if packet.metadata and "type" in packet.metadata:
-            packet_type = packet.metadata["type"]
-
-        # View용 DTO 생성
-        view_data = PacketViewData(
-            time_str=timestamp,
-            packet_type=packet_type,
-            data_hex=data_hex,
-            data_ascii=data_ascii
-        )
+        if not packets:
+            return
 
         # View 업데이트 (Facade Method)
-        self.panel.append_packet(view_data)
+        self.panel.append_packets(packets)
 
     def on_settings_changed(self, state: PreferencesState) -> None:
         """
@@ -153,11 +139,40 @@ class PacketPresenter(QObject):
             self._is_capturing = state.packet_realtime
             self.panel.set_capture_state(state.packet_realtime)
 
+    def on_filter_changed(self, expr: str) -> None:
+        """
+        필터 표현식 변경 처리 (입력 완료 시 1회 컴파일)
+
+        Logic:
+            - 표현식 컴파일 성공 시 필터 교체 및 오류 표시 해제
+            - 문법 오류 시 기존 필터 유지 및 View에 오류 표시
+
+        Args:
+            expr (str): 필터 표현식 (빈 문자열이면 필터 해제).
+        """
+        try:
+            self._packet_filter = compile_packet_filter(expr)
+        except ValueError as e:
+            self.panel.set_filter_error(str(e))
+            return
+        self.panel.set_filter_error("")
+        logger.debug(f"Packet filter changed: {expr!r}")
+
+    def on_packet_selected(self, packet: Any) -> None:
+        """
+        패킷 선택 시 필드 트리 표시 (선택된 패킷만 디코딩)
+
+        Args:
+            packet (Any): 선택된 패킷 (model.packet_parser.Packet).
+        """
+        self.panel.show_packet_fields(dissector_registry.decode(packet))
+
     def on_clear_requested(self) -> None:
         """
         View의 Clear 버튼 클릭 요청 처리
         """
         self.panel.clear_view()
+        dissector_registry.clear_cache()
         logger.debug("Packet view cleared by user.")
 
     def on_capture_toggled(self, enabled: bool) -> None:
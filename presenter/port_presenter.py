@@ -31,7 +31,10 @@ from model.connection_controller import ConnectionController
 from model.port_scanner import PortScanWorker
 from core.settings_manager import SettingsManager
 from core.logger import logger
-from common.constants import ConfigKeys
+from common.constants import (
+    ConfigKeys, DEFAULT_GAP_CHARS, DEFAULT_RX_ENCODING, DEFAULT_LOG_ROW_BYTES, LOG_HEX_ROW_BYTES, PARSER_INDEX_GAP
+)
+from common.enums import ParserType
 from common.dtos import (
     PortConfig,
     PortInfo,
@@ -92,6 +95,9 @@ class PortPresenter(QObject):
             widget = self.left_section.get_port_panel_at(i)
             if widget:
                 self._connect_tab_signals(widget)
+                self._apply_rx_encoding(widget)
+                self._apply_log_storage(widget)
+                self._apply_log_row_bytes(widget)
 
         # 새 탭 추가 시그널 연결 (View의 시그널 사용)
         self.left_section.port_tab_added.connect(self._on_port_tab_added)
@@ -184,9 +190,68 @@ class PortPresenter(QObject):
             panel (PortPanel): 추가된 PortPanel.
         """
         self._connect_tab_signals(panel)
+        self._apply_rx_encoding(panel)
+        self._apply_log_storage(panel)
+        self._apply_log_row_bytes(panel)
         # 탭 추가 시에도 포트 리스트 최신화 (새 탭에 빈 목록이 뜨지 않도록)
         self.scan_ports()
 
+    def _apply_rx_encoding(self, panel: PortPanel) -> None:
+        """
+        설정된 수신 데이터 인코딩을 패널에 적용합니다.
+
+        Args:
+            panel (PortPanel): 대상 PortPanel.
+        """
+        encoding = SettingsManager().get(ConfigKeys.RX_ENCODING, DEFAULT_RX_ENCODING)
+        try:
+            panel.set_rx_encoding(encoding)
+        except ValueError as e:
+            # 잘못된 설정값이면 패널의 기존 인코딩 유지
+            logger.warning(f"RX encoding not applied: {e}")
+
+    def _apply_log_storage(self, panel: PortPanel) -> None:
+        """
+        설정된 로그 보관 방식(디스크 스크롤백, 메모리 압축 보관)을 패널에 적용합니다.
+
+        Args:
+            panel (PortPanel): 대상 PortPanel.
+        """
+        settings = SettingsManager()
+        panel.set_log_scrollback(settings.get(ConfigKeys.RX_SCROLLBACK, False))
+        panel.set_log_compression(settings.get(ConfigKeys.RX_COMPRESSION, False))
+
+    @staticmethod
+    def _apply_parser_settings(config: PortConfig) -> None:
+        """
+        환경 설정의 패킷 파서 선택을 연결 설정에 적용합니다.
+
+        Logic:
+            - 유휴 간격 파서가 선택되어 있으면 GapParser와 문자 시간 단위 임계값 지정
+              (Controller가 포트 보드레이트로 환산, Modbus RTU 디섹터 적용 대상)
+            - 그 외 선택은 연결 설정의 파서를 그대로 유지
+
+        Args:
+            config (PortConfig): 연결 요청 설정 DTO (직접 수정).
+        """
+        settings = SettingsManager()
+        if settings.get(ConfigKeys.PACKET_PARSER_TYPE, 0) == PARSER_INDEX_GAP:
+            config.parser_type = ParserType.GAP
+            config.parser_options = {"gap_chars": settings.get(ConfigKeys.PACKET_GAP_CHARS, DEFAULT_GAP_CHARS)}
+
+    def _apply_log_row_bytes(self, panel: PortPanel) -> None:
+        """
+        설정된 로그 행 최대 폭(바이트)을 패널에 적용합니다.
+
+        Args:
+            panel (PortPanel): 대상 PortPanel.
+        """
+        settings = SettingsManager()
+        panel.set_log_row_bytes(
+            settings.get(ConfigKeys.RX_ROW_BYTES, DEFAULT_LOG_ROW_BYTES),
+            settings.get(ConfigKeys.RX_HEX_ROW_BYTES, LOG_HEX_ROW_BYTES[0])
+        )
+
     def update_current_port_panel(self) -> None:
         """
         현재 활성 포트 패널 참조를 업데이트합니다.
@@ -251,6 +316,7 @@ class PortPresenter(QObject):
         Args:
             config (PortConfig): 포트 설정 DTO.
         """
+        self._apply_parser_settings(config)
         self.connection_controller.open_connection(config)
 
     def handle_close_request(self) -> None:
@@ -373,6 +439,7 @@ class PortPresenter(QObject):
             config = self.current_port_panel.get_port_config()
             port_name = config.port
             if port_name and not self.connection_controller.is_connection_open(port_name):
+                self._apply_parser_settings(config)
                 self.connection_controller.open_connection(config)
             elif not port_name:
                 logger.warning("No port selected")
@@ -11,6 +11,7 @@
 ## WHAT
 * CommandProcessor: ASCII/HEX 변환, 접두사/접미사 처리, 에러 핸들링
 * EventBus: 구독/발행 메커니즘, 토픽 라우팅, 구독 취소
+* UiFlushScheduler: 요청 기반 플러시 예약, 병합 및 유휴 정지
 * SettingsManager: 싱글톤 패턴, 설정값 읽기/쓰기 무결성
 
 ## HOW
@@ -25,6 +26,7 @@ from unittest.mock import MagicMock, patch
 
 from core.command_processor import CommandProcessor
 from core.event_bus import EventBus
+from core.ui_scheduler import UiFlushScheduler
 from core.settings_manager import SettingsManager
 from common.constants import ConfigKeys
 
@@ -246,6 +248,87 @@ class TestEventBus:
         sub2.assert_called_once()
 
 
+class TestUiFlushScheduler:
+    """
+    UI 플러시 스케줄러의 요청 기반 동작을 검증합니다.
+    """
+
+    def test_idle_until_requested(self, qtbot):
+        """
+        요청 병합, 같은 틱 내 후속 단계 실행 및 유휴 정지 테스트
+
+        Logic:
+            - 요청 전에는 타이머가 없음 (유휴 Wakeup 없음)
+            - 같은 콜백 중복 요청은 1회 실행으로 병합
+            - 실행 중 요청된 다른 콜백은 같은 틱에 실행
+            - 처리 후 대기 요청이 없으면 타이머 정지
+        """
+        scheduler = UiFlushScheduler(interval_ms=1)
+        assert scheduler._timer is None
+
+        second = MagicMock()
+        first = MagicMock(side_effect=lambda: scheduler.request(second))
+
+        # WHEN: 중복 요청
+        scheduler.request(first)
+        scheduler.request(first)
+        qtbot.waitUntil(lambda: scheduler.is_idle, timeout=1000)
+
+        # THEN
+        first.assert_called_once()
+        second.assert_called_once()
+        assert not scheduler._timer.isActive()
+
+    def test_rerequest_defers_to_next_tick(self, qtbot):
+        """
+        실행 중 자기 자신을 재요청하면 다음 틱으로 이월되는지 테스트
+        """
+        scheduler = UiFlushScheduler(interval_ms=1)
+        calls = []
+
+        def busy():
+            calls.append(1)
+            if len(calls) < 3:
+                scheduler.request(busy)
+
+        scheduler.request(busy)
+        qtbot.waitUntil(lambda: len(calls) == 3, timeout=1000)
+        qtbot.waitUntil(lambda: scheduler.is_idle, timeout=1000)
+        assert len(calls) == 3
+
+    def test_deleted_owner_callback_dropped(self, qtbot):
+        """
+        요청이 남은 채 위젯이 삭제되면 콜백을 호출하지 않고 버리는지 테스트
+
+        Logic:
+            - C++ 객체가 삭제된 위젯의 바운드 메서드 요청
+            - 참조가 사라진 Python 객체의 바운드 메서드 요청 (스케줄러가 객체를 붙잡지 않음)
+        """
+        from PyQt5 import sip
+        from PyQt5.QtWidgets import QWidget
+
+        class Owner:
+            calls = 0
+
+            def flush(self):
+                Owner.calls += 1
+
+        scheduler = UiFlushScheduler(interval_ms=1)
+        widget = QWidget()
+        alive = Owner()
+        scheduler.request(widget.update)
+        scheduler.request(Owner().flush)
+        scheduler.request(alive.flush)
+        sip.delete(widget)
+
+        with patch('core.ui_scheduler.logger') as mock_logger:
+            qtbot.waitUntil(lambda: scheduler.is_idle, timeout=1000)
+            qtbot.wait(5)
+
+        mock_logger.error.assert_not_called()
+        assert Owner.calls == 1
+
+
 class TestSettingsManager:
     """
     설정 관리자(SettingsManager)의 저장소 로직을 검증합니다.
@@ -12,7 +12,7 @@
 * 시스템 초기화 및 의존성 주입 확인
 * 포트 연결 및 해제 시나리오 (View -> Presenter -> Model)
 * 수동 데이터 송신 흐름 (ManualPanel -> ConnectionController)
-* 데이터 수신 및 UI 업데이트 흐름 (Fast Path 검증)
+* 데이터 수신 및 UI 업데이트 흐름 (Fast Path 검증, 과부하 생략)
 * 매크로 실행 및 중단 시나리오
 
 ## HOW
@@ -30,6 +30,10 @@ from unittest.mock import MagicMock, patch
 from PyQt5.QtCore import QCoreApplication
 
 from presenter.main_presenter import MainPresenter
+from presenter.data_handler import DataTrafficHandler
+from presenter.port_presenter import PortPresenter
+from model.connection_controller import ConnectionController
+from model.packet_parser import Packet
 from common.dtos import (
     PortConfig,
     ManualCommand,
@@ -37,9 +41,10 @@ from common.dtos import (
     MacroEntry,
     MacroExecutionRequest,
     MacroRepeatOption,
-    PacketEvent
+    PacketBatchEvent
 )
-from common.constants import ConfigKeys
+from common.constants import ConfigKeys, PARSER_INDEX_GAP
+from common.enums import ParserType
 
 
 @pytest.fixture
@@ -242,7 +247,7 @@ class TestIntegrationRefactored:
 
         # THEN: 즉시 UI 업데이트가 아니라 버퍼에 들어가야 함 (Throttling)
         assert port_name in presenter.data_handler._rx_buffer
-        assert presenter.data_handler._rx_buffer[port_name] == rx_data
+        assert presenter.data_handler._rx_buffer[port_name].size == len(rx_data)
 
         # WHEN: 타이머에 의한 플러시 시뮬레이션 (직접 호출)
         presenter.data_handler._flush_rx_buffer_to_ui()
@@ -254,6 +259,78 @@ class TestIntegrationRefactored:
         call_args = window.append_rx_data.call_args[0][0]
         assert call_args.port == port_name
         assert call_args.data == rx_data
+        # 청크 1개는 복사 없이 그대로 전달 (Zero-copy)
+        assert call_args.data is rx_data
+
+    def test_data_reception_overload(self, mock_main_window):
+        """
+        과부하 시 화면 대기 버퍼 상한 및 생략 마커 전달 검증
+
+        Logic:
+            1. 대기 버퍼 상한을 넘는 데이터 수신
+            2. 오래된 구간이 생략되고 생략량이 DTO로 전달되는지 확인
+            3. 포트당 1회 전달 크기가 제한되고 나머지는 다음 틱으로 이월되는지 확인
+        """
+        with patch('presenter.data_handler.UI_PENDING_LIMIT_BYTES', 8), \
+             patch('presenter.data_handler.UI_FLUSH_SLICE_BYTES', 4):
+            handler = DataTrafficHandler(mock_main_window)
+            handler.stop()
+
+            # WHEN: 상한(8) 초과 수신 (2개 포트)
+            handler.on_fast_data_received(PortDataEvent(port="COM1", data=b"0123456789AB"))
+            handler.on_fast_data_received(PortDataEvent(port="COM2", data=b"xy"))
+
+            # THEN: 가장 최근 8바이트만 유지
+            assert handler._rx_buffer["COM1"].size == 8
+
+            # WHEN: 1틱 플러시
+            handler._flush_rx_buffer_to_ui()
+
+        batches = [c[0][0] for c in mock_main_window.append_rx_data.call_args_list]
+        # THEN: Round-robin 순서로 포트당 최대 4바이트, 생략량은 첫 배치에만 포함
+        assert [(b.port, b.data, b.skipped) for b in batches] == [
+            ("COM1", b"4567", 4),
+            ("COM2", b"xy", 0),
+            ("COM1", b"89AB", 0),
+        ]
+
+    def test_log_storage_settings_applied_to_tab(self):
+        """
+        저장된 로그 보관 설정(스크롤백/압축 보관)이 새 탭 패널에 적용되는지 검증
+        """
+        # GIVEN: 압축 보관만 켜진 설정
+        values = {ConfigKeys.RX_SCROLLBACK: False, ConfigKeys.RX_COMPRESSION: True}
+        settings = MagicMock()
+        settings.get.side_effect = lambda key, default=None: values.get(key, default)
+        panel = MagicMock()
+
+        # WHEN
+        with patch('presenter.port_presenter.SettingsManager', return_value=settings):
+            PortPresenter._apply_log_storage(MagicMock(), panel)
+
+        # THEN
+        panel.set_log_scrollback.assert_called_once_with(False)
+        panel.set_log_compression.assert_called_once_with(True)
+
+    def test_gap_parser_settings_applied_to_connection(self):
+        """
+        환경 설정에서 유휴 간격 파서를 선택하면 연결 설정에 GapParser와 문자 시간 임계값이 지정되는지 검증
+        """
+        # GIVEN: 유휴 간격 파서, 임계값 3.5 문자 시간
+        values = {ConfigKeys.PACKET_PARSER_TYPE: PARSER_INDEX_GAP, ConfigKeys.PACKET_GAP_CHARS: 3.5}
+        settings = MagicMock()
+        settings.get.side_effect = lambda key, default=None: values.get(key, default)
+        config = PortConfig(port="COM9", baudrate=9600)
+
+        # WHEN
+        with patch('presenter.port_presenter.SettingsManager', return_value=settings):
+            PortPresenter._apply_parser_settings(config)
+
+        # THEN: Controller가 만드는 파서는 9600bps 기준 3.5 문자 시간(약 4ms) 임계값의 GapParser
+        assert config.parser_type == ParserType.GAP
+        assert config.parser_options == {"gap_chars": 3.5}
+        parser = ConnectionController._create_parser(config)
+        assert parser.gap_us == pytest.approx(3.5 * 10 / 9600 * 1_000_000)
 
     def test_macro_execution_flow(self, integration_system, sample_port_config):
         """
@@ -328,23 +405,14 @@ class TestIntegrationRefactored:
         """
         presenter, window, controller = integration_system
 
-        # GIVEN: 패킷 이벤트 생성
-        # PacketParser가 만든 패킷 객체 Mocking
-        mock_packet = MagicMock()
-        mock_packet.raw_data = b'\xAA\xBB'
-        mock_packet.type_name = "TEST_PKT"
-
-        event = PacketEvent(packet=mock_packet)
+        # GIVEN: 패킷 배치 이벤트 생성
+        packet = Packet(b'\xAA\xBB', 0.0, "TEST_PKT")
+        event = PacketBatchEvent(port="COM1", packets=[packet])
 
         # WHEN: EventRouter 시그널 발생 (라우터는 MainPresenter 초기화 시 생성됨)
         # MainPresenter 내부의 event_router를 통해 패킷 수신 시뮬레이션
         presenter.event_router.packet_received.emit(event)
         QCoreApplication.processEvents()
 
-        # THEN: PacketPanel에 데이터 추가 확인
-        window.right_section.packet_panel.append_packet.assert_called_once()
-
-        # DTO 값 검증
-        view_data = window.right_section.packet_panel.append_packet.call_args[0][0]
-        assert view_data.data_hex == "AA BB"
-        assert view_data.packet_type == "TEST_PKT"
\ No newline at end of file
+        # THEN: PacketPanel에 배치가 그대로 전달되었는지 확인
+        window.right_section.packet_panel.append_packets.assert_called_once_with([packet])
\ No newline at end of file
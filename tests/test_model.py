@@ -10,6 +10,10 @@
 
 ## WHAT
 * PacketParser: Raw 데이터 파싱 및 객체 변환 테스트
+* PacketFilter: 필터 표현식 컴파일 및 판별 테스트
+* PacketDissector: 프로토콜 필드 지연 디코딩 테스트
+* PortStatisticsEngine: 포트별 처리량/점유율 집계 테스트
+* LineAssembler: 배치 경계에 걸친 문자/라인 조립 테스트
 * ConnectionController: 연결 생명주기 및 데이터 송수신 흐름 제어 테스트
 * MacroRunner: 매크로 로드, 상태 관리 및 시그널 발생 테스트
 
@@ -24,11 +28,19 @@ import time
 import pytest
 from unittest.mock import MagicMock, call, patch
 
-from model.packet_parser import ParserFactory
+from model.packet_parser import ParserFactory, Packet
+from model.packet_filter import compile_packet_filter
+from model.packet_dissector import DissectorRegistry, ModbusRtuDissector, ATDissector, dissector_registry
+from model.port_statistics import PortStatisticsEngine
+from model.line_assembler import LineAssembler
+from model.line_store import LineStore, DiskLineStore, CompressedLineStore, LINE_FLAG_TEXT
+from model.log_search_index import LogSearchIndex
+from model.terminal_screen import TerminalScreen, decode_attr, ATTR_BOLD, COLOR_RGB
 from model.connection_controller import ConnectionController
 from model.macro_runner import MacroRunner
 from common.dtos import PortConfig, MacroEntry, PortConnectionEvent, PortDataEvent
 from common.enums import ParserType
+from common.constants import DEFAULT_GAP_US, MIN_GAP_US
 
 
 # =============================================================================
@@ -79,6 +91,580 @@ class TestPacketParser:
         assert packets[0].raw_data == input_data
         assert packets[0].type_name == "RAW"
 
+    def test_packet_is_slotted(self):
+        """
+        Packet이 인스턴스 dict 없이 생성되는지 테스트 (고속 수신 시 메모리 절감)
+        """
+        # GIVEN/WHEN: AT 파서로 2개 라인 파싱
+        parser = ParserFactory.create_parser(ParserType.AT)
+        packets = parser.parse(b"OK\r\nERROR\r\n")
+
+        # THEN: 두 패킷 모두 타입명 공유, __dict__ 없음
+        assert [p.type_name for p in packets] == ["AT", "AT"]
+        assert not hasattr(packets[0], "__dict__")
+
+
+class TestGapParser:
+    """
+    유휴 간격(Gap) 기반 파서의 프레이밍 동작을 검증하는 테스트 클래스입니다.
+    """
+
+    def test_split_by_arrival_gap(self):
+        """
+        청크 도착 시각 간격으로 버스트를 분리하는지 테스트
+
+        Logic:
+            - 임계값 1ms 파서에 3개 청크 입력 (두 번째 간격만 임계값 초과)
+            - 첫 버스트만 패킷으로 확정되고 마지막 버스트는 보류되는지 확인
+        """
+        # GIVEN: 1ms 임계값 파서, 한 배치에 담긴 청크 3개
+        parser = ParserFactory.create_parser(ParserType.GAP, gap_us=1000)
+        data = b"AABBCC"
+        marks = [(0, 10.0000), (2, 10.0005), (4, 10.0100)]
+
+        # WHEN: 파싱 수행
+        packets = parser.parse_chunks(data, marks)
+
+        # THEN: 첫 버스트(AABB)만 확정, 타임스탬프는 첫 청크 도착 시각
+        assert len(packets) == 1
+        assert packets[0].data == b"AABB"
+        assert packets[0].timestamp == 10.0
+
+        # WHEN: 유휴 통지 (임계값 경과)
+        tail = parser.flush_idle(10.0200)
+
+        # THEN: 마지막 버스트 확정
+        assert [p.data for p in tail] == [b"CC"]
+        assert parser.flush_idle(10.0300) == []
+
+    def test_burst_across_batches(self):
+        """
+        Worker 배치 경계와 무관하게 하나의 버스트가 유지되는지 테스트
+        """
+        # GIVEN: 5ms 임계값 파서
+        parser = ParserFactory.create_parser(ParserType.GAP, gap_us=5000)
+
+        # WHEN: 간격이 짧은 두 배치 입력 후 임계값 이전에 유휴 통지
+        assert parser.parse_chunks(b"12", [(0, 1.000)]) == []
+        assert parser.parse_chunks(b"34", [(0, 1.001)]) == []
+        assert parser.flush_idle(1.002) == []
+
+        # THEN: 임계값 경과 후 하나의 패킷으로 확정
+        packets = parser.flush_idle(1.010)
+        assert len(packets) == 1
+        assert packets[0].data == b"1234"
+
+    def test_gap_in_char_times(self):
+        """
+        문자 시간 단위 임계값 환산 테스트 (9600 8N1 = 10bit/char)
+        """
+        # WHEN: 3.5 문자 시간으로 생성
+        parser = ParserFactory.create_parser(ParserType.GAP, gap_chars=3.5, baudrate=9600)
+
+        # THEN: 3.5 * 10 / 9600 s
+        assert parser.gap_us == pytest.approx(3.5 * 10 * 1_000_000 / 9600)
+        assert parser.idle_timeout == pytest.approx(3.5 * 10 / 9600)
+
+
+    def test_invalid_or_unknown_gap(self):
+        """
+        0 이하 임계값은 ValueError, baudrate를 모르면 기본값, 너무 짧은 임계값은 하한으로 보정되는지 테스트
+        """
+        with pytest.raises(ValueError):
+            ParserFactory.create_parser(ParserType.GAP, gap_us=0)
+        with pytest.raises(ValueError):
+            ParserFactory.create_parser(ParserType.GAP, gap_chars=-1, baudrate=9600)
+
+        # baudrate 0 -> 문자 시간 환산 불가 -> 기본 임계값
+        parser = ParserFactory.create_parser(ParserType.GAP, gap_chars=3.5, baudrate=0)
+        assert parser.gap_us == pytest.approx(DEFAULT_GAP_US)
+
+        # 고속 보드레이트의 짧은 간격은 Worker 폴링 주기 하한으로 보정
+        parser = ParserFactory.create_parser(ParserType.GAP, gap_chars=3.5, baudrate=921600)
+        assert parser.gap_us == pytest.approx(MIN_GAP_US)
+
+class TestPacketFilter:
+    """
+    패킷 필터 표현식 컴파일 및 판별 동작을 검증하는 테스트 클래스입니다.
+    """
+
+    def test_compound_expression(self):
+        """
+        타입/길이/내용 조건 조합 테스트
+        """
+        # GIVEN: 조건식 컴파일
+        match = compile_packet_filter('type == AT and (len > 5 or data contains "ERR")')
+
+        # THEN: 조건별 일치 여부
+        assert match(Packet(b"ERROR\r\n", 0.0, "AT"))
+        assert match(Packet(b"ERR", 0.0, "AT"))
+        assert not match(Packet(b"OK", 0.0, "AT"))
+        assert not match(Packet(b"ERROR\r\n", 0.0, "RAW"))
+
+    def test_hex_bytes_and_missing_field(self):
+        """
+        HEX 바이트 검색 및 패킷에 없는 속성 비교 테스트
+        """
+        # GIVEN: HEX 시퀀스 검색, 존재하지 않는 retries 속성
+        contains = compile_packet_filter("data contains 0x7E01")
+        retries = compile_packet_filter("retries > 0")
+        packet = Packet(b"\x00\x7e\x01\x02", 0.0)
+
+        # THEN: 바이트 시퀀스 일치, 없는 속성은 불일치
+        assert contains(packet)
+        assert not retries(packet)
+
+    def test_invalid_expression(self):
+        """
+        문법 오류 시 ValueError 발생 및 빈 표현식 처리 테스트
+        """
+        with pytest.raises(ValueError):
+            compile_packet_filter("len >")
+        with pytest.raises(ValueError):
+            compile_packet_filter("(type == AT")
+        assert compile_packet_filter("  ") is None
+
+
+class TestPacketDissector:
+    """
+    디섹터 레지스트리의 지연 디코딩 및 필터 연동을 검증하는 테스트 클래스입니다.
+    """
+
+    @staticmethod
+    def _modbus_frame(body: bytes) -> bytes:
+        crc = ModbusRtuDissector._crc16(body)
+        return body + bytes([crc & 0xFF, crc >> 8])
+
+    def test_modbus_fields_and_crc(self):
+        """
+        Modbus RTU 필드 해석 및 CRC 검증 테스트
+        """
+        registry = DissectorRegistry()
+        registry.register(ModbusRtuDissector())
+        good = Packet(self._modbus_frame(b"\x01\x03\x00\x00\x00\x02"), 0.0, "GAP")
+        bad = Packet(b"\x01\x03\x00\x00\x00\x02\x00\x00", 0.0, "GAP")
+
+        assert registry.get_field_value(good, "modbus.function") == 3
+        assert registry.get_field_value(good, "modbus.crc.valid") is True
+        assert registry.get_field_value(bad, "modbus.crc.valid") is False
+        # 적용 대상이 아닌 타입은 디코딩하지 않음
+        assert registry.decode(Packet(good.data, 0.0, "RAW")) == []
+
+    def test_decode_is_lazy_and_cached(self):
+        """
+        디코딩은 요청 시 1회만 수행되고 캐시 상한을 지키는지 테스트
+        """
+        dissector = ATDissector()
+        dissector.decode = MagicMock(wraps=dissector.decode)
+        registry = DissectorRegistry(cache_size=2)
+        registry.register(dissector)
+        packets = [Packet(b"+CREG: 0,1", 0.0, "AT") for _ in range(3)]
+
+        # WHEN: 등록만으로는 디코딩하지 않음
+        dissector.decode.assert_not_called()
+
+        registry.decode(packets[0])
+        registry.decode(packets[0])
+        assert dissector.decode.call_count == 1
+
+        # THEN: 상한 초과 시 가장 오래된 결과부터 제거
+        registry.decode(packets[1])
+        registry.decode(packets[2])
+        registry.decode(packets[0])
+        assert dissector.decode.call_count == 4
+
+    def test_filter_on_dissected_fields(self):
+        """
+        필터 표현식에서 디섹터 필드(점 경로) 참조 테스트
+        """
+        urc = Packet(b"+CREG: 0,1\r\n", 0.0, "AT")
+        frame = Packet(self._modbus_frame(b"\x11\x06\x00\x01\x00\x03"), 0.0, "GAP")
+
+        assert compile_packet_filter("at.kind == URC and at.params.1 == 1")(urc)
+        assert compile_packet_filter("modbus.function == 6 and modbus.crc.valid == True")(frame)
+        assert not compile_packet_filter("modbus.function == 6")(urc)
+        dissector_registry.clear_cache()
+
+    def test_errors_field_counts_dissector_errors(self):
+        """
+        필터 errors 필드가 디섹터 오류(Modbus CRC 불일치, AT ERROR 결과) 수로 판정되는지 테스트
+        """
+        # GIVEN
+        errors = compile_packet_filter("errors > 0")
+        good = Packet(self._modbus_frame(b"\x01\x03\x00\x00\x00\x02"), 0.0, "GAP")
+        bad_crc = Packet(b"\x01\x03\x00\x00\x00\x02\x00\x00", 0.0, "GAP")
+
+        # THEN: CRC 불일치/ERROR 결과만 일치, 디섹터가 없는 타입은 오류 0
+        assert errors(bad_crc)
+        assert not errors(good)
+        assert errors(Packet(b"+CME ERROR: 10\r\n", 0.0, "AT"))
+        assert not errors(Packet(b"OK\r\n", 0.0, "AT"))
+        assert compile_packet_filter("errors == 0")(Packet(b"\x00", 0.0, "RAW"))
+        dissector_registry.clear_cache()
+
+
+class TestPortStatistics:
+    """
+    포트별 통계 엔진의 속도/점유율 계산을 검증하는 테스트 클래스입니다.
+    """
+
+    def test_rates_and_utilization(self):
+        """
+        슬라이딩 윈도우 속도, Peak, 회선 점유율 계산 테스트
+        """
+        # GIVEN: 9600bps 8N1 (문자당 10비트 -> 최대 960 B/s)
+        engine = PortStatisticsEngine(window=2, alpha=0.5)
+        engine.configure_port("COM1", 9600)
+        engine.sample(now=0.0)
+
+        # WHEN: 1초 동안 480바이트 수신 (2청크)
+        engine.record_rx("COM1", 240)
+        engine.record_rx("COM1", 240)
+        engine.record_tx("COM1", 10)
+        stats = engine.sample(now=1.0)["COM1"]
+
+        # THEN
+        assert stats.rx_bytes == 480 and stats.rx_chunks == 2
+        assert stats.rx_rate == pytest.approx(480.0)
+        assert stats.rx_peak == pytest.approx(480.0)
+        assert stats.rx_rate_ewma == pytest.approx(240.0)
+        assert stats.utilization == pytest.approx(50.0)
+
+        # 유휴 구간: 윈도우 평균은 감소, Peak는 유지
+        stats = engine.sample(now=2.0)["COM1"]
+        assert stats.rx_rate == pytest.approx(240.0)
+        assert stats.rx_peak == pytest.approx(480.0)
+
+    def test_ports_are_independent(self):
+        """
+        포트별 카운터 분리 및 에러/제거 처리 테스트
+        """
+        engine = PortStatisticsEngine()
+        engine.record_rx("COM1", 100)
+        engine.record_error("COM2")
+
+        stats = engine.sample(now=0.0)
+        assert stats["COM1"].rx_bytes == 100 and stats["COM1"].error_count == 0
+        assert stats["COM2"].rx_bytes == 0 and stats["COM2"].error_count == 1
+
+        engine.remove_port("COM1")
+        assert "COM1" not in engine.sample(now=1.0)
+
+
+class TestLineAssembler:
+    """
+    스트리밍 라인 조립기의 증분 디코딩 및 라인 이월을 검증하는 테스트 클래스입니다.
+    """
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "cp949"])
+    def test_multibyte_split_across_batches(self, encoding):
+        """
+        배치 경계에서 잘린 한글 문자와 라인이 하나의 행으로 조립되는지 테스트
+        """
+        # GIVEN: "상태: 정상\n"을 멀티바이트 문자 중간에서 분할
+        data = "상태: 정상\n".encode(encoding)
+        assembler = LineAssembler(encoding)
+
+        # WHEN
+        first = assembler.feed(data[:3])
+        second = assembler.feed(data[3:])
+
+        # THEN: 완성 전에는 라인 없음, 깨진 문자 없이 1행
+        assert first == []
+        assert second == ["상태: 정상"]
+        assert not assembler.has_partial
+
+    def test_crlf_split_and_partial_flush(self):
+        """
+        경계에 걸친 CRLF 인식 및 미완성 라인 강제 배출 테스트
+        """
+        assembler = LineAssembler(newline="\r\n")
+
+        assert assembler.feed(b"OK\r") == []
+        assert assembler.feed(b"\nAT+CSQ\r\n> ") == ["OK", "AT+CSQ"]
+        assert assembler.has_partial
+
+        assert assembler.flush() == ["> "]
+        assert assembler.flush() == []
+
+    def test_partial_limit_and_raw_mode(self):
+        """
+        미완성 라인 길이 상한 초과 시 강제 배출 및 Raw 모드 테스트
+        """
+        assembler = LineAssembler(max_partial=4)
+        assert assembler.feed(b"abcdef") == ["abcdef"]
+
+        assembler.set_newline(None)
+        assert assembler.feed(b"a\nb\xea\xb0") == ["a\nb"]
+        assert assembler.feed(b"\x80") == ["가"]
+
+        with pytest.raises(ValueError):
+            assembler.set_encoding("no-such-codec")
+
+    def test_split_long_line_rows(self):
+        """
+        긴 라인의 고정 폭 행 분할 테스트 (문자 경계 유지, 줄바꿈은 마지막 행에만)
+        """
+        assembler = LineAssembler(newline="\r\n")
+        raw = "가나다라".encode("utf-8") + b"\r\n"
+
+        rows = assembler.split_raw(raw, 4)
+        assert rows == ["가".encode(), "나".encode(), "다".encode(), "라".encode() + b"\r\n"]
+        assert [assembler.decode(row) for row in rows] == ["가", "나", "다", "라"]
+
+        assert assembler.split_raw(bytes(40), 16, exact=True) == [bytes(16), bytes(16), bytes(8)]
+        assert assembler.split_raw(b"AT\r\n", 2) == [b"AT\r\n"]
+
+
+class TestTerminalScreen:
+    """
+    TerminalScreen(ANSI/VT100 셀 격자 화면) 테스트 클래스
+    """
+
+    def test_escape_sequences_across_batches(self):
+        """
+        배치 경계에 걸친 이스케이프 시퀀스/멀티바이트 문자 해석 및 색상/커서 이동 테스트
+        """
+        screen = TerminalScreen(columns=10, rows=3)
+
+        screen.feed(b"\x1b[1;3")
+        screen.feed(b"1mERR\x1b[0m \xea\xb0")
+        screen.feed(b"\x80\x1b]0;title\x07!")
+        line = screen.lines[0]
+        assert line.text == "ERR 가!"
+        assert decode_attr(line.attrs[0]) == (2, 0, ATTR_BOLD)
+        assert line.attrs[3] == 0 and line.chars[5] == ""
+
+        screen.feed(b"\x1b[3;5H\x1b[38;2;1;2;3mX\x1b[1;5H\x1b[K")
+        assert screen.lines[0].text == "ERR"
+        assert screen.lines[2].text == "    X"
+        assert decode_attr(screen.lines[2].attrs[4])[0] == COLOR_RGB | 0x010203
+
+    def test_scroll_damage_and_scrollback(self):
+        """
+        전체 화면 스크롤 시 스크롤 줄 수/변경 행 추적 및 스크롤백 보관 테스트
+        """
+        screen = TerminalScreen(columns=8, rows=3, scrollback=2)
+        screen.take_damage()
+
+        screen.feed(b"a\r\nb\r\nc\r\nd\r\ne")
+        scrolled, dirty = screen.take_damage()
+        assert scrolled == 2
+        assert dirty == {0, 1, 2}
+        assert [line.text for line in screen.lines] == ["c", "d", "e"]
+        assert [line.text for line in screen.history] == ["a", "b"]
+
+        # 부분 스크롤 영역은 스크롤백에 보관하지 않고 영역만 변경 행으로 표시
+        screen.feed(b"\x1b[2;3r\x1b[3;1H\n")
+        assert screen.take_damage() == (0, {1, 2})
+        assert screen.history_total == 2
+
+        # 자동 줄바꿈: 마지막 칸 이후 문자가 와야 다음 행으로 이동
+        screen.feed(b"\x1b[r\x1b[2J\x1b[H12345678")
+        assert (screen.cursor_row, screen.cursor_col) == (0, 7)
+        screen.feed(b"9")
+        assert [line.text for line in screen.lines] == ["12345678", "9", ""]
+
+
+class TestLineStore:
+    """
+    열 배열 기반 라인 저장소의 추가/조회/앞쪽 제거를 검증하는 테스트 클래스입니다.
+    """
+
+    def test_extend_get_and_drop_front(self):
+        """
+        행 추가/조회, 기준 인덱스 이동 Trim 및 압축 후 조회 일관성 테스트
+        """
+        # GIVEN
+        store = LineStore()
+        store.extend([b"AT\r\n", b"OK\r\n"], stamp=1.5)
+        store.extend([b"hello"], flags=LINE_FLAG_TEXT)
+        store.extend([b"x" * 10 for _ in range(5)], stamp=2.0)
+
+        # WHEN: 앞쪽 2행 제거 (압축 없음) -> 추가 제거 (압축 발생)
+        store.drop_front(2)
+        first = store.get(0)
+        store.drop_front(3)
+
+        # THEN
+        assert first == (b"hello", 0.0, LINE_FLAG_TEXT)
+        assert len(store) == 3
+        assert store.first_id == 5
+        assert store.get(0) == (b"x" * 10, 2.0, 0)
+        assert store.payload_bytes == 30
+
+        store.extend([b"tail"])
+        assert store.get(3) == (b"tail", 0.0, 0)
+
+        store.clear()
+        assert len(store) == 0 and store.first_id == 9
+
+    def test_disk_store_scrollback(self, tmp_path):
+        """
+        디스크 스크롤백 저장소: 메모리 창 밖의 오래된 행 조회 및 파일 정리 테스트
+        """
+        # GIVEN: 메모리 창 2행
+        store = DiskLineStore(directory=str(tmp_path), window=2)
+
+        # WHEN
+        for i in range(10):
+            store.extend([f"line{i}".encode()], stamp=float(i))
+        store.extend([b"hello"], flags=LINE_FLAG_TEXT)
+
+        # THEN: 창 밖(디스크)과 창 안(메모리) 행 모두 조회
+        assert len(store) == 11
+        assert len(store._tail) <= 4
+        assert store.get(0) == (b"line0", 0.0, 0)
+        assert store.get(9) == (b"line9", 9.0, 0)
+        assert store.get(10) == (b"hello", 0.0, LINE_FLAG_TEXT)
+
+        store.drop_front(3)
+        assert store.get(0)[0] == b"line3" and store.first_id == 3
+
+        store.close()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_compressed_store_blocks(self, qapp):
+        """
+        압축 보관 저장소: 블록 봉인/백그라운드 압축 후 조회 및 블록 단위 해제 테스트
+        """
+        from PyQt5.QtCore import QThreadPool
+
+        # GIVEN: 블록당 4행
+        store = CompressedLineStore(block_lines=4, cache_blocks=1)
+
+        # WHEN
+        for i in range(20):
+            store.extend([f"AT+CSQ {i}".encode()], stamp=float(i), flags=i % 2)
+        QThreadPool.globalInstance().waitForDone()
+
+        # THEN: 오래된 행은 압축 블록, 최근 행은 일반 저장소
+        assert len(store) == 20
+        assert store._blocks and all(block.raw is None for block in store._blocks)
+        assert store.get(0) == (b"AT+CSQ 0", 0.0, 0)
+        assert store.get(9) == (b"AT+CSQ 9", 9.0, 1)
+        assert store.get(19) == (b"AT+CSQ 19", 19.0, 1)
+
+        blocks = len(store._blocks)
+        store.drop_front(5)
+        assert len(store._blocks) == blocks - 1
+        assert store.get(0)[0] == b"AT+CSQ 5" and store.first_id == 5
+
+
+class TestLogSearchIndex:
+    """
+    증분 로그 검색 인덱스 테스트
+    """
+
+    def test_search_modes_and_trim(self):
+        """
+        리터럴/정규식/HEX 검색 및 앞쪽 행 제거 반영 테스트
+        """
+        # GIVEN: 블록당 4행, 여러 배치로 추가
+        index = LogSearchIndex(block_lines=4)
+        rows = [b"AT+CSQ\r\n", b"+CSQ: 21,99\r\n", b"OK\r\n", b"ERROR\r\n", b"\xc7\xd1\xb1\xdb ok\r\n"] * 3
+        index.append(rows[:6])
+        index.append(rows[6:])
+
+        # WHEN / THEN: 대소문자 무시 리터럴, 행당 1회
+        result = index.search("ok", "cp949")
+        assert list(result.ids) == [2, 4, 7, 9, 12, 14]
+        assert result.total == 6 and len(result.density) > 0 and max(result.density) == 1.0
+        assert not result.truncated
+
+        # 정규식, 유효하지 않은 정규식은 일반 문자열
+        assert list(index.search(r"^\+csq: \d+", "cp949").ids) == [1, 6, 11]
+        assert index.search("[", "cp949").total == 0
+
+        # 인코딩 변환 후 원본 바이트 검색, HEX 모드는 바이트열 그대로
+        assert list(index.search("한글", "cp949").ids) == [4, 9, 14]
+        assert list(index.search("4F 4B", "cp949", hex_mode=True).ids) == [2, 7, 12]
+        assert index.search("6F 6B", "cp949", hex_mode=True).total == 3
+
+        # 앞쪽 행 제거 후에는 살아있는 행만 결과에 포함
+        index.drop_front(8)
+        result = index.search("ok", "cp949")
+        assert list(result.ids) == [9, 12, 14] and result.first_id == 8
+
+    def test_pending_rows_released_without_search(self):
+        """
+        검색 없이 행 추가/제거만 반복해도 대기열이 살아있는 행과 용량 상한을 넘지 않는지 테스트
+        """
+        # GIVEN: 용량 상한 1000바이트 인덱스
+        index = LogSearchIndex(block_lines=4, max_bytes=1000)
+
+        # WHEN: 추가 후 앞쪽 행 제거 (Trim)를 반복
+        for _ in range(100):
+            index.append([b"line %03d\r\n" % n for n in range(20)])
+            index.drop_front(15)
+
+        # THEN: 제거된 행은 대기열에서 해제, 대기열 내용은 상한 이하
+        assert len(index._pending) <= 5 * 100
+        assert index._pending_bytes <= 1000
+        assert sum(map(len, index._pending)) == index._pending_bytes
+
+        # 제거되지 않은 행만 검색되고 블록은 이어지는 행에만 이어붙음
+        index.drop_front(400)
+        result = index.search("line 019", "utf-8")
+        assert list(result.ids) == [1919, 1939, 1959, 1979, 1999]
+        index.append([b"line 019\r\n"])
+        assert list(index.search("line 019", "utf-8").ids)[-2:] == [1999, 2000]
+
+
+    def test_pending_folded_into_blocks_without_search(self):
+        """
+        제거(Trim) 없이 추가만 계속해도(스크롤백 모드) 행별 객체 대신 블록으로 구성되는지 테스트
+        """
+        # GIVEN: 블록당 4행
+        index = LogSearchIndex(block_lines=4)
+
+        # WHEN: 검색 없이 여러 배치 추가
+        for n in range(25):
+            index.append([b"row %02d\r\n" % n])
+
+        # THEN: 대기열은 블록 1개 분량 미만, 나머지는 블록
+        assert len(index._pending) < 4
+        assert sum(block.count for block in index._blocks) + len(index._pending) == 25
+        assert list(index.search("row 2", "utf-8").ids) == [20, 21, 22, 23, 24]
+
+    def test_match_does_not_span_rows(self):
+        """
+        행 구분자를 넘거나 구분자 자체에 걸친 일치는 제외되어 match_payload와 같은 결과인지 테스트
+        """
+        from model.log_search_index import compile_matcher, match_payload
+
+        # GIVEN
+        index = LogSearchIndex(block_lines=8)
+        rows = [b"foo\r\n", b"bar\r\n", b"foo \r\n", b"x\ny\r\n"]
+        index.append(rows)
+
+        # WHEN / THEN: 행 안의 일치만 인정 (행 내부의 0x0A는 일치)
+        cases = [(r"foo\sbar", False), (r"foo\s*", False), ("0A", True), ("6F 0A", True)]
+        for text, hex_mode in cases:
+            matcher = compile_matcher(text, "utf-8", hex_mode)
+            expected = [row for row, payload in enumerate(rows) if match_payload(matcher, payload)]
+            assert list(index.search(text, "utf-8", hex_mode).ids) == expected
+        assert list(index.search("0A", "utf-8", hex_mode=True).ids) == [3]
+        assert index.search(r"foo\sbar", "utf-8").total == 0
+
+    def test_capacity_truncation_reported(self):
+        """
+        용량 상한으로 제외된 오래된 행이 검색 결과에 truncated로 보고되는지 테스트
+        """
+        # GIVEN: 용량 상한 40바이트 (7바이트 행 5개까지)
+        index = LogSearchIndex(block_lines=4, max_bytes=40)
+        index.append([b"ok %02d\r\n" % n for n in range(20)])
+
+        # WHEN
+        result = index.search("ok", "utf-8")
+
+        # THEN: 남은 행만 검색하고 제외 구간 보고
+        assert list(result.ids) == [15, 16, 17, 18, 19]
+        assert result.truncated and result.first_id == 0 and result.indexed_first_id == 15
+
+        # 제외 구간이 모두 제거(Trim)되면 전체 검색
+        index.drop_front(16)
+        assert not index.search("ok", "utf-8").truncated
 
 # =============================================================================
 # 2. 연결 컨트롤러 테스트 (Connection Controller Tests)
@@ -208,6 +794,28 @@ class TestConnectionController:
         assert event.port == sample_port_config.port
         assert event.state == "closed"
 
+    def test_invalid_parser_options_rejected_before_transport(self, qapp):
+        """
+        잘못된 파서 옵션이면 Transport/Worker를 만들기 전에 오류 보고 후 열지 않는지 검증
+        """
+        # GIVEN: 임계값이 0인 유휴 간격 파서 설정
+        controller = ConnectionController()
+        error_spy = MagicMock()
+        controller.error_occurred.connect(error_spy)
+        config = PortConfig(port="COM9", parser_type=ParserType.GAP, parser_options={"gap_chars": 0})
+
+        # WHEN
+        with patch("model.connection_controller.SerialTransport") as transport_cls, \
+                patch("model.connection_controller.ConnectionWorker") as worker_cls:
+            result = controller.open_connection(config)
+
+        # THEN
+        assert result is False
+        transport_cls.assert_not_called()
+        worker_cls.assert_not_called()
+        assert "COM9" not in controller.parsers
+        error_spy.assert_called_once()
+
 
 # =============================================================================
 # 3. 매크로 러너 테스트 (Macro Runner Tests)
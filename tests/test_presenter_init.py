@@ -24,6 +24,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 
 from presenter.main_presenter import MainPresenter
+from common.dtos import PortDataEvent
 
 
 @pytest.fixture
@@ -156,22 +157,27 @@ class TestMainPresenterInit:
 
     def test_data_handler_init(self, mock_main_window, mock_settings_manager):
         """
-        DataTrafficHandler 초기화 및 타이머 시작 테스트
+        DataTrafficHandler 초기화 및 요청 기반 플러시 예약 테스트
 
         Logic:
             - DataHandler가 View 참조를 가지고 생성되었는지 확인
-            - 내부 타이머(QTimer)가 시작되었는지 간접 확인 (Mock 호출 등)
+            - 생성 시점에는 플러시를 예약하지 않음 (유휴 Wakeup 없음)
+            - 데이터 수신 시에만 UI 스케줄러에 플러시 예약
         """
         with patch('presenter.main_presenter.SettingsManager', return_value=mock_settings_manager):
-            # QTimer를 패치하여 실제 타이머 동작 방지 및 호출 확인
-            with patch('presenter.data_handler.QTimer') as MockTimer:
+            # UI 스케줄러를 패치하여 실제 타이머 동작 방지 및 호출 확인
+            with patch('presenter.data_handler.ui_scheduler') as mock_scheduler:
                 # WHEN: Presenter 생성 -> DataHandler 생성
                 presenter = MainPresenter(mock_main_window)
 
                 # THEN: DataHandler가 View를 보유
                 assert presenter.data_handler.view == mock_main_window
 
-                # THEN: 타이머 시작 확인
-                # DataHandler __init__ 에서 timer.start() 호출됨
-                mock_timer_instance = MockTimer.return_value
-                mock_timer_instance.start.assert_called()
\ No newline at end of file
+                # THEN: 데이터가 없으면 플러시 예약 없음
+                mock_scheduler.request.assert_not_called()
+
+                # WHEN: 데이터 수신
+                presenter.data_handler.on_fast_data_received(PortDataEvent(port="COM1", data=b"A"))
+
+                # THEN: 플러시 예약
+                mock_scheduler.request.assert_called_once_with(presenter.data_handler._flush_rx_buffer_to_ui)
@@ -9,7 +9,7 @@ PacketPresenter의 비즈니스 로직과 뷰 제어 흐름을 검증합니다.
 * 전역 설정 변경 시 뷰(View)의 상태가 동기화되는지 보장
 
 ## WHAT
-* on_packet_received: 수신 데이터의 포맷팅 및 뷰 추가 로직
+* on_packet_received: 패킷 배치의 뷰 전달 로직
 * 캡처 제어: _is_capturing 플래그에 따른 이벤트 필터링
 * 설정 변경: 버퍼 크기 및 오토스크롤 설정 반영
 * 사용자 액션: Clear, Toggle Capture 요청 처리
@@ -25,7 +25,8 @@ import pytest
 from unittest.mock import MagicMock, call
 
 from presenter.packet_presenter import PacketPresenter
-from common.dtos import PacketEvent, PreferencesState, PacketViewData
+from model.packet_parser import Packet
+from common.dtos import PacketBatchEvent, PreferencesState
 from common.constants import ConfigKeys
 
 
@@ -99,35 +100,52 @@ class TestPacketPresenter:
 
     def test_packet_processing(self, presenter, mock_panel):
         """
-        패킷 수신 및 포맷팅 로직 테스트
+        패킷 배치 수신 처리 테스트
 
         Logic:
-            - Mock Packet 객체를 포함한 PacketEvent 생성
+            - Packet 리스트를 담은 PacketBatchEvent 생성
             - on_packet_received 호출
-            - 뷰에 추가된 PacketViewData의 포맷(Hex, ASCII) 검증
+            - 변환 없이 배치 그대로 뷰에 전달되는지 검증 (포맷팅은 모델에서 지연 수행)
         """
-        # GIVEN: 테스트용 패킷 데이터
-        mock_packet = MagicMock()
-        mock_packet.raw_data = b'\x41\x42\x00\xff'  # 'AB' + NULL + Non-printable
-        mock_packet.type_name = "TEST_TYPE"
-
-        event = PacketEvent(packet=mock_packet)
+        # GIVEN: 테스트용 패킷 배치
+        packets = [Packet(b'\x41\x42\x00\xff', 0.0, "TEST_TYPE"), Packet(b'OK', 0.0, "AT")]
+        event = PacketBatchEvent(port="COM1", packets=packets)
 
         # WHEN: 패킷 수신 이벤트 처리
         presenter.on_packet_received(event)
 
-        # THEN: 뷰에 데이터가 추가되어야 함
-        mock_panel.append_packet.assert_called_once()
+        # THEN: 뷰에 배치가 한 번에 추가되어야 함
+        mock_panel.append_packets.assert_called_once_with(packets)
+
+    def test_packet_filter(self, presenter, mock_panel):
+        """
+        필터 표현식 적용 및 오류 표시 테스트
+
+        Logic:
+            - 유효한 필터 설정 후 일치하는 패킷만 뷰에 전달되는지 확인
+            - 잘못된 표현식은 오류 표시 후 기존 필터 유지
+        """
+        # GIVEN: AT 타입만 표시하는 필터
+        presenter.on_filter_changed("type == AT")
+        mock_panel.set_filter_error.assert_called_with("")
+
+        at_packet = Packet(b"OK\r\n", 0.0, "AT")
+        raw_packet = Packet(b"\x00", 0.0, "RAW")
+
+        # WHEN: 혼합 배치 수신
+        presenter.on_packet_received(PacketBatchEvent(port="COM1", packets=[at_packet, raw_packet]))
+
+        # THEN: AT 패킷만 전달
+        mock_panel.append_packets.assert_called_once_with([at_packet])
 
-        # 전달된 DTO 검증
-        args = mock_panel.append_packet.call_args[0]
-        view_data: PacketViewData = args[0]
+        # WHEN: 문법 오류 표현식
+        presenter.on_filter_changed("len >")
 
-        assert isinstance(view_data, PacketViewData)
-        assert view_data.packet_type == "TEST_TYPE"
-        assert view_data.data_hex == "41 42 00 FF"  # Hex formatting check
-        assert view_data.data_ascii == "AB.."       # ASCII filtering check (. for non-printable)
-        assert view_data.time_str is not None       # Timestamp check
+        # THEN: 오류 표시, 기존 필터 유지
+        assert mock_panel.set_filter_error.call_args[0][0] != ""
+        mock_panel.append_packets.reset_mock()
+        presenter.on_packet_received(PacketBatchEvent(port="COM1", packets=[raw_packet]))
+        mock_panel.append_packets.assert_not_called()
 
     def test_packet_ignored_when_not_capturing(self, presenter, mock_panel):
         """
@@ -143,13 +161,13 @@ class TestPacketPresenter:
 
         mock_packet = MagicMock()
         mock_packet.raw_data = b'\x00'
-        event = PacketEvent(packet=mock_packet)
+        event = PacketBatchEvent(port="COM1", packets=[mock_packet])
 
         # WHEN: 패킷 수신
         presenter.on_packet_received(event)
 
         # THEN: 뷰에 추가되지 않음
-        mock_panel.append_packet.assert_not_called()
+        mock_panel.append_packets.assert_not_called()
 
     def test_settings_update(self, presenter, mock_panel):
         """
@@ -178,8 +196,8 @@ class TestPacketPresenter:
 
         # 내부 상태 변경 확인 (캡처 플래그가 꺼졌으므로 패킷 무시 확인)
         mock_packet = MagicMock()
-        presenter.on_packet_received(PacketEvent(packet=mock_packet))
-        mock_panel.append_packet.assert_not_called()
+        presenter.on_packet_received(PacketBatchEvent(port="COM1", packets=[mock_packet]))
+        mock_panel.append_packets.assert_not_called()
 
     def test_clear_view(self, presenter, mock_panel):
         """
@@ -207,8 +225,8 @@ class TestPacketPresenter:
         presenter.on_capture_toggled(False)
 
         # Check logic: Packet ignored
-        presenter.on_packet_received(PacketEvent(packet=MagicMock()))
-        mock_panel.append_packet.assert_not_called()
+        presenter.on_packet_received(PacketBatchEvent(port="COM1", packets=[MagicMock()]))
+        mock_panel.append_packets.assert_not_called()
 
         # GIVEN: 캡처 켜기
         presenter.on_capture_toggled(True)
@@ -216,5 +234,5 @@ class TestPacketPresenter:
         # Check logic: Packet processed
         mock_packet = MagicMock()
         mock_packet.raw_data = b'\x01'
-        presenter.on_packet_received(PacketEvent(packet=mock_packet))
-        mock_panel.append_packet.assert_called()
\ No newline at end of file
+        presenter.on_packet_received(PacketBatchEvent(port="COM1", packets=[mock_packet]))
+        mock_panel.append_packets.assert_called()
\ No newline at end of file
@@ -11,6 +11,7 @@ UI 위젯(View)의 독립적인 동작과 사용자 상호작용을 검증합니
 ## WHAT
 * QSmartLineEdit: HEX 모드 입력 필터링 및 자동 대문자 변환
 * ManualControlPanel: DTO 생성 및 전송 시그널 검증
+* QSmartListView: 로그 렌더링 캐시 및 고속 경로 검증
 * PacketPanel: 데이터 모델 업데이트 및 초기화(Clear) 검증
 * PortPanel: 연결 상태 변경에 따른 UI 반영 확인
 
@@ -18,15 +19,24 @@ UI 위젯(View)의 독립적인 동작과 사용자 상호작용을 검증합니
 * pytest-qt의 `qtbot` 픽스처를 사용하여 UI 이벤트(클릭, 키 입력) 시뮬레이션
 * SignalSpy(qtbot.waitSignal)를 사용하여 시그널 발생과 전달된 데이터(DTO) 검증
 """
+import queue
+import time
+
 import pytest
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QPushButton
+from PyQt5.QtGui import QStaticText, QTextDocument
 
 from view.custom_qt.smart_line_edit import QSmartLineEdit
+from view.custom_qt.smart_list_view import QSmartListView, LOG_SPANS_ROLE
 from view.panels.manual_control_panel import ManualControlPanel
 from view.panels.packet_panel import PacketPanel
 from view.panels.port_panel import PortPanel
-from common.dtos import PacketViewData, ManualCommand
+from model.packet_parser import Packet
+from model.log_exporter import LogExportJob, format_rows
+from common.enums import ExportFormat, LogDedupMode, NewlineMode
+from common.dtos import ManualCommand, ColorRule
+from view.services.color_service import ColorService
 
 
 class TestSmartLineEdit:
@@ -157,6 +167,427 @@ class TestManualControlPanel:
         assert blocker.args[0] is True
 
 
+class TestSmartListView:
+    """
+    QSmartListView 로그 렌더링 델리게이트 테스트
+    """
+
+    def test_render_cache_and_fast_path(self, qtbot):
+        """
+        렌더링 항목 캐시 재사용 및 단순 텍스트 고속 경로 검증
+
+        Logic:
+            - 단순 텍스트는 QStaticText, 색상 구간/검색 일치 라인은 QTextDocument
+            - 같은 키는 재페인트 시 재생성하지 않음
+            - 검색어 변경 시 일치 라인만 하이라이트 문서로 전환
+        """
+        # GIVEN
+        view = QSmartListView()
+        qtbot.addWidget(view)
+        delegate = view.delegate
+        font = view.font()
+
+        # WHEN / THEN: 단순 텍스트 -> 고속 경로, 캐시 재사용
+        plain = delegate._get_render_entry("OK", (), "#000000", font)
+        assert isinstance(plain, QStaticText)
+        assert delegate._get_render_entry("OK", (), "#000000", font) is plain
+
+        rich = delegate._get_render_entry("ERROR", ((0, 5, 0),), "#000000", font)
+        assert isinstance(rich, QTextDocument)
+
+        # 검색어 일치 라인은 하이라이트 문서로 렌더링
+        view.set_search_pattern("OK")
+        assert isinstance(delegate._get_render_entry("OK", (), "#000000", font), QTextDocument)
+        assert isinstance(delegate._get_render_entry("AT", (), "#000000", font), QStaticText)
+
+    def test_color_spans_stored_with_plain_text(self, qtbot):
+        """
+        색상 규칙 적용 시 모델이 평문 + 색상 구간을 보관하는지 검증
+
+        Logic:
+            - HTML 태그 없이 평문 저장 (검색/내보내기 그대로 사용)
+            - 겹치는 구간은 먼저 시작하는 매칭 우선 (단일 패스)
+            - 규칙 변경 시 저장된 평문으로 구간 재계산
+        """
+        # GIVEN
+        view = QSmartListView()
+        qtbot.addWidget(view)
+        view.set_color_rules([
+            ColorRule(name="word", pattern=r"\bERROR\b", color="#FF0000"),
+            ColorRule(name="code", pattern="OR", color="#0000FF", regex_enabled=False),
+        ])
+        view.set_newline_char("\n")
+
+        # WHEN
+        view.append_bytes(b"<ERROR>\n")
+        model = view.log_model
+
+        # THEN
+        assert model.data(model.index(0), Qt.DisplayRole) == "<ERROR>"
+        assert model.data(model.index(0), LOG_SPANS_ROLE) == ((1, 5, 0),)
+        assert view.get_all_text() == "<ERROR>"
+
+        view.set_color_rules([])
+        assert model.data(model.index(0), LOG_SPANS_ROLE) == ()
+
+    def test_lazy_row_formatting_on_mode_switch(self, qtbot):
+        """
+        HEX 모드 전환 시 행을 다시 만들지 않고 요청된 행만 새 모드로 포맷팅하는지 검증
+
+        Logic:
+            - 행은 라인 원본과 타임스탬프를 유지 (전환 후에도 타임스탬프 보존)
+            - 전환 직후에는 새 모드의 포맷 결과가 없고, data() 요청 행만 생성
+            - 이전 모드로 돌아오면 캐시된 결과 재사용
+        """
+        # GIVEN
+        view = QSmartListView()
+        qtbot.addWidget(view)
+        view.set_timestamp_enabled(True)
+        view.set_newline_char("\r\n")
+        view.append_bytes(b"AT\r\nOK\r\n")
+        model = view.log_model
+        text = model.data(model.index(0), Qt.DisplayRole)
+        stamp = text.split(" ")[0]
+        assert text == f"{stamp} AT"
+
+        # WHEN
+        view.set_hex_mode_enabled(True)
+        cached = len(model._format_cache)
+        hex_text = model.data(model.index(0), Qt.DisplayRole)
+
+        # THEN
+        assert model.rowCount() == 2
+        assert hex_text == f"{stamp} 41 54 0D 0A "
+        assert len(model._format_cache) == cached + 1
+
+        view.set_hex_mode_enabled(False)
+        assert model.data(model.index(0), Qt.DisplayRole) is text
+
+    def test_recent_rows_prefetched_in_worker(self, qtbot):
+        """
+        추가된 최근 행이 작업 스레드에서 미리 포맷팅되어 캐시에 저장되는지 검증
+        """
+        # GIVEN: 색상 규칙이 있는 뷰
+        view = QSmartListView()
+        qtbot.addWidget(view)
+        view.set_color_rules([ColorRule(name="Err", pattern="ERROR", color="#FF0000")])
+        view.set_newline_char("\n")
+        model = view.log_model
+
+        # WHEN: data() 요청 없이 행 추가만 수행
+        view.append_bytes(b"OK\nERROR 1\n")
+
+        # THEN: 그리기 전에 캐시가 채워지고, 조회 결과는 메인 스레드 포맷팅과 동일
+        qtbot.waitUntil(lambda: len(model._format_cache) == 2, timeout=1000)
+        entry = model.data(model.index(1), LOG_SPANS_ROLE)
+        assert entry == model._format_row(1)[1] == ((0, 5, 0),)
+
+    def test_long_raw_line_split_into_rows(self, qtbot):
+        """
+        종료 문자 없는 긴 수신 데이터가 추가 시점에 행 최대 폭 단위로 분할되는지 검증
+        """
+        # GIVEN: Raw 모드, 텍스트 행 최대 64바이트 / HEX 행 16바이트
+        view = QSmartListView()
+        qtbot.addWidget(view)
+        view.set_newline_char(None)
+        view.set_row_bytes(64, 16)
+        model = view.log_model
+
+        # WHEN
+        view.append_bytes(b"A" * 150)
+        view.set_hex_mode_enabled(True)
+        view.append_bytes(bytes(range(40)))
+
+        # THEN
+        assert model.rowCount() == 3 + 3
+        assert [len(p) for p in model.payloads(0, 5)] == [64, 64, 22, 16, 16, 8]
+        assert model.data(model.index(3), Qt.DisplayRole).startswith("00 01 02")
+
+    def test_compression_retains_more_lines(self, qtbot):
+        """
+        압축 보관 모드에서 최대 라인 수의 배율만큼 유지하고 오래된 행이 실제로 블록 압축되는지 검증
+        """
+        from PyQt5.QtCore import QThreadPool
+        from common.constants import LOG_COMPRESSION_LINES_FACTOR
+
+        # GIVEN: 최대 라인 수 기본값, 압축 보관
+        view = QSmartListView()
+        qtbot.addWidget(view)
+        view.set_newline_char("\n")
+        view.set_compression_enabled(True)
+        model = view.log_model
+        max_lines = model._max_lines
+
+        # WHEN: 최대 라인 수의 3배 추가
+        view.append_bytes(b"".join(f"AT+CSQ {i}\n".encode() for i in range(max_lines * 3)))
+        QThreadPool.globalInstance().waitForDone()
+
+        # THEN: Trim 없이 유지되고 앞쪽 행은 압축 블록에 보관
+        assert max_lines * 3 <= max_lines * LOG_COMPRESSION_LINES_FACTOR
+        assert model.rowCount() == max_lines * 3
+        assert model._store._blocks and all(block.raw is None for block in model._store._blocks)
+        assert model.data(model.index(0), Qt.DisplayRole) == "AT+CSQ 0"
+
+        # WHEN: 최대 라인 수 축소 -> 블록 크기에 맞춰 저장소 재구성
+        view.set_max_lines(100)
+
+        # THEN
+        assert model.rowCount() == 100 * LOG_COMPRESSION_LINES_FACTOR
+        assert model._store.block_lines == 100
+
+    def test_collapse_duplicate_lines(self, qtbot):
+        """
+        중복 접기 모드에서 연속 중복 라인이 행 추가 없이 반복 횟수로 갱신되는지 검증
+        """
+        # GIVEN: 숫자 무시 중복 접기
+        view = QSmartListView()
+        qtbot.addWidget(view)
+        view.set_newline_char("\n")
+        view.set_dedup_mode(LogDedupMode.IGNORE_DIGITS)
+        model = view.log_model
+
+        # WHEN: 배치 안/배치 간 반복
+        view.append_bytes(b"ERR 1\nERR 2\nERR 3\n")
+        with qtbot.waitSignal(model.dataChanged):
+            view.append_bytes(b"ERR 4\n")
+        view.append_bytes(b"OK\nOK\n")
+
+        # THEN
+        assert model.rowCount() == 2
+        assert model.data(model.index(0), Qt.DisplayRole).startswith("ERR 1  (×4, ")
+        assert model.data(model.index(1), Qt.DisplayRole).startswith("OK  (×2, ")
+
+        view.set_dedup_mode(LogDedupMode.OFF)
+        view.append_bytes(b"OK\n")
+        assert model.rowCount() == 3
+
+    def test_background_search_navigation(self, qtbot):
+        """
+        백그라운드 검색 결과로 다음/이전 이동 및 일치 수 알림 검증
+
+        Logic:
+            - 결과가 없으면 검색 완료 후 이동
+            - 최신 결과가 있으면 즉시 이동 (순환)
+        """
+        # GIVEN
+        view = QSmartListView()
+        qtbot.addWidget(view)
+        view.set_newline_char("\n")
+        view.append_bytes(b"AT\nOK\nAT+CSQ\nok\nERROR\n")
+
+        # WHEN: 첫 검색은 백그라운드 완료 후 이동
+        with qtbot.waitSignal(view.search_result_changed, timeout=3000) as blocker:
+            view.find_next("ok")
+
+        # THEN
+        assert blocker.args == [1, 2]
+        assert view.currentIndex().row() == 1
+        assert view.minimap_scroll_bar._density
+
+        with qtbot.waitSignal(view.search_result_changed, timeout=1000) as blocker:
+            view.find_next("ok")
+        assert blocker.args == [2, 2] and view.currentIndex().row() == 3
+
+        with qtbot.waitSignal(view.search_result_changed, timeout=1000) as blocker:
+            view.find_next("ok")
+        assert blocker.args == [1, 2] and view.currentIndex().row() == 1
+
+        with qtbot.waitSignal(view.search_result_changed, timeout=1000) as blocker:
+            view.find_prev("ok")
+        assert blocker.args == [2, 2] and view.currentIndex().row() == 3
+
+    def test_async_incremental_filter(self, qtbot):
+        """
+        백그라운드 필터링 및 추가 행 증분 판정 검증
+
+        Logic:
+            - 기존 행은 검색 작업 결과로 매핑 구성
+            - 필터 설정 이후 추가된 행은 추가 시 판정, Trim은 매핑에서도 제거
+        """
+        # GIVEN
+        view = QSmartListView()
+        qtbot.addWidget(view)
+        view.set_newline_char("\n")
+        view.append_bytes(b"AT\nOK\nAT+CSQ\nok\nERROR\n")
+
+        # WHEN
+        view.set_search_pattern("ok")
+        view.set_filter_mode(True)
+        proxy = view.model()
+        qtbot.waitUntil(lambda: proxy.rowCount() == 2, timeout=3000)
+
+        # THEN
+        assert [proxy.data(proxy.index(row, 0)) for row in range(2)] == ["OK", "ok"]
+
+        view.append_bytes(b"NOK\nAT\n")
+        assert proxy.rowCount() == 3 and proxy.data(proxy.index(2, 0)) == "NOK"
+
+        view.set_max_lines(6)
+        view.log_model._trim_size = 2
+        view.append_bytes(b"OK\n")
+        assert [proxy.data(proxy.index(row, 0)) for row in range(proxy.rowCount())] == ["ok", "NOK", "OK"]
+
+        view.set_filter_mode(False)
+        assert proxy.rowCount() == view.log_model.rowCount()
+
+    def test_filter_forwards_folded_row_change_only(self, qtbot):
+        """
+        필터 모드에서 중복 접기 갱신이 해당 프록시 행 1개만 dataChanged로 전달되는지 검증
+        """
+        # GIVEN: 숫자 무시 중복 접기 + "ERR" 필터
+        view = QSmartListView()
+        qtbot.addWidget(view)
+        view.set_newline_char("\n")
+        view.set_dedup_mode(LogDedupMode.IGNORE_DIGITS)
+        view.append_bytes(b"ERR 1\nOK\nERR 2\nERR 3\n")
+        view.set_search_pattern("ERR")
+        view.set_filter_mode(True)
+        proxy = view.model()
+        qtbot.waitUntil(lambda: proxy.rowCount() == 2, timeout=3000)
+
+        # WHEN: 마지막 행에 접힘
+        with qtbot.waitSignal(proxy.dataChanged, timeout=1000) as blocker:
+            view.append_bytes(b"ERR 4\n")
+
+        # THEN: 접힌 행만 갱신 범위
+        top_left, bottom_right = blocker.args[0], blocker.args[1]
+        assert top_left.row() == bottom_right.row() == 1
+        assert proxy.data(proxy.index(1, 0)).startswith("ERR 2  (×3, ")
+
+    def test_streaming_export(self, qtbot, tmp_path):
+        """
+        로그/패킷 모델 스트리밍 내보내기 검증
+
+        Logic:
+            - 청크 단위로 작업 스레드에 전달되어 전체 행 기록 (진행률 알림)
+            - 시작 이후 추가된 행은 제외, 패킷 모델도 같은 경로로 내보내기
+        """
+        # GIVEN
+        view = QSmartListView()
+        qtbot.addWidget(view)
+        view.set_newline_char("\n")
+        view.append_bytes(b"AT\nOK, \"1\"\n")
+        view.append_marker("-- marker --")
+
+        # WHEN: CSV
+        path = tmp_path / "log.csv"
+        job = LogExportJob(view.log_model, str(path), ExportFormat.CSV, chunk_rows=2)
+        with qtbot.waitSignal(job.signals.export_completed, timeout=3000) as blocker:
+            job.start()
+            view.append_bytes(b"LATE\n")
+
+        # THEN
+        assert blocker.args == [str(path), 3]
+        assert path.read_text(encoding="utf-8").splitlines() == [
+            "timestamp,direction,data,count,last_seen",
+            ",RX,AT,1,", ',RX,"OK, ""1""",1,', ",INFO,-- marker --,1,"
+        ]
+
+        # WHEN: 패킷 모델 HEX 덤프
+        panel = PacketPanel()
+        qtbot.addWidget(panel)
+        panel.packet_model.append_packets([Packet(b"AT+CSQ\r\n" * 2, 0.0, "AT")])
+        path = tmp_path / "packets.hex"
+        job = LogExportJob(panel.packet_model, str(path), ExportFormat.HEX)
+        with qtbot.waitSignal(job.signals.export_completed, timeout=3000):
+            job.start()
+
+        # THEN
+        assert path.read_text(encoding="utf-8").splitlines() == [
+            "AT (16 bytes)",
+            "0000  41 54 2B 43 53 51 0D 0A 41 54 2B 43 53 51 0D 0A  AT+CSQ..AT+CSQ..",
+        ]
+
+    def test_export_pump_retries_unsent_chunk(self, qtbot, tmp_path, monkeypatch):
+        """
+        쓰기 대기열이 가득 찼을 때 꺼낸 청크를 보관하고 같은 행을 다시 읽지 않는지 검증
+        """
+        # GIVEN: 행 3개, 청크 1행, 대기열 1칸 (작업 스레드 미기동)
+        view = QSmartListView()
+        qtbot.addWidget(view)
+        view.set_newline_char("\n")
+        view.append_bytes(b"A\nB\nC\n")
+        calls = []
+        export_rows = view.log_model.export_rows
+        monkeypatch.setattr(view.log_model, "export_rows",
+                            lambda start_id, count: calls.append(start_id) or export_rows(start_id, count))
+        job = LogExportJob(view.log_model, str(tmp_path / "log.txt"), ExportFormat.TEXT, chunk_rows=1)
+        job.task._chunks = queue.Queue(maxsize=1)
+        job._active = True
+
+        # WHEN: 대기열이 가득 찬 채로 여러 틱 진행
+        job._pump()
+        job._pump()
+        job._pump()
+
+        # THEN: 두 번째 청크는 한 번만 읽고 보관
+        assert len(calls) == 2
+        assert [row[2] for row in job.task._chunks.get_nowait()] == [b"A\n"]
+
+        # WHEN: 대기열이 비면 보관 청크부터 전달
+        job._pump()
+
+        # THEN
+        assert len(calls) == 3
+        assert [row[2] for row in job.task._chunks.get_nowait()] == [b"B\n"]
+        job.cancel()
+
+    def test_export_keeps_repeat_count(self, qtbot, tmp_path):
+        """
+        반복 접힌 행의 반복 횟수/마지막 시각 내보내기 검증
+        """
+        # GIVEN: 5번 반복되어 한 행으로 접힌 로그
+        view = QSmartListView()
+        qtbot.addWidget(view)
+        view.set_newline_char("\n")
+        view.set_dedup_mode(LogDedupMode.EXACT)
+        view.append_bytes(b"ERR\n" * 5 + b"OK\n")
+        assert view.log_model.rowCount() == 2
+
+        # WHEN: CSV
+        path = tmp_path / "log.csv"
+        job = LogExportJob(view.log_model, str(path), ExportFormat.CSV)
+        with qtbot.waitSignal(job.signals.export_completed, timeout=3000):
+            job.start()
+
+        # THEN: count/last_seen 열 기록
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert lines[1].startswith(",RX,ERR,5,") and lines[1] != ",RX,ERR,5,"
+        assert lines[2] == ",RX,OK,1,"
+
+        # WHEN/THEN: TEXT/HEX는 로그 뷰와 같은 접미사
+        last_seen = time.mktime((2026, 1, 2, 3, 4, 5, 0, 0, -1))
+        rows = [(0.0, "RX", b"ERR", False, (5, last_seen))]
+        assert format_rows(rows, ExportFormat.TEXT) == "ERR  (×5, 03:04:05)\n"
+        assert format_rows(rows, ExportFormat.HEX).splitlines()[0] == "RX (3 bytes)  (×5, 03:04:05)"
+
+    def test_color_rules_single_pass_engine(self):
+        """
+        결합 정규식 기반 색상 규칙 엔진 검증
+
+        Logic:
+            - 같은 위치에서는 나중 규칙 우선, 일반 문자열은 이스케이프
+            - 역참조 패턴은 개별 평가로 폴백, 잘못된 정규식은 제외
+            - 동일 규칙 세트는 캐시된 컴파일 결과 재사용
+        """
+        # GIVEN
+        rules = [
+            ColorRule(name="err", pattern=r"ERR\w*", color="#FF0000"),
+            ColorRule(name="exact", pattern="ERR", color="#00FF00", regex_enabled=False),
+            ColorRule(name="dot", pattern="a.b", color="#0000FF", regex_enabled=False),
+            ColorRule(name="pair", pattern=r"(\d)\1", color="#FFFF00"),
+            ColorRule(name="broken", pattern="[", color="#FF00FF"),
+        ]
+
+        # WHEN
+        compiled = ColorService.compile_rules(rules)
+
+        # THEN
+        assert compiled.spans("ERROR a.b axb 77") == ((0, 3, 1), (6, 3, 2), (14, 2, 3))
+        assert ColorService.compile_rules(list(rules)) is compiled
+        assert ColorService.apply_rules("x<ERR", rules[1:2], False) == 'x&lt;<span style="color:#00ff00;">ERR</span>'
+
+
 class TestPacketPanel:
     """
     PacketPanel의 데이터 모델 업데이트 및 뷰 제어 테스트
@@ -167,32 +598,46 @@ class TestPacketPanel:
         패킷 추가 시 테이블 모델 업데이트 검증
 
         Logic:
-            - PacketViewData DTO 생성
-            - append_packet 호출
-            - 테이블 모델의 rowCount 증가 및 데이터 일치 확인
+            - Packet 배치 전달 (append_packets)
+            - UI 틱(단발 타이머) 이후 rowCount 증가 확인
+            - HEX/ASCII가 data() 요청 시점에 변환되는지 확인
         """
         # GIVEN: 패널 생성
         panel = PacketPanel()
         qtbot.addWidget(panel)
         panel.show()
 
-        view_data = PacketViewData(
-            time_str="12:00:00",
-            packet_type="TEST",
-            data_hex="AA BB",
-            data_ascii=".."
-        )
+        packets = [Packet(b"\xAA\xBB", 0.0, "TEST"), Packet(b"OK", 0.0, "AT")]
+
+        # WHEN: 패킷 배치 추가
+        panel.append_packets(packets)
 
-        # WHEN: 패킷 추가
-        panel.append_packet(view_data)
+        # THEN: 타이머 만료 후 한 번에 반영
+        model = panel.packet_model
+        assert model.rowCount() == 0
+        qtbot.waitUntil(lambda: model.rowCount() == 2, timeout=1000)
+
+        assert model.data(model.index(0, 1), Qt.DisplayRole) == "TEST"
+        assert model.data(model.index(0, 2), Qt.DisplayRole) == "AA BB"
+        assert model.data(model.index(0, 3), Qt.DisplayRole) == ".."
+        assert model.data(model.index(1, 3), Qt.DisplayRole) == "OK"
+
+    def test_buffer_limit(self, qtbot):
+        """
+        버퍼 크기 초과 시 오래된 패킷부터 제거되는지 검증
+        """
+        # GIVEN: 버퍼 3개
+        panel = PacketPanel()
+        qtbot.addWidget(panel)
+        panel.set_buffer_size(3)
 
-        # THEN: 모델 업데이트 확인
+        # WHEN: 5개 패킷 배치 추가
+        panel.append_packets([Packet(bytes([i]), 0.0) for i in range(5)])
         model = panel.packet_model
-        assert model.rowCount() == 1
+        qtbot.waitUntil(lambda: model.rowCount() == 3, timeout=1000)
 
-        # 데이터 검증 (Column 2: HEX)
-        index = model.index(0, 2)
-        assert model.data(index, Qt.DisplayRole) == "AA BB"
+        # THEN: 마지막 3개만 유지
+        assert model.data(model.index(0, 2), Qt.DisplayRole) == "02"
 
     def test_clear_view(self, qtbot):
         """
@@ -207,8 +652,8 @@ class TestPacketPanel:
         panel = PacketPanel()
         qtbot.addWidget(panel)
 
-        panel.append_packet(PacketViewData("T", "T", "H", "A"))
-        assert panel.packet_model.rowCount() == 1
+        panel.append_packets([Packet(b"A", 0.0)])
+        qtbot.waitUntil(lambda: panel.packet_model.rowCount() == 1, timeout=1000)
 
         # WHEN: Clear 수행
         panel.clear_view()
@@ -272,4 +717,136 @@ class TestPortPanel:
 
             # THEN: 시그널 발생 확인
             assert blocker.signal_triggered
-            assert blocker.args[0] == "COM1"
\ No newline at end of file
+            assert blocker.args[0] == "COM1"
+    def test_hidden_tab_defers_log_append(self, qtbot):
+        """
+        숨겨진 탭은 수신 데이터를 대기열에만 보관하고, 표시될 때 로그 뷰에 반영하는지 검증
+        """
+        # GIVEN: 화면에 표시되지 않은 패널
+        panel = PortPanel()
+        qtbot.addWidget(panel)
+        model = panel._data_log_widget.data_log_list.log_model
+
+        # WHEN: 숨겨진 동안 수신
+        panel.append_log_data(b"AT\r\nOK\r\n")
+
+        # THEN: 행 추가 없음 -> 표시되면 반영
+        assert model.rowCount() == 0
+        panel.show()
+        qtbot.waitUntil(lambda: model.rowCount() == 1, timeout=1000)
+
+    def test_terminal_mode_routes_data_to_terminal_view(self, qtbot):
+        """
+        터미널 모드에서는 수신 데이터가 라인 로그 대신 터미널 화면에 반영되는지 검증
+        """
+        # GIVEN: 터미널 모드로 표시된 패널
+        panel = PortPanel()
+        qtbot.addWidget(panel)
+        panel.show()
+        widget = panel._data_log_widget
+        widget.data_log_terminal_chk.setChecked(True)
+        model = widget.data_log_list.log_model
+
+        # WHEN: ANSI 색상 코드가 포함된 데이터 수신
+        panel.append_log_data(b"\x1b[32mOK\x1b[0m\r\n$ ")
+
+        # THEN: 이스케이프 시퀀스 없이 터미널 화면에 표시, 라인 로그 행 추가 없음
+        screen = widget.data_log_terminal.screen
+        assert screen.lines[0].text == "OK"
+        assert screen.lines[1].text == "$"
+        assert model.rowCount() == 0
+        assert not widget.data_log_hex_chk.isEnabled()
+        assert widget.get_state()["terminal_mode"] is True
+
+    def test_hidden_tab_backlog_overflow_not_dropped(self, qtbot, monkeypatch):
+        """
+        숨겨진 탭의 보관량이 상한을 넘으면 초과분을 버리지 않고 백그라운드로 모델에 반영하는지 검증
+        """
+        # GIVEN: 보관 상한 64바이트, 화면에 표시되지 않은 패널
+        monkeypatch.setattr("view.widgets.data_log.LOG_HIDDEN_BACKLOG_BYTES", 64)
+        panel = PortPanel()
+        qtbot.addWidget(panel)
+        widget = panel._data_log_widget
+        widget.data_log_newline_combo.setCurrentIndex(widget.data_log_newline_combo.findData(NewlineMode.LF.value))
+        model = widget.data_log_list.log_model
+
+        # WHEN: 숨겨진 동안 상한의 몇 배를 수신
+        for n in range(20):
+            panel.append_log_data(b"line %02d\n" % n)
+
+        # THEN: 숨겨진 상태에서 초과분만 반영, 표시 후 생략 없이 전체 반영
+        qtbot.waitUntil(lambda: widget._backlog.size <= 64, timeout=1000)
+        assert 0 < model.rowCount() < 20
+        panel.show()
+        qtbot.waitUntil(lambda: model.rowCount() == 20, timeout=1000)
+        assert widget._backlog.skipped == 0
+
+    def test_hidden_tab_marker_queued_in_order(self, qtbot):
+        """
+        숨겨진 탭의 마커는 대기분을 동기 반영하지 않고 대기열에 보관되어 표시 시 순서대로 반영되는지 검증
+        """
+        # GIVEN: 화면에 표시되지 않은 패널, 대기 중인 수신 데이터
+        panel = PortPanel()
+        qtbot.addWidget(panel)
+        widget = panel._data_log_widget
+        widget.data_log_newline_combo.setCurrentIndex(widget.data_log_newline_combo.findData(NewlineMode.LF.value))
+        model = widget.data_log_list.log_model
+        panel.append_log_data(b"AT\n")
+
+        # WHEN: 마커 추가 후 이어서 수신
+        panel.append_log_marker("--- marker ---")
+        panel.append_log_data(b"OK\n")
+
+        # THEN: 숨겨진 동안은 반영 없음 -> 표시되면 수신 순서대로 반영
+        assert model.rowCount() == 0
+        panel.show()
+        qtbot.waitUntil(lambda: model.rowCount() == 3, timeout=1000)
+        assert [model.data(model.index(row), Qt.DisplayRole) for row in range(3)] == ["AT", "--- marker ---", "OK"]
+
+    def test_local_echo_stored_as_tx_rows(self, qtbot):
+        """
+        로컬 에코가 대기열 순서를 지켜 송신 행으로 추가되고 내보내기에서 TX로 구분되는지 검증
+        """
+        # GIVEN: 대기 중인 수신 데이터 (미완성 라인 포함)
+        panel = PortPanel()
+        qtbot.addWidget(panel)
+        widget = panel._data_log_widget
+        widget.data_log_newline_combo.setCurrentIndex(widget.data_log_newline_combo.findData(NewlineMode.LF.value))
+        model = widget.data_log_list.log_model
+        panel.append_log_data(b"OK\nPART")
+
+        # WHEN: 로컬 에코 후 이어서 수신
+        panel.append_log_tx_data(b"AT\n")
+        panel.append_log_data(b"READY\n")
+        panel.show()
+        qtbot.waitUntil(lambda: model.rowCount() == 4, timeout=1000)
+
+        # THEN: 수신 미완성 라인과 섞이지 않고 송신 행은 TX로 내보내기
+        rows = model.export_rows(model.first_id, 4)
+        assert [(row[1], row[2]) for row in rows] == [
+            ("RX", b"OK\n"), ("RX", b"PART"), ("TX", b"AT\n"), ("RX", b"READY\n")
+        ]
+
+    def test_hidden_tab_backlog_hard_cap(self, qtbot, monkeypatch):
+        """
+        숨겨진 탭 대기열이 절대 상한을 넘으면 오래된 구간을 생략하고 표시 시 생략 마커를 먼저 보여주는지 검증
+        """
+        # GIVEN: 절대 상한 32바이트 (초과분 반영 기준은 그보다 크게 두어 반영 없음)
+        monkeypatch.setattr("view.widgets.data_log.LOG_HIDDEN_BACKLOG_MAX_BYTES", 32)
+        monkeypatch.setattr("view.widgets.data_log.LOG_HIDDEN_BACKLOG_BYTES", 1024)
+        panel = PortPanel()
+        qtbot.addWidget(panel)
+        widget = panel._data_log_widget
+        widget.data_log_newline_combo.setCurrentIndex(widget.data_log_newline_combo.findData(NewlineMode.LF.value))
+        model = widget.data_log_list.log_model
+
+        # WHEN: 8바이트 라인 10개 수신
+        for n in range(10):
+            panel.append_log_data(b"line %02d\n" % n)
+
+        # THEN: 최근 4라인만 보관, 생략량 기록 -> 표시 시 생략 마커 후 보관분 반영
+        assert widget._backlog.size == 32 and widget._backlog.skipped == 48
+        panel.show()
+        qtbot.waitUntil(lambda: model.rowCount() == 5, timeout=1000)
+        assert model.data(model.index(0), Qt.DisplayRole).startswith("data_log_overload_marker")
+        assert model.data(model.index(1), Qt.DisplayRole) == "line 06"
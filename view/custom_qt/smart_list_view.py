@@ -10,35 +10,160 @@ QListView를 기반으로 대량의 로그 데이터를 효율적으로 표시
 
 ## WHAT
 * QAbstractListModel 기반의 고속 데이터 관리 (LogModel)
-* 검색 탐색(Next/Prev) 및 정규식 필터링 (QSortFilterProxyModel)
+* 검색 탐색(Next/Prev) 및 정규식 필터링 (LogFilterProxyModel)
+* 백그라운드 검색 (전체 일치 수, 스크롤바 일치 밀도 미니맵)
 * HEX/ASCII 모드 전환 및 스마트 타임스탬프 지원
-* ColorRule 주입을 통한 동적 색상 적용 및 HTML 렌더링
+* ColorRule 주입을 통한 동적 색상 적용 (평문 + 색상 구간 저장, HTML 미사용)
 
 ## HOW
-* QSortFilterProxyModel로 검색어 필터링 구현 (디바운싱 적용)
-* QStyledItemDelegate로 HTML 텍스트 및 하이라이트 커스텀 렌더링
-* ColorService를 활용한 텍스트 포맷팅 및 테마별 색상 보정
-* deque를 사용한 원본 데이터 버퍼링 및 메모리 제한
+* 필터링은 백그라운드 검색 결과(일치 행 일련번호)를 프록시 매핑으로 점진 반영하고,
+  이후 추가되는 행만 배치 단위로 판정 (메인 스레드 전체 재평가 없음, 디바운싱 적용)
+* QStyledItemDelegate로 색상 구간 및 하이라이트 커스텀 렌더링
+  (렌더링 결과 LRU 캐시, 색상/하이라이트 없는 라인은 QStaticText 고속 경로)
+* 모델은 행별 원본(라인 bytes)과 타임스탬프만 LineStore(열 배열)에 보관, 표시 텍스트/색상 구간은 data() 요청 시 생성
+  (표시 모드 키별 LRU 캐시 -> HEX/인코딩/색상 규칙 전환은 보이는 행 수에 비례)
+* 행 추가 후 최근 행(자동 스크롤 시 보일 행)은 QThreadPool 작업에서 미리 포맷팅하여 캐시에 저장
+  (포맷터는 설정값을 복사해 둔 순수 함수, 메인 스레드는 행 추가와 캐시 저장만 수행)
+* 색상 구간은 규칙 인덱스만 담고, 색상은 그릴 때 테마에 맞춰 결정
+* 필터/내보내기는 평문 표시 텍스트를 그대로 사용 (태그 제거 불필요)
+* 검색 탐색은 모델의 증분 검색 인덱스를 QThreadPool 작업으로 질의하고, 결과(일치 행 일련번호)에서 bisect로 이동
+* LineAssembler로 배치 경계에 걸친 문자/라인을 조립하여 완성된 라인만 행으로 추가
+* 중복 접기 모드에서는 직전 행과 같은 라인을 행으로 추가하지 않고 반복 횟수/마지막 시각만 갱신 (제자리 dataChanged)
+* 행 최대 폭(바이트)을 넘는 라인은 추가 시점에 고정 폭 행으로 분할 (HEX 모드는 hexdump 형식 16/32바이트)
+  -> 행당 렌더링 비용 상한, 균일 행 높이 가정 유지
 """
 import re
-import datetime
-from typing import List, Any, Optional
-from collections import deque
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from collections import OrderedDict
 
-from PyQt5.QtWidgets import QListView, QAbstractItemView, QStyle, QStyledItemDelegate
+from PyQt5.QtWidgets import QListView, QAbstractItemView, QStyle, QStyledItemDelegate, QScrollBar
 from PyQt5.QtCore import (
-    Qt, QAbstractListModel, QModelIndex, QVariant, QSize, QRegExp, pyqtSlot,
-    QSortFilterProxyModel, QTimer, QDateTime
+    Qt, QAbstractListModel, QAbstractProxyModel, QModelIndex, QVariant, QSize, QRegExp, pyqtSignal,
+    pyqtSlot, QTimer, QDateTime, QPointF, QThreadPool, QObject, QRunnable
 )
 from PyQt5.QtGui import (
-    QColor, QTextDocument, QAbstractTextDocumentLayout, QTextCharFormat, QPainter, QPalette
+    QColor, QTextDocument, QAbstractTextDocumentLayout, QTextCharFormat, QPainter, QPalette,
+    QFont, QStaticText, QTransform, QTextCursor
 )
 
-from common.constants import DEFAULT_LOG_MAX_LINES, TRIM_CHUNK_RATIO
-from common.dtos import ColorRule
-from view.services.color_service import ColorService
+from common.constants import (
+    DEFAULT_LOG_MAX_LINES, TRIM_CHUNK_RATIO, LINE_PARTIAL_FLUSH_MS, LOG_RENDER_CACHE_SIZE,
+    LOG_FORMAT_CACHE_SIZE, DEFAULT_RX_ENCODING, SEARCH_REFRESH_MS, DEFAULT_LOG_ROW_BYTES,
+    LOG_HEX_ROW_BYTES, LOG_PREFETCH_ROWS, LOG_BLOCK_LINES, MIN_LOG_BLOCK_LINES, LOG_COMPRESSION_LINES_FACTOR
+)
+from common.dtos import ColorRule, LogSearchResult
+from common.enums import LogDedupMode
+from core.logger import logger
+from model.line_assembler import LineAssembler
+from model.line_store import (
+    LineStore, DiskLineStore, CompressedLineStore, LINE_FLAG_TEXT, LINE_FLAG_MARKER, LINE_FLAG_TX
+)
+from model.log_search_index import LogSearchIndex, LogSearchTask, compile_matcher, match_payload
+from model.log_exporter import ExportRow
+from view.services.color_service import ColorService, ColorSpan, CompiledColorRules
 from view.managers.theme_manager import theme_manager
 
+# 모델의 색상 구간 조회용 역할 (Tuple[ColorSpan, ...])
+LOG_SPANS_ROLE = Qt.UserRole + 1
+
+# 안내 마커 라인 구간의 규칙 인덱스 (기본 색상 + 기울임)
+MARKER_SPAN_INDEX = -1
+
+# 숫자 무시 중복 판정용 숫자 구간
+_DIGIT_RUN = re.compile(rb"\d+")
+
+
+def _format_stamp(stamp: float) -> str:
+    """행 타임스탬프(epoch 초)를 표시 형식("[HH:MM:SS]")으로 변환합니다."""
+    return time.strftime("[%H:%M:%S]", time.localtime(stamp))
+
+
+def _format_line(formatter: Optional[Callable[[Any, float], Tuple[str, Tuple[ColorSpan, ...]]]],
+                 payload: bytes, stamp: float, flags: int,
+                 repeat: Optional[Tuple[int, float]]) -> Tuple[str, Tuple[ColorSpan, ...]]:
+    """
+    저장소 행을 표시 텍스트와 색상 구간으로 변환합니다. (메인/작업 스레드 공용)
+
+    Logic:
+        - 마커 행: 그대로 + 기울임 구간
+        - 텍스트 행: UTF-8 디코딩 후 포맷터 적용, 수신 행: 원본 그대로 포맷터 적용
+        - 접힌 행은 끝에 반복 횟수와 마지막 수신 시각 표시
+
+    Args:
+        formatter: 행 포맷터 (None이면 기본 인코딩 디코딩 + 타임스탬프).
+        payload: 행 내용.
+        stamp: 타임스탬프 (epoch 초, 0.0 = 없음).
+        flags: 행 플래그 (LINE_FLAG_*).
+        repeat: (반복 횟수, 마지막 수신 시각), 접히지 않은 행은 None.
+
+    Returns:
+        Tuple[str, Tuple[ColorSpan, ...]]: (표시 텍스트, 색상 구간).
+    """
+    if flags & LINE_FLAG_TEXT:
+        payload = payload.decode("utf-8")
+        if flags & LINE_FLAG_MARKER:
+            return payload, ((0, len(payload), MARKER_SPAN_INDEX),)
+    if formatter is not None:
+        text, spans = formatter(payload, stamp)
+    else:
+        text = payload if isinstance(payload, str) else payload.decode(DEFAULT_RX_ENCODING, errors="replace")
+        text, spans = (f"{_format_stamp(stamp)} {text}" if stamp else text), ()
+
+    if repeat is not None:
+        count, last_seen = repeat
+        text = f"{text}  (×{count}, {time.strftime('%H:%M:%S', time.localtime(last_seen))})"
+    return text, spans
+
+
+class LogFormatSignals(QObject):
+    """
+    선포맷팅 작업 시그널 정의 클래스
+
+    QRunnable은 QObject가 아니므로 시그널을 직접 가질 수 없어 별도 클래스로 분리합니다.
+    """
+    # (작업 세대, [(행 일련번호, 반복 정보, (표시 텍스트, 색상 구간))])
+    rows_formatted = pyqtSignal(int, object)
+
+
+class LogFormatTask(QRunnable):
+    """
+    최근 추가된 행의 선포맷팅 작업 (QThreadPool에서 실행)
+
+    행 내용은 메인 스레드에서 미리 꺼내 전달하고, 포맷터는 설정값이 고정된 순수 함수여야 합니다.
+    결과는 메인 스레드 슬롯에서 모델의 표시 텍스트 캐시에 저장됩니다.
+    """
+
+    def __init__(self, formatter: Callable[[Any, float], Tuple[str, Tuple[ColorSpan, ...]]],
+                 generation: int, rows: List[tuple]) -> None:
+        """
+        LogFormatTask 초기화
+
+        Args:
+            formatter: 설정값이 고정된 행 포맷터
+            generation: 요청 시점의 모델 선포맷팅 세대 (결과 유효성 확인용)
+            rows: (행 일련번호, 반복 정보, 내용, 타임스탬프, 플래그) 리스트
+        """
+        super().__init__()
+        self.signals = LogFormatSignals()
+        self._formatter = formatter
+        self._generation = generation
+        self._rows = rows
+
+    def run(self) -> None:
+        """행을 포맷팅하고 결과를 시그널로 전달합니다."""
+        results = []
+        for row_id, repeat, payload, stamp, flags in self._rows:
+            try:
+                entry = _format_line(self._formatter, payload, stamp, flags, repeat)
+            except Exception as e:  # 포맷터 오류는 해당 행만 제외 (그릴 때 다시 시도)
+                logger.debug(f"Row prefetch failed: {e}")
+                continue
+            results.append((row_id, repeat, entry))
+        self.signals.rows_formatted.emit(self._generation, results)
+
 
 class QSmartListView(QListView):
     """
@@ -48,6 +173,9 @@ class QSmartListView(QListView):
     검색 탐색(Next/Prev) 및 필터링 기능을 제공합니다.
     """
 
+    # 검색 결과 변경 (현재 일치 순번(1부터, 0 = 선택 없음), 전체 일치 수)
+    search_result_changed = pyqtSignal(int, int)
+
     def __init__(self, parent=None):
         """
         QSmartListView를 초기화합니다.
@@ -64,11 +192,8 @@ class QSmartListView(QListView):
         self.log_model = LogModel()
 
         # 프록시 모델 설정 (필터링 지원)
-        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model = LogFilterProxyModel(self)
         self.proxy_model.setSourceModel(self.log_model)
-        self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        # 전체 열에 대해 필터링 (로그는 0번 컬럼 하나임)
-        self.proxy_model.setFilterKeyColumn(0)
 
         self.setModel(self.proxy_model)
 
@@ -76,6 +201,10 @@ class QSmartListView(QListView):
         self.delegate = LogDelegate(self)
         self.setItemDelegate(self.delegate)
 
+        # 검색 일치 밀도 미니맵을 그리는 스크롤바
+        self.minimap_scroll_bar = SearchMinimapScrollBar(self)
+        self.setVerticalScrollBar(self.minimap_scroll_bar)
+
         # ---------------------------------------------------------
         # 2. 뷰 속성 설정
         # ---------------------------------------------------------
@@ -103,13 +232,34 @@ class QSmartListView(QListView):
         self._timestamp_enabled = False
         self._timestamp_timeout_ms = 100
 
-        # 색상 규칙 (외부 주입)
+        # 행 최대 폭 (바이트, 긴 라인은 추가 시점에 여러 행으로 분할)
+        self._row_bytes = DEFAULT_LOG_ROW_BYTES
+        self._hex_row_bytes = LOG_HEX_ROW_BYTES[0]
+
+        # 색상 규칙 (외부 주입) 및 단일 패스 매칭기 (규칙 변경 시에만 컴파일, 활성 규칙이 없으면 None)
         self._color_rules: List[ColorRule] = []
+        self._rule_engine: Optional[CompiledColorRules] = None
+        # 색상 규칙 변경 횟수 (표시 모드 키의 일부, 규칙 변경 시 캐시된 색상 구간 무효화)
+        self._rules_generation = 0
 
         self._last_data_time = None
 
-        # HEX 모드 전환을 위한 원본 bytes 데이터 저장 (원형 버퍼로 메모리 최적화)
-        self._original_data: deque = deque(maxlen=DEFAULT_LOG_MAX_LINES)
+        # 백그라운드 검색 상태 (실행 중인 작업은 1개, 결과는 최신 검색어 기준 1개만 보관)
+        self._search_text = ""
+        self._search_result: Optional[LogSearchResult] = None
+        self._search_task: Optional[LogSearchTask] = None
+        self._search_rerun = False       # 작업 실행 중 조건/행 변경 -> 완료 후 다시 검색
+        self._search_pending_step = 0    # 결과 도착 시 이동할 방향 (1 = 다음, -1 = 이전, 0 = 없음)
+
+        # 배치 경계에 걸친 문자/라인 조립 (행에는 라인 원본 bytes를 보관)
+        self._assembler = LineAssembler(newline=self._newline_char)
+        self._apply_display_mode()
+
+        # 미완성 라인 강제 표시 타이머 (수신이 멈춘 프롬프트 등)
+        self._partial_flush_timer = QTimer(self)
+        self._partial_flush_timer.setSingleShot(True)
+        self._partial_flush_timer.setInterval(LINE_PARTIAL_FLUSH_MS)
+        self._partial_flush_timer.timeout.connect(self._flush_partial_line)
 
         # 필터링 디바운스 타이머 (입력 멈춤 감지)
         # 복잡한 정규식 입력 시 UI 프리징 방지
@@ -118,6 +268,13 @@ class QSmartListView(QListView):
         self._filter_debounce_timer.setInterval(300)  # 300ms 대기
         self._filter_debounce_timer.timeout.connect(self._execute_filter_update)
 
+        # 수신 중 검색 결과(일치 수/미니맵) 갱신 타이머 (행 추가마다 검색하지 않도록 간격 제한)
+        self._search_refresh_timer = QTimer(self)
+        self._search_refresh_timer.setSingleShot(True)
+        self._search_refresh_timer.setInterval(SEARCH_REFRESH_MS)
+        self._search_refresh_timer.timeout.connect(self._request_search)
+        self.log_model.rowsInserted.connect(self._schedule_search_refresh)
+
         self.setObjectName("SmartListView")
 
     def set_color_rules(self, rules: List[ColorRule]) -> None:
@@ -128,8 +285,12 @@ class QSmartListView(QListView):
             rules (List[ColorRule]): 적용할 ColorRule 리스트.
         """
         self._color_rules = rules
-        # 규칙이 변경되면 기존 데이터 다시 렌더링
-        self._refresh_all_data()
+        engine = ColorService.compile_rules(rules)
+        self._rule_engine = None if engine.is_empty else engine
+        self._rules_generation += 1
+        self.delegate.set_color_rules(rules)
+        # 규칙이 변경되면 보이는 행부터 새 규칙으로 색상 구간 계산 (전체 재계산 없음)
+        self._apply_display_mode()
 
     def set_newline_char(self, char: Optional[str]) -> None:
         """
@@ -139,11 +300,39 @@ class QSmartListView(QListView):
             char (Optional[str]): 사용할 줄바꿈 문자 (예: '\n', '\r\n'). None이면 Raw 모드.
         """
         self._newline_char = char
+        self._assembler.set_newline(char)
+        self._apply_display_mode()
+
+    def set_encoding(self, encoding: str) -> None:
+        """
+        수신 데이터 인코딩을 설정합니다.
+        변경 시 보관된 라인 원본을 새 인코딩으로 표시합니다. (보이는 행만 즉시 변환)
+
+        Args:
+            encoding (str): 인코딩 이름 (예: 'utf-8', 'cp949').
+
+        Raises:
+            ValueError: 지원하지 않는 인코딩인 경우.
+        """
+        previous = self._assembler.encoding
+        self._assembler.set_encoding(encoding)
+        if self._assembler.encoding != previous:
+            self._apply_display_mode()
+
+    @property
+    def encoding(self) -> str:
+        """현재 수신 데이터 인코딩 이름"""
+        return self._assembler.encoding
+
+    @property
+    def search_truncated(self) -> bool:
+        """최근 검색 결과가 검색 인덱스 용량 초과로 오래된 행 일부를 제외했는지 여부"""
+        return self._search_result is not None and self._search_result.truncated
 
     def set_hex_mode_enabled(self, enabled: bool) -> None:
         """
         HEX 모드 활성화/비활성화를 설정합니다.
-        모드 변경 시 원본 데이터를 사용하여 화면을 다시 렌더링합니다.
+        모드 변경 시 보관된 라인 원본으로 보이는 행만 다시 포맷팅합니다. (타임스탬프 유지)
 
         Args:
             enabled (bool): HEX 모드 활성화 여부.
@@ -152,7 +341,27 @@ class QSmartListView(QListView):
             return
 
         self._hex_mode = enabled
-        self._refresh_all_data()
+        self._apply_display_mode()
+
+    def set_row_bytes(self, row_bytes: int, hex_row_bytes: int) -> None:
+        """
+        행 최대 폭을 설정합니다. (이후 추가되는 행부터 적용)
+
+        Args:
+            row_bytes (int): 텍스트 모드 행 최대 폭 (바이트, 문자 경계에서 분할).
+            hex_row_bytes (int): HEX 모드 행당 바이트 수.
+        """
+        self._row_bytes = max(1, row_bytes)
+        self._hex_row_bytes = max(1, hex_row_bytes)
+
+    def set_dedup_mode(self, mode: LogDedupMode) -> None:
+        """
+        연속 중복 라인 접기 모드를 설정합니다. (이후 수신분부터 적용)
+
+        Args:
+            mode (LogDedupMode): 중복 접기 모드.
+        """
+        self.log_model.set_dedup_mode(mode)
 
     def set_timestamp_enabled(self, enabled: bool, timeout_ms: int = 100) -> None:
         """
@@ -200,82 +409,161 @@ class QSmartListView(QListView):
             lines = [line_formatter(line) for line in lines]
 
         # 3. 모델에 배치(Batch) 추가
+        self._add_lines(lines)
+
+    def _add_lines(self, lines: List[str]) -> None:
+        """
+        포맷팅이 끝난 텍스트 라인들을 모델에 배치로 추가하고 자동 스크롤합니다.
+
+        Args:
+            lines (List[str]): 추가할 라인 리스트 (평문).
+        """
         if lines:
             self.log_model.add_logs(lines)
 
-            # 4. 자동 스크롤 (맨 아래에 있을 때만)
+            # 자동 스크롤 (맨 아래에 있을 때만)
             if self.is_at_bottom():
                 self.scrollToBottom()
 
-    def append_bytes(self, data: bytes) -> None:
+    def _add_raw_lines(self, payloads: List[bytes], stamp: float, flags: int = 0) -> None:
         """
-        바이트 데이터를 받아 내부 설정에 따라 처리 후 추가합니다.
+        수신 라인 원본들을 모델에 배치로 추가하고 자동 스크롤합니다.
+        행 최대 폭을 넘는 라인은 고정 폭 행으로 분할합니다.
 
-        Logic:
-            1. 원본 데이터 저장 (HEX 모드 전환용)
-            2. 설정에 따라 HEX 문자열 또는 디코딩된 문자열로 변환
-            3. 타임스탬프 및 색상 적용을 위한 포맷터 생성
-            4. append() 호출
+        Args:
+            payloads (List[bytes]): 라인 원본 bytes 리스트.
+            stamp (float): 배치 공통 타임스탬프 (epoch 초, 0.0 = 없음).
+            flags (int): 행 플래그 (송신 에코 = LINE_FLAG_TX).
+        """
+        if payloads:
+            width = self._hex_row_bytes if self._hex_mode else self._row_bytes
+            if max(map(len, payloads)) > width:
+                rows = []
+                for payload in payloads:
+                    rows.extend(self._assembler.split_raw(payload, width, exact=self._hex_mode))
+                payloads = rows
+            self.log_model.add_raw_lines(payloads, stamp, flags)
+
+            # 자동 스크롤 (맨 아래에 있을 때만)
+            if self.is_at_bottom():
+                self.scrollToBottom()
+
+    def append_marker(self, text: str) -> None:
+        """
+        데이터와 구분되는 안내 라인을 추가합니다. (줄바꿈 분할/색상 규칙 미적용)
+        순서 보장을 위해 미완성 라인을 먼저 표시합니다.
 
         Args:
-            data (bytes): 수신된 바이트 데이터.
+            text (str): 마커 텍스트.
         """
-        # 원본 데이터 저장 (HEX 모드 전환용, deque가 maxlen 관리)
-        self._original_data.append(data)
+        self._flush_partial_line()
+        self.log_model.add_marker(text)
+        if self.is_at_bottom():
+            self.scrollToBottom()
 
-        # 1. 텍스트 변환
-        if self._hex_mode:
-            text = " ".join([f"{b:02X}" for b in data]) + " "
-        else:
-            try:
-                text = data.decode('utf-8', errors='replace')
-            except Exception:
-                text = str(data)
+    def _apply_display_mode(self) -> None:
+        """
+        현재 표시 설정(HEX/인코딩/줄바꿈/색상 규칙)을 모델의 행 포맷터에 반영합니다.
+        """
+        mode_key = (self._hex_mode, self._assembler.encoding, self._newline_char, self._rules_generation)
+        self.log_model.set_formatter(self._create_row_formatter(), mode_key)
+        # 검색어 해석(HEX/인코딩)이 바뀌었을 수 있으므로 필터와 검색 결과 갱신
+        self._execute_filter_update()
 
-        # 2. 타임스탬프 판단 (스마트 로직)
-        should_add_timestamp = self._should_add_timestamp()
+    def _create_row_formatter(self) -> Callable[[Any, float], Tuple[str, Tuple[ColorSpan, ...]]]:
+        """
+        현재 표시 설정을 고정한 행 포맷터를 만듭니다. (모델의 행 포맷터)
 
-        # 3. Formatter 생성 (클로저)
-        formatter = self._create_line_formatter(should_add_timestamp)
+        설정값을 복사해 두므로 이후 설정이 바뀌어도 결과가 달라지지 않아
+        작업 스레드(선포맷팅)에서도 호출할 수 있습니다.
 
-        # 4. 모델에 추가
-        self.append(text, formatter)
+        Logic:
+            - 수신 라인(bytes): HEX 모드면 HEX 문자열, 아니면 설정 시점의 인코딩/줄바꿈으로 디코딩
+            - 텍스트 라인(str): 그대로 사용
+            - 타임스탬프가 있으면 앞에 붙이고 색상 구간 계산
 
-    def _create_line_formatter(self, add_timestamp: bool):
+        Returns:
+            Callable: (수신 라인 bytes 또는 텍스트 str, 타임스탬프) -> (표시 텍스트, 색상 구간).
         """
-        라인 포맷터 함수(클로저)를 생성합니다.
+        hex_mode = self._hex_mode
+        decoder = LineAssembler(self._assembler.encoding, self._newline_char)
+        rule_engine = self._rule_engine
+
+        def format_row(payload: Any, stamp: float) -> Tuple[str, Tuple[ColorSpan, ...]]:
+            if isinstance(payload, bytes):
+                text = payload.hex(" ").upper() + " " if hex_mode else decoder.decode(payload)
+            else:
+                text = payload
+
+            if stamp:
+                text = f"{_format_stamp(stamp)} {text}"
+            return text, (rule_engine.spans(text) if rule_engine is not None else ())
+
+        return format_row
+
+    def append_bytes(self, data: bytes) -> None:
+        """
+        바이트 데이터를 받아 라인 원본 단위로 모델에 추가합니다.
+
+        Logic:
+            1. LineAssembler로 완성된 라인의 원본 bytes만 조립 (Raw 모드는 배치 단위)
+            2. 타임스탬프는 배치당 1회 생성하여 행 메타데이터로 보관
+            3. 표시 텍스트(HEX/디코딩/색상)는 행이 그려질 때 만들어짐 (LogModel 포맷터)
+            4. 미완성 라인이 남으면 타임아웃 후 강제 표시 예약
 
         Args:
-            add_timestamp (bool): 타임스탬프 추가 여부.
+            data (bytes): 수신된 바이트 데이터.
+        """
+        # 1. 라인 조립
+        payloads = self._assembler.feed_raw(data)
 
-        Returns:
-            callable: 생성된 포맷터 함수.
+        # 2. 타임스탬프 판단 (스마트 로직)
+        if payloads:
+            self._add_raw_lines(payloads, self._create_timestamp(self._should_add_timestamp()))
+
+        # 3. 미완성 라인은 수신이 멈추면 표시 (새 데이터가 오면 대기 시간 재시작)
+        if self._assembler.has_partial:
+            self._partial_flush_timer.start()
+        else:
+            self._partial_flush_timer.stop()
+
+    def append_tx_bytes(self, data: bytes) -> None:
         """
-        # 캡처 시점의 테마 상태 확인 (다크 모드 여부)
-        is_dark = theme_manager.is_dark_theme()
+        송신 데이터(로컬 에코)를 송신 행으로 추가합니다.
 
-        def formatter(line: str) -> str:
-            """
-            개별 라인을 포맷팅하는 내부 함수.
+        Logic:
+            - 수신 미완성 라인을 먼저 표시하여 수신/송신 내용이 한 행에 섞이지 않게 함
+            - 송신 청크는 한 번에 보낸 단위이므로 끝의 미완성 라인까지 바로 표시
 
-            Args:
-                line (str): 원본 라인 텍스트.
+        Args:
+            data (bytes): 송신한 바이트 데이터.
+        """
+        self._flush_partial_line()
+        payloads = self._assembler.feed_raw(data) + self._assembler.flush_raw()
+        if payloads:
+            self._add_raw_lines(payloads, self._create_timestamp(self._should_add_timestamp()), LINE_FLAG_TX)
 
-            Returns:
-                str: 포맷팅된(타임스탬프, HTML 색상) 텍스트.
-            """
-            formatted = line
+    def _flush_partial_line(self) -> None:
+        """
+        미완성 라인을 강제로 표시합니다. (Timer Slot, 마커 삽입 전)
+        """
+        self._partial_flush_timer.stop()
+        payloads = self._assembler.flush_raw()
+        if payloads:
+            self._add_raw_lines(payloads, self._create_timestamp(self._should_add_timestamp()))
 
-            if add_timestamp:
-                ts = datetime.datetime.now().strftime("[%H:%M:%S]")
-                formatted = f"{ts} {formatted}"
+    @staticmethod
+    def _create_timestamp(add_timestamp: bool) -> float:
+        """
+        배치 공통 타임스탬프를 생성합니다. (표시 형식 변환은 행이 그려질 때 수행)
 
-            if self._color_rules:
-                # ColorService를 통해 규칙 적용 (테마 반영)
-                formatted = ColorService.apply_rules(formatted, self._color_rules, is_dark)
+        Args:
+            add_timestamp (bool): 타임스탬프 추가 여부.
 
-            return formatted
-        return formatter
+        Returns:
+            float: 현재 시각 (epoch 초), 추가하지 않으면 0.0.
+        """
+        return time.time() if add_timestamp else 0.0
 
     def _should_add_timestamp(self) -> bool:
         """
@@ -308,58 +596,32 @@ class QSmartListView(QListView):
         self._last_data_time = now
         return False
 
-    def _refresh_all_data(self) -> None:
-        """
-        모든 데이터를 다시 렌더링합니다.
-        HEX 모드 변경 또는 테마 변경 시 호출됩니다.
+    def set_max_lines(self, max_lines: int) -> None:
         """
-        if not self._original_data:
-            return
-
-        scroll_pos = self.verticalScrollBar().value()
-        was_at_bottom = self.is_at_bottom()
+        최대 로그 라인 수를 설정합니다.
 
-        # 모델 초기화
-        self.log_model.clear()
+        Args:
+            max_lines (int): 최대 라인 수.
+        """
+        self.log_model.set_max_lines(max_lines)
 
-        # 현재 테마 상태 확인
-        is_dark = theme_manager.is_dark_theme()
+    def set_scrollback_enabled(self, enabled: bool) -> None:
+        """
+        디스크 스크롤백 모드를 설정합니다. (최대 라인 수 제한 없이 전체 이력 유지)
 
-        # 원본 데이터 순회하며 재생성
-        for data in self._original_data:
-            if self._hex_mode:
-                text = " ".join([f"{b:02X}" for b in data]) + " "
-            else:
-                try:
-                    text = data.decode('utf-8', errors='replace')
-                except Exception:
-                    text = str(data)
-
-            # 재생성 시에는 타임스탬프를 정확히 복원하기 어려우므로 생략하거나
-            # 저장된 타임스탬프가 있다면 그것을 써야 함.
-            # 현재 구조에서는 단순 텍스트 재구성이므로 타임스탬프 생략 (또는 규칙만 적용)
-            formatter = None
-            if self._color_rules:
-                formatter = lambda line: ColorService.apply_rules(line, self._color_rules, is_dark)
-
-            self.append(text, formatter)
-
-        # 스크롤 위치 복원
-        if was_at_bottom:
-            self.scrollToBottom()
-        else:
-            self.verticalScrollBar().setValue(scroll_pos)
+        Args:
+            enabled (bool): 스크롤백 모드 사용 여부.
+        """
+        self.log_model.set_scrollback_enabled(enabled)
 
-    def set_max_lines(self, max_lines: int) -> None:
+    def set_compression_enabled(self, enabled: bool) -> None:
         """
-        최대 로그 라인 수를 설정합니다.
+        오래된 라인의 메모리 압축 보관을 설정합니다. (스크롤백 모드가 아닐 때 적용)
 
         Args:
-            max_lines (int): 최대 라인 수.
+            enabled (bool): 압축 보관 사용 여부.
         """
-        self.log_model.set_max_lines(max_lines)
-        # deque의 크기도 조정 (기존 데이터 유지하며 리사이징)
-        self._original_data = deque(self._original_data, maxlen=max_lines)
+        self.log_model.set_compression_enabled(enabled)
 
     def is_at_bottom(self) -> bool:
         """
@@ -374,10 +636,13 @@ class QSmartListView(QListView):
 
     def clear(self) -> None:
         """
-        로그 모델과 원본 데이터 버퍼를 초기화합니다.
+        로그 모델과 라인 조립 상태를 초기화합니다.
         """
         self.log_model.clear()
-        self._original_data.clear()
+        self._assembler.reset()
+        self.delegate.clear_cache()
+        self._partial_flush_timer.stop()
+        self._request_search()
 
     @pyqtSlot(str)
     def set_search_pattern(self, text: str) -> None:
@@ -387,11 +652,19 @@ class QSmartListView(QListView):
         Logic:
             - 정규식 컴파일 (실패 시 일반 텍스트 이스케이프)
             - 델리게이트에 패턴 전달 (하이라이트 즉시 갱신)
-            - 필터링은 디바운싱 타이머 시작 (UI 프리징 방지)
+            - 필터링과 백그라운드 검색(일치 수/미니맵)은 디바운싱 타이머 시작 (UI 프리징 방지)
 
         Args:
             text (str): 검색할 문자열 (정규식 지원).
         """
+        if text != self._search_text:
+            self._search_text = text
+            self._search_result = None
+            self._search_pending_step = 0
+            self.minimap_scroll_bar.set_density(())
+            if not text:
+                self.search_result_changed.emit(0, 0)
+
         if not text:
             self._current_pattern = None
             self.delegate.set_search_pattern(None)
@@ -426,121 +699,177 @@ class QSmartListView(QListView):
     def _execute_filter_update(self) -> None:
         """
         디바운스 타이머 종료 후 실제 필터링을 수행합니다.
-        QSortFilterProxyModel의 필터를 업데이트하여 뷰를 갱신합니다.
+        프록시 모델의 필터 조건을 갱신하고(백그라운드 필터링), 일치 수/미니맵 검색을 시작합니다.
         """
-        if self._filter_enabled and self._current_pattern:
-            self.proxy_model.setFilterRegExp(self._current_pattern)
+        if self._filter_enabled and self._search_text:
+            self.proxy_model.set_filter(self._search_query())
         else:
-            self.proxy_model.setFilterRegExp("")  # 필터 해제
+            self.proxy_model.set_filter(None)  # 필터 해제
+        self._request_search()
 
-    def find_next(self, text: str) -> bool:
+    def find_next(self, text: str) -> None:
         """
         다음 검색 결과를 찾아 해당 행으로 이동합니다 (Wrap around 지원).
-        현재 보이는(필터링된) 항목 내에서 검색합니다.
+        현재 보이는(필터링된) 항목 내에서 이동하며, 최신 결과가 없으면 백그라운드 검색 완료 후 이동합니다.
 
         Args:
             text (str): 검색할 문자열.
-
-        Returns:
-            bool: 찾았으면 True, 아니면 False.
         """
-        if not text:
-            return False
-
-        pattern = self._create_pattern(text)
-        current_row = self.currentIndex().row()
-        total_rows = self.model().rowCount()
-
-        start_row = current_row + 1 if current_row >= 0 else 0
-
-        # 1. 현재 위치 다음부터 끝까지 검색
-        for row in range(start_row, total_rows):
-            if self._match_row(row, pattern):
-                self._select_and_scroll(row)
-                return True
-
-        # 2. 처음부터 현재 위치까지 검색 (Wrap around)
-        for row in range(0, start_row):
-            if self._match_row(row, pattern):
-                self._select_and_scroll(row)
-                return True
-
-        return False
+        self._find(text, 1)
 
-    def find_prev(self, text: str) -> bool:
+    def find_prev(self, text: str) -> None:
         """
         이전 검색 결과를 찾아 해당 행으로 이동합니다 (Wrap around 지원).
 
         Args:
             text (str): 검색할 문자열.
+        """
+        self._find(text, -1)
 
-        Returns:
-            bool: 찾았으면 True, 아니면 False.
+    def _find(self, text: str, step: int) -> None:
+        """
+        검색 결과에서 현재 행 다음/이전 일치 행으로 이동합니다.
+
+        Logic:
+            - 같은 조건의 최신 결과(행 추가/삭제 없음)가 있으면 즉시 이동 (bisect, 행 순회 없음)
+            - 없으면 이동 방향을 기억하고 백그라운드 검색 요청 -> 완료 시 이동
+
+        Args:
+            text (str): 검색할 문자열.
+            step (int): 1 = 다음, -1 = 이전.
         """
         if not text:
-            return False
+            return
+        if text != self._search_text:
+            self.set_search_pattern(text)
 
-        pattern = self._create_pattern(text)
-        current_row = self.currentIndex().row()
-        total_rows = self.model().rowCount()
+        result = self._search_result
+        if (result is not None and result.query == self._search_query()
+                and result.generation == self.log_model.search_index.generation):
+            self._navigate(result, step)
+            return
 
-        start_row = current_row - 1 if current_row >= 0 else total_rows - 1
+        self._search_pending_step = step
+        self._request_search()
 
-        # 1. 현재 위치 이전부터 처음까지 역순 검색
-        for row in range(start_row, -1, -1):
-            if self._match_row(row, pattern):
-                self._select_and_scroll(row)
-                return True
+    def _search_query(self) -> tuple:
+        """현재 검색 조건 (검색어, 인코딩, HEX 모드 여부)"""
+        return self._search_text, self._assembler.encoding, self._hex_mode
 
-        # 2. 끝에서부터 현재 위치까지 역순 검색 (Wrap around)
-        for row in range(total_rows - 1, start_row, -1):
-            if self._match_row(row, pattern):
-                self._select_and_scroll(row)
-                return True
+    @pyqtSlot()
+    def _request_search(self) -> None:
+        """
+        현재 검색어로 백그라운드 검색을 시작합니다. (실행 중이면 완료 후 다시 검색)
+        """
+        if not self._search_text:
+            return
+        if self._search_task is not None:
+            self._search_rerun = True
+            return
 
-        return False
+        text, encoding, hex_mode = self._search_query()
+        task = LogSearchTask(self.log_model.search_index, text, encoding, hex_mode)
+        task.signals.search_finished.connect(self._on_search_finished)
+        self._search_task = task
+        QThreadPool.globalInstance().start(task)
 
-    def get_all_text(self) -> str:
+    @pyqtSlot()
+    def _schedule_search_refresh(self) -> None:
+        """행 추가 시 검색어가 있으면 일정 간격으로 검색 결과를 갱신합니다."""
+        if self._search_text and not self._search_refresh_timer.isActive():
+            self._search_refresh_timer.start()
+
+    @pyqtSlot(object)
+    def _on_search_finished(self, result: LogSearchResult) -> None:
         """
-        모델에 있는 모든 로그 데이터를 가져와 하나의 문자열로 반환합니다.
-        HTML 태그는 제거됩니다.
+        백그라운드 검색 완료 처리 (메인 스레드)
 
-        Returns:
-            str: 개행 문자로 구분된 전체 로그 텍스트.
+        Logic:
+            - 검색 중 조건이 바뀐 결과는 버리고 다시 검색
+            - 미니맵/일치 수 갱신, 대기 중인 이동 수행
+
+        Args:
+            result (LogSearchResult): 검색 결과.
         """
-        lines = self.log_model.get_plain_text_logs()
-        return "\n".join(lines)
+        self._search_task = None
+        rerun = self._search_rerun
+        self._search_rerun = False
 
-    @staticmethod
-    def _create_pattern(text: str) -> QRegExp:
+        if result.query != self._search_query():
+            self._request_search()
+            return
+
+        self._search_result = result
+        self.minimap_scroll_bar.set_density(result.density)
+        step = self._search_pending_step
+        self._search_pending_step = 0
+        if step:
+            self._navigate(result, step)
+        else:
+            self.search_result_changed.emit(self._current_match_number(result), result.total)
+
+        if rerun:
+            self._request_search()
+
+    def _navigate(self, result: LogSearchResult, step: int) -> bool:
         """
-        검색 문자열을 QRegExp 객체로 변환합니다.
+        검색 결과에서 현재 행 기준 다음/이전 일치 행을 선택합니다. (끝에 도달하면 반대쪽으로 순환)
+
+        제거(Trim)되었거나 필터로 숨겨진 행은 건너뜁니다.
 
         Args:
-            text (str): 검색 문자열.
+            result (LogSearchResult): 검색 결과.
+            step (int): 1 = 다음, -1 = 이전.
 
         Returns:
-            QRegExp: 컴파일된 정규식 객체.
+            bool: 이동했으면 True.
         """
-        pattern = QRegExp(text, Qt.CaseInsensitive)
-        if not pattern.isValid():
-            pattern = QRegExp(QRegExp.escape(text), Qt.CaseInsensitive)
-        return pattern
+        ids = result.ids
+        total = len(ids)
+        first_id = self.log_model.first_id
+        row_count = self.log_model.rowCount()
 
-    def _match_row(self, row: int, pattern: QRegExp) -> bool:
-        """
-        특정 행의 데이터가 검색 패턴과 일치하는지 확인합니다.
+        current = self.currentIndex()
+        if current.isValid():
+            current_id = first_id + self.proxy_model.mapToSource(current).row()
+            pos = bisect_right(ids, current_id) if step > 0 else bisect_left(ids, current_id) - 1
+        else:
+            pos = 0 if step > 0 else total - 1
+
+        for _ in range(total):
+            pos %= total
+            row = ids[pos] - first_id
+            if 0 <= row < row_count:
+                index = self.proxy_model.mapFromSource(self.log_model.index(row))
+                if index.isValid():
+                    self._select_and_scroll(index.row())
+                    self.search_result_changed.emit(pos + 1, total)
+                    return True
+            pos += step
+
+        self.search_result_changed.emit(0, total)
+        return False
 
-        Args:
-            row (int): 행 인덱스.
-            pattern (QRegExp): 검색 패턴.
+    def _current_match_number(self, result: LogSearchResult) -> int:
+        """현재 선택된 행이 검색 결과의 몇 번째 일치인지 반환합니다. (일치하지 않으면 0)"""
+        current = self.currentIndex()
+        if not current.isValid():
+            return 0
+        current_id = self.log_model.first_id + self.proxy_model.mapToSource(current).row()
+        pos = bisect_left(result.ids, current_id)
+        if pos < len(result.ids) and result.ids[pos] == current_id:
+            return pos + 1
+        return 0
+
+    def get_all_text(self) -> str:
+        """
+        모델에 있는 모든 로그 데이터를 가져와 하나의 문자열로 반환합니다.
 
         Returns:
-            bool: 일치하면 True.
+            str: 개행 문자로 구분된 전체 로그 텍스트.
         """
-        index = self.model().index(row, 0)
-        text = self.model().data(index)
-        return pattern.indexIn(text) != -1
+        lines = self.log_model.get_plain_text_logs()
+        return "\n".join(lines)
 
     def _select_and_scroll(self, row: int) -> None:
         """
@@ -609,166 +938,127 @@ class QSmartListView(QListView):
 
             painter.restore()
 
-    def append_bytes(self, data: bytes) -> None:
-        """
-        bytes 데이터를 받아 내부 설정에 따라 처리
-
-        - hex_mode: HEX 문자열로 변환
-        - timestamp_enabled: 스마트 타임스탬프 추가
-        - color_manager: 색상 규칙 적용
-        - newline_char: 줄바꿈 분할
-
-        Args:
-            data: 수신된 바이트 데이터
-        """
-        # 원본 데이터 저장 (HEX 모드 전환용)
-        self._original_data.append(data)
-
-        # 1. HEX 변환 (옵션)
-        if self._hex_mode:
-            text = " ".join([f"{b:02X}" for b in data]) + " "
-        else:
-            try:
-                text = data.decode('utf-8', errors='replace')
-            except Exception:
-                text = str(data)
-
-        # 2. 타임스탬프 판단 (스마트 로직)
-        should_add_timestamp = self._should_add_timestamp()
 
-        # 3. Formatter 정의
-        formatter = None
-        if self._timestamp_enabled or self._color_manager:
-            formatter = self._create_line_formatter(should_add_timestamp)
+class SearchMinimapScrollBar(QScrollBar):
+    """
+    검색 일치 밀도 미니맵을 그리는 세로 스크롤바 클래스입니다.
 
-        # 4. 기존 append() 호출
-        self.append(text, formatter)
+    전체 행 범위를 균등 분할한 구간별 일치 비율을 스크롤바 오른쪽 가장자리에 표시합니다.
+    """
 
-    def _should_add_timestamp(self) -> bool:
+    def __init__(self, parent=None):
         """
-        타임스탬프를 추가할지 판단
+        SearchMinimapScrollBar를 초기화합니다.
 
-        Returns:
-            bool: 타임스탬프 추가 여부
+        Args:
+            parent (QWidget, optional): 부모 위젯.
         """
-        if not self._timestamp_enabled:
-            return False
-
-        now = QDateTime.currentMSecsSinceEpoch()
+        super().__init__(Qt.Vertical, parent)
+        self._density: Tuple[float, ...] = ()
 
-        # Newline 모드: 각 줄 시작에 타임스탬프
-        if self._newline_char:
-            # append()의 formatter에서 각 라인마다 적용됨
-            return True
-
-        # Raw 모드: 시간 간격 체크
-        if self._last_data_time is None:
-            self._last_data_time = now
-            return True
-
-        time_diff = now - self._last_data_time
-        if time_diff >= self._timestamp_timeout_ms:
-            self._last_data_time = now
-            return True
-
-        self._last_data_time = now
-        return False
-
-    def _create_line_formatter(self, add_timestamp: bool):
+    def set_density(self, density: Tuple[float, ...]) -> None:
         """
-        라인 포맷터 함수를 생성
+        구간별 일치 비율을 설정합니다.
 
         Args:
-            add_timestamp (bool): 타임스탬프 추가 여부
-
-        Returns:
-            callable: 생성된 포맷터 함수
+            density (Tuple[float, ...]): 구간별 일치 비율 (0.0 ~ 1.0, 빈 튜플이면 미니맵 숨김).
         """
-        def formatter(line: str) -> str:
-            """
-            라인 포맷터 함수
-
-            Args:
-                line (str): 포맷팅할 라인
-
-            Returns:
-                str: 포맷팅된 라인
-            """
-            formatted = line
-
-            # 타임스탬프 추가
-            if add_timestamp:
-                ts = datetime.datetime.now().strftime("[%H:%M:%S]")
-                formatted = f"{ts} {formatted}"
-
-            # 색상 규칙 적용 (옵션)
-            if self._color_manager:
-                formatted = self._color_manager.apply_rules(formatted)
-
-            return formatted
-
-        return formatter
+        if density == self._density:
+            return
+        self._density = density
+        self.update()
 
-    def _refresh_all_data(self) -> None:
+    def paintEvent(self, event) -> None:
         """
-        원본 데이터를 모두 다시 처리하여 화면을 갱신
-        HEX 모드 변경 시 호출됩니다.
+        스크롤바를 그린 뒤 일치 구간 표시를 덧그립니다.
+
+        Args:
+            event (QPaintEvent): 페인트 이벤트.
         """
-        if not self._original_data:
+        super().paintEvent(event)
+        if not self._density:
             return
 
-        # 현재 스크롤 위치 저장
-        scroll_pos = self.verticalScrollBar().value()
-        was_at_bottom = self.is_at_bottom()
-
-        # 모델 초기화
-        self.log_model.clear()
+        painter = QPainter(self)
+        color = QColor(self.palette().highlight().color())
+        rect = self.rect()
+        bins = len(self._density)
+        width = max(2, rect.width() // 3)
+        height = max(2, rect.height() // bins)
+        x = rect.right() - width + 1
+        for i, value in enumerate(self._density):
+            if value <= 0.0:
+                continue
+            color.setAlphaF(0.35 + 0.65 * value)
+            painter.fillRect(x, rect.top() + i * rect.height() // bins, width, height, color)
+        painter.end()
 
-        # 모든 원본 데이터를 다시 처리
-        for data in self._original_data:
-            # HEX 변환
-            if self._hex_mode:
-                text = " ".join([f"{b:02X}" for b in data]) + " "
-            else:
-                try:
-                    text = data.decode('utf-8', errors='replace')
-                except Exception:
-                    text = str(data)
-
-            # Formatter(타임스탬프는 원본 시간을 알 수 없으므로 생략)
-            formatter = None
-            if self._color_manager:
-                formatter = lambda line: self._color_manager.apply_rules(line)
-
-            # Append (newline split은 기존 설정 사용)
-            self.append(text, formatter)
-
-        # 스크롤 위치 복원
-        if was_at_bottom:
-            self.scrollToBottom()
-        else:
-            self.verticalScrollBar().setValue(scroll_pos)
 
 class LogModel(QAbstractListModel):
     """
     대량의 로그 데이터를 관리하는 데이터 모델 클래스입니다.
 
-    QAbstractListModel을 상속받아 데이터를 리스트 형태로 관리하며,
-    최대 라인 수 제한(Trim) 로직을 포함합니다.
+    행 데이터는 열 배열 기반 LineStore(내용 Arena + 오프셋/타임스탬프/플래그 배열)에 보관하며,
+    최대 라인 수 제한(Trim)은 저장소의 기준 인덱스 이동으로 처리합니다.
+    스크롤백 모드에서는 DiskLineStore에 보관하여 최대 라인 수 제한 없이 전체 이력을 유지하고,
+    압축 보관 모드에서는 CompressedLineStore로 오래된 행을 압축하여 같은 메모리에 더 긴 이력을 유지합니다.
+    중복 접기 모드에서는 직전 행과 같은 수신 라인을 새 행 대신 반복 횟수로 기록합니다.
+    표시 텍스트와 색상 구간은 data() 요청 시 행 포맷터로 만들어 표시 모드별 LRU 캐시에 보관합니다.
     """
 
-    def __init__(self, max_lines: int = DEFAULT_LOG_MAX_LINES):
+    def __init__(self, max_lines: int = DEFAULT_LOG_MAX_LINES, cache_size: int = LOG_FORMAT_CACHE_SIZE):
         """
         LogModel을 초기화합니다.
 
         Args:
             max_lines (int): 유지할 최대 로그 라인 수.
+            cache_size (int): 표시 텍스트 캐시 최대 항목 수.
         """
         super().__init__()
-        self._data: List[str] = []
+        # 행 저장소 (수신 라인은 원본 bytes, 텍스트/마커 행은 UTF-8 + 플래그)
+        # 스크롤백 모드에서는 디스크 저장소 (Trim 없음)
+        self._store: Any = LineStore()
+        self._scrollback = False
+        # 압축 보관 모드 (오래된 행을 zlib 블록으로 보관, 스크롤백이 꺼져 있을 때만 사용)
+        self._compression = False
+        # 백그라운드 검색용 증분 인덱스 (행 일련번호 = 저장소 first_id + 행 인덱스)
+        self._search_index = LogSearchIndex()
+
+        # 연속 중복 라인 접기 (행 일련번호 -> (반복 횟수, 마지막 수신 시각), 접힌 행만 보관)
+        self._dedup = LogDedupMode.OFF
+        self._repeats: Dict[int, Tuple[int, float]] = {}
+        # 마지막 행의 중복 판정 키 (마지막 행이 수신 라인이 아니거나 접기 모드가 꺼져 있으면 None)
+        self._last_key: Optional[bytes] = None
+
+        # 행 포맷터: (원본 bytes 또는 텍스트 str, 타임스탬프) -> (표시 텍스트, 색상 구간)
+        # 표시 모드 키가 같으면 결과 동일
+        self._formatter: Optional[Callable[[Any, float], Tuple[str, Tuple[ColorSpan, ...]]]] = None
+        self._mode_key: Any = None
+
+        # 표시 텍스트 캐시: (행 일련번호, 표시 모드 키, 반복 정보) -> (표시 텍스트, 색상 구간)
+        self._format_cache: "OrderedDict[tuple, Tuple[str, Tuple[ColorSpan, ...]]]" = OrderedDict()
+        self._cache_size = cache_size
+
+        # 최근 추가 행 선포맷팅 (작업 스레드, 실행 중인 작업은 1개)
+        # 세대는 포맷터/저장소가 바뀌면 증가하여 이전 작업 결과를 버림
+        self._prefetch_task: Optional[LogFormatTask] = None
+        self._prefetch_rerun = False
+        self._prefetch_generation = 0
+        self._prefetched_id = 0  # 이 일련번호 미만의 행은 현재 세대에서 요청 완료
+
         self._max_lines = max_lines
         self._trim_size = int(max_lines * TRIM_CHUNK_RATIO)
 
+    @property
+    def search_index(self) -> LogSearchIndex:
+        """백그라운드 검색용 증분 인덱스"""
+        return self._search_index
+
+    @property
+    def first_id(self) -> int:
+        """첫 행의 일련번호 (검색 결과의 행 일련번호 -> 행 인덱스 변환용)"""
+        return self._store.first_id
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """
         데이터의 행(row) 개수를 반환합니다.
@@ -779,11 +1069,12 @@ class LogModel(QAbstractListModel):
         Returns:
             int: 데이터 개수.
         """
-        return len(self._data)
+        return len(self._store)
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
         """
         지정된 인덱스와 역할에 해당하는 데이터를 반환합니다.
+        표시 텍스트는 요청된(보이는) 행만 포맷팅합니다.
 
         Args:
             index (QModelIndex): 데이터 인덱스.
@@ -792,47 +1083,334 @@ class LogModel(QAbstractListModel):
         Returns:
             Any: 요청된 데이터. 유효하지 않은 경우 QVariant.
         """
-        if not index.isValid() or not (0 <= index.row() < len(self._data)):
+        if not index.isValid() or not (0 <= index.row() < len(self._store)):
             return QVariant()
 
         if role == Qt.DisplayRole:
-            return self._data[index.row()]
+            return self._formatted(index.row())[0]
+        if role == LOG_SPANS_ROLE:
+            return self._formatted(index.row())[1]
 
         return QVariant()
 
+    def set_formatter(self, formatter: Callable[[Any, float], Tuple[str, Tuple[ColorSpan, ...]]],
+                      mode_key: Any) -> None:
+        """
+        행 포맷터와 표시 모드 키를 설정합니다. (HEX/인코딩/색상 규칙 변경 시)
+
+        기존 행은 다시 만들지 않고 변경 알림만 보내므로, 다시 그려지는 행만 새 모드로 포맷팅됩니다.
+        이전 모드의 캐시 항목은 키가 달라 그대로 남으며, 같은 모드로 돌아오면 재사용됩니다.
+
+        Args:
+            formatter (callable): (원본 bytes 또는 텍스트 str, 타임스탬프) -> (표시 텍스트, 색상 구간).
+            mode_key (Any): 표시 결과를 결정하는 설정값의 해시 가능한 조합.
+        """
+        self._formatter = formatter
+        if mode_key == self._mode_key:
+            return
+        self._mode_key = mode_key
+        self._reset_prefetch()
+        if len(self._store):
+            self.dataChanged.emit(self.index(0), self.index(len(self._store) - 1),
+                                  [Qt.DisplayRole, LOG_SPANS_ROLE])
+
     def add_logs(self, lines: List[str]) -> None:
         """
-        로그 데이터를 배치로 추가하고 필요시 오래된 로그를 삭제(Trim)합니다.
+        텍스트 로그를 배치로 추가합니다. (표시 모드와 무관하게 그대로 표시)
 
         Args:
-            lines (List[str]): 추가할 로그 문자열 리스트.
+            lines (List[str]): 추가할 로그 문자열 리스트 (평문).
         """
-        if not lines:
+        self._insert([line.encode("utf-8") for line in lines], 0.0, LINE_FLAG_TEXT)
+
+    def add_raw_lines(self, payloads: List[bytes], stamp: float = 0.0, flags: int = 0) -> None:
+        """
+        수신 라인 원본을 배치로 추가합니다. (표시 텍스트는 포맷터가 생성)
+
+        Args:
+            payloads (List[bytes]): 라인 원본 bytes 리스트.
+            stamp (float): 배치 공통 타임스탬프 (epoch 초, 0.0 = 없음).
+            flags (int): 행 플래그 (송신 에코 = LINE_FLAG_TX, 중복 접기 미적용).
+        """
+        self._insert(payloads, stamp, flags)
+
+    def add_marker(self, text: str) -> None:
+        """
+        안내 마커 행을 추가합니다. (포맷터/색상 규칙 미적용)
+
+        Args:
+            text (str): 마커 텍스트.
+        """
+        self._insert([text.encode("utf-8")], 0.0, LINE_FLAG_TEXT | LINE_FLAG_MARKER)
+
+    def set_dedup_mode(self, mode: LogDedupMode) -> None:
+        """
+        연속 중복 라인 접기 모드를 설정합니다. (이미 접힌 행은 유지, 이후 수신분부터 적용)
+
+        Args:
+            mode (LogDedupMode): 중복 접기 모드.
+        """
+        self._dedup = mode
+        self._last_key = None
+
+    def _dedup_key(self, payload: bytes) -> bytes:
+        """
+        중복 판정 키를 반환합니다. (끝의 줄바꿈 제외, 숫자 무시 모드는 숫자 구간을 '#'으로 치환)
+
+        Args:
+            payload (bytes): 라인 원본.
+
+        Returns:
+            bytes: 판정 키.
+        """
+        key = payload.rstrip(b"\r\n")
+        if self._dedup == LogDedupMode.IGNORE_DIGITS:
+            key = _DIGIT_RUN.sub(b"#", key)
+        return key
+
+    def _collapse_repeats(self, payloads: List[bytes], stamp: float) -> List[bytes]:
+        """
+        직전 라인과 같은 라인을 반복 횟수로 접고, 새 행으로 추가할 라인만 반환합니다.
+
+        Logic:
+            - 배치 안의 연속 중복과 기존 마지막 행과의 중복을 모두 접음
+            - 새 행의 반복 정보는 추가될 행 일련번호로 미리 기록
+            - 기존 마지막 행이 접히면 반복 정보만 갱신하고 해당 행 dataChanged 알림
+
+        Args:
+            payloads (List[bytes]): 수신 라인 원본 리스트.
+            stamp (float): 배치 공통 타임스탬프 (0.0이면 마지막 시각은 현재 시각).
+
+        Returns:
+            List[bytes]: 새 행으로 추가할 라인 리스트.
+        """
+        seen = stamp or time.time()
+        next_id = self._store.first_id + len(self._store)
+        key = self._last_key
+        rows: List[bytes] = []
+        counts: List[int] = []
+        merged = 0  # 기존 마지막 행에 접힌 수
+        for payload in payloads:
+            payload_key = self._dedup_key(payload)
+            if payload_key == key:
+                if rows:
+                    counts[-1] += 1
+                else:
+                    merged += 1
+                continue
+            rows.append(payload)
+            counts.append(1)
+            key = payload_key
+        self._last_key = key
+
+        for offset, count in enumerate(counts):
+            if count > 1:
+                self._repeats[next_id + offset] = (count, seen)
+        if merged:
+            last_id = next_id - 1
+            self._repeats[last_id] = (self._repeats.get(last_id, (1, 0.0))[0] + merged, seen)
+            last = self.index(len(self._store) - 1)
+            self.dataChanged.emit(last, last, [Qt.DisplayRole, LOG_SPANS_ROLE])
+        return rows
+
+    def _insert(self, payloads: List[bytes], stamp: float, flags: int) -> None:
+        """
+        행을 저장소에 추가하고 필요시 오래된 로그를 삭제(Trim)합니다.
+
+        Args:
+            payloads (List[bytes]): 행 내용 리스트.
+            stamp (float): 배치 공통 타임스탬프.
+            flags (int): 행 플래그 (LINE_FLAG_*).
+        """
+        if flags:
+            self._last_key = None
+        elif self._dedup != LogDedupMode.OFF and payloads:
+            payloads = self._collapse_repeats(payloads, stamp)
+        if not payloads:
             return
 
-        begin_row = len(self._data)
-        end_row = begin_row + len(lines) - 1
+        begin_row = len(self._store)
+        end_row = begin_row + len(payloads) - 1
 
         self.beginInsertRows(QModelIndex(), begin_row, end_row)
-        self._data.extend(lines)
+        self._store.extend(payloads, stamp, flags)
+        self._search_index.append(payloads)
         self.endInsertRows()
 
-        # 최대 라인 수 초과 시 Trim 수행
-        if len(self._data) > self._max_lines:
+        # 유지 라인 수 초과 시 Trim 수행 (저장소 기준 인덱스 이동, 스크롤백 모드는 제외)
+        count = len(self._store)
+        limit = self._retained_lines()
+        if not self._scrollback and count > limit:
             remove_count = self._trim_size
             # 여유분 계산: 너무 많이 지우지 않도록 안전장치
-            if len(self._data) - remove_count < self._max_lines * 0.8:
-                remove_count = len(self._data) - int(self._max_lines * 0.9)
+            if count - remove_count < limit * 0.8:
+                remove_count = count - int(limit * 0.9)
 
             if remove_count > 0:
                 self.beginRemoveRows(QModelIndex(), 0, remove_count - 1)
-                del self._data[:remove_count]
+                self._store.drop_front(remove_count)
+                self._search_index.drop_front(remove_count)
+                if self._repeats:
+                    first_id = self._store.first_id
+                    self._repeats = {row_id: repeat for row_id, repeat in self._repeats.items()
+                                     if row_id >= first_id}
                 self.endRemoveRows()
 
+        self._schedule_prefetch()
+
+    def _reset_prefetch(self) -> None:
+        """진행 중인 선포맷팅 결과를 무효화합니다. (포맷터/저장소 변경 시)"""
+        self._prefetch_generation += 1
+        self._prefetch_task = None
+        self._prefetch_rerun = False
+        self._prefetched_id = 0
+
+    def _schedule_prefetch(self) -> None:
+        """
+        최근 추가된 행의 포맷팅을 작업 스레드에 요청합니다.
+
+        Logic:
+            - 마지막 LOG_PREFETCH_ROWS 행 중 아직 요청하지 않은 행만 전달 (자동 스크롤 시 보일 행)
+            - 작업 실행 중이면 완료 후 다시 요청
+            - 행 내용은 메인 스레드에서 꺼내 전달 (저장소는 메인 스레드 전용)
+        """
+        if self._formatter is None:
+            return
+        if self._prefetch_task is not None:
+            self._prefetch_rerun = True
+            return
+
+        count = len(self._store)
+        first_id = self._store.first_id
+        start = max(count - LOG_PREFETCH_ROWS, self._prefetched_id - first_id, 0)
+        if start >= count:
+            return
+
+        rows = []
+        for row in range(start, count):
+            row_id = first_id + row
+            repeat = self._repeats.get(row_id)
+            if (row_id, self._mode_key, repeat) not in self._format_cache:
+                rows.append((row_id, repeat) + tuple(self._store.get(row)))
+        self._prefetched_id = first_id + count
+        if not rows:
+            return
+
+        task = LogFormatTask(self._formatter, self._prefetch_generation, rows)
+        task.signals.rows_formatted.connect(self._on_rows_formatted)
+        self._prefetch_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_rows_formatted(self, generation: int, results: List[tuple]) -> None:
+        """
+        선포맷팅 결과를 표시 텍스트 캐시에 저장합니다. (메인 스레드)
+
+        Args:
+            generation (int): 요청 시점의 선포맷팅 세대 (다르면 결과 버림).
+            results (List[tuple]): (행 일련번호, 반복 정보, (표시 텍스트, 색상 구간)) 리스트.
+        """
+        if generation != self._prefetch_generation:
+            return
+        self._prefetch_task = None
+
+        first_id = self._store.first_id
+        for row_id, repeat, entry in results:
+            # Trim된 행, 이후 반복 횟수가 바뀐 행은 제외
+            if row_id < first_id or self._repeats.get(row_id) != repeat:
+                continue
+            key = (row_id, self._mode_key, repeat)
+            if key not in self._format_cache:
+                self._format_cache[key] = entry
+        while len(self._format_cache) > self._cache_size:
+            self._format_cache.popitem(last=False)
+
+        if self._prefetch_rerun:
+            self._prefetch_rerun = False
+            self._schedule_prefetch()
+
+    def set_scrollback_enabled(self, enabled: bool) -> None:
+        """
+        디스크 스크롤백 모드를 설정합니다.
+
+        Logic:
+            - 활성화: 디스크 저장소로 기존 행을 옮기고 이후 Trim 없이 전체 이력 유지
+            - 비활성화: 최근 최대 라인 수만큼만 메모리 저장소로 옮기고 스크롤백 파일 삭제
+
+        Args:
+            enabled (bool): 스크롤백 모드 사용 여부.
+        """
+        if enabled != self._scrollback:
+            self._scrollback = enabled
+            self._replace_store()
+
+    def set_compression_enabled(self, enabled: bool) -> None:
+        """
+        메모리 압축 보관 모드를 설정합니다. (디스크 스크롤백이 꺼져 있을 때 사용)
+
+        오래된 행을 블록 단위로 압축하여 같은 메모리로 더 많은 라인(최대 라인 수 x LOG_COMPRESSION_LINES_FACTOR)을 유지합니다.
+
+        Args:
+            enabled (bool): 압축 보관 사용 여부.
+        """
+        if enabled != self._compression:
+            self._compression = enabled
+            self._replace_store()
+
+    def _replace_store(self) -> None:
+        """
+        현재 모드(디스크 스크롤백 > 압축 보관 > 일반)에 맞는 저장소로 교체하고 기존 행을 옮깁니다.
+
+        Logic:
+            - 스크롤백 모드는 전체 행, 그 외에는 최근 유지 라인 수만 이전
+            - 압축 보관 블록 크기는 유지 라인 수에 맞춤 (블록이 봉인되기 전에 Trim되지 않도록)
+            - 스크롤백 파일을 만들 수 없으면 경고 로그 후 메모리 저장소 사용
+        """
+        if self._scrollback:
+            try:
+                store = DiskLineStore()
+            except OSError as e:
+                logger.warning(f"Scrollback file not available: {e}")
+                self._scrollback = False
+                store = None
+        else:
+            store = None
+        if store is None:
+            if self._compression:
+                store = CompressedLineStore(block_lines=self._compressed_block_lines())
+            else:
+                store = LineStore()
+
+        self.beginResetModel()
+        previous = self._store
+        count = len(previous)
+        start = 0 if self._scrollback else max(0, count - self._retained_lines())
+        self._search_index.reset(store.first_id)
+        repeats = {}
+        for row in range(start, count):
+            payload, stamp, flags = previous.get(row)
+            repeat = self._repeats.get(previous.first_id + row)
+            if repeat is not None:
+                repeats[store.first_id + len(store)] = repeat
+            store.extend((payload,), stamp, flags)
+            self._search_index.append((payload,))
+        self._store = store
+        self._repeats = repeats
+        self._trim_size = int(self._retained_lines() * TRIM_CHUNK_RATIO)
+        self._format_cache.clear()
+        self._reset_prefetch()
+        if isinstance(previous, DiskLineStore):
+            previous.close()
+        self.endResetModel()
+
     def clear(self) -> None:
         """모든 데이터를 삭제합니다."""
         self.beginResetModel()
-        self._data.clear()
+        self._store.clear()
+        self._search_index.reset(self._store.first_id)
+        self._repeats.clear()
+        self._last_key = None
+        self._format_cache.clear()
+        self._reset_prefetch()
         self.endResetModel()
 
     def set_max_lines(self, max_lines: int) -> None:
@@ -843,43 +1421,391 @@ class LogModel(QAbstractListModel):
             max_lines (int): 최대 라인 수.
         """
         self._max_lines = max_lines
-        self._trim_size = int(max_lines * TRIM_CHUNK_RATIO)
+        self._trim_size = int(self._retained_lines() * TRIM_CHUNK_RATIO)
+        # 압축 보관 블록 크기는 유지 라인 수에 따라 정해지므로 바뀌면 저장소 재구성
+        store = self._store
+        if isinstance(store, CompressedLineStore) and store.block_lines != self._compressed_block_lines():
+            self._replace_store()
+
+    def _retained_lines(self) -> int:
+        """
+        메모리에 유지할 라인 수를 반환합니다. (압축 보관 모드는 최대 라인 수의 LOG_COMPRESSION_LINES_FACTOR배)
+
+        Returns:
+            int: 유지 라인 수.
+        """
+        if self._compression and not self._scrollback:
+            return self._max_lines * LOG_COMPRESSION_LINES_FACTOR
+        return self._max_lines
+
+    def _compressed_block_lines(self) -> int:
+        """
+        압축 보관 블록당 행 수를 반환합니다.
+
+        CompressedLineStore는 최근 행이 블록 2개 분량 이상 쌓여야 봉인하므로,
+        유지 라인 수 안에서 여러 블록이 봉인되도록 블록 크기를 유지 라인 수의 1/8로 제한합니다.
+
+        Returns:
+            int: 블록당 행 수 (MIN_LOG_BLOCK_LINES ~ LOG_BLOCK_LINES).
+        """
+        return max(MIN_LOG_BLOCK_LINES, min(LOG_BLOCK_LINES, self._retained_lines() // 8))
+
+    def payloads(self, first: int, last: int) -> List[bytes]:
+        """
+        행 범위의 원본 내용을 반환합니다. (필터 판정용)
+
+        Args:
+            first (int): 첫 행 인덱스.
+            last (int): 마지막 행 인덱스 (포함).
+
+        Returns:
+            List[bytes]: 행 내용 리스트.
+        """
+        return [self._store.get(row)[0] for row in range(first, last + 1)]
+
+    def export_rows(self, start_id: int, count: int) -> List[ExportRow]:
+        """
+        행 일련번호 범위의 내보내기 행을 반환합니다. (LogExportJob이 청크 단위로 호출)
+
+        Args:
+            start_id (int): 첫 행 일련번호 (살아있는 행이어야 함).
+            count (int): 행 수.
+
+        Returns:
+            List[ExportRow]: (타임스탬프, 방향/종류, 내용, 텍스트 행 여부, 반복 정보).
+        """
+        first_id = self._store.first_id
+        start = start_id - first_id
+        rows = []
+        for row in range(max(0, start), min(len(self._store), start + count)):
+            payload, stamp, flags = self._store.get(row)
+            is_text = bool(flags & LINE_FLAG_TEXT)
+            direction = "INFO" if is_text else ("TX" if flags & LINE_FLAG_TX else "RX")
+            rows.append((stamp, direction, payload, is_text,
+                         self._repeats.get(first_id + row)))
+        return rows
 
     def get_plain_text_logs(self) -> List[str]:
         """
-        저장된 모든 로그에서 HTML 태그를 제거하여 리스트로 반환합니다.
+        저장된 모든 로그를 현재 표시 모드의 평문 리스트로 반환합니다. (캐시를 오염시키지 않음)
 
         Returns:
-            List[str]: 태그가 제거된 로그 문자열 리스트.
+            List[str]: 로그 문자열 리스트.
+        """
+        return [self._format_row(row)[0] for row in range(len(self._store))]
+
+    def _formatted(self, row: int) -> Tuple[str, Tuple[ColorSpan, ...]]:
         """
-        # HTML 태그 제거용 정규식 컴파일 (<...>)
-        cleaner = re.compile('<.*?>')
+        행의 표시 텍스트와 색상 구간을 반환합니다. (LRU 캐시, 미스 시 1회 포맷팅)
+
+        Args:
+            row (int): 행 인덱스.
 
-        plain_logs = []
-        for line in self._data:
-            clean_text = re.sub(cleaner, '', line)
-            plain_logs.append(clean_text)
+        Returns:
+            Tuple[str, Tuple[ColorSpan, ...]]: (표시 텍스트, 색상 구간).
+        """
+        row_id = self._store.first_id + row
+        key = (row_id, self._mode_key, self._repeats.get(row_id))
+        entry = self._format_cache.get(key)
+        if entry is not None:
+            self._format_cache.move_to_end(key)
+            return entry
 
-        return plain_logs
+        entry = self._format_cache[key] = self._format_row(row)
+        if len(self._format_cache) > self._cache_size:
+            self._format_cache.popitem(last=False)
+        return entry
+
+    def _format_row(self, row: int) -> Tuple[str, Tuple[ColorSpan, ...]]:
+        """
+        행 원본을 현재 포맷터로 변환합니다. (접힌 행은 끝에 반복 횟수와 마지막 수신 시각 표시)
+
+        Args:
+            row (int): 행 인덱스.
+
+        Returns:
+            Tuple[str, Tuple[ColorSpan, ...]]: (표시 텍스트, 색상 구간).
+        """
+        payload, stamp, flags = self._store.get(row)
+        return _format_line(self._formatter, payload, stamp, flags,
+                            self._repeats.get(self._store.first_id + row))
+
+
+class LogFilterProxyModel(QAbstractProxyModel):
+    """
+    로그 필터 프록시 모델 클래스입니다.
+
+    필터가 없으면 원본 행을 그대로 전달하고, 필터 모드에서는 일치 행 일련번호 배열(오름차순)로
+    프록시 행 -> 원본 행을 매핑합니다.
+    기존 행은 백그라운드 검색 작업 결과를 블록 단위로 받아 채우고(점진 표시),
+    필터 설정 이후 추가된 행만 메인 스레드에서 배치 단위로 판정합니다.
+    """
+
+    def __init__(self, parent=None):
+        """
+        LogFilterProxyModel을 초기화합니다.
+
+        Args:
+            parent (QObject, optional): 부모 객체.
+        """
+        super().__init__(parent)
+        # 필터 모드의 일치 행 일련번호 (None = 필터 없음, 원본 그대로)
+        self._rows: Optional[array] = None
+        self._matcher: Optional[tuple] = None
+        self._query: Optional[tuple] = None
+        # 이 일련번호 미만의 행은 검색 작업이, 이상의 행은 추가 시 메인 스레드가 판정
+        self._boundary_id = 0
+        self._task: Optional[LogSearchTask] = None
+
+    def setSourceModel(self, model: 'LogModel') -> None:
+        """
+        원본 모델을 설정하고 행 변경 시그널을 연결합니다.
+
+        Args:
+            model (LogModel): 원본 로그 모델.
+        """
+        super().setSourceModel(model)
+        model.rowsAboutToBeInserted.connect(self._on_rows_about_to_be_inserted)
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        model.rowsRemoved.connect(self._on_rows_removed)
+        model.modelAboutToBeReset.connect(self._on_model_about_to_be_reset)
+        model.modelReset.connect(self._on_model_reset)
+        model.dataChanged.connect(self._on_data_changed)
+
+    @property
+    def is_filtering(self) -> bool:
+        """필터 모드 여부"""
+        return self._rows is not None
+
+    def set_filter(self, query: Optional[tuple]) -> None:
+        """
+        필터 조건을 설정합니다. (같은 조건이면 무시)
+
+        Logic:
+            - 실행 중인 검색 작업 중단 후 빈 결과로 교체 (한 번의 Reset)
+            - 현재 행은 백그라운드 검색으로 점진 표시, 이후 추가 행은 추가 시 판정
+
+        Args:
+            query (Optional[tuple]): (검색어, 인코딩, HEX 모드 여부). None이면 필터 해제.
+        """
+        matcher = compile_matcher(*query) if query else None
+        if matcher is None:
+            query = None
+        if query == self._query:
+            return
+
+        self.beginResetModel()
+        self._query = query
+        self._matcher = matcher
+        self._restart()
+        self.endResetModel()
+
+    def _restart(self) -> None:
+        """필터 결과를 비우고 현재 행에 대한 검색 작업을 시작합니다. (Reset 구간 안에서 호출)"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._query is None:
+            self._rows = None
+            return
+
+        source = self.sourceModel()
+        self._rows = array('Q')
+        self._boundary_id = source.first_id + source.rowCount()
+        if source.rowCount() == 0:
+            return
+
+        text, encoding, hex_mode = self._query
+        task = LogSearchTask(source.search_index, text, encoding, hex_mode,
+                             limit_id=self._boundary_id, progressive=True)
+        task.signals.search_progress.connect(self._on_search_progress)
+        task.signals.search_finished.connect(self._on_search_finished)
+        self._task = task
+        QThreadPool.globalInstance().start(task)
+
+    @pyqtSlot(object)
+    def _on_search_progress(self, ids: array) -> None:
+        """
+        검색 작업의 블록별 결과를 매핑에 삽입합니다. (이미 제거된 행 제외)
+
+        Args:
+            ids (array): 블록 내 일치 행 일련번호 (오름차순).
+        """
+        if self._task is None or self.sender() is not self._task.signals:
+            return
+        first_id = self.sourceModel().first_id
+        start = bisect_left(ids, first_id)
+        if start >= len(ids):
+            return
+        if start:
+            ids = ids[start:]
+
+        rows = self._rows
+        position = bisect_left(rows, ids[0])
+        self.beginInsertRows(QModelIndex(), position, position + len(ids) - 1)
+        rows[position:position] = ids
+        self.endInsertRows()
+
+    @pyqtSlot(object)
+    def _on_search_finished(self, result: LogSearchResult) -> None:
+        """검색 작업 완료 처리"""
+        if self._task is not None and self.sender() is self._task.signals:
+            self._task = None
+
+    # -------------------------------------------------------------------------
+    # 원본 모델 변경 전달
+    # -------------------------------------------------------------------------
+    @pyqtSlot(QModelIndex, int, int)
+    def _on_rows_about_to_be_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        if self._rows is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+
+    @pyqtSlot(QModelIndex, int, int)
+    def _on_rows_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        """추가된 행 전달 (필터 모드는 배치 단위로 판정하여 일치 행만 추가)"""
+        if self._rows is None:
+            self.endInsertRows()
+            return
+
+        source = self.sourceModel()
+        first_id = source.first_id
+        matched = [first_id + row for row, payload in enumerate(source.payloads(first, last), first)
+                   if match_payload(self._matcher, payload)]
+        if matched:
+            position = len(self._rows)
+            self.beginInsertRows(QModelIndex(), position, position + len(matched) - 1)
+            self._rows.extend(matched)
+            self.endInsertRows()
+
+    @pyqtSlot(QModelIndex, int, int)
+    def _on_rows_about_to_be_removed(self, parent: QModelIndex, first: int, last: int) -> None:
+        """앞쪽 행 제거(Trim) 전달 (필터 모드는 제거될 일련번호 미만의 일치 행 제거)"""
+        if self._rows is None:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            return
+
+        end_id = self.sourceModel().first_id + last + 1
+        count = bisect_left(self._rows, end_id)
+        if count:
+            self.beginRemoveRows(QModelIndex(), 0, count - 1)
+            del self._rows[:count]
+            self.endRemoveRows()
+
+    @pyqtSlot(QModelIndex, int, int)
+    def _on_rows_removed(self, parent: QModelIndex, first: int, last: int) -> None:
+        if self._rows is None:
+            self.endRemoveRows()
+
+    @pyqtSlot()
+    def _on_model_about_to_be_reset(self) -> None:
+        self.beginResetModel()
+
+    @pyqtSlot()
+    def _on_model_reset(self) -> None:
+        """원본 초기화/저장소 교체 시 필터 결과를 다시 만듭니다."""
+        self._restart()
+        self.endResetModel()
+
+    @pyqtSlot(QModelIndex, QModelIndex, "QVector<int>")
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: List[int]) -> None:
+        """
+        행 내용 변경 전달 (필터 모드는 변경 범위에 든 일치 행만)
+
+        중복 접기 갱신(마지막 행 1개)은 해당 프록시 행만, 표시 모드 변경(전체 범위)은 보이는 전체 범위로 전달됩니다.
+        """
+        rows = self._rows
+        if rows is None:
+            self.dataChanged.emit(self.index(top_left.row(), 0), self.index(bottom_right.row(), 0), roles)
+            return
+        first_id = self.sourceModel().first_id
+        first = bisect_left(rows, first_id + top_left.row())
+        last = bisect_right(rows, first_id + bottom_right.row()) - 1
+        if first <= last:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, 0), roles)
+
+    # -------------------------------------------------------------------------
+    # QAbstractProxyModel 구현
+    # -------------------------------------------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        if self._rows is None:
+            return self.sourceModel().rowCount()
+        return len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else 1
+
+    def index(self, row: int, column: int = 0, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if parent.isValid() or column != 0 or not (0 <= row < self.rowCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index: QModelIndex) -> QModelIndex:
+        """
+        프록시 인덱스를 원본 인덱스로 변환합니다.
+
+        Args:
+            proxy_index (QModelIndex): 프록시 인덱스.
+
+        Returns:
+            QModelIndex: 원본 인덱스 (유효하지 않으면 빈 인덱스).
+        """
+        if not proxy_index.isValid() or self.sourceModel() is None:
+            return QModelIndex()
+        row = proxy_index.row()
+        if self._rows is not None:
+            if row >= len(self._rows):
+                return QModelIndex()
+            row = self._rows[row] - self.sourceModel().first_id
+        return self.sourceModel().index(row, 0)
+
+    def mapFromSource(self, source_index: QModelIndex) -> QModelIndex:
+        """
+        원본 인덱스를 프록시 인덱스로 변환합니다. (필터 모드는 bisect)
+
+        Args:
+            source_index (QModelIndex): 원본 인덱스.
+
+        Returns:
+            QModelIndex: 프록시 인덱스 (필터로 숨겨진 행이면 빈 인덱스).
+        """
+        if not source_index.isValid():
+            return QModelIndex()
+        row = source_index.row()
+        if self._rows is not None:
+            row_id = self.sourceModel().first_id + row
+            row = bisect_left(self._rows, row_id)
+            if row >= len(self._rows) or self._rows[row] != row_id:
+                return QModelIndex()
+        return self.createIndex(row, 0)
 
 
 class LogDelegate(QStyledItemDelegate):
     """
     로그 아이템의 렌더링을 담당하는 델리게이트 클래스입니다.
 
-    QTextDocument를 사용하여 HTML 텍스트를 렌더링하고,
+    평문과 색상 구간으로 QTextDocument 서식을 구성하여 렌더링하고,
     검색 결과 하이라이트 기능을 수행합니다.
+    렌더링 준비 결과는 LRU 캐시에 보관하여 스크롤/재페인트 시 다시 구성하지 않습니다.
     """
 
-    def __init__(self, parent=None):
+    # 한 행으로 표시하기 위해 공백으로 치환할 줄바꿈 문자 (길이 유지 -> 구간 인덱스 유효)
+    _LINE_BREAKS = str.maketrans("\r\n", "  ")
+
+    def __init__(self, parent=None, cache_size: int = LOG_RENDER_CACHE_SIZE):
         """
         LogDelegate를 초기화합니다.
 
         Args:
             parent (QObject, optional): 부모 객체.
+            cache_size (int): 렌더링 캐시 최대 항목 수.
         """
         super().__init__(parent)
-        self.doc = QTextDocument()
         self.search_pattern: Optional[QRegExp] = None
 
         # 검색 결과 하이라이트 포맷 (노란색 배경)
@@ -887,6 +1813,19 @@ class LogDelegate(QStyledItemDelegate):
         self.highlight_format.setBackground(QColor("yellow"))
         self.highlight_format.setForeground(QColor("black"))
 
+        # 렌더링 캐시: (텍스트, 구간, 색상, 테마, 폰트, 검색어) -> QStaticText(단순 텍스트) | QTextDocument(서식)
+        self._render_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._cache_size = cache_size
+        self._pattern_key = ""
+
+        # 색상 규칙 및 테마별 규칙 인덱스 -> 색상 (그릴 때 결정)
+        self._color_rules: List[ColorRule] = []
+        self._palettes: Dict[bool, List[Optional[QColor]]] = {}
+
+        # 폰트별 행 높이 (uniformItemSizes 기준, 폰트 키 -> 높이)
+        self._line_heights: Dict[str, int] = {}
+        self._margin = QTextDocument().documentMargin()
+
     def set_search_pattern(self, pattern: Optional[QRegExp]) -> None:
         """
         검색 패턴을 설정합니다.
@@ -895,6 +1834,24 @@ class LogDelegate(QStyledItemDelegate):
             pattern (Optional[QRegExp]): 검색할 정규식 객체. None이면 해제.
         """
         self.search_pattern = pattern
+        # 검색어는 캐시 키의 일부이므로 이전 검색어의 항목은 LRU로 자연 소멸
+        self._pattern_key = pattern.pattern() if pattern and not pattern.isEmpty() else ""
+
+    def set_color_rules(self, rules: List[ColorRule]) -> None:
+        """
+        색상 구간의 규칙 인덱스를 해석할 색상 규칙을 설정합니다.
+
+        Args:
+            rules (List[ColorRule]): 색상 규칙 리스트 (모델 구간 계산에 사용한 것과 동일).
+        """
+        self._color_rules = rules
+        self._palettes.clear()
+        self._render_cache.clear()
+
+    def clear_cache(self) -> None:
+        """렌더링 캐시를 비웁니다."""
+        self._render_cache.clear()
+        self._line_heights.clear()
 
     def paint(self, painter: QPainter, option: 'QStyleOptionViewItem', index: QModelIndex) -> None:
         """
@@ -903,8 +1860,8 @@ class LogDelegate(QStyledItemDelegate):
         Logic:
             1. 선택 상태에 따른 배경 그리기
             2. 테마에 맞는 텍스트 색상 결정 (QPalette)
-            3. 데이터(HTML) 설정 및 검색어 하이라이트 적용
-            4. QTextDocument를 사용하여 페인팅
+            3. 캐시된 렌더링 항목 조회 (미스 시 1회만 준비)
+            4. 단순 텍스트는 drawStaticText, 색상 구간/하이라이트는 QTextDocument로 페인팅
 
         Args:
             painter (QPainter): 페인터 객체.
@@ -923,32 +1880,27 @@ class LogDelegate(QStyledItemDelegate):
         else:
             text_color = option.palette.text().color().name()
 
-        # 3. 데이터 설정 및 HTML 래핑
-        raw_text = index.data(Qt.DisplayRole)
-
-        # 문서 기본 폰트 설정
-        self.doc.setDefaultFont(option.font)
-
-        # 색상이 적용된 HTML 생성 (기본 텍스트 색상 강제)
-        styled_html = f'<div style="color: {text_color};">{raw_text}</div>'
-        self.doc.setHtml(styled_html)
-
-        # 4. 검색 하이라이트 적용
-        if self.search_pattern and not self.search_pattern.isEmpty():
-            cursor = self.doc.find(self.search_pattern)
-            while not cursor.isNull():
-                cursor.mergeCharFormat(self.highlight_format)
-                cursor = self.doc.find(self.search_pattern, cursor)
-
-        # 5. 그리기
-        painter.translate(option.rect.left(), option.rect.top())
-        ctx = QAbstractTextDocumentLayout.PaintContext()
+        # 3. 렌더링 항목 조회
+        entry = self._get_render_entry(
+            index.data(Qt.DisplayRole), index.data(LOG_SPANS_ROLE), text_color, option.font
+        )
+
+        # 4. 그리기
+        if isinstance(entry, QStaticText):
+            # 고속 경로: 색상/하이라이트 없는 단순 텍스트 (QTextDocument와 같은 여백에 배치)
+            painter.setFont(option.font)
+            painter.setPen(QColor(text_color))
+            painter.drawStaticText(
+                QPointF(option.rect.left() + self._margin, option.rect.top() + self._margin), entry
+            )
+        else:
+            painter.translate(option.rect.left(), option.rect.top())
+            ctx = QAbstractTextDocumentLayout.PaintContext()
 
-        # 선택된 경우 텍스트 색상 강제 조정 (QPalette 활용)
-        if option.state & QStyle.State_Selected:
-            ctx.palette.setColor(QPalette.Text, option.palette.highlightedText().color())
+            # 구간 밖 텍스트의 기본 색상 (테마 및 선택 상태 반영)
+            ctx.palette.setColor(QPalette.Text, QColor(text_color))
 
-        self.doc.documentLayout().draw(painter, ctx)
+            entry.documentLayout().draw(painter, ctx)
         painter.restore()
 
     def sizeHint(self, option: 'QStyleOptionViewItem', index: QModelIndex) -> QSize:
@@ -962,10 +1914,141 @@ class LogDelegate(QStyledItemDelegate):
         Returns:
             QSize: 아이템의 크기.
         """
-        text = index.data(Qt.DisplayRole)
-        self.doc.setHtml(text)
-        self.doc.setDefaultFont(option.font)
+        entry = self._get_render_entry(
+            index.data(Qt.DisplayRole), index.data(LOG_SPANS_ROLE),
+            option.palette.text().color().name(), option.font
+        )
+        if isinstance(entry, QStaticText):
+            width = entry.size().width() + self._margin * 2
+        else:
+            width = entry.idealWidth()
+        return QSize(int(width), self._line_height(option.font))
+
+    def _get_render_entry(self, raw_text: Any, spans: Any, text_color: str, font: QFont) -> Any:
+        """
+        렌더링 준비 결과를 캐시에서 조회하거나 새로 생성합니다.
 
-        # 너비는 리스트뷰 너비에 맞추고 높이만 계산
-        self.doc.setTextWidth(option.rect.width())
-        return QSize(int(self.doc.idealWidth()), int(self.doc.size().height()))
\ No newline at end of file
+        Logic:
+            - 캐시 히트 시 최근 사용으로 갱신 후 반환
+            - 색상 구간/검색 일치가 없는 텍스트: QStaticText (레이아웃 1회 준비)
+            - 그 외: 평문 + 구간별 글자 서식 + 검색 하이라이트를 적용한 QTextDocument
+
+        Args:
+            raw_text (Any): 모델 데이터 (평문).
+            spans (Any): 모델 색상 구간 (Tuple[ColorSpan, ...]).
+            text_color (str): 기본 텍스트 색상 (#RRGGBB).
+            font (QFont): 표시 폰트.
+
+        Returns:
+            Any: QStaticText 또는 QTextDocument.
+        """
+        text = raw_text if isinstance(raw_text, str) else ""
+        spans = spans if isinstance(spans, tuple) else ()
+        is_dark = theme_manager.is_dark_theme()
+        key = (text, spans, text_color, is_dark, font.key(), self._pattern_key)
+        entry = self._render_cache.get(key)
+        if entry is not None:
+            self._render_cache.move_to_end(key)
+            return entry
+
+        text = text.translate(self._LINE_BREAKS)
+        pattern = self.search_pattern if self._pattern_key else None
+        if not spans and (pattern is None or pattern.indexIn(text) == -1):
+            entry = QStaticText(text)
+            entry.setTextFormat(Qt.PlainText)
+            entry.prepare(QTransform(), font)
+        else:
+            entry = QTextDocument()
+            # 문서 기본 폰트 설정
+            entry.setDefaultFont(font)
+            entry.setPlainText(text)
+
+            # 색상 구간 적용 (Python 인덱스 -> QString(UTF-16) 위치)
+            if spans:
+                self._apply_spans(entry, text, spans, self._get_palette(is_dark))
+
+            # 검색 하이라이트 적용
+            if pattern is not None:
+                cursor = entry.find(pattern)
+                while not cursor.isNull():
+                    cursor.mergeCharFormat(self.highlight_format)
+                    cursor = entry.find(pattern, cursor)
+
+        self._render_cache[key] = entry
+        if len(self._render_cache) > self._cache_size:
+            self._render_cache.popitem(last=False)
+        return entry
+
+    def _get_palette(self, is_dark: bool) -> List[Optional[QColor]]:
+        """
+        테마별 규칙 인덱스 -> 색상 목록을 반환합니다. (테마별 1회 계산)
+
+        Args:
+            is_dark (bool): 다크 테마 여부.
+
+        Returns:
+            List[Optional[QColor]]: 규칙 순서대로의 색상 (유효하지 않으면 None).
+        """
+        palette = self._palettes.get(is_dark)
+        if palette is None:
+            palette = []
+            for name in ColorService.resolve_palette(self._color_rules, is_dark):
+                color = QColor(name) if name else None
+                palette.append(color if color is not None and color.isValid() else None)
+            self._palettes[is_dark] = palette
+        return palette
+
+    @staticmethod
+    def _apply_spans(doc: QTextDocument, text: str, spans: Tuple[ColorSpan, ...],
+                     palette: List[Optional[QColor]]) -> None:
+        """
+        문서에 색상 구간별 글자 서식을 적용합니다.
+
+        Args:
+            doc (QTextDocument): 평문이 설정된 문서.
+            text (str): 문서 평문.
+            spans (Tuple[ColorSpan, ...]): 색상 구간.
+            palette (List[Optional[QColor]]): 규칙 인덱스 -> 색상.
+        """
+        # BMP 밖 문자(이모지 등)는 QString에서 2칸을 차지하므로 위치 보정
+        offsets = None
+        if not text.isascii() and any(ord(c) > 0xFFFF for c in text):
+            offsets = [0]
+            for c in text:
+                offsets.append(offsets[-1] + (2 if ord(c) > 0xFFFF else 1))
+
+        cursor = QTextCursor(doc)
+        for start, length, index in spans:
+            fmt = QTextCharFormat()
+            if index == MARKER_SPAN_INDEX:
+                fmt.setFontItalic(True)
+            elif 0 <= index < len(palette) and palette[index] is not None:
+                fmt.setForeground(palette[index])
+            else:
+                continue
+
+            end = start + length
+            if offsets is not None:
+                start, end = offsets[start], offsets[end]
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            cursor.mergeCharFormat(fmt)
+
+    def _line_height(self, font: QFont) -> int:
+        """
+        폰트의 한 줄 행 높이를 반환합니다. (QTextDocument 여백 포함, 폰트별 1회 측정)
+
+        Args:
+            font (QFont): 표시 폰트.
+
+        Returns:
+            int: 행 높이 (픽셀).
+        """
+        font_key = font.key()
+        height = self._line_heights.get(font_key)
+        if height is None:
+            doc = QTextDocument()
+            doc.setDefaultFont(font)
+            doc.setPlainText("X")
+            height = self._line_heights[font_key] = int(doc.size().height())
+        return height
@@ -0,0 +1,355 @@
+"""
+터미널 뷰 위젯 모듈
+
+TerminalScreen(셀 격자 화면 버퍼)을 고정폭 글꼴로 직접 그리는 터미널 표시 위젯입니다.
+
+## WHY
+* ANSI 색상/커서 이동을 출력하는 장치(셸, 부트로더, 메뉴 UI)를 깨진 문자 없이 표시
+* 라인 로그 뷰(QSmartListView)는 추가 전용 행 모델이라 이미 표시된 위치를 다시 쓰는 출력을 표현할 수 없음
+* 고속 스크롤 출력에서도 라인마다 서식(HTML/QTextDocument)을 만들지 않아야 함
+
+## WHAT
+* 화면 + 스크롤백 표시 (세로 스크롤바, 스크롤백을 보는 중에는 새 출력이 와도 위치 유지)
+* 16/256/TrueColor 색상, 굵게/기울임/밑줄/반전, 커서 표시
+* 뷰 크기에 맞춰 화면 열/행 수 조정
+
+## HOW
+* 수신 데이터는 화면 버퍼에만 반영하고, 다시 그리기는 UI 틱당 1회로 병합 (ui_scheduler)
+* 변경 영역만 다시 그림: 전체 화면 스크롤은 viewport().scroll()로 기존 픽셀을 복사(Blit)하고 새 행만 갱신
+* 행은 같은 속성의 연속 구간(Run) 단위로 배경 채우기 + drawText 1회 (셀 단위 그리기 없음)
+* 속성 -> (전경색, 배경색, 글꼴) 변환 결과를 캐시 (팔레트/글꼴 변경 시 초기화)
+"""
+from itertools import groupby
+from typing import Dict, Optional, Tuple
+
+from PyQt5.QtWidgets import QAbstractScrollArea, QWidget
+from PyQt5.QtCore import Qt, QEvent, QPointF, QRectF
+from PyQt5.QtGui import (
+    QColor, QFont, QFontDatabase, QFontMetricsF, QPainter, QPalette, QPaintEvent, QResizeEvent
+)
+
+from common.constants import DEFAULT_RX_ENCODING
+from core.ui_scheduler import ui_scheduler
+from model.terminal_screen import (
+    TerminalScreen, TerminalLine, decode_attr, ATTR_BOLD, ATTR_ITALIC, ATTR_UNDERLINE, ATTR_REVERSE,
+    COLOR_RGB
+)
+
+# 기본 16색 (xterm)
+_ANSI_COLORS = (
+    "#000000", "#CD0000", "#00CD00", "#CDCD00", "#0000EE", "#CD00CD", "#00CDCD", "#E5E5E5",
+    "#7F7F7F", "#FF0000", "#00FF00", "#FFFF00", "#5C5CFF", "#FF00FF", "#00FFFF", "#FFFFFF",
+)
+
+# 256색 팔레트의 6x6x6 색상 큐브 단계
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+
+def _palette_color(index: int) -> QColor:
+    """256색 팔레트 인덱스를 색상으로 변환합니다."""
+    if index < 16:
+        return QColor(_ANSI_COLORS[index])
+    if index < 232:
+        index -= 16
+        return QColor(_CUBE_LEVELS[index // 36], _CUBE_LEVELS[index // 6 % 6], _CUBE_LEVELS[index % 6])
+    level = 8 + (index - 232) * 10
+    return QColor(level, level, level)
+
+
+class QTerminalView(QAbstractScrollArea):
+    """
+    셀 격자 터미널 표시 위젯 클래스
+
+    입력(키보드 송신)은 지원하지 않는 표시 전용 위젯입니다.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None, encoding: str = DEFAULT_RX_ENCODING) -> None:
+        """
+        QTerminalView 초기화
+
+        Args:
+            parent (Optional[QWidget]): 부모 위젯.
+            encoding (str): 수신 데이터 인코딩.
+        """
+        super().__init__(parent)
+        self._screen = TerminalScreen(encoding=encoding)
+
+        # 글꼴 기준 셀 크기 (폭은 실수: 글리프 누적 진행 폭과 일치)
+        self._cell_width = 1.0
+        self._cell_height = 1
+        self._ascent = 0.0
+
+        # 속성 -> (전경색, 배경색, 글꼴) 캐시
+        self._styles: Dict[int, Tuple[QColor, Optional[QColor], QFont]] = {}
+
+        # 마지막 화면 하단 추적 여부와 스크롤백 제거 기준 (history_total - len(history))
+        self._follow = True
+        self._dropped = 0
+        self._syncing = False
+        self._painted_cursor: Optional[int] = None
+
+        # 셀 격자는 고정폭 글꼴 전제 (QSS fixed-font 클래스가 적용되면 해당 글꼴로 대체)
+        self.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.verticalScrollBar().valueChanged.connect(self._on_scroll_value_changed)
+        self._update_metrics()
+
+    @property
+    def screen(self) -> TerminalScreen:
+        """화면 버퍼"""
+        return self._screen
+
+    # -------------------------------------------------------------------------
+    # 데이터 입력
+    # -------------------------------------------------------------------------
+    def feed(self, data: bytes) -> None:
+        """
+        수신 바이트를 화면 버퍼에 반영하고 다시 그리기를 예약합니다.
+
+        Args:
+            data (bytes): 수신 원본 바이트.
+        """
+        self._screen.feed(data)
+        ui_scheduler.request(self._flush_damage)
+
+    def append_marker(self, text: str) -> None:
+        """
+        안내 마커 라인을 추가합니다.
+
+        Args:
+            text (str): 마커 텍스트.
+        """
+        self._screen.write_marker(text)
+        ui_scheduler.request(self._flush_damage)
+
+    def clear(self) -> None:
+        """화면과 스크롤백을 지웁니다."""
+        ui_scheduler.cancel(self._flush_damage)
+        self._screen.clear()
+        self._screen.take_damage()
+        self._dropped = 0
+        self._follow = True
+        self._sync_scrollbar()
+        self.viewport().update()
+
+    def set_encoding(self, encoding: str) -> None:
+        """
+        수신 데이터 인코딩을 설정합니다.
+
+        Args:
+            encoding (str): 인코딩 이름.
+        """
+        self._screen.set_encoding(encoding)
+
+    # -------------------------------------------------------------------------
+    # 다시 그리기
+    # -------------------------------------------------------------------------
+    def _flush_damage(self) -> None:
+        """
+        화면 버퍼의 변경 영역을 뷰포트에 반영합니다. (UI 스케줄러 콜백)
+
+        Logic:
+            - 스크롤백을 보는 중이면 보던 내용이 유지되도록 위치만 보정하고 전체 갱신
+            - 전체 화면 스크롤은 기존 픽셀을 위로 복사한 뒤 변경 행만 갱신
+            - 커서가 있던 행과 현재 커서 행도 갱신
+        """
+        scrolled, dirty = self._screen.take_damage()
+        self._sync_scrollbar()
+        if not self._follow:
+            self.viewport().update()
+            return
+
+        screen = self._screen
+        height = self._cell_height
+        if scrolled >= screen.rows:
+            self.viewport().update()
+            self._painted_cursor = None
+            return
+        if scrolled:
+            self.viewport().scroll(0, -scrolled * height)
+
+        if self._painted_cursor is not None:
+            dirty.add(self._painted_cursor - scrolled)
+        if screen.cursor_visible:
+            dirty.add(screen.cursor_row)
+
+        width = self.viewport().width()
+        for row in dirty:
+            if 0 <= row < screen.rows:
+                self.viewport().update(0, row * height, width, height)
+
+    def _sync_scrollbar(self) -> None:
+        """스크롤바 범위를 스크롤백 행 수에 맞추고 위치를 보정합니다."""
+        screen = self._screen
+        bar = self.verticalScrollBar()
+        count = len(screen.history)
+        dropped = screen.history_total - count
+        value = bar.value() - (dropped - self._dropped)
+        self._dropped = dropped
+
+        self._syncing = True
+        bar.setRange(0, count)
+        bar.setPageStep(screen.rows)
+        bar.setValue(count if self._follow else max(0, value))
+        self._syncing = False
+
+    def _on_scroll_value_changed(self, value: int) -> None:
+        """사용자가 스크롤하면 하단 추적 여부를 갱신하고 전체를 다시 그립니다."""
+        if self._syncing:
+            return
+        self._follow = value >= self.verticalScrollBar().maximum()
+        self.viewport().update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """
+        변경 영역에 걸친 행만 그립니다.
+
+        Args:
+            event (QPaintEvent): 페인트 이벤트.
+        """
+        screen = self._screen
+        palette = self.palette()
+        background = palette.color(QPalette.Base)
+        rect = event.rect()
+
+        painter = QPainter(self.viewport())
+        painter.fillRect(rect, background)
+
+        height = self._cell_height
+        top = self.verticalScrollBar().value()
+        total = len(screen.history) + screen.rows
+        first = max(0, rect.top() // height)
+        last = min(screen.rows - 1, rect.bottom() // height)
+        for row in range(first, last + 1):
+            index = top + row
+            if index >= total:
+                break
+            self._paint_line(painter, screen.line(index), row * height)
+
+        # 커서 (화면 하단을 보는 중일 때만)
+        self._painted_cursor = None
+        cursor_row = len(screen.history) + screen.cursor_row - top
+        if screen.cursor_visible and 0 <= cursor_row < screen.rows and first <= cursor_row <= last:
+            cell = QRectF(screen.cursor_col * self._cell_width, cursor_row * height, self._cell_width, height)
+            color = QColor(palette.color(QPalette.Text))
+            color.setAlpha(128)
+            painter.fillRect(cell, color)
+        if screen.cursor_visible and 0 <= cursor_row < screen.rows:
+            self._painted_cursor = cursor_row
+        painter.end()
+
+    def _paint_line(self, painter: QPainter, line: TerminalLine, y: int) -> None:
+        """
+        한 행을 같은 속성 구간 단위로 그립니다.
+
+        Args:
+            painter (QPainter): 페인터 객체.
+            line (TerminalLine): 그릴 행.
+            y (int): 행 상단 좌표.
+        """
+        chars = line.chars
+        cell_width = self._cell_width
+        height = self._cell_height
+        baseline = y + self._ascent
+        columns = min(len(chars), self._screen.columns)
+        start = 0
+        for attr, group in groupby(line.attrs[:columns]):
+            end = start + len(list(group))
+            text = "".join(chars[start:end])
+            if attr or text.strip():
+                foreground, background, font = self._style(attr)
+                x = start * cell_width
+                if background is not None:
+                    painter.fillRect(QRectF(x, y, (end - start) * cell_width, height), background)
+                painter.setPen(foreground)
+                painter.setFont(font)
+                if text.isascii():
+                    painter.drawText(QPointF(x, baseline), text)
+                else:
+                    # 넓은 문자는 칸 위치에 맞춰 한 글자씩 (두 번째 칸은 빈 문자열)
+                    for offset, ch in enumerate(chars[start:end]):
+                        if ch and ch != " ":
+                            painter.drawText(QPointF((start + offset) * cell_width, baseline), ch)
+            start = end
+
+    def _style(self, attr: int) -> Tuple[QColor, Optional[QColor], QFont]:
+        """셀 속성을 (전경색, 배경색 또는 None, 글꼴)로 변환합니다. (캐시)"""
+        style = self._styles.get(attr)
+        if style is not None:
+            return style
+
+        fg_code, bg_code, flags = decode_attr(attr)
+        palette = self.palette()
+        # 굵은 기본 8색은 밝은 색으로 표시 (xterm 관례)
+        if flags & ATTR_BOLD and 1 <= fg_code <= 8:
+            fg_code += 8
+        foreground = self._color(fg_code) or palette.color(QPalette.Text)
+        background = self._color(bg_code)
+        if flags & ATTR_REVERSE:
+            foreground, background = background or palette.color(QPalette.Base), foreground
+
+        font = QFont(self.font())
+        font.setBold(bool(flags & ATTR_BOLD))
+        font.setItalic(bool(flags & ATTR_ITALIC))
+        font.setUnderline(bool(flags & ATTR_UNDERLINE))
+
+        style = self._styles[attr] = (foreground, background, font)
+        return style
+
+    @staticmethod
+    def _color(code: int) -> Optional[QColor]:
+        """색상 코드를 색상으로 변환합니다. (기본색이면 None)"""
+        if not code:
+            return None
+        if code & COLOR_RGB:
+            return QColor((code >> 16) & 0xFF, (code >> 8) & 0xFF, code & 0xFF)
+        return _palette_color(code - 1)
+
+    # -------------------------------------------------------------------------
+    # 크기 / 글꼴
+    # -------------------------------------------------------------------------
+    def _update_metrics(self) -> None:
+        """글꼴 기준 셀 크기를 다시 계산하고 화면 크기를 맞춥니다."""
+        metrics = QFontMetricsF(self.font())
+        self._cell_width = max(1.0, metrics.horizontalAdvance("M"))
+        self._cell_height = max(1, int(round(metrics.height())))
+        self._ascent = metrics.ascent()
+        self._styles.clear()
+        self._resize_screen()
+
+    def _resize_screen(self) -> None:
+        """뷰포트 크기에 맞춰 화면 열/행 수를 조정합니다."""
+        viewport = self.viewport()
+        columns = int(viewport.width() / self._cell_width)
+        rows = viewport.height() // self._cell_height
+        if columns > 0 and rows > 0:
+            self._screen.resize(columns, rows)
+            self._screen.take_damage()
+        self._painted_cursor = None
+        self._sync_scrollbar()
+        viewport.update()
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """
+        뷰 크기 변경 시 화면 크기를 맞춥니다.
+
+        Args:
+            event (QResizeEvent): 크기 변경 이벤트.
+        """
+        super().resizeEvent(event)
+        self._resize_screen()
+
+    def changeEvent(self, event: QEvent) -> None:
+        """
+        글꼴/팔레트(테마) 변경 시 셀 크기와 색상 캐시를 갱신합니다.
+
+        Args:
+            event (QEvent): 변경 이벤트.
+        """
+        super().changeEvent(event)
+        if event.type() == QEvent.FontChange:
+            self._update_metrics()
+        elif event.type() in (QEvent.PaletteChange, QEvent.StyleChange):
+            self._styles.clear()
+            self.viewport().update()
@@ -6,10 +6,12 @@ from .font_settings_dialog import FontSettingsDialog
 from .about_dialog import AboutDialog
 from .preferences_dialog import PreferencesDialog
 from .file_transfer_dialog import FileTransferDialog
+from .export_dialog import ExportProgressDialog
 
 __all__ = [
     'FontSettingsDialog',
     'AboutDialog',
     'PreferencesDialog',
     'FileTransferDialog',
+    'ExportProgressDialog',
 ]
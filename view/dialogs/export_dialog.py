@@ -0,0 +1,134 @@
+"""
+로그 내보내기 진행 대화상자 모듈
+
+데이터 로그/패킷 뷰의 내보내기 파일 선택, 진행률 표시 및 취소를 담당합니다.
+
+## WHY
+* 대량 이력 내보내기는 수 초 이상 걸릴 수 있어 진행 상황 표시와 취소 수단 필요
+* 데이터 로그와 패킷 뷰가 같은 내보내기 흐름을 공유해야 함
+
+## WHAT
+* 형식(텍스트/HEX 덤프/CSV) 선택이 포함된 저장 파일 대화상자
+* LogExportJob 진행률 표시 및 취소, 실패 시 경고 메시지
+
+## HOW
+* QProgressDialog 상속 (모달 없이 표시, 로그 수신/표시는 계속 진행)
+* 파일 쓰기는 LogExportTask(QThreadPool)에서 수행, 대화상자는 시그널로 진행률만 갱신
+"""
+import os
+from typing import Any, Optional
+
+from PyQt5.QtWidgets import QProgressDialog, QFileDialog, QMessageBox, QWidget
+from PyQt5.QtCore import Qt, pyqtSlot
+
+from common.constants import DEFAULT_RX_ENCODING
+from common.enums import ExportFormat
+from model.log_exporter import LogExportJob
+from view.managers.language_manager import language_manager
+
+# 저장 대화상자 필터 -> 내보내기 형식 (확장자 우선)
+EXPORT_FILTERS = {
+    "Text Files (*.txt)": ExportFormat.TEXT,
+    "Hex Dump (*.hex)": ExportFormat.HEX,
+    "CSV Files (*.csv)": ExportFormat.CSV,
+}
+EXPORT_EXTENSIONS = {".txt": ExportFormat.TEXT, ".hex": ExportFormat.HEX, ".csv": ExportFormat.CSV}
+
+
+class ExportProgressDialog(QProgressDialog):
+    """
+    로그 내보내기 진행 대화상자 클래스입니다.
+    """
+
+    def __init__(self, job: LogExportJob, parent: Optional[QWidget] = None):
+        """
+        ExportProgressDialog를 초기화하고 작업 시그널을 연결합니다.
+
+        Args:
+            job (LogExportJob): 진행할 내보내기 작업.
+            parent (QWidget, optional): 부모 위젯.
+        """
+        super().__init__(parent)
+        self._job = job
+        job.setParent(self)
+
+        self.setWindowTitle(language_manager.get_text("export_dialog_title"))
+        self.setLabelText(os.path.basename(job.task.file_path))
+        self.setCancelButtonText(language_manager.get_text("export_btn_cancel"))
+        self.setWindowModality(Qt.NonModal)
+        self.setAutoClose(False)
+        self.setAutoReset(False)
+        self.setMinimumDuration(0)
+        self.setRange(0, 0)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+
+        job.signals.progress_updated.connect(self.on_progress_updated)
+        job.signals.export_completed.connect(self.on_export_finished)
+        job.signals.export_cancelled.connect(self.on_export_finished)
+        job.signals.error_occurred.connect(self.on_error_occurred)
+        self.canceled.connect(job.cancel)
+
+    @classmethod
+    def start_export(cls, parent: QWidget, model: Any, title: str,
+                     encoding: str = DEFAULT_RX_ENCODING) -> Optional['ExportProgressDialog']:
+        """
+        저장 파일을 선택받아 내보내기를 시작합니다.
+
+        Logic:
+            - 확장자가 있으면 확장자, 없으면 선택한 필터로 형식 결정
+            - 작업 시작 후 진행 대화상자 표시 (모달 아님)
+
+        Args:
+            parent (QWidget): 부모 위젯.
+            model (Any): 원본 모델 (first_id, rowCount, export_rows 제공).
+            title (str): 저장 대화상자 제목.
+            encoding (str): 원본 내용 디코딩 인코딩.
+
+        Returns:
+            Optional[ExportProgressDialog]: 진행 대화상자 (취소 시 None).
+        """
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            parent, title, "", ";;".join(EXPORT_FILTERS)
+        )
+        if not file_path:
+            return None
+
+        ext = os.path.splitext(file_path)[1].lower()
+        export_format = EXPORT_EXTENSIONS.get(ext) or EXPORT_FILTERS.get(selected_filter, ExportFormat.TEXT)
+
+        job = LogExportJob(model, file_path, export_format, encoding)
+        dialog = cls(job, parent)
+        dialog.show()
+        job.start()
+        return dialog
+
+    @pyqtSlot(int, int)
+    def on_progress_updated(self, written: int, total: int) -> None:
+        """
+        진행률을 갱신합니다.
+
+        Args:
+            written (int): 기록한 행 수.
+            total (int): 전체 행 수.
+        """
+        if self.maximum() != total:
+            self.setRange(0, max(total, 1))
+        self.setValue(min(written, max(total, 1)))
+
+    @pyqtSlot()
+    def on_export_finished(self) -> None:
+        """완료/취소 시 대화상자를 닫습니다."""
+        self.close()
+
+    @pyqtSlot(str)
+    def on_error_occurred(self, message: str) -> None:
+        """
+        실패 메시지를 표시하고 대화상자를 닫습니다.
+
+        Args:
+            message (str): 오류 메시지.
+        """
+        self._job.cancel()
+        QMessageBox.warning(self.parentWidget(), language_manager.get_text("export_dialog_title"),
+                            f"{language_manager.get_text('export_msg_failed')}\n{message}")
+        self.close()
@@ -20,7 +20,7 @@ from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
     QLabel, QComboBox, QSpinBox, QPushButton,
     QFileDialog, QGroupBox, QFormLayout, QRadioButton,
-    QButtonGroup, QListWidget, QCheckBox, QLineEdit
+    QButtonGroup, QListWidget, QCheckBox, QLineEdit, QDoubleSpinBox
 )
 from PyQt5.QtCore import pyqtSignal, Qt
 from typing import Optional, Any
@@ -30,9 +30,17 @@ from view.managers.theme_manager import theme_manager
 from common.constants import (
     VALID_BAUDRATES,
     DEFAULT_LOG_MAX_LINES,
+    MIN_LOG_MAX_LINES,
+    MAX_LOG_MAX_LINES,
+    MIN_LOG_ROW_BYTES,
+    MAX_LOG_ROW_BYTES,
+    DEFAULT_LOG_ROW_BYTES,
+    LOG_HEX_ROW_BYTES,
     MIN_SCAN_INTERVAL_MS,
     MAX_SCAN_INTERVAL_MS,
     MAX_PACKET_SIZE,
+    PARSER_INDEX_GAP,
+    RX_ENCODINGS,
     ConfigKeys
 )
 from common.enums import NewlineMode, ThemeType
@@ -155,6 +163,9 @@ class PreferencesDialog(QDialog):
         self.port_newline_combo.addItems([mode.value for mode in NewlineMode])
         self.port_newline_combo.setEditable(True)
 
+        self.port_rx_encoding_combo = QComboBox()
+        self.port_rx_encoding_combo.addItems(RX_ENCODINGS)
+
         self.port_local_echo_chk = QCheckBox(language_manager.get_text("pref_chk_local_echo"))
 
         self.port_scan_interval_ms_spin = QSpinBox()
@@ -164,6 +175,7 @@ class PreferencesDialog(QDialog):
 
         default_layout.addRow(language_manager.get_text("pref_lbl_baudrate"), self.port_baudrate_combo)
         default_layout.addRow(language_manager.get_text("pref_lbl_newline"), self.port_newline_combo)
+        default_layout.addRow(language_manager.get_text("pref_lbl_rx_encoding"), self.port_rx_encoding_combo)
         default_layout.addRow(language_manager.get_text("pref_lbl_local_echo"), self.port_local_echo_chk)
         default_layout.addRow(language_manager.get_text("pref_lbl_scan"), self.port_scan_interval_ms_spin)
         default_group.setLayout(default_layout)
@@ -218,12 +230,44 @@ class PreferencesDialog(QDialog):
         path_layout.addWidget(self.browse_btn)
 
         self.max_lines_spin = QSpinBox()
-        self.max_lines_spin.setRange(100, 100000)
+        self.max_lines_spin.setRange(MIN_LOG_MAX_LINES, MAX_LOG_MAX_LINES)
         self.max_lines_spin.setSingleStep(100)
         self.max_lines_spin.setValue(DEFAULT_LOG_MAX_LINES)
 
+        # 디스크 스크롤백 (최대 라인 수 제한 없이 전체 이력 유지)
+        self.log_scrollback_chk = QCheckBox(language_manager.get_text("pref_chk_log_scrollback"))
+        self.log_scrollback_chk.toggled.connect(lambda checked: self.max_lines_spin.setEnabled(not checked))
+
+        # 메모리 압축 보관 (오래된 라인을 압축하여 같은 메모리로 더 긴 이력 유지)
+        self.log_compression_chk = QCheckBox(language_manager.get_text("pref_chk_log_compression"))
+        self.log_scrollback_chk.toggled.connect(lambda checked: self.log_compression_chk.setEnabled(not checked))
+
+        # 로그 행 최대 폭 (종료 문자 없는 긴 라인을 고정 폭 행으로 분할)
+        self.log_row_bytes_spin = QSpinBox()
+        self.log_row_bytes_spin.setRange(MIN_LOG_ROW_BYTES, MAX_LOG_ROW_BYTES)
+        self.log_row_bytes_spin.setSingleStep(256)
+        self.log_row_bytes_spin.setValue(DEFAULT_LOG_ROW_BYTES)
+        self.log_row_bytes_spin.setSuffix(" bytes")
+
+        self.log_hex_row_bytes_combo = QComboBox()
+        for row_bytes in LOG_HEX_ROW_BYTES:
+            self.log_hex_row_bytes_combo.addItem(f"{row_bytes} bytes", row_bytes)
+
+        # 패킷 단위 로깅 (필터 일치 프레임만 기록)
+        self.log_packet_mode_chk = QCheckBox(language_manager.get_text("pref_chk_log_packet_mode"))
+        self.log_packet_filter_edit = QLineEdit()
+        self.log_packet_filter_edit.setPlaceholderText("type == AT and len > 20")
+        self.log_packet_filter_edit.setEnabled(False)
+        self.log_packet_mode_chk.toggled.connect(self.log_packet_filter_edit.setEnabled)
+
         file_layout.addRow(language_manager.get_text("pref_lbl_log_path"), path_layout)
         file_layout.addRow(language_manager.get_text("pref_lbl_max_lines"), self.max_lines_spin)
+        file_layout.addRow("", self.log_scrollback_chk)
+        file_layout.addRow("", self.log_compression_chk)
+        file_layout.addRow(language_manager.get_text("pref_lbl_log_row_bytes"), self.log_row_bytes_spin)
+        file_layout.addRow(language_manager.get_text("pref_lbl_log_hex_row_bytes"), self.log_hex_row_bytes_combo)
+        file_layout.addRow("", self.log_packet_mode_chk)
+        file_layout.addRow(language_manager.get_text("pref_lbl_log_packet_filter"), self.log_packet_filter_edit)
         file_group.setLayout(file_layout)
 
         layout.addWidget(file_group)
@@ -246,12 +290,14 @@ class PreferencesDialog(QDialog):
         self.parser_type_delimiter = QRadioButton(language_manager.get_text("pref_parser_type_delimiter"))
         self.parser_type_fixed = QRadioButton(language_manager.get_text("pref_parser_type_fixed"))
         self.parser_type_raw = QRadioButton(language_manager.get_text("pref_parser_type_raw"))
+        self.parser_type_gap = QRadioButton(language_manager.get_text("pref_parser_type_gap"))
 
         self.parser_type_button_group.addButton(self.parser_type_auto, 0)
         self.parser_type_button_group.addButton(self.parser_type_at, 1)
         self.parser_type_button_group.addButton(self.parser_type_delimiter, 2)
         self.parser_type_button_group.addButton(self.parser_type_fixed, 3)
         self.parser_type_button_group.addButton(self.parser_type_raw, 4)
+        self.parser_type_button_group.addButton(self.parser_type_gap, PARSER_INDEX_GAP)
         self.parser_type_auto.setChecked(True)
 
         parser_type_layout.addWidget(self.parser_type_auto)
@@ -259,6 +305,7 @@ class PreferencesDialog(QDialog):
         parser_type_layout.addWidget(self.parser_type_delimiter)
         parser_type_layout.addWidget(self.parser_type_fixed)
         parser_type_layout.addWidget(self.parser_type_raw)
+        parser_type_layout.addWidget(self.parser_type_gap)
         parser_type_group.setLayout(parser_type_layout)
 
         # Delimiter 설정 그룹
@@ -296,6 +343,19 @@ class PreferencesDialog(QDialog):
         fixed_length_layout.addRow(language_manager.get_text("pref_lbl_packet_length"), self.packet_length_spin)
         fixed_length_group.setLayout(fixed_length_layout)
 
+        # Gap (유휴 간격) 설정 그룹: 임계값은 문자 시간 단위 (연결 시 보드레이트로 환산)
+        gap_group = QGroupBox(language_manager.get_text("pref_grp_gap"))
+        gap_layout = QFormLayout()
+
+        self.gap_chars_spin = QDoubleSpinBox()
+        self.gap_chars_spin.setRange(1.0, 1000.0)
+        self.gap_chars_spin.setDecimals(1)
+        self.gap_chars_spin.setSingleStep(0.5)
+        self.gap_chars_spin.setToolTip(language_manager.get_text("pref_lbl_gap_chars_tooltip"))
+
+        gap_layout.addRow(language_manager.get_text("pref_lbl_gap_chars"), self.gap_chars_spin)
+        gap_group.setLayout(gap_layout)
+
         # AT Color Rules 그룹
         at_color_group = QGroupBox(language_manager.get_text("pref_grp_at_colors"))
         at_color_layout = QVBoxLayout()
@@ -340,6 +400,7 @@ class PreferencesDialog(QDialog):
         left_v_layout.addWidget(delimiter_group)
 
         right_v_layout.addWidget(fixed_length_group)
+        right_v_layout.addWidget(gap_group)
         right_v_layout.addWidget(at_color_group)
         right_v_layout.addWidget(packet_group)
         right_v_layout.addStretch()
@@ -410,10 +471,19 @@ class PreferencesDialog(QDialog):
 
         self.proportional_font_size_spin.setValue(self.state.font_size)
         self.max_lines_spin.setValue(self.state.max_log_lines)
+        self.log_scrollback_chk.setChecked(self.state.log_scrollback)
+        self.log_compression_chk.setChecked(self.state.log_compression)
+        self.log_row_bytes_spin.setValue(self.state.log_row_bytes)
+        index = self.log_hex_row_bytes_combo.findData(self.state.log_hex_row_bytes)
+        if index != -1:
+            self.log_hex_row_bytes_combo.setCurrentIndex(index)
 
         # Serial
         self.port_baudrate_combo.setCurrentText(str(self.state.baudrate))
         self.port_newline_combo.setCurrentText(self.state.newline)
+        index = self.port_rx_encoding_combo.findText(self.state.rx_encoding)
+        if index != -1:
+            self.port_rx_encoding_combo.setCurrentIndex(index)
         self.port_local_echo_chk.setChecked(self.state.local_echo_enabled)
         self.port_scan_interval_ms_spin.setValue(self.state.scan_interval_ms)
 
@@ -423,6 +493,8 @@ class PreferencesDialog(QDialog):
 
         # Logging
         self.log_path_edit.setText(self.state.log_dir or os.getcwd())
+        self.log_packet_mode_chk.setChecked(self.state.log_packet_mode)
+        self.log_packet_filter_edit.setText(self.state.log_packet_filter)
 
         # Packet
         btn = self.parser_type_button_group.button(self.state.parser_type)
@@ -433,6 +505,7 @@ class PreferencesDialog(QDialog):
         self.delimiter_list.addItems(self.state.delimiters)
 
         self.packet_length_spin.setValue(self.state.packet_length)
+        self.gap_chars_spin.setValue(self.state.gap_chars)
 
         self.at_color_ok_chk.setChecked(self.state.at_color_ok)
         self.at_color_error_chk.setChecked(self.state.at_color_error)
@@ -459,6 +532,11 @@ class PreferencesDialog(QDialog):
             language=self.language_combo.currentData(),
             font_size=self.proportional_font_size_spin.value(),
             max_log_lines=self.max_lines_spin.value(),
+            rx_encoding=self.port_rx_encoding_combo.currentText(),
+            log_scrollback=self.log_scrollback_chk.isChecked(),
+            log_compression=self.log_compression_chk.isChecked(),
+            log_row_bytes=self.log_row_bytes_spin.value(),
+            log_hex_row_bytes=self.log_hex_row_bytes_combo.currentData(),
             baudrate=baud_val,
             newline=newline_val,
             local_echo_enabled=self.port_local_echo_chk.checkState() == Qt.Checked,
@@ -466,11 +544,14 @@ class PreferencesDialog(QDialog):
             command_prefix=self.prefix_combo.currentText(),
             command_suffix=self.suffix_combo.currentText(),
             log_dir=self.log_path_edit.text(),
+            log_packet_mode=self.log_packet_mode_chk.checkState() == Qt.Checked,
+            log_packet_filter=self.log_packet_filter_edit.text().strip(),
 
             # Packet Settings
             parser_type=self.parser_type_button_group.checkedId(),
             delimiters=delimiters,
             packet_length=self.packet_length_spin.value(),
+            gap_chars=self.gap_chars_spin.value(),
             at_color_ok=self.at_color_ok_chk.checkState() == Qt.Checked,
             at_color_error=self.at_color_error_chk.checkState() == Qt.Checked,
             at_color_urc=self.at_color_urc_chk.checkState() == Qt.Checked,
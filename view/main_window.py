@@ -339,6 +339,16 @@ class MainWindow(QMainWindow):
         """
         self.global_status_bar.update_statistics(stats)
 
+    def update_port_statistics(self, port_name: str, stats: PortStatistics) -> None:
+        """
+        해당 포트 탭의 통계 위젯을 업데이트합니다.
+
+        Args:
+            port_name (str): 포트 이름.
+            stats (PortStatistics): 통계 정보 DTO.
+        """
+        self.left_section.update_port_statistics(port_name, stats)
+
     def update_status_bar_time(self, time_str: str) -> None:
         """
         상태바의 현재 시간을 업데이트합니다.
@@ -496,7 +496,7 @@ class ColorManager(QObject):
     @staticmethod
     def _apply_single_rule(text: str, rule: ColorRule) -> str:
         """
-        단일 규칙 적용 (Helper). ColorService에 위임합니다.
+        단일 규칙 적용 (Helper). 규칙 1개짜리 세트로 ColorService에 위임합니다.
 
         Args:
             text (str): 대상 텍스트.
@@ -505,7 +505,8 @@ class ColorManager(QObject):
         Returns:
             str: 변환된 텍스트.
         """
-        return ColorService._apply_single_rule(text, rule.pattern, rule.color, rule.regex_enabled)
+        from view.managers.theme_manager import theme_manager
+        return ColorService.apply_rules(text, [rule], theme_manager.is_dark_theme())
 
 
 # 전역 인스턴스 생성
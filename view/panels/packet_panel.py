@@ -11,25 +11,33 @@
 ## WHAT
 * QTableView 기반의 패킷 목록 표시
 * PacketModel을 통한 데이터 관리 및 버퍼 크기 제한
-* 캡처 제어(Start/Stop) 및 초기화(Clear) 툴바
+* 캡처 제어(Start/Stop), 필터 표현식 입력, 초기화(Clear) 및 내보내기(Export) 툴바
 * 자동 스크롤 제어
+* 선택한 패킷의 프로토콜 필드 트리(디섹터 결과) 표시
 
 ## HOW
 * QAbstractTableModel을 상속받아 고성능 데이터 모델 구현
 * deque를 사용하여 고정 크기 버퍼(Ring Buffer) 구현
-* Presenter로부터 DTO(PacketViewData)를 받아 모델 업데이트
+* Presenter로부터 Packet 배치를 받아 UI 틱당 1회 모델 업데이트
+* HEX/ASCII/시각 문자열은 화면에 보이는 행만 지연 생성 (LRU 캐시)
+* 필드 트리는 행 선택 시에만 Presenter에 디코딩 요청
 """
-from typing import List, Any
-from collections import deque
+import time
+from typing import Any, Optional, Sequence, Tuple, List
+from collections import deque, OrderedDict
+from itertools import islice
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableView,
-    QPushButton, QCheckBox, QHeaderView, QLabel, QAbstractItemView
+    QPushButton, QCheckBox, QHeaderView, QLabel, QAbstractItemView, QLineEdit,
+    QSplitter, QTreeWidget, QTreeWidgetItem
 )
 from PyQt5.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QVariant
 
+from core.ui_scheduler import ui_scheduler
+from model.log_exporter import ExportRow
+from view.dialogs.export_dialog import ExportProgressDialog
 from view.managers.language_manager import language_manager
-from common.dtos import PacketViewData
 
 
 class PacketModel(QAbstractTableModel):
@@ -38,11 +46,19 @@ class PacketModel(QAbstractTableModel):
 
     QAbstractTableModel을 상속받아 QTableView에 데이터를 제공합니다.
     최대 버퍼 크기를 관리하여 메모리 사용량을 제어합니다.
+    원본 바이트와 타임스탬프만 보관하고, 문자열 변환은 화면에 보이는 행에 대해
+    data() 호출 시점에만 수행합니다 (소형 LRU 캐시).
     """
 
     # 컬럼 정의
     COLUMNS = ["Time", "Type", "HEX", "ASCII"]
 
+    # 포맷 캐시 크기 (화면에 보이는 행 수보다 충분히 크게)
+    FORMAT_CACHE_SIZE = 256
+
+    # ASCII 변환 테이블 (출력 불가 문자는 '.')
+    _ASCII_TABLE = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+
     def __init__(self, buffer_size: int = 100):
         """
         PacketModel 초기화
@@ -53,6 +69,20 @@ class PacketModel(QAbstractTableModel):
         super().__init__()
         self._buffer_size = buffer_size
         self._data: deque = deque(maxlen=buffer_size)
+        # 첫 행의 일련번호 (앞쪽 행 제거 시 증가, 내보내기 범위 추적용)
+        self._first_id = 0
+        # Packet -> (time, hex, ascii)
+        self._format_cache: "OrderedDict[Any, Tuple[str, str, str]]" = OrderedDict()
+
+    @property
+    def buffer_size(self) -> int:
+        """최대 패킷 저장 개수"""
+        return self._buffer_size
+
+    @property
+    def first_id(self) -> int:
+        """첫 행의 일련번호"""
+        return self._first_id
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """행 개수 반환"""
@@ -79,14 +109,16 @@ class PacketModel(QAbstractTableModel):
         packet = self._data[index.row()]
         col = index.column()
 
+        if col == 1:
+            return packet.type_name
+
+        time_str, data_hex, data_ascii = self._get_formatted(packet)
         if col == 0:
-            return packet.time_str
-        elif col == 1:
-            return packet.packet_type
+            return time_str
         elif col == 2:
-            return packet.data_hex
+            return data_hex
         elif col == 3:
-            return packet.data_ascii
+            return data_ascii
         return QVariant()
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
@@ -95,35 +127,109 @@ class PacketModel(QAbstractTableModel):
             return self.COLUMNS[section]
         return QVariant()
 
-    def append_packet(self, packet: PacketViewData) -> None:
+    def _get_formatted(self, packet: Any) -> Tuple[str, str, str]:
+        """
+        패킷의 표시 문자열을 반환합니다. (LRU 캐시)
+
+        Logic:
+            - 캐시 히트 시 최근 사용으로 갱신
+            - 미스 시 시각/HEX/ASCII 문자열 생성 후 캐시 (초과 시 가장 오래된 항목 제거)
+
+        Args:
+            packet (Any): 패킷 객체 (data, timestamp, type_name 속성).
+
+        Returns:
+            Tuple[str, str, str]: (시각, HEX, ASCII) 문자열.
+        """
+        cached = self._format_cache.get(packet)
+        if cached is not None:
+            self._format_cache.move_to_end(packet)
+            return cached
+
+        raw = packet.data
+        ts = packet.timestamp
+        time_str = f"{time.strftime('%H:%M:%S', time.localtime(ts))}.{int(ts * 1000) % 1000:03d}"
+        formatted = (
+            time_str,
+            raw.hex(" ").upper(),
+            raw.translate(self._ASCII_TABLE).decode("ascii")
+        )
+
+        self._format_cache[packet] = formatted
+        if len(self._format_cache) > self.FORMAT_CACHE_SIZE:
+            self._format_cache.popitem(last=False)
+        return formatted
+
+    def packet_at(self, row: int) -> Optional[Any]:
+        """
+        행 번호에 해당하는 패킷을 반환합니다.
+
+        Args:
+            row (int): 행 번호.
+
+        Returns:
+            Optional[Any]: 패킷 객체. 범위를 벗어나면 None.
+        """
+        if 0 <= row < len(self._data):
+            return self._data[row]
+        return None
+
+    def export_rows(self, start_id: int, count: int) -> List[ExportRow]:
         """
-        패킷 데이터를 추가합니다.
-        버퍼가 가득 찬 경우 가장 오래된 데이터를 제거합니다.
+        행 일련번호 범위의 내보내기 행을 반환합니다. (LogExportJob이 청크 단위로 호출)
 
         Args:
-            packet (PacketViewData): 추가할 패킷 데이터 DTO.
-        """
-        # 버퍼가 가득 찼다면 행 제거 신호를 보냄
-        if len(self._data) >= self._buffer_size:
-            self.beginRemoveRows(QModelIndex(), 0, 0)
-            # deque는 자동으로 오래된 것을 밀어내지만, Qt View 갱신을 위해 명시적으로 알림 필요
-            # 그러나 deque의 append는 기존 데이터를 덮어쓰거나 밀어내므로
-            # 여기서는 beginInsertRows 전에 remove를 먼저 처리하는 것이 안전함.
-            # 하지만 deque 특성상 append 시 자동 popleft가 발생하므로,
-            # Qt 모델 동기화를 위해 popleft를 먼저 수행.
-            self._data.popleft()
+            start_id (int): 첫 행 일련번호.
+            count (int): 행 수.
+
+        Returns:
+            List[ExportRow]: (수신 시각, 패킷 타입, 데이터, False, None).
+        """
+        start = max(0, start_id - self._first_id)
+        end = min(len(self._data), start_id - self._first_id + count)
+        return [(packet.timestamp, packet.type_name, packet.data, False, None)
+                for packet in islice(self._data, start, end)]
+
+    def append_packets(self, packets: Sequence[Any]) -> None:
+        """
+        패킷 배치를 추가합니다.
+        버퍼 초과분은 가장 오래된 데이터부터 제거합니다.
+
+        Logic:
+            - 배치 자체가 버퍼보다 크면 마지막 buffer_size개만 사용
+            - 초과분을 한 번의 remove 구간으로 제거
+            - 새 행을 한 번의 insert 구간으로 추가
+
+        Args:
+            packets (Sequence[Any]): 추가할 패킷 리스트 (model.packet_parser.Packet).
+        """
+        if not packets:
+            return
+
+        if len(packets) > self._buffer_size:
+            packets = packets[-self._buffer_size:]
+
+        # deque(maxlen)의 자동 밀어내기 전에 Qt 모델 동기화를 위해 명시적으로 제거
+        overflow = len(self._data) + len(packets) - self._buffer_size
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._format_cache.pop(self._data.popleft(), None)
+            self._first_id += overflow
             self.endRemoveRows()
 
         # 새 행 추가
         row = len(self._data)
-        self.beginInsertRows(QModelIndex(), row, row)
-        self._data.append(packet)
+        self.beginInsertRows(QModelIndex(), row, row + len(packets) - 1)
+        self._data.extend(packets)
         self.endInsertRows()
 
     def clear(self) -> None:
         """모든 데이터 삭제"""
         self.beginResetModel()
+        self._first_id += len(self._data)
         self._data.clear()
+        self._format_cache.clear()
         self.endResetModel()
 
     def set_buffer_size(self, size: int) -> None:
@@ -139,8 +245,10 @@ class PacketModel(QAbstractTableModel):
 
         self.beginResetModel()
         self._buffer_size = size
-        # deque 리사이징 (새 maxlen 적용)
+        # deque 리사이징 (새 maxlen 적용, 초과분은 앞쪽부터 제거)
+        self._first_id += max(0, len(self._data) - size)
         self._data = deque(self._data, maxlen=size)
+        self._format_cache.clear()
         self.endResetModel()
 
 
@@ -156,6 +264,8 @@ class PacketPanel(QWidget):
     # 사용자 액션 시그널
     clear_requested = pyqtSignal()
     capture_toggled = pyqtSignal(bool)
+    filter_changed = pyqtSignal(str)
+    packet_selected = pyqtSignal(object)
 
     def __init__(self, parent: QWidget = None) -> None:
         """
@@ -172,10 +282,16 @@ class PacketPanel(QWidget):
         self._autoscroll_chk: QCheckBox = None
         self._capture_chk: QCheckBox = None
         self._clear_btn: QPushButton = None
+        self._export_btn: QPushButton = None
         self._title_lbl: QLabel = None
+        self._filter_edit: QLineEdit = None
+        self._field_tree: QTreeWidget = None
 
         self._autoscroll_enabled = True
 
+        # UI 틱 단위 배치 갱신용 대기 버퍼 (추가 시 공용 UI 스케줄러에 플러시 예약)
+        self._pending_packets: List[Any] = []
+
         self.init_ui()
 
         # 언어 변경 연결
@@ -206,11 +322,24 @@ class PacketPanel(QWidget):
         self._clear_btn = QPushButton(language_manager.get_text("packet_panel_btn_clear"))
         self._clear_btn.clicked.connect(self.clear_requested.emit)
 
+        # 내보내기 (백그라운드 스트리밍 저장)
+        self._export_btn = QPushButton(language_manager.get_text("packet_panel_btn_export"))
+        self._export_btn.clicked.connect(self._on_export_clicked)
+
+        # 필터 표현식 (입력 완료 시에만 컴파일 요청)
+        self._filter_edit = QLineEdit()
+        self._filter_edit.setPlaceholderText(language_manager.get_text("packet_panel_filter_placeholder"))
+        self._filter_edit.setClearButtonEnabled(True)
+        self._filter_edit.editingFinished.connect(
+            lambda: self.filter_changed.emit(self._filter_edit.text().strip())
+        )
+
         toolbar_layout.addWidget(self._title_lbl)
-        toolbar_layout.addStretch()
+        toolbar_layout.addWidget(self._filter_edit, 1)
         toolbar_layout.addWidget(self._capture_chk)
         toolbar_layout.addWidget(self._autoscroll_chk)
         toolbar_layout.addWidget(self._clear_btn)
+        toolbar_layout.addWidget(self._export_btn)
 
         # 2. 패킷 테이블 (Table View)
         self._packet_table = QTableView()
@@ -230,20 +359,49 @@ class PacketPanel(QWidget):
         header.setSectionResizeMode(2, QHeaderView.Stretch)          # HEX (가변)
         header.setSectionResizeMode(3, QHeaderView.Stretch)          # ASCII (가변)
 
+        # 행 선택 시에만 필드 트리 디코딩 요청
+        self._packet_table.selectionModel().currentRowChanged.connect(self._on_current_row_changed)
+
+        # 3. 필드 트리 (Dissector 결과)
+        self._field_tree = QTreeWidget()
+        self._field_tree.setColumnCount(2)
+        self._field_tree.setHeaderLabels([
+            language_manager.get_text("packet_col_field"),
+            language_manager.get_text("packet_col_value")
+        ])
+        self._field_tree.setProperty("class", "fixed-font")
+
+        splitter = QSplitter(Qt.Vertical)
+        splitter.addWidget(self._packet_table)
+        splitter.addWidget(self._field_tree)
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 1)
+
         layout.addLayout(toolbar_layout)
-        layout.addWidget(self._packet_table)
+        layout.addWidget(splitter)
 
     def retranslate_ui(self) -> None:
         """언어 변경 시 텍스트 업데이트"""
         self._title_lbl.setText(language_manager.get_text("packet_panel_title"))
         self._clear_btn.setText(language_manager.get_text("packet_panel_btn_clear"))
+        self._export_btn.setText(language_manager.get_text("packet_panel_btn_export"))
         self._capture_chk.setText(language_manager.get_text("packet_panel_chk_capture"))
         self._autoscroll_chk.setText(language_manager.get_text("packet_panel_chk_autoscroll"))
+        self._filter_edit.setPlaceholderText(language_manager.get_text("packet_panel_filter_placeholder"))
+        self._field_tree.setHeaderLabels([
+            language_manager.get_text("packet_col_field"),
+            language_manager.get_text("packet_col_value")
+        ])
         # 타이틀 라벨 업데이트 로직 필요 시 추가 (객체 참조 저장 필요)
 
     # -------------------------------------------------------------------------
     # Public Methods (Presenter에서 호출 - Facade Interface)
     # -------------------------------------------------------------------------
+    @property
+    def packet_model(self) -> PacketModel:
+        """패킷 테이블 모델 (읽기 전용)"""
+        return self._packet_model
+
     def set_buffer_size(self, size: int) -> None:
         """
         패킷 버퍼 크기를 설정합니다.
@@ -272,25 +430,98 @@ class PacketPanel(QWidget):
         """
         self._capture_chk.setChecked(enabled)
 
-    def append_packet(self, data: PacketViewData) -> None:
+    def append_packets(self, packets: Sequence[Any]) -> None:
         """
-        새 패킷 데이터를 뷰에 추가합니다.
+        패킷 배치를 대기 버퍼에 추가합니다.
+        실제 모델 갱신과 스크롤은 UI 틱당 1회만 수행됩니다.
 
         Args:
-            data (PacketViewData): 패킷 데이터 DTO.
+            packets (Sequence[Any]): 패킷 리스트 (model.packet_parser.Packet).
         """
-        self._packet_model.append_packet(data)
+        if not packets:
+            return
 
-        if self._autoscroll_enabled:
-            self._packet_table.scrollToBottom()
+        self._pending_packets.extend(packets)
+
+        # 버퍼 크기를 넘는 대기분은 어차피 표시되지 않으므로 미리 버림
+        buffer_size = self._packet_model.buffer_size
+        if len(self._pending_packets) > buffer_size:
+            del self._pending_packets[:-buffer_size]
+
+        ui_scheduler.request(self._flush_pending)
+
+    def set_filter_error(self, message: str) -> None:
+        """
+        필터 표현식 오류 상태를 표시합니다.
+
+        Args:
+            message (str): 오류 메시지. 빈 문자열이면 정상 상태로 복귀.
+        """
+        self._filter_edit.setToolTip(message)
+        self._filter_edit.setProperty("state", "error" if message else "")
+        self._filter_edit.style().unpolish(self._filter_edit)
+        self._filter_edit.style().polish(self._filter_edit)
+
+    def show_packet_fields(self, fields: Sequence[Any]) -> None:
+        """
+        선택된 패킷의 필드 트리를 표시합니다.
+
+        Args:
+            fields (Sequence[Any]): 루트 필드 리스트 (name, value, children 속성).
+        """
+        self._field_tree.clear()
+        for field in fields:
+            self._field_tree.addTopLevelItem(self._create_field_item(field))
+        self._field_tree.expandAll()
 
     def clear_view(self) -> None:
         """테이블 뷰를 초기화합니다."""
+        ui_scheduler.cancel(self._flush_pending)
+        self._pending_packets.clear()
         self._packet_model.clear()
+        self._field_tree.clear()
 
     # -------------------------------------------------------------------------
     # Internal Slots
     # -------------------------------------------------------------------------
+    def _flush_pending(self) -> None:
+        """대기 중인 패킷을 한 번의 모델 갱신으로 반영합니다."""
+        if not self._pending_packets:
+            return
+
+        packets = self._pending_packets
+        self._pending_packets = []
+        self._packet_model.append_packets(packets)
+
+        if self._autoscroll_enabled:
+            self._packet_table.scrollToBottom()
+
+    def _on_current_row_changed(self, current: QModelIndex, previous: QModelIndex) -> None:
+        """
+        테이블 현재 행 변경 핸들러
+
+        Args:
+            current (QModelIndex): 새 현재 인덱스.
+            previous (QModelIndex): 이전 인덱스.
+        """
+        packet = self._packet_model.packet_at(current.row()) if current.isValid() else None
+        if packet is None:
+            self._field_tree.clear()
+            return
+        self.packet_selected.emit(packet)
+
+    def _create_field_item(self, field: Any) -> QTreeWidgetItem:
+        """필드 노드를 트리 아이템으로 재귀 변환합니다."""
+        item = QTreeWidgetItem([str(field.name), str(field.value)])
+        for child in field.children:
+            item.addChild(self._create_field_item(child))
+        return item
+
+    def _on_export_clicked(self) -> None:
+        """패킷 목록을 파일로 내보냅니다."""
+        ExportProgressDialog.start_export(self, self._packet_model,
+                                          language_manager.get_text("packet_panel_btn_export"))
+
     def _on_autoscroll_toggled(self, checked: bool) -> None:
         """
         자동 스크롤 체크박스 토글 핸들러
@@ -187,6 +187,24 @@ class PortPanel(QWidget):
         """
         self._data_log_widget.append_data(data)
 
+    def append_log_tx_data(self, data: bytes) -> None:
+        """
+        로그 뷰어에 송신 데이터(로컬 에코)를 추가합니다.
+
+        Args:
+            data (bytes): 송신한 데이터.
+        """
+        self._data_log_widget.append_tx_data(data)
+
+    def append_log_marker(self, text: str) -> None:
+        """
+        로그 뷰어에 안내 마커 라인을 추가합니다. (예: 과부하 생략 표시)
+
+        Args:
+            text (str): 마커 텍스트.
+        """
+        self._data_log_widget.append_marker(text)
+
     def clear_data_log(self) -> None:
         """로그 뷰어를 초기화합니다."""
         self._data_log_widget.on_clear_data_log_clicked()
@@ -204,6 +222,43 @@ class PortPanel(QWidget):
         """
         self._data_log_widget.set_max_lines(max_lines)
 
+    def set_log_scrollback(self, enabled: bool) -> None:
+        """
+        로그 뷰의 디스크 스크롤백 모드를 설정합니다.
+
+        Args:
+            enabled (bool): 스크롤백 모드 사용 여부 (최대 라인 수 제한 없음).
+        """
+        self._data_log_widget.set_scrollback_enabled(enabled)
+
+    def set_log_compression(self, enabled: bool) -> None:
+        """
+        로그 뷰의 오래된 라인 메모리 압축 보관을 설정합니다.
+
+        Args:
+            enabled (bool): 압축 보관 사용 여부 (디스크 스크롤백이 꺼져 있을 때 적용).
+        """
+        self._data_log_widget.set_compression_enabled(enabled)
+
+    def set_log_row_bytes(self, row_bytes: int, hex_row_bytes: int) -> None:
+        """
+        로그 뷰의 행 최대 폭을 설정합니다.
+
+        Args:
+            row_bytes (int): 텍스트 모드 행 최대 폭 (바이트).
+            hex_row_bytes (int): HEX 모드 행당 바이트 수.
+        """
+        self._data_log_widget.set_row_bytes(row_bytes, hex_row_bytes)
+
+    def set_rx_encoding(self, encoding: str) -> None:
+        """
+        수신 데이터 표시 인코딩을 설정합니다.
+
+        Args:
+            encoding (str): 인코딩 이름 (예: 'utf-8', 'cp949').
+        """
+        self._data_log_widget.set_encoding(encoding)
+
     def update_statistics(self, stats: PortStatistics) -> None:
         """
         통계 위젯을 업데이트합니다.
@@ -29,7 +29,7 @@ from PyQt5.QtGui import QIcon
 from view.managers.language_manager import language_manager
 from view.managers.theme_manager import theme_manager
 from view.panels.port_panel import PortPanel
-from common.dtos import LogDataBatch
+from common.dtos import LogDataBatch, PortStatistics
 
 
 class PortTabPanel(QTabWidget):
@@ -303,9 +303,27 @@ class PortTabPanel(QTabWidget):
             if isinstance(widget, PortPanel):
                 # DTO의 포트 이름과 일치하는지 확인
                 if widget.get_port_name() == batch.port:
+                    if batch.skipped:
+                        widget.append_log_marker(
+                            language_manager.get_text("data_log_overload_marker").format(batch.skipped)
+                        )
                     widget.append_log_data(batch.data)
                     return  # 찾았으면 종료
 
+    def update_port_statistics(self, port_name: str, stats: PortStatistics) -> None:
+        """
+        지정된 포트 이름을 가진 탭의 통계를 업데이트합니다.
+
+        Args:
+            port_name (str): 포트 이름.
+            stats (PortStatistics): 통계 정보 DTO.
+        """
+        for i in range(self.count() - 1):  # 마지막 탭(+) 제외
+            widget = self.widget(i)
+            if isinstance(widget, PortPanel) and widget.get_port_name() == port_name:
+                widget.update_statistics(stats)
+                return
+
     def _on_panel_title_changed(self, panel: PortPanel, title: str) -> None:
         """
         패널의 탭 제목이 변경되었을 때 호출됩니다.
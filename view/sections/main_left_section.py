@@ -28,7 +28,7 @@ from view.panels.port_panel import PortPanel
 from view.panels.manual_control_panel import ManualControlPanel
 from view.panels.port_tab_panel import PortTabPanel
 from view.widgets.system_log import SystemLogWidget
-from common.dtos import LogDataBatch, SystemLogEvent, ColorRule
+from common.dtos import LogDataBatch, SystemLogEvent, ColorRule, PortStatistics
 
 
 class MainLeftSection(QWidget):
@@ -306,14 +306,14 @@ class MainLeftSection(QWidget):
 
     def append_data_to_current_port(self, data: bytes) -> None:
         """
-        현재 활성화된 포트 탭의 로그창에 데이터(Local Echo 등)를 추가합니다.
+        현재 활성화된 포트 탭의 로그창에 송신 데이터(Local Echo)를 추가합니다. (송신 행으로 구분)
 
         Args:
-            data (bytes): 추가할 데이터.
+            data (bytes): 추가할 송신 데이터.
         """
         current_widget = self.get_current_port_panel()
         if current_widget:
-            current_widget.append_log_data(data)
+            current_widget.append_log_tx_data(data)
 
     def append_rx_data(self, batch: LogDataBatch) -> None:
         """
@@ -327,6 +327,16 @@ class MainLeftSection(QWidget):
         """
         self._port_tab_panel.append_rx_data(batch)
 
+    def update_port_statistics(self, port_name: str, stats: PortStatistics) -> None:
+        """
+        특정 포트 탭의 통계 위젯을 업데이트합니다.
+
+        Args:
+            port_name (str): 포트 이름.
+            stats (PortStatistics): 통계 정보 DTO.
+        """
+        self._port_tab_panel.update_port_statistics(port_name, stats)
+
     # -------------------------------------------------------------------------
     # 내부 시그널 핸들러
     # -------------------------------------------------------------------------
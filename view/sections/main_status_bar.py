@@ -104,12 +104,12 @@ class MainStatusBar(QStatusBar):
         # HTML 태그로 색상 적용
         self.port_lbl.setText(f"Port: {port} <span style='color:{color}; font-weight:bold;'>{status_symbol}</span>")
 
-    def update_rx_speed(self, bytes_per_sec: int) -> None:
+    def update_rx_speed(self, bytes_per_sec: float) -> None:
         """수신 속도 업데이트"""
         speed = bytes_per_sec / 1024
         self.rx_count_lbl.setText(f"RX: {speed:.1f} KB/s")
 
-    def update_tx_speed(self, bytes_per_sec: int) -> None:
+    def update_tx_speed(self, bytes_per_sec: float) -> None:
         """송신 속도 업데이트"""
         speed = bytes_per_sec / 1024
         self.tx_count_lbl.setText(f"TX: {speed:.1f} KB/s")
@@ -150,13 +150,12 @@ class MainStatusBar(QStatusBar):
         Args:
             stats (PortStatistics): 통계 데이터 객체.
         """
-        # RX/TX Speed
-        self.update_rx_speed(stats.rx_bytes) # Note: stats.rx_bytes가 속도인지 누적량인지 확인 필요. 여기선 속도로 가정.
-        self.update_tx_speed(stats.tx_bytes)
+        # RX/TX Speed (슬라이딩 윈도우 평균)
+        self.update_rx_speed(stats.rx_rate)
+        self.update_tx_speed(stats.tx_rate)
 
-        # BPS (Optional)
-        if hasattr(stats, 'bps'):
-             self.bps_lbl.setText(f"BPS: {stats.bps}")
+        # BPS
+        self.bps_lbl.setText(f"BPS: {stats.bps}")
 
     def retranslate_ui(self) -> None:
         """언어 변경 시 상태바 텍스트를 업데이트합니다."""
@@ -7,35 +7,181 @@ UI(View)나 상태(Manager)와 독립적으로 순수 로직만을 수행합니
 ## WHY
 * ColorManager에서 로직을 분리하여 '상태 관리'와 '로직 수행'의 책임 분리 (SoC)
 * 반복적인 정규식 컴파일로 인한 성능 저하 방지 (Caching)
+* 규칙마다 라인 전체를 다시 훑으면 규칙 수에 비례해 비용 증가 (규칙 수십 개 시 병목)
 * 테마(Dark/Light) 변경 시 가독성을 위해 색상 명도(Lightness) 자동 보정 필요
 
 ## WHAT
-* 텍스트에 색상 규칙 적용 (HTML span 태그 생성)
-* 정규식(Regex) 및 단순 문자열 매칭
-* 정규식 객체 캐싱 관리
+* 텍스트의 색상 구간(Span) 계산 (start, length, 규칙 인덱스) - 로그 뷰용
+* 텍스트에 색상 규칙 적용 (HTML span 태그 생성, 구간 계산 결과 기반)
+* 규칙 세트를 단일 정규식으로 컴파일 (CompiledColorRules, 라인당 1회 패스)
+* 컴파일된 규칙 세트의 크기 제한 캐싱 관리 (LRU)
 * HLS 색상 모델을 이용한 명도 자동 보정 알고리즘
 * 기본 구문 강조 규칙 정의 및 DTO 변환 (get_syntax_rules)
 
 ## HOW
 * 상태를 가지지 않는(Stateless) 클래스와 정적 메서드(@staticmethod)로 구현
-* 클래스 레벨 딕셔너리(_regex_cache)를 사용하여 컴파일된 정규식 재사용
+* 활성 규칙을 이름 있는 그룹의 Alternation((?P<_cr0>...)|(?P<_cr1>...))으로 결합, match.lastgroup으로 규칙 식별
+* 규칙 세트 시그니처(패턴/옵션/색상) -> 컴파일 결과를 OrderedDict LRU(COLOR_RULE_CACHE_SIZE)로 재사용
+* 구간은 규칙 인덱스만 담아 테마와 무관, 색상표는 테마별 1회 계산 (palette)
+* 겹치는 구간은 먼저 시작하는 매칭이 우선, 같은 위치에서는 나중 규칙이 우선 (역순 배치)
+* 결합할 수 없는 패턴(역참조, 그룹 이름 충돌 등)은 개별 평가 후 덮어쓰기로 폴백
 * colorsys 모듈을 사용하여 RGB <-> HLS 변환 수행
 """
 import re
+import html
 import colorsys
-from typing import List, Dict, Pattern, Optional
+from collections import OrderedDict
+from typing import List, Dict, Pattern, Optional, Tuple
 
+from common.constants import COLOR_RULE_CACHE_SIZE
 from common.dtos import ColorRule
 from core.logger import logger
 
 
+# 색상 구간: (시작 인덱스, 길이, 규칙 인덱스)
+ColorSpan = Tuple[int, int, int]
+
+# 결합 정규식에서 다른 그룹 번호/이름을 참조하는 패턴 (개별 평가 대상)
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=")
+# 패턴 선두의 전역 인라인 플래그 (예: "(?i)") -> 결합 시 범위 플래그로 변환
+_GLOBAL_FLAGS_RE = re.compile(r"^\(\?([imsx]+)\)")
+
+
+class CompiledColorRules:
+    """
+    색상 규칙 세트를 컴파일한 단일 패스 매칭기 클래스
+
+    규칙 세트가 바뀔 때만 생성되며(ColorService.compile_rules), 라인마다 정규식 1회 패스로
+    색상 구간을 계산합니다.
+    """
+
+    __slots__ = ("_regex", "_group_rules", "_separate", "_rules", "_palettes")
+
+    def __init__(self, rules: List[ColorRule]) -> None:
+        """
+        CompiledColorRules 초기화
+
+        Logic:
+            - 활성 규칙을 역순으로 Alternation에 배치 (같은 위치에서 나중 규칙 우선)
+            - 일반 규칙은 re.escape, 잘못된 정규식은 로깅 후 제외
+            - 역참조를 포함한 패턴이나 결합 컴파일 실패 시 해당 규칙은 개별 평가
+
+        Args:
+            rules (List[ColorRule]): 색상 규칙 리스트.
+        """
+        self._rules = list(rules)
+        self._regex: Optional[Pattern] = None
+        self._group_rules: Dict[str, int] = {}
+        self._separate: List[Tuple[int, Pattern]] = []
+        self._palettes: Dict[bool, List[Optional[str]]] = {}
+
+        combinable: List[Tuple[int, str, Pattern]] = []
+        for index in range(len(rules) - 1, -1, -1):
+            rule = rules[index]
+            if not getattr(rule, 'enabled', True) or not rule.pattern:
+                continue
+            source = rule.pattern if rule.regex_enabled else re.escape(rule.pattern)
+            try:
+                compiled = re.compile(source)
+            except re.error as e:
+                logger.error(f"Invalid regex pattern '{rule.pattern}': {e}")
+                continue
+
+            if _BACKREF_RE.search(source):
+                self._separate.append((index, compiled))
+                continue
+            if _GLOBAL_FLAGS_RE.match(source):
+                source = _GLOBAL_FLAGS_RE.sub(r"(?\1:", source, count=1) + ")"
+            combinable.append((index, source, compiled))
+
+        if combinable:
+            alternatives = []
+            for index, source, _ in combinable:
+                name = f"_cr{index}"
+                alternatives.append(f"(?P<{name}>{source})")
+                self._group_rules[name] = index
+            try:
+                self._regex = re.compile("|".join(alternatives))
+            except re.error:
+                # 그룹 이름 충돌 등으로 결합할 수 없으면 전체를 개별 평가
+                self._group_rules.clear()
+                self._separate.extend((index, compiled) for index, _, compiled in combinable)
+
+        # 개별 평가는 규칙 순서대로 덮어쓰기 (나중 규칙 우선)
+        self._separate.sort(key=lambda item: item[0])
+
+    @property
+    def is_empty(self) -> bool:
+        """매칭할 활성 규칙이 없는지 여부"""
+        return self._regex is None and not self._separate
+
+    def spans(self, text: str) -> Tuple[ColorSpan, ...]:
+        """
+        텍스트의 색상 구간을 계산합니다.
+
+        Logic:
+            1. 결합 정규식 1회 패스 (빈 매칭 제외, lastgroup -> 규칙 인덱스)
+            2. 개별 평가 규칙이 있으면 순서대로 덮어쓰기 후 정렬
+
+        Args:
+            text (str): 원본 텍스트.
+
+        Returns:
+            Tuple[ColorSpan, ...]: (start, length, 규칙 인덱스) 튜플. 매칭이 없으면 빈 튜플.
+        """
+        spans: List[Tuple[int, int, int]] = []  # (start, end, index)
+        if self._regex is not None:
+            group_rules = self._group_rules
+            for match in self._regex.finditer(text):
+                start, end = match.span()
+                if end > start:
+                    spans.append((start, end, group_rules[match.lastgroup]))
+
+        if not self._separate:
+            return tuple((s, e - s, i) for s, e, i in spans)
+
+        for index, pattern in self._separate:
+            for match in pattern.finditer(text):
+                start, end = match.span()
+                if end <= start:
+                    continue
+                overlaid = []
+                for s, e, i in spans:
+                    if e <= start or s >= end:
+                        overlaid.append((s, e, i))
+                        continue
+                    if s < start:
+                        overlaid.append((s, start, i))
+                    if e > end:
+                        overlaid.append((end, e, i))
+                overlaid.append((start, end, index))
+                spans = overlaid
+        spans.sort()
+        return tuple((s, e - s, i) for s, e, i in spans)
+
+    def palette(self, is_dark_theme: bool) -> List[Optional[str]]:
+        """
+        규칙 인덱스별 표시 색상을 반환합니다. (테마별 1회 계산)
+
+        Args:
+            is_dark_theme (bool): 다크 테마 여부.
+
+        Returns:
+            List[Optional[str]]: 규칙 순서대로의 색상 코드 (없으면 None).
+        """
+        palette = self._palettes.get(is_dark_theme)
+        if palette is None:
+            palette = self._palettes[is_dark_theme] = ColorService.resolve_palette(self._rules, is_dark_theme)
+        return palette
+
+
 class ColorService:
     """
     색상 적용, 패턴 매칭, 색상 보정을 담당하는 정적 서비스 클래스
     """
 
-    # 정규식 컴파일 캐시 (패턴 문자열 -> 컴파일된 객체)
-    _regex_cache: Dict[str, Pattern] = {}
+    # 컴파일된 규칙 세트 캐시 (규칙 세트 시그니처 -> CompiledColorRules, 최대 COLOR_RULE_CACHE_SIZE)
+    _compiled_cache: 'OrderedDict[tuple, CompiledColorRules]' = OrderedDict()
 
     # -------------------------------------------------------------------------
     # 기본 규칙 데이터 (Default Rules Data)
@@ -79,15 +225,75 @@ class ColorService:
             rules.append(rule)
         return rules
 
-    @staticmethod
-    def apply_rules(text: str, rules: List[ColorRule], is_dark_theme: bool) -> str:
+    @classmethod
+    def compile_rules(cls, rules: List[ColorRule]) -> CompiledColorRules:
         """
-        텍스트에 색상 규칙 리스트를 순차적으로 적용합니다.
+        규칙 세트를 단일 패스 매칭기로 컴파일합니다. (캐시 사용)
 
         Logic:
-            1. 활성화된(enabled) 규칙만 필터링
-            2. 현재 테마(Dark/Light)에 맞는 색상 결정 및 보정
-            3. 텍스트 내 패턴 매칭 및 HTML 태그(<span style...>) 치환
+            - 규칙의 패턴/옵션/색상으로 시그니처 생성 (규칙이 제자리에서 수정되어도 구분)
+            - 캐시 적중 시 재사용, 미스 시 컴파일 후 상한 초과분은 오래된 것부터 제거
+
+        Args:
+            rules (List[ColorRule]): 색상 규칙 리스트.
+
+        Returns:
+            CompiledColorRules: 컴파일된 규칙 세트.
+        """
+        key = tuple(
+            (rule.pattern, rule.regex_enabled, getattr(rule, 'enabled', True),
+             rule.color, getattr(rule, 'light_color', ""), getattr(rule, 'dark_color', ""))
+            for rule in rules
+        )
+        compiled = cls._compiled_cache.get(key)
+        if compiled is not None:
+            cls._compiled_cache.move_to_end(key)
+            return compiled
+
+        compiled = cls._compiled_cache[key] = CompiledColorRules(rules)
+        if len(cls._compiled_cache) > COLOR_RULE_CACHE_SIZE:
+            cls._compiled_cache.popitem(last=False)
+        return compiled
+
+    @classmethod
+    def compute_spans(cls, text: str, rules: List[ColorRule]) -> Tuple[ColorSpan, ...]:
+        """
+        텍스트에 적용될 색상 구간을 계산합니다. (HTML 생성 없음)
+
+        라인을 반복 처리하는 쪽은 compile_rules 결과를 보관하여 spans()를 직접 호출하는 것이 빠릅니다.
+
+        Args:
+            text (str): 원본 텍스트.
+            rules (List[ColorRule]): 적용할 색상 규칙 리스트 (DTO).
+
+        Returns:
+            Tuple[ColorSpan, ...]: (start, length, 규칙 인덱스) 튜플. 매칭이 없으면 빈 튜플.
+        """
+        return cls.compile_rules(rules).spans(text)
+
+    @classmethod
+    def resolve_palette(cls, rules: List[ColorRule], is_dark_theme: bool) -> List[Optional[str]]:
+        """
+        규칙 인덱스별 표시 색상을 결정합니다. (구간의 규칙 인덱스 -> 색상)
+
+        Args:
+            rules (List[ColorRule]): 색상 규칙 리스트.
+            is_dark_theme (bool): 다크 테마 여부.
+
+        Returns:
+            List[Optional[str]]: 규칙 순서대로의 색상 코드 (없으면 None).
+        """
+        return [cls._resolve_color(rule, is_dark_theme) for rule in rules]
+
+    @classmethod
+    def apply_rules(cls, text: str, rules: List[ColorRule], is_dark_theme: bool) -> str:
+        """
+        텍스트에 색상 규칙 리스트를 적용한 HTML을 생성합니다.
+
+        Logic:
+            1. 컴파일된 규칙 세트로 색상 구간 계산 (단일 패스)
+            2. 현재 테마(Dark/Light)에 맞는 색상표 조회 (규칙 세트별 캐시)
+            3. 구간별 HTML 태그(<span style...>) 생성 (나머지 텍스트는 이스케이프)
 
         Args:
             text (str): 원본 텍스트.
@@ -100,20 +306,20 @@ class ColorService:
         if not rules:
             return text
 
-        result = text
-        for rule in rules:
-            # DTO의 enabled 속성 확인
-            if hasattr(rule, 'enabled') and rule.enabled:
-                target_color = ColorService._resolve_color(rule, is_dark_theme)
-
-                # 유효한 색상이 없으면 규칙 적용 스킵
-                if not target_color:
-                    continue
-
-                result = ColorService._apply_single_rule(
-                    result, rule.pattern, target_color, rule.regex_enabled
-                )
-        return result
+        compiled = cls.compile_rules(rules)
+        palette = compiled.palette(is_dark_theme)
+        parts = []
+        pos = 0
+        for start, length, index in compiled.spans(text):
+            color = palette[index]
+            # 유효한 색상이 없으면 규칙 적용 스킵
+            if not color:
+                continue
+            parts.append(html.escape(text[pos:start]))
+            parts.append(f'<span style="color:{color};">{html.escape(text[start:start + length])}</span>')
+            pos = start + length
+        parts.append(html.escape(text[pos:]))
+        return "".join(parts)
 
     @classmethod
     def _resolve_color(cls, rule: ColorRule, is_dark_theme: bool) -> Optional[str]:
@@ -210,51 +416,10 @@ class ColorService:
             logger.warning(f"Invalid hex color format: {hex_color}")
             return hex_color
 
-    @classmethod
-    def _apply_single_rule(cls, text: str, pattern: str, color: str, regex_enabled: bool) -> str:
-        """
-        단일 색상 규칙을 텍스트에 적용합니다.
-
-        Logic:
-            - Regex 규칙: 캐시된 정규식 객체를 사용하여 매칭된 부분을 HTML 태그로 감쌈
-            - 일반 규칙: str.replace를 사용하여 단순 치환
-
-        Args:
-            text (str): 대상 텍스트.
-            pattern (str): 매칭 패턴 (정규식 또는 문자열).
-            color (str): 적용할 HEX 색상 코드.
-            regex_enabled (bool): 정규식 사용 여부.
-
-        Returns:
-            str: 태그가 적용된 텍스트.
-        """
-        if regex_enabled:
-            try:
-                # 정규식 컴파일 및 캐시 확인
-                if pattern not in cls._regex_cache:
-                    cls._regex_cache[pattern] = re.compile(pattern)
-
-                pattern_obj = cls._regex_cache[pattern]
-
-                # 그룹 0(\g<0>)을 사용하여 매칭된 전체 문자열을 태그로 감쌈
-                return pattern_obj.sub(
-                    rf'<span style="color:{color};">\g<0></span>',
-                    text
-                )
-            except re.error as e:
-                logger.error(f"Invalid regex pattern '{pattern}': {e}")
-                return text
-        else:
-            # 단순 문자열 치환 (정규식 오버헤드 없음)
-            return text.replace(
-                pattern,
-                f'<span style="color:{color};">{pattern}</span>'
-            )
-
     @classmethod
     def clear_cache(cls) -> None:
         """
-        캐시된 정규식 객체들을 메모리에서 제거합니다.
+        캐시된 규칙 세트 컴파일 결과를 메모리에서 제거합니다.
         (설정이 대거 변경되거나 메모리 정리가 필요할 때 사용)
         """
-        cls._regex_cache.clear()
\ No newline at end of file
+        cls._compiled_cache.clear()
\ No newline at end of file
@@ -13,36 +13,104 @@ QSmartListView를 기반으로 하여 대량의 데이터 처리 성능을 최
 
 ## WHAT
 * QSmartListView 기반 통신 데이터 뷰어
+* ANSI/VT100 출력 장치용 터미널 표시 모드 (QTerminalView, 셀 격자 화면)
 * 데이터 필터링, HEX/ASCII 모드 전환, 타임스탬프 표시
 * 로그 저장(DataLoggerManager와 연동) 및 화면 초기화 기능
 
 ## HOW
 * QSmartListView 객체에 데이터 및 설정 위임
-* QTimer를 사용한 데이터 버퍼링 및 UI 업데이트 최적화
+* 수신 데이터는 DataTrafficHandler가 UI 틱당 1회 전달하므로 보이는 동안은 위젯 내부 버퍼링 없이 즉시 반영
+* 숨겨진 탭은 원본 bytes만 대기열(ChunkBacklog)에 보관하고 라인 조립/행 추가는 하지 않음
+  -> 탭이 보이면 UI 틱마다 시간 예산 안에서 나눠 반영 (보이지 않는 탭의 CPU 사용 최소화)
+  -> 보관량이 LOG_HIDDEN_BACKLOG_BYTES를 넘으면 초과분만 모델에 반영
+     (모든 숨겨진 탭이 UI 틱당 LOG_HIDDEN_DRAIN_BUDGET_MS 하나를 Round-robin으로 공유)
+  -> 반영이 못 따라가 LOG_HIDDEN_BACKLOG_MAX_BYTES를 넘으면 오래된 구간부터 생략하고 생략 마커 표시
+  -> 안내 마커는 대기열에 순서대로 보관하여 앞선 데이터가 반영될 때 함께 표시 (동기 반영 없음)
+* 로컬 에코(송신) 데이터는 송신 행(LINE_FLAG_TX)으로 추가하여 내보내기에서 TX로 구분
+  (대기분이 있으면 마커와 같이 순서대로 보관)
+* 터미널 모드는 QStackedWidget으로 뷰를 전환하고 수신 데이터는 현재 표시 중인 뷰에만 반영
+  (라인 로그 전용 옵션인 검색/필터/HEX/줄바꿈/중복 접기/내보내기는 비활성화)
 """
+import time
+import weakref
+from collections import OrderedDict
 
+
+from PyQt5 import sip
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QCheckBox, QLabel, QLineEdit, QFileDialog, QComboBox
+    QPushButton, QCheckBox, QLabel, QLineEdit, QFileDialog, QComboBox, QStackedWidget
 )
-from PyQt5.QtCore import QTimer, pyqtSignal, pyqtSlot, Qt
-from typing import Optional, List
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, Qt
+from PyQt5.QtGui import QShowEvent
+from typing import NamedTuple, Optional, List
 from view.managers.language_manager import language_manager
 
 from view.custom_qt.smart_list_view import QSmartListView
+from view.custom_qt.terminal_view import QTerminalView
+from view.dialogs.export_dialog import ExportProgressDialog
 
+from core.structures import ChunkBacklog
+from core.ui_scheduler import ui_scheduler
 from common.constants import (
     DEFAULT_LOG_MAX_LINES,
-    UI_REFRESH_INTERVAL_MS,
-    FILE_FILTER_LOG, FILE_FILTER_ALL
+    FILE_FILTER_LOG, FILE_FILTER_ALL,
+    LOG_HIDDEN_BACKLOG_BYTES, LOG_HIDDEN_BACKLOG_MAX_BYTES, LOG_HIDDEN_DRAIN_BUDGET_MS,
+    UI_FLUSH_BUDGET_MS, UI_FLUSH_SLICE_BYTES
 )
-from common.enums import NewlineMode
+from common.enums import NewlineMode, LogDedupMode
 from common.dtos import ColorRule
 
 # 추가된 파일 필터 상수 (로컬 상수로 정의하거나 constants.py로 이동 가능)
 # 여기서는 편의상 메서드 내에서 문자열로 조합 사용
 FILE_FILTERS = "Binary Files (*.bin);;Text Hex Dump (*.txt);;PCAP Files (*.pcap);;All Files (*)"
 
+
+class _LocalEcho(NamedTuple):
+    """대기열에 순서대로 보관하는 로컬 에코(송신) 데이터 (내부용)"""
+    data: bytes
+
+
+class _HiddenBacklogDrainer:
+    """
+    숨겨진 탭 대기열 초과분 반영 조정자 (내부용)
+
+    모든 숨겨진 DataLogWidget이 UI 틱당 LOG_HIDDEN_DRAIN_BUDGET_MS 하나를 공유하며,
+    위젯마다 슬라이스 1개씩 Round-robin으로 반영합니다. (숨겨진 탭 수와 무관하게 프레임 예산 유지)
+    """
+
+    def __init__(self) -> None:
+        # 초과분이 남은 위젯 (약한 참조 -> None, 순서 = 다음 방문 순서)
+        self._widgets: "OrderedDict[weakref.ref, None]" = OrderedDict()
+
+    def request(self, widget: "DataLogWidget") -> None:
+        """위젯의 초과분 반영을 예약합니다."""
+        self._widgets[weakref.ref(widget)] = None
+        ui_scheduler.request(self._run)
+
+    def _run(self) -> None:
+        """
+        공유 예산 안에서 위젯을 돌아가며 초과분을 반영합니다. (UI 스케줄러 콜백)
+
+        Logic:
+            - 사라졌거나 다시 보이는 위젯은 제외 (보이는 위젯은 자체 예산으로 반영)
+            - 초과분이 남은 위젯은 뒤로 보내 다음 방문/다음 틱에 이어서 처리
+        """
+        deadline = time.perf_counter() + LOG_HIDDEN_DRAIN_BUDGET_MS / 1000
+        widgets = self._widgets
+        while widgets and time.perf_counter() < deadline:
+            ref, _ = widgets.popitem(last=False)
+            widget = ref()
+            if widget is None or sip.isdeleted(widget) or widget.isVisible():
+                continue
+            if widget._drain_step(LOG_HIDDEN_BACKLOG_BYTES):
+                widgets[ref] = None
+        if widgets:
+            ui_scheduler.request(self._run)
+
+
+_hidden_drainer = _HiddenBacklogDrainer()
+
 class DataLogWidget(QWidget):
     """
     데이터를 표시하는 뷰어 위젯 클래스
@@ -69,17 +137,23 @@ class DataLogWidget(QWidget):
         # UI Components
         self.data_log_title = None
         self.data_log_list = None
+        self.data_log_terminal: Optional[QTerminalView] = None
+        self.data_log_stack: Optional[QStackedWidget] = None
         self.data_log_search_prev_btn: Optional[QPushButton] = None
         self.data_log_search_next_btn: Optional[QPushButton] = None
         self.data_log_tx_broadcast_allowed_chk: Optional[QCheckBox] = None
         self.data_log_search_edit = None
+        self.data_log_search_count_lbl: Optional[QLabel] = None
         self.data_log_toggle_logging_btn: Optional[QPushButton] = None
         self.data_log_clear_log_btn: Optional[QPushButton] = None
+        self.data_log_export_btn: Optional[QPushButton] = None
         self.data_log_pause_chk: Optional[QCheckBox] = None
         self.data_log_timestamp_chk: Optional[QCheckBox] = None
         self.data_log_hex_chk: Optional[QCheckBox] = None
         self.data_log_filter_chk: Optional[QCheckBox] = None
+        self.data_log_terminal_chk: Optional[QCheckBox] = None
         self.data_log_newline_combo: Optional[QComboBox] = None
+        self.data_log_dedup_combo: Optional[QComboBox] = None
 
         # State Variables
         self.tx_broadcast_allowed_enabled: bool = True
@@ -87,11 +161,14 @@ class DataLogWidget(QWidget):
         self.is_paused: bool = False
         self.timestamp_enabled: bool = False
         self.filter_enabled: bool = False
-        self.ui_update_buffer: list = []
+        self.terminal_mode: bool = False
 
         self.max_lines: int = DEFAULT_LOG_MAX_LINES
         self.tab_name: str = ""
 
+        # 숨겨진 탭의 미표시 수신 데이터 (탭이 보일 때 나눠서 반영)
+        self._backlog = ChunkBacklog()
+
         # Removed self.color_manager = color_manager
 
         # ---------------------------------------------------------
@@ -102,14 +179,6 @@ class DataLogWidget(QWidget):
         # 언어 변경 연결
         language_manager.language_changed.connect(self.retranslate_ui)
 
-        # ---------------------------------------------------------
-        # 3. 타이머 설정 (성능 최적화)
-        # ---------------------------------------------------------
-        self.ui_update_timer: QTimer = QTimer()
-        self.ui_update_timer.setInterval(UI_REFRESH_INTERVAL_MS)
-        self.ui_update_timer.timeout.connect(self.flush_buffer)
-        self.ui_update_timer.start()
-
     def set_tab_name(self, name: str) -> None:
         """
         탭 이름 설정
@@ -200,6 +269,15 @@ class DataLogWidget(QWidget):
         self.data_log_newline_combo.addItem(language_manager.get_text("data_log_newline_crlf"), NewlineMode.CRLF.value)
         self.data_log_newline_combo.setFixedWidth(100)
 
+        # Dedup Combo (연속 중복 라인 접기)
+        self.data_log_dedup_combo = QComboBox()
+        self.data_log_dedup_combo.setToolTip(language_manager.get_text("data_log_combo_dedup_tooltip"))
+        self.data_log_dedup_combo.addItem(language_manager.get_text("data_log_dedup_off"), LogDedupMode.OFF.value)
+        self.data_log_dedup_combo.addItem(language_manager.get_text("data_log_dedup_exact"), LogDedupMode.EXACT.value)
+        self.data_log_dedup_combo.addItem(language_manager.get_text("data_log_dedup_ignore_digits"),
+                                          LogDedupMode.IGNORE_DIGITS.value)
+        self.data_log_dedup_combo.currentIndexChanged.connect(self.on_data_log_dedup_changed)
+
         # Log View
         self.data_log_list = QSmartListView()
         self.data_log_list.set_max_lines(DEFAULT_LOG_MAX_LINES)
@@ -211,6 +289,14 @@ class DataLogWidget(QWidget):
         self.data_log_list.setToolTip(language_manager.get_text("data_log_list_log_tooltip"))
         self.data_log_list.setProperty("class", "fixed-font")
 
+        # Terminal View (ANSI/VT100 출력용, 터미널 모드에서만 표시)
+        self.data_log_terminal = QTerminalView()
+        self.data_log_terminal.setProperty("class", "fixed-font")
+
+        self.data_log_stack = QStackedWidget()
+        self.data_log_stack.addWidget(self.data_log_list)
+        self.data_log_stack.addWidget(self.data_log_terminal)
+
         # Components Init (Reuse existing initialization code)
         self.data_log_title = QLabel(language_manager.get_text("data_log_title"))
         self.data_log_title.setProperty("class", "section-title")
@@ -223,8 +309,14 @@ class DataLogWidget(QWidget):
         self.data_log_search_prev_btn.clicked.connect(self.on_data_log_search_prev_clicked)
         self.data_log_search_next_btn = QPushButton(">")
         self.data_log_search_next_btn.clicked.connect(self.on_data_log_search_next_clicked)
+        # 검색 결과 (현재 순번/전체 일치 수, 백그라운드 검색 완료 시 갱신)
+        self.data_log_search_count_lbl = QLabel()
+        self.data_log_list.search_result_changed.connect(self.on_data_log_search_result_changed)
         self.data_log_clear_log_btn = QPushButton(language_manager.get_text("data_log_btn_clear"))
         self.data_log_clear_log_btn.clicked.connect(self.on_clear_data_log_clicked)
+        self.data_log_export_btn = QPushButton(language_manager.get_text("data_log_btn_export"))
+        self.data_log_export_btn.setToolTip(language_manager.get_text("data_log_btn_export_tooltip"))
+        self.data_log_export_btn.clicked.connect(self.on_data_log_export_clicked)
         self.data_log_toggle_logging_btn = QPushButton(language_manager.get_text("data_log_btn_toggle_logging"))
         self.data_log_toggle_logging_btn.setCheckable(True)
         self.data_log_toggle_logging_btn.toggled.connect(self.on_data_log_logging_toggled)
@@ -236,6 +328,9 @@ class DataLogWidget(QWidget):
         self.data_log_timestamp_chk.stateChanged.connect(self.on_data_log_timestamp_changed)
         self.data_log_pause_chk = QCheckBox(language_manager.get_text("data_log_chk_pause"))
         self.data_log_pause_chk.stateChanged.connect(self.on_data_log_pause_changed)
+        self.data_log_terminal_chk = QCheckBox(language_manager.get_text("data_log_chk_terminal"))
+        self.data_log_terminal_chk.setToolTip(language_manager.get_text("data_log_chk_terminal_tooltip"))
+        self.data_log_terminal_chk.stateChanged.connect(self.on_data_log_terminal_mode_changed)
 
         toolbar_layout = QHBoxLayout()
         toolbar_layout.addWidget(self.data_log_title)
@@ -245,19 +340,23 @@ class DataLogWidget(QWidget):
         toolbar_layout.addWidget(self.data_log_search_edit)
         toolbar_layout.addWidget(self.data_log_search_prev_btn)
         toolbar_layout.addWidget(self.data_log_search_next_btn)
+        toolbar_layout.addWidget(self.data_log_search_count_lbl)
         toolbar_layout.addWidget(self.data_log_filter_chk)
         toolbar_layout.addWidget(self.data_log_newline_combo)
+        toolbar_layout.addWidget(self.data_log_dedup_combo)
         toolbar_layout.addWidget(self.data_log_hex_chk)
         toolbar_layout.addWidget(self.data_log_timestamp_chk)
+        toolbar_layout.addWidget(self.data_log_terminal_chk)
         toolbar_layout.addWidget(self.data_log_pause_chk)
         toolbar_layout.addWidget(self.data_log_clear_log_btn)
+        toolbar_layout.addWidget(self.data_log_export_btn)
         toolbar_layout.addWidget(self.data_log_toggle_logging_btn)
 
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(2)
         layout.addLayout(toolbar_layout)
-        layout.addWidget(self.data_log_list)
+        layout.addWidget(self.data_log_stack)
 
         self.setLayout(layout)
 
@@ -287,10 +386,14 @@ class DataLogWidget(QWidget):
         self.data_log_timestamp_chk.setToolTip(language_manager.get_text("data_log_chk_timestamp_tooltip"))
         self.data_log_pause_chk.setText(language_manager.get_text("data_log_chk_pause"))
         self.data_log_pause_chk.setToolTip(language_manager.get_text("data_log_chk_pause_tooltip"))
+        self.data_log_terminal_chk.setText(language_manager.get_text("data_log_chk_terminal"))
+        self.data_log_terminal_chk.setToolTip(language_manager.get_text("data_log_chk_terminal_tooltip"))
 
         # Buttons
         self.data_log_clear_log_btn.setText(language_manager.get_text("data_log_btn_clear"))
         self.data_log_clear_log_btn.setToolTip(language_manager.get_text("data_log_btn_clear_tooltip"))
+        self.data_log_export_btn.setText(language_manager.get_text("data_log_btn_export"))
+        self.data_log_export_btn.setToolTip(language_manager.get_text("data_log_btn_export_tooltip"))
 
         # 로깅 버튼 텍스트는 상태에 따라 달라짐 (토글 시)
         if not self.data_log_toggle_logging_btn.isChecked():
@@ -306,12 +409,23 @@ class DataLogWidget(QWidget):
         self.data_log_newline_combo.setToolTip(language_manager.get_text("data_log_combo_newline_tooltip"))
         self.data_log_newline_combo.setCurrentIndex(current_index)
 
+        # Dedup Combo
+        self.data_log_dedup_combo.setItemText(0, language_manager.get_text("data_log_dedup_off"))
+        self.data_log_dedup_combo.setItemText(1, language_manager.get_text("data_log_dedup_exact"))
+        self.data_log_dedup_combo.setItemText(2, language_manager.get_text("data_log_dedup_ignore_digits"))
+        self.data_log_dedup_combo.setToolTip(language_manager.get_text("data_log_combo_dedup_tooltip"))
+
     # -------------------------------------------------------------------------
     # 데이터 처리 및 버퍼링
     # -------------------------------------------------------------------------
     def append_data(self, data: bytes) -> None:
         """
-        수신된 바이트 데이터를 버퍼에 추가합니다.
+        수신된 바이트 데이터를 로그 뷰에 추가합니다.
+
+        Logic:
+            - 위젯이 보이지 않으면(비활성 탭) 원본만 대기열에 보관 (절대 상한 초과분은 오래된 구간부터 생략)
+            - 보관량이 LOG_HIDDEN_BACKLOG_BYTES를 넘으면 초과분 반영을 공유 예산 조정자에 예약
+            - 보이는 중이라도 반영 중인 대기분이 있으면 순서 유지를 위해 뒤에 이어 보관
 
         Args:
             data (bytes): 수신된 원본 바이트 데이터.
@@ -320,6 +434,47 @@ class DataLogWidget(QWidget):
         if self.is_paused:
             return
 
+        if self._backlog or not self.isVisible():
+            self._backlog.push(data, LOG_HIDDEN_BACKLOG_MAX_BYTES)
+            if self.isVisible():
+                ui_scheduler.request(self._drain_backlog)
+            elif self._backlog.size > LOG_HIDDEN_BACKLOG_BYTES:
+                _hidden_drainer.request(self)
+            return
+
+        self._append_to_view(data)
+
+    def append_tx_data(self, data: bytes) -> None:
+        """
+        송신 데이터(로컬 에코)를 송신 행으로 추가합니다.
+
+        Args:
+            data (bytes): 송신한 바이트 데이터.
+        """
+        if self.is_paused:
+            return
+
+        # 앞서 받은 수신 데이터 뒤에 표시되어야 하므로 대기분이 있으면 마커처럼 그 뒤에 보관
+        if self._backlog:
+            self._backlog.push_marker(_LocalEcho(data))
+            if self.isVisible():
+                ui_scheduler.request(self._drain_backlog)
+            return
+        self._append_to_view(data, tx=True)
+
+    def _append_to_view(self, data: bytes, tx: bool = False) -> None:
+        """
+        바이트 데이터를 현재 줄바꿈 설정으로 로그 뷰에 반영합니다.
+
+        Args:
+            data (bytes): 수신(또는 송신) 원본 바이트 데이터.
+            tx (bool): 송신 데이터(로컬 에코) 여부.
+        """
+        # 터미널 모드는 이스케이프 시퀀스가 줄바꿈/커서 이동을 결정하므로 원본 그대로 전달
+        if self.terminal_mode:
+            self.data_log_terminal.feed(data)
+            return
+
         # Newline 문자 설정 (QSmartListView에 전달)
         newline_mode = self.data_log_newline_combo.currentData()
 
@@ -334,24 +489,102 @@ class DataLogWidget(QWidget):
 
         self.data_log_list.set_newline_char(newline_char)
 
-        # 버퍼에 추가 (bytes 그대로)
-        self.ui_update_buffer.append(data)
+        # Handler가 이미 UI 틱 단위로 묶어 전달하므로 바로 모델에 반영 (bytes 그대로)
+        if tx:
+            self.data_log_list.append_tx_bytes(data)
+        else:
+            self.data_log_list.append_bytes(data)
 
-    def flush_buffer(self) -> None:
+    def append_marker(self, text: str) -> None:
         """
-        타이머에 의해 주기적으로 호출되어 버퍼 내용을 UI에 반영합니다.
-        각 bytes 데이터를 QSmartListView에 전달하여 자동으로 처리합니다.
+        데이터와 구분되는 안내 마커 라인을 추가합니다.
+
+        Args:
+            text (str): 마커 텍스트.
         """
-        if not self.ui_update_buffer:
+        if self.is_paused:
             return
 
-        # 버퍼 내용을 복사하고 즉시 비움
-        buffer_items = self.ui_update_buffer[:]
-        self.ui_update_buffer.clear()
+        # 마커는 앞서 받은 데이터 뒤에 표시되어야 하므로 대기분이 있으면 그 뒤에 보관 (반영 시 순서대로 표시)
+        if self._backlog:
+            self._backlog.push_marker(text)
+            if self.isVisible():
+                ui_scheduler.request(self._drain_backlog)
+            return
+        self._append_marker_to_view(text)
 
-        # 각 bytes를 QSmartListView에 전달
-        for data in buffer_items:
-            self.data_log_list.append_bytes(data)
+    def _append_marker_to_view(self, text: str) -> None:
+        """
+        안내 마커를 현재 표시 중인 뷰에 추가합니다.
+
+        Args:
+            text (str): 마커 텍스트.
+        """
+        if self.terminal_mode:
+            self.data_log_terminal.append_marker(text)
+        else:
+            self.data_log_list.append_marker(text)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """
+        탭이 다시 보이면 숨겨진 동안 쌓인 수신 데이터 반영을 예약합니다.
+
+        Args:
+            event (QShowEvent): 표시 이벤트.
+        """
+        super().showEvent(event)
+        if self._backlog:
+            ui_scheduler.request(self._drain_backlog)
+
+    def _drain_backlog(self) -> None:
+        """
+        대기 중인 수신 데이터와 마커를 로그 뷰에 반영합니다. (UI 스케줄러 콜백, 보이는 동안)
+
+        Logic:
+            - 마커 또는 UI_FLUSH_SLICE_BYTES 단위로 반영하고 시간 예산을 넘으면 다음 틱에 이어서 처리
+            - 다시 숨겨졌으면 중단 (초과분은 공유 예산 조정자, 나머지는 다음 표시 때 반영)
+        """
+        if not self.isVisible():
+            if self._backlog.size > LOG_HIDDEN_BACKLOG_BYTES:
+                _hidden_drainer.request(self)
+            return
+
+        deadline = time.perf_counter() + UI_FLUSH_BUDGET_MS / 1000
+        while self._drain_step(0):
+            if time.perf_counter() >= deadline:
+                ui_scheduler.request(self._drain_backlog)
+                return
+
+    def _drain_step(self, keep: int) -> bool:
+        """
+        대기열 앞쪽의 마커 1개 또는 슬라이스 1개를 반영합니다.
+
+        Logic:
+            - 절대 상한으로 생략한 구간이 있으면 과부하 마커를 먼저 표시
+            - 맨 앞이 마커면 마커를, 아니면 keep을 넘는 분량에서 최대 UI_FLUSH_SLICE_BYTES 반영
+
+        Args:
+            keep (int): 반영하지 않고 남겨둘 바이트 수 (숨겨진 탭 = LOG_HIDDEN_BACKLOG_BYTES).
+
+        Returns:
+            bool: 이어서 반영할 분량(keep 초과분 또는 맨 앞 마커)이 남아 있으면 True.
+        """
+        backlog = self._backlog
+        if backlog.skipped:
+            skipped = backlog.skipped
+            backlog.skipped = 0
+            self._append_marker_to_view(
+                language_manager.get_text("data_log_overload_marker").format(skipped)
+            )
+
+        marker = backlog.pop_marker()
+        if isinstance(marker, _LocalEcho):
+            self._append_to_view(marker.data, tx=True)
+        elif marker is not None:
+            self._append_marker_to_view(marker)
+        elif backlog.size > keep:
+            self._append_to_view(backlog.take(min(UI_FLUSH_SLICE_BYTES, backlog.size - keep)))
+        return backlog.size > keep or backlog.marker_next
 
     # -------------------------------------------------------------------------
     # 사용자 액션 처리 (검색, 옵션, 버튼)
@@ -378,11 +611,46 @@ class DataLogWidget(QWidget):
         """검색어가 변경되면 하이라이트 패턴을 즉시 업데이트합니다."""
         self.data_log_list.set_search_pattern(text)
 
+    @pyqtSlot(int, int)
+    def on_data_log_search_result_changed(self, current: int, total: int) -> None:
+        """
+        검색 결과 일치 수를 표시합니다.
+
+        Args:
+            current (int): 현재 선택된 일치 순번 (0 = 선택 없음).
+            total (int): 전체 일치 수 (검색 인덱스에 남아 있는 행 기준).
+        """
+        label = self.data_log_search_count_lbl
+        if not self.data_log_search_edit.text():
+            label.clear()
+            label.setToolTip("")
+            return
+
+        text = f"{current}/{total}" if current else str(total)
+        # 검색 인덱스 용량 초과로 오래된 행 일부를 검색하지 못한 경우 '+' 표시 및 안내
+        if self.data_log_list.search_truncated:
+            label.setText(f"{text}+")
+            label.setToolTip(language_manager.get_text("data_log_lbl_search_truncated_tooltip"))
+        else:
+            label.setText(text)
+            label.setToolTip("")
+
+    @pyqtSlot()
+    def on_data_log_export_clicked(self) -> None:
+        """현재 로그를 파일로 내보냅니다. (백그라운드 스트리밍 저장)"""
+        title = language_manager.get_text("data_log_btn_export")
+        if self.tab_name:
+            title = f"{self.tab_name}::{title}"
+        ExportProgressDialog.start_export(self, self.data_log_list.log_model, title,
+                                          self.data_log_list.encoding)
+
     @pyqtSlot()
     def on_clear_data_log_clicked(self) -> None:
         """화면에 표시된 로그와 대기 중인 버퍼를 모두 지웁니다."""
+        ui_scheduler.cancel(self._drain_backlog)
+        self._backlog.clear()
         self.data_log_list.clear()
-        self.ui_update_buffer.clear()
+        self.data_log_terminal.clear()
 
     @pyqtSlot(bool)
     def on_data_log_logging_toggled(self, checked: bool) -> None:
@@ -471,6 +739,36 @@ class DataLogWidget(QWidget):
         self.hex_mode = (state == Qt.Checked)
         self.data_log_list.set_hex_mode_enabled(self.hex_mode)
 
+    @pyqtSlot(int)
+    def on_data_log_terminal_mode_changed(self, state: int) -> None:
+        """
+        터미널 표시 모드 토글을 처리합니다.
+
+        Logic:
+            - 표시 뷰 전환 (이후 수신분부터 전환된 뷰에 반영)
+            - 라인 로그 전용 옵션 활성 상태 갱신
+
+        Args:
+            state (int): 체크박스 상태.
+        """
+        self.terminal_mode = (state == Qt.Checked)
+        self.data_log_stack.setCurrentWidget(self.data_log_terminal if self.terminal_mode else self.data_log_list)
+
+        for widget in (self.data_log_search_edit, self.data_log_search_prev_btn, self.data_log_search_next_btn,
+                       self.data_log_filter_chk, self.data_log_newline_combo, self.data_log_dedup_combo,
+                       self.data_log_hex_chk, self.data_log_timestamp_chk, self.data_log_export_btn):
+            widget.setEnabled(not self.terminal_mode)
+
+    @pyqtSlot(int)
+    def on_data_log_dedup_changed(self, index: int) -> None:
+        """
+        연속 중복 라인 접기 모드 변경을 처리합니다.
+
+        Args:
+            index (int): 선택된 콤보박스 인덱스.
+        """
+        self.data_log_list.set_dedup_mode(LogDedupMode(self.data_log_dedup_combo.itemData(index)))
+
     @pyqtSlot(int)
     def on_data_log_timestamp_changed(self, state: int) -> None:
         """
@@ -505,6 +803,44 @@ class DataLogWidget(QWidget):
         self.max_lines = max_lines
         self.data_log_list.set_max_lines(max_lines)
 
+    def set_scrollback_enabled(self, enabled: bool) -> None:
+        """
+        디스크 스크롤백 모드를 설정합니다.
+
+        Args:
+            enabled (bool): 스크롤백 모드 사용 여부.
+        """
+        self.data_log_list.set_scrollback_enabled(enabled)
+
+    def set_compression_enabled(self, enabled: bool) -> None:
+        """
+        오래된 라인의 메모리 압축 보관을 설정합니다.
+
+        Args:
+            enabled (bool): 압축 보관 사용 여부.
+        """
+        self.data_log_list.set_compression_enabled(enabled)
+
+    def set_row_bytes(self, row_bytes: int, hex_row_bytes: int) -> None:
+        """
+        로그 행 최대 폭을 설정합니다. (이후 수신분부터 적용)
+
+        Args:
+            row_bytes (int): 텍스트 모드 행 최대 폭 (바이트).
+            hex_row_bytes (int): HEX 모드 행당 바이트 수.
+        """
+        self.data_log_list.set_row_bytes(row_bytes, hex_row_bytes)
+
+    def set_encoding(self, encoding: str) -> None:
+        """
+        수신 데이터 표시 인코딩을 설정합니다.
+
+        Args:
+            encoding (str): 인코딩 이름 (예: 'utf-8', 'cp949').
+        """
+        self.data_log_list.set_encoding(encoding)
+        self.data_log_terminal.set_encoding(encoding)
+
     @property
     def broadcast_enabled_enabled(self) -> bool:
         """
@@ -529,7 +865,9 @@ class DataLogWidget(QWidget):
             "is_paused": self.is_paused,
             "search_text": self.data_log_search_edit.text(),
             "filter_enabled": self.filter_enabled,
-            "newline_mode": self.data_log_newline_combo.currentData()
+            "newline_mode": self.data_log_newline_combo.currentData(),
+            "dedup_mode": self.data_log_dedup_combo.currentData(),
+            "terminal_mode": self.terminal_mode
         }
         return state
 
@@ -549,6 +887,7 @@ class DataLogWidget(QWidget):
         self.data_log_timestamp_chk.setChecked(state.get("timestamp", False))
         self.data_log_pause_chk.setChecked(state.get("is_paused", False))
         self.data_log_filter_chk.setChecked(state.get("filter_enabled", False))
+        self.data_log_terminal_chk.setChecked(state.get("terminal_mode", False))
         self.data_log_search_edit.setText(state.get("search_text", ""))
 
         newline_mode = state.get("newline_mode", NewlineMode.RAW.value)
@@ -556,13 +895,6 @@ class DataLogWidget(QWidget):
         if index >= 0:
             self.data_log_newline_combo.setCurrentIndex(index)
 
-    def closeEvent(self, event) -> None:
-        """
-        위젯 종료 시 타이머를 안전하게 정지
-
-        Args:
-            event (QCloseEvent): 종료 이벤트.
-        """
-        if self.ui_update_timer.isActive():
-            self.ui_update_timer.stop()
-        super().closeEvent(event)
+        index = self.data_log_dedup_combo.findData(state.get("dedup_mode", LogDedupMode.OFF.value))
+        if index >= 0:
+            self.data_log_dedup_combo.setCurrentIndex(index)
@@ -9,6 +9,7 @@
 
 ## WHAT
 * RX/TX 바이트 수, 에러 카운트, 가동 시간 표시
+* RX/TX 속도(윈도우/Peak) 및 회선 점유율 표시
 * 마지막 수신 시간 표시
 
 ## HOW
@@ -31,6 +32,9 @@ class PortStatsWidget(QWidget):
         self.error_count_lbl: Optional[QLabel] = None
         self.tx_count_lbl: Optional[QLabel] = None
         self.rx_count_lbl: Optional[QLabel] = None
+        self.rx_rate_lbl: Optional[QLabel] = None
+        self.tx_rate_lbl: Optional[QLabel] = None
+        self.load_lbl: Optional[QLabel] = None
         self.group_box: Optional[QGroupBox] = None
         self.init_ui()
         language_manager.language_changed.connect(self.retranslate_ui)
@@ -47,12 +51,18 @@ class PortStatsWidget(QWidget):
         self.error_count_lbl = QLabel("Errors: 0")
         self.uptime_lbl = QLabel("Uptime: 00:00:00")
         self.last_rx_count_lbl = QLabel("Last RX: [--:--:--.---]")
+        self.rx_rate_lbl = QLabel("RX Rate: 0 B/s")
+        self.tx_rate_lbl = QLabel("TX Rate: 0 B/s")
+        self.load_lbl = QLabel("Load: 0.0%")
 
         gb_layout.addWidget(self.rx_count_lbl, 0, 0)
         gb_layout.addWidget(self.tx_count_lbl, 0, 1)
-        gb_layout.addWidget(self.error_count_lbl, 1, 0)
-        gb_layout.addWidget(self.uptime_lbl, 1, 1)
-        gb_layout.addWidget(self.last_rx_count_lbl, 2, 0, 1, 2)
+        gb_layout.addWidget(self.rx_rate_lbl, 1, 0)
+        gb_layout.addWidget(self.tx_rate_lbl, 1, 1)
+        gb_layout.addWidget(self.error_count_lbl, 2, 0)
+        gb_layout.addWidget(self.load_lbl, 2, 1)
+        gb_layout.addWidget(self.uptime_lbl, 3, 0)
+        gb_layout.addWidget(self.last_rx_count_lbl, 3, 1)
 
         self.group_box.setLayout(gb_layout)
         layout.addWidget(self.group_box, 0, 0)
@@ -71,7 +81,13 @@ class PortStatsWidget(QWidget):
         self.rx_count_lbl.setText(f"RX: {self.format_bytes(stats.rx_bytes)}")
         self.tx_count_lbl.setText(f"TX: {self.format_bytes(stats.tx_bytes)}")
         self.error_count_lbl.setText(f"Errors: {stats.error_count}")
-        # BPS는 MainStatusBar에서 주로 표시하므로 여기선 선택적
+        self.rx_rate_lbl.setText(
+            f"RX Rate: {self.format_bytes(int(stats.rx_rate))}/s (Peak {self.format_bytes(int(stats.rx_peak))}/s)"
+        )
+        self.tx_rate_lbl.setText(
+            f"TX Rate: {self.format_bytes(int(stats.tx_rate))}/s (Peak {self.format_bytes(int(stats.tx_peak))}/s)"
+        )
+        self.load_lbl.setText(f"Load: {stats.utilization:.1f}%")
 
     def set_rx_bytes(self, bytes_count: int):
         """
@@ -13,7 +13,7 @@
 * 검색, 필터링, 로그 파일 저장 기능
 
 ## HOW
-* ColorService를 사용하여 로그 레벨별 색상 태그 적용
+* 색상 규칙을 QSmartListView에 주입하여 로그 레벨별 색상 구간 적용
 * SystemLogEvent DTO를 통해 정형화된 데이터 수신
 * QTimer 및 QFileDialog를 활용한 부가 기능 구현
 """
@@ -27,11 +27,9 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import pyqtSignal, pyqtSlot, Qt
 
 from view.managers.language_manager import language_manager
-from view.managers.theme_manager import theme_manager
 from view.custom_qt.smart_list_view import QSmartListView
 from common.constants import DEFAULT_LOG_MAX_LINES
 from common.dtos import ColorRule, SystemLogEvent
-from view.services.color_service import ColorService
 
 
 class SystemLogWidget(QWidget):
@@ -208,8 +206,7 @@ class SystemLogWidget(QWidget):
         Logic:
             - DTO에서 데이터 추출 (메시지, 레벨, 타임스탬프)
             - 타임스탬프 포맷팅 ([HH:MM:SS])
-            - ColorService를 사용하여 색상 규칙 적용 (다크/라이트 테마 반영)
-            - 뷰에 추가
+            - 뷰에 추가 (색상 규칙은 QSmartListView가 구간으로 계산, 테마는 그릴 때 반영)
 
         Args:
             event (SystemLogEvent): 시스템 로그 이벤트 DTO.
@@ -222,13 +219,7 @@ class SystemLogWidget(QWidget):
         timestamp_str = dt.strftime("[%H:%M:%S]")
         full_text = f"{timestamp_str} {text}"
 
-        # 3. 색상 규칙 적용
-        if self._color_rules:
-            # 현재 테마 상태 조회 및 전달
-            is_dark = theme_manager.is_dark_theme()
-            full_text = ColorService.apply_rules(full_text, self._color_rules, is_dark)
-
-        # 4. 뷰에 추가
+        # 3. 뷰에 추가 (색상 규칙은 뷰가 색상 구간으로 적용)
         self.sys_log_list.append(full_text)
 
     def clear(self) -> None: